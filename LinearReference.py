@@ -72,6 +72,13 @@ class LinearReference(object):
         # triggered *before* the project is saved to file
         qgis.core.QgsProject.instance().writeProject.connect(self.store_settings)
 
+        # cached coordinate-transforms of both map_tools, see tools.MyTransforms
+        self.iface.mapCanvas().destinationCrsChanged.connect(tools.MyTransforms.invalidate_transforms)
+        qgis.core.QgsProject.instance().transformContextChanged.connect(tools.MyTransforms.invalidate_transforms)
+
+        # provider 'linref' for Show-Layers, registered before the first project is read, see tools.MyShowProvider
+        tools.MyShowProvider.register_provider()
+
         # no further initialization, the mapTools are only created when they are needed
 
 
@@ -198,7 +205,7 @@ class LinearReference(object):
     def unload(self):
         """standard-to_implement-function for plugins: reset GUI
         triggered by plugin-deactivation or project-close (!)"""
-        # Rev. 2023-04-21
+        # Rev. 2023-09-12
         # call unload-Function of the initialized map_tools
         if self.mt_PolEvt:
             self.mt_PolEvt.unload()
@@ -225,13 +232,19 @@ class LinearReference(object):
 
         # this should not be necessary, cause signal-slot connections are disconnected, if the slot-function (Python-Functions are objects with destructors) is unloaded (except lambda-Functions)
         # But it should not harm...
-        try:
-            qgis.core.QgsProject.instance().layersAdded.disconnect(self.recheck_settings)
-            qgis.core.QgsProject.instance().layersRemoved.disconnect(self.recheck_settings)
-        except Exception as e:
-            # TypeError: 'method' object is not connected
-            # print(f"Expected exception in {gdp()}: \"{e}\"")
-            pass
+        # each disconnect separately, a failed disconnect must not skip the others
+        for signal, slot in [
+            (qgis.core.QgsProject.instance().layersAdded, self.recheck_settings),
+            (qgis.core.QgsProject.instance().layersRemoved, self.recheck_settings),
+            (self.iface.mapCanvas().destinationCrsChanged, tools.MyTransforms.invalidate_transforms),
+            (qgis.core.QgsProject.instance().transformContextChanged, tools.MyTransforms.invalidate_transforms)
+        ]:
+            try:
+                signal.disconnect(slot)
+            except Exception as e:
+                # TypeError: 'method' object is not connected
+                # print(f"Expected exception in {gdp()}: \"{e}\"")
+                pass
 
     def show_help(self):
         """display local help ./docs/index.html"""
@@ -120,12 +120,23 @@ class LolDialog(QtWidgets.QDockWidget):
             column_resize_mode=QtWidgets.QHeaderView.ResizeToContents,
             sorting_enabled=True,
             show_clear_button=False,
-            show_template="#{0} '{1}'"
+            show_template="#{0} '{1}'",
+            filter_enabled=True
         )
         self.qcbn_snapped_ref_fid.setMinimumWidth(250)
 
         sub_wdg.layout().addWidget(self.qcbn_snapped_ref_fid)
 
+        # type-ahead-filter for the Reference-Layer-list, Return opens the filtered list
+        self.le_ref_filter = QtWidgets.QLineEdit(self)
+        self.le_ref_filter.setPlaceholderText(QtCore.QCoreApplication.translate('LolDialog', 'Filter...'))
+        self.le_ref_filter.setClearButtonEnabled(True)
+        self.le_ref_filter.setMaximumWidth(100)
+        self.le_ref_filter.textChanged.connect(self.qcbn_snapped_ref_fid.set_filter)
+        self.le_ref_filter.returnPressed.connect(self.qcbn_snapped_ref_fid.showPopup)
+        self.qcbn_snapped_ref_fid.filter_reset.connect(self.le_ref_filter.clear)
+        sub_wdg.layout().addWidget(self.le_ref_filter)
+
         self.pb_open_ref_form = QtWidgets.QPushButton(self)
         self.pb_open_ref_form.setFixedSize(20, 20)
         self.pb_open_ref_form.setStyleSheet("QPushButton { border: none; }")
@@ -170,6 +181,14 @@ class LolDialog(QtWidgets.QDockWidget):
         self.measure_grb.layout().addWidget(unit_widget_2, sub_row, 5)
         self.canvas_unit_widgets.append(unit_widget_2)
 
+        sub_row += 1
+        self.measure_grb.layout().addWidget(QtWidgets.QLabel(QtCore.QCoreApplication.translate('LolDialog','Events at cursor:'), self), sub_row, 0)
+        self.le_events_at_cursor = QtWidgets.QLineEdit(self)
+        self.le_events_at_cursor.setFont(le_font_m)
+        self.le_events_at_cursor.setReadOnly(True)
+        self.le_events_at_cursor.setToolTip(QtCore.QCoreApplication.translate('LolDialog',"PKs of the LoL-features at the snapped measure, nearest feature if none"))
+        self.measure_grb.layout().addWidget(self.le_events_at_cursor, sub_row, 1, 1, 4)
+
         sub_row += 1
         from_lbl = QtWidgets.QLabel(QtCore.QCoreApplication.translate('LolDialog','From:'), self)
         to_lbl = QtWidgets.QLabel(QtCore.QCoreApplication.translate('LolDialog','To:'), self)
@@ -395,6 +414,55 @@ class LolDialog(QtWidgets.QDockWidget):
 
         self.measure_container_wdg.layout().addWidget(self.edit_grb)
 
+        # edit-session: edits collected in the edit-buffer and saved with one commit, see tools.MyEditSession
+        self.edit_session_grb = QtWidgets.QGroupBox(QtCore.QCoreApplication.translate('LolDialog','Edit-Session:'), self)
+        self.edit_session_grb.setCheckable(True)
+        self.edit_session_grb.setChecked(False)
+        self.edit_session_grb.setMaximumHeight(20)
+        self.edit_session_grb.setStyle(tools.MyQtWidgets.GroupBoxProxyStyle())
+        self.edit_session_grb.setLayout(QtWidgets.QGridLayout())
+
+        self.cb_edit_session = QtWidgets.QCheckBox(QtCore.QCoreApplication.translate('LolDialog','collect edits'), self)
+        self.cb_edit_session.setToolTip(qt_format(QtCore.QCoreApplication.translate('LolDialog',"Insert, Update and Delete without immediate commit{br}{nbsp}{nbsp}{nbsp}-Data-Layer stays editable{br}{nbsp}{nbsp}{nbsp}-one commit with Save or by the auto-save-thresholds{br}{nbsp}{nbsp}{nbsp}-Show-Layer refreshed after each commit")))
+        self.edit_session_grb.layout().addWidget(self.cb_edit_session, 0, 0)
+        self.edit_session_grb.layout().addWidget(QtWidgets.QLabel(QtCore.QCoreApplication.translate('LolDialog',"Pending changes:"), self), 0, 1)
+        self.le_pending_changes = QtWidgets.QLineEdit(self)
+        self.le_pending_changes.setFont(le_font_m)
+        # always disabled
+        self.le_pending_changes.setEnabled(False)
+        self.edit_session_grb.layout().addWidget(self.le_pending_changes, 0, 2)
+
+        self.edit_session_grb.layout().addWidget(QtWidgets.QLabel(QtCore.QCoreApplication.translate('LolDialog',"Auto-save after:"), self), 1, 0)
+        self.qspb_auto_commit_count = QtWidgets.QSpinBox(self)
+        self.qspb_auto_commit_count.setFont(spbx_font_m)
+        self.qspb_auto_commit_count.setRange(0, 100000)
+        self.qspb_auto_commit_count.setSuffix(QtCore.QCoreApplication.translate('LolDialog'," changes"))
+        self.qspb_auto_commit_count.setSpecialValueText(QtCore.QCoreApplication.translate('LolDialog','off'))
+        self.qspb_auto_commit_count.setToolTip(qt_format(QtCore.QCoreApplication.translate('LolDialog',"Auto-save by number of pending changes, 0 {arrow} off")))
+        self.edit_session_grb.layout().addWidget(self.qspb_auto_commit_count, 1, 1)
+        self.qspb_auto_commit_seconds = QtWidgets.QSpinBox(self)
+        self.qspb_auto_commit_seconds.setFont(spbx_font_m)
+        self.qspb_auto_commit_seconds.setRange(0, 86400)
+        self.qspb_auto_commit_seconds.setSuffix(QtCore.QCoreApplication.translate('LolDialog'," s"))
+        self.qspb_auto_commit_seconds.setSpecialValueText(QtCore.QCoreApplication.translate('LolDialog','off'))
+        self.qspb_auto_commit_seconds.setToolTip(qt_format(QtCore.QCoreApplication.translate('LolDialog',"Auto-save by seconds after the first unsaved change, 0 {arrow} off")))
+        self.edit_session_grb.layout().addWidget(self.qspb_auto_commit_seconds, 1, 2)
+
+        self.pbtn_commit_edits = QtWidgets.QPushButton(self)
+        self.pbtn_commit_edits.setText(QtCore.QCoreApplication.translate('LolDialog',"Save"))
+        self.pbtn_commit_edits.setIconSize(QtCore.QSize(25, 25))
+        self.pbtn_commit_edits.setIcon(QtGui.QIcon(':icons/mActionFileSave.svg'))
+        self.pbtn_commit_edits.setToolTip(QtCore.QCoreApplication.translate('LolDialog',"Commit all pending changes..."))
+        self.edit_session_grb.layout().addWidget(self.pbtn_commit_edits, 2, 1)
+        self.pbtn_rollback_edits = QtWidgets.QPushButton(self)
+        self.pbtn_rollback_edits.setText(QtCore.QCoreApplication.translate('LolDialog',"Discard"))
+        self.pbtn_rollback_edits.setIconSize(QtCore.QSize(25, 25))
+        self.pbtn_rollback_edits.setIcon(QtGui.QIcon(':icons/mActionDeleteSelectedFeatures.svg'))
+        self.pbtn_rollback_edits.setToolTip(QtCore.QCoreApplication.translate('LolDialog',"Discard all pending changes..."))
+        self.edit_session_grb.layout().addWidget(self.pbtn_rollback_edits, 2, 2)
+
+        self.measure_container_wdg.layout().addWidget(self.edit_session_grb)
+
         row += 1
 
         self.selection_grb = QtWidgets.QGroupBox(QtCore.QCoreApplication.translate('LolDialog','Feature-Selection:'), self)
@@ -445,8 +513,8 @@ class LolDialog(QtWidgets.QDockWidget):
 
         self.selection_grb.layout().addWidget(sub_sub_wdg)
 
-        # table to show the selected edit-features
-        self.qtw_selected_pks = QtWidgets.QTableWidget()
+        # table to show the selected edit-features, QTableView with tools.MyQtWidgets.LazyTableModel, see dlg_refresh_feature_selection_section
+        self.qtw_selected_pks = QtWidgets.QTableView()
         self.qtw_selected_pks.setFont(default_font_m)
         self.qtw_selected_pks.setIconSize(QtCore.QSize(20, 20))
         # minimum row height
@@ -460,7 +528,7 @@ class LolDialog(QtWidgets.QDockWidget):
         self.qtw_selected_pks.setFocusPolicy(QtCore.Qt.NoFocus)
         self.qtw_selected_pks.setSortingEnabled(True)
         # initial sort-column and order
-        self.qtw_selected_pks.sortItems(0, 0)
+        self.qtw_selected_pks.sortByColumn(0, QtCore.Qt.AscendingOrder)
         self.qtw_selected_pks.setMinimumHeight(200)
 
         self.qtw_selected_pks.horizontalHeader().setStretchLastSection(True)
@@ -487,6 +555,44 @@ class LolDialog(QtWidgets.QDockWidget):
 
         self.selection_grb.layout().addWidget(sub_sub_wdg)
 
+        # bulk-operations on all selected features, see tools.MyBatchTools.SelectionBulkEditor
+        sub_sub_wdg = QtWidgets.QWidget()
+        sub_sub_wdg.setLayout(QtWidgets.QHBoxLayout())
+
+        self.pbtn_bulk_shift = QtWidgets.QPushButton(self)
+        self.pbtn_bulk_shift.setText(QtCore.QCoreApplication.translate('LolDialog',"Shift..."))
+        self.pbtn_bulk_shift.setMinimumWidth(25)
+        self.pbtn_bulk_shift.setIcon(QtGui.QIcon(':icons/mActionDoubleArrowRight.svg'))
+        self.pbtn_bulk_shift.setToolTip(QtCore.QCoreApplication.translate('LolDialog',"Shift the measures of all selected features, truncated to the Reference-line-length"))
+        self.pbtn_bulk_shift.setEnabled(False)
+        sub_sub_wdg.layout().addWidget(self.pbtn_bulk_shift)
+
+        self.pbtn_bulk_offset = QtWidgets.QPushButton(self)
+        self.pbtn_bulk_offset.setText(QtCore.QCoreApplication.translate('LolDialog',"Offset..."))
+        self.pbtn_bulk_offset.setMinimumWidth(25)
+        self.pbtn_bulk_offset.setIcon(QtGui.QIcon(':icons/mActionMoveFeatureCopyLine.svg'))
+        self.pbtn_bulk_offset.setToolTip(QtCore.QCoreApplication.translate('LolDialog',"Set or scale the offset of all selected features"))
+        self.pbtn_bulk_offset.setEnabled(False)
+        sub_sub_wdg.layout().addWidget(self.pbtn_bulk_offset)
+
+        self.pbtn_bulk_rereference = QtWidgets.QPushButton(self)
+        self.pbtn_bulk_rereference.setText(QtCore.QCoreApplication.translate('LolDialog',"Re-reference..."))
+        self.pbtn_bulk_rereference.setMinimumWidth(25)
+        self.pbtn_bulk_rereference.setIcon(QtGui.QIcon(':icons/mActionMoveVertex.svg'))
+        self.pbtn_bulk_rereference.setToolTip(QtCore.QCoreApplication.translate('LolDialog',"Assign all selected features to another Reference-line, measures proportional to the line-lengths"))
+        self.pbtn_bulk_rereference.setEnabled(False)
+        sub_sub_wdg.layout().addWidget(self.pbtn_bulk_rereference)
+
+        self.pbtn_bulk_delete = QtWidgets.QPushButton(self)
+        self.pbtn_bulk_delete.setText(QtCore.QCoreApplication.translate('LolDialog',"Delete..."))
+        self.pbtn_bulk_delete.setMinimumWidth(25)
+        self.pbtn_bulk_delete.setIcon(QtGui.QIcon(':icons/mActionDeleteSelectedFeatures.svg'))
+        self.pbtn_bulk_delete.setToolTip(QtCore.QCoreApplication.translate('LolDialog',"Delete all selected features from Data-Layer"))
+        self.pbtn_bulk_delete.setEnabled(False)
+        sub_sub_wdg.layout().addWidget(self.pbtn_bulk_delete)
+
+        self.selection_grb.layout().addWidget(sub_sub_wdg)
+
         self.measure_container_wdg.layout().addWidget(self.selection_grb, 1)
 
         # spacer between self.selection_grb and Status-Bar
@@ -750,6 +856,73 @@ class LolDialog(QtWidgets.QDockWidget):
         self.settings_container_wdg.setLayout(QtWidgets.QVBoxLayout())
         self.settings_container_wdg.layout().addWidget(self.layers_and_fields_grb)
 
+        self.bulk_import_grb = QtWidgets.QGroupBox(QtCore.QCoreApplication.translate('LolDialog','Bulk-Import:'), self)
+        self.bulk_import_grb.setCheckable(True)
+        self.bulk_import_grb.setChecked(False)
+        self.bulk_import_grb.setMaximumHeight(20)
+        self.bulk_import_grb.setStyle(tools.MyQtWidgets.GroupBoxProxyStyle())
+        self.bulk_import_grb.setLayout(QtWidgets.QGridLayout())
+
+        row = 0
+        self.bulk_import_grb.layout().addWidget(QtWidgets.QLabel(qt_format(QtCore.QCoreApplication.translate('LolDialog',"Columns matched by name to the Data-Layer-fields:{br}{nbsp}{nbsp}{nbsp}-Reference-Field, From- and To-Field{br}{nbsp}{nbsp}{nbsp}-Offset-Field optional, empty {arrow} 0{br}{nbsp}{nbsp}{nbsp}-ID-Field, if not integer{br}{nbsp}{nbsp}{nbsp}-further Data-Layer-fields optional")), self), row, 0)
+
+        row += 1
+        self.pbtn_import_measure_table = QtWidgets.QPushButton(QtCore.QCoreApplication.translate('LolDialog',"Import measure-table..."), self)
+        self.pbtn_import_measure_table.setToolTip(qt_format(QtCore.QCoreApplication.translate('LolDialog',"Import CSV, XLSX, ODS, GPKG or DBF into Data-Layer{br}{nbsp}{nbsp}{nbsp}-rows validated against the Reference-line-lengths{br}{nbsp}{nbsp}{nbsp}-one edit-session for all accepted rows{br}{nbsp}{nbsp}{nbsp}-rejected rows listed in a temporary table")))
+        self.bulk_import_grb.layout().addWidget(self.pbtn_import_measure_table, row, 0)
+
+        self.settings_container_wdg.layout().addWidget(self.bulk_import_grb)
+
+        self.integrity_grb = QtWidgets.QGroupBox(QtCore.QCoreApplication.translate('LolDialog','Integrity-Check:'), self)
+        self.integrity_grb.setCheckable(True)
+        self.integrity_grb.setChecked(False)
+        self.integrity_grb.setMaximumHeight(20)
+        self.integrity_grb.setStyle(tools.MyQtWidgets.GroupBoxProxyStyle())
+        self.integrity_grb.setLayout(QtWidgets.QGridLayout())
+
+        sub_sub_wdg = QtWidgets.QWidget()
+        sub_sub_wdg.setLayout(QtWidgets.QHBoxLayout())
+        self.pbtn_check_integrity = QtWidgets.QPushButton(QtCore.QCoreApplication.translate('LolDialog',"Check all"), self)
+        self.pbtn_check_integrity.setToolTip(qt_format(QtCore.QCoreApplication.translate('LolDialog',"Check all Data-features{br}{nbsp}{nbsp}{nbsp}-ID unique, not null{br}{nbsp}{nbsp}{nbsp}-Reference-feature exists, single-part{br}{nbsp}{nbsp}{nbsp}-measures within 0 ... length{br}{nbsp}{nbsp}{nbsp}-Show-feature exists{br}Issues are listed in a temporary table")))
+        sub_sub_wdg.layout().addWidget(self.pbtn_check_integrity)
+        self.pbtn_check_integrity_changes = QtWidgets.QPushButton(QtCore.QCoreApplication.translate('LolDialog',"Check changes"), self)
+        self.pbtn_check_integrity_changes.setToolTip(QtCore.QCoreApplication.translate('LolDialog',"Re-check only the Data- and Reference-features changed since the last check"))
+        sub_sub_wdg.layout().addWidget(self.pbtn_check_integrity_changes)
+        self.integrity_grb.layout().addWidget(sub_sub_wdg, 0, 0)
+
+        self.settings_container_wdg.layout().addWidget(self.integrity_grb)
+
+        self.overlay_grb = QtWidgets.QGroupBox(QtCore.QCoreApplication.translate('LolDialog','Overlay:'), self)
+        self.overlay_grb.setCheckable(True)
+        self.overlay_grb.setChecked(False)
+        self.overlay_grb.setMaximumHeight(20)
+        self.overlay_grb.setStyle(tools.MyQtWidgets.GroupBoxProxyStyle())
+        self.overlay_grb.setLayout(QtWidgets.QGridLayout())
+
+        row = 0
+        self.overlay_grb.layout().addWidget(QtWidgets.QLabel(QtCore.QCoreApplication.translate('LolDialog','Overlay with configuration:'), self), row, 0)
+        self.cb_overlay_configuration = QtWidgets.QComboBox(self)
+        self.cb_overlay_configuration.setFont(cbx_font_m)
+        self.cb_overlay_configuration.setToolTip(qt_format(QtCore.QCoreApplication.translate('LolDialog',"Stored configuration with the second Data-Layer{br}{nbsp}{nbsp}{nbsp}-same Reference-Layer as the current configuration")))
+        self.overlay_grb.layout().addWidget(self.cb_overlay_configuration, row, 1)
+
+        row += 1
+        self.overlay_grb.layout().addWidget(QtWidgets.QLabel(QtCore.QCoreApplication.translate('LolDialog','Operation:'), self), row, 0)
+        self.cb_overlay_operation = QtWidgets.QComboBox(self)
+        self.cb_overlay_operation.setFont(cbx_font_m)
+        self.cb_overlay_operation.addItem(QtCore.QCoreApplication.translate('LolDialog','Intersection'), 'intersection')
+        self.cb_overlay_operation.addItem(QtCore.QCoreApplication.translate('LolDialog','Union'), 'union')
+        self.cb_overlay_operation.addItem(QtCore.QCoreApplication.translate('LolDialog','Difference'), 'difference')
+        self.cb_overlay_operation.setToolTip(qt_format(QtCore.QCoreApplication.translate('LolDialog',"Intersection {arrow} segments covered by both Data-Layers{br}Union {arrow} segments covered by one or both Data-Layers{br}Difference {arrow} segments covered by the current, not by the second Data-Layer")))
+        self.overlay_grb.layout().addWidget(self.cb_overlay_operation, row, 1)
+
+        row += 1
+        self.pbtn_overlay = QtWidgets.QPushButton(QtCore.QCoreApplication.translate('LolDialog',"Overlay to GeoPackage..."), self)
+        self.pbtn_overlay.setToolTip(qt_format(QtCore.QCoreApplication.translate('LolDialog',"Dynamic segmentation in background{br}{nbsp}{nbsp}{nbsp}-result as new Data-Layer in a GeoPackage-table{br}{nbsp}{nbsp}{nbsp}-attributes of both Data-Layers with prefix a_ and b_")))
+        self.overlay_grb.layout().addWidget(self.pbtn_overlay, row, 0, 1, 2)
+
+        self.settings_container_wdg.layout().addWidget(self.overlay_grb)
+
         self.style_grb = QtWidgets.QGroupBox(QtCore.QCoreApplication.translate('LolDialog','Styles:'), self)
         self.style_grb.setCheckable(True)
         self.style_grb.setChecked(False)
@@ -905,7 +1078,7 @@ class LolDialog(QtWidgets.QDockWidget):
 
     def reset_measure_widgets(self):
         """resets dialog-widgets with measures"""
-        # Rev. 2023-05-10
+        # Rev. 2023-09-04
         with QtCore.QSignalBlocker(self.qcbn_snapped_ref_fid):
             self.qcbn_snapped_ref_fid.clear_selection()
 
@@ -915,6 +1088,9 @@ class LolDialog(QtWidgets.QDockWidget):
         with QtCore.QSignalBlocker(self.le_map_y):
             self.le_map_y.clear()
 
+        with QtCore.QSignalBlocker(self.le_events_at_cursor):
+            self.le_events_at_cursor.clear()
+
         with QtCore.QSignalBlocker(self.le_snap_pt_from_x):
             self.le_snap_pt_from_x.clear()
 
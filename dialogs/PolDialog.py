@@ -111,12 +111,23 @@ class PolDialog(QtWidgets.QDockWidget):
             column_resize_mode=QtWidgets.QHeaderView.ResizeToContents,
             sorting_enabled=True,
             show_clear_button=False,
-            show_template="#{0} '{1}'"
+            show_template="#{0} '{1}'",
+            filter_enabled=True
         )
         self.qcbn_snapped_ref_fid.setFont(cbx_font_m)
         # self.qcbn_snapped_ref_fid.setMinimumWidth(250)
         sub_wdg.layout().addWidget(self.qcbn_snapped_ref_fid)
 
+        # type-ahead-filter for the Reference-Layer-list, Return opens the filtered list
+        self.le_ref_filter = QtWidgets.QLineEdit(self)
+        self.le_ref_filter.setPlaceholderText(QtCore.QCoreApplication.translate('PolDialog', 'Filter...'))
+        self.le_ref_filter.setClearButtonEnabled(True)
+        self.le_ref_filter.setMaximumWidth(100)
+        self.le_ref_filter.textChanged.connect(self.qcbn_snapped_ref_fid.set_filter)
+        self.le_ref_filter.returnPressed.connect(self.qcbn_snapped_ref_fid.showPopup)
+        self.qcbn_snapped_ref_fid.filter_reset.connect(self.le_ref_filter.clear)
+        sub_wdg.layout().addWidget(self.le_ref_filter)
+
         self.pb_open_ref_form = QtWidgets.QPushButton(self)
         self.pb_open_ref_form.setFixedSize(20, 20)
         self.pb_open_ref_form.setStyleSheet("QPushButton { border: none; }")
@@ -296,6 +307,55 @@ class PolDialog(QtWidgets.QDockWidget):
         # self.edit_grb.hide()
         self.measure_container_wdg.layout().addWidget(self.edit_grb)
 
+        # edit-session: edits collected in the edit-buffer and saved with one commit, see tools.MyEditSession
+        self.edit_session_grb = QtWidgets.QGroupBox(QtCore.QCoreApplication.translate('PolDialog','Edit-Session:'), self)
+        self.edit_session_grb.setCheckable(True)
+        self.edit_session_grb.setChecked(False)
+        self.edit_session_grb.setMaximumHeight(20)
+        self.edit_session_grb.setStyle(tools.MyQtWidgets.GroupBoxProxyStyle())
+        self.edit_session_grb.setLayout(QtWidgets.QGridLayout())
+
+        self.cb_edit_session = QtWidgets.QCheckBox(QtCore.QCoreApplication.translate('PolDialog','collect edits'), self)
+        self.cb_edit_session.setToolTip(qt_format(QtCore.QCoreApplication.translate('PolDialog',"Insert, Update and Delete without immediate commit{br}{nbsp}{nbsp}{nbsp}-Data-Layer stays editable{br}{nbsp}{nbsp}{nbsp}-one commit with Save or by the auto-save-thresholds{br}{nbsp}{nbsp}{nbsp}-Show-Layer refreshed after each commit")))
+        self.edit_session_grb.layout().addWidget(self.cb_edit_session, 0, 0)
+        self.edit_session_grb.layout().addWidget(QtWidgets.QLabel(QtCore.QCoreApplication.translate('PolDialog',"Pending changes:"), self), 0, 1)
+        self.le_pending_changes = QtWidgets.QLineEdit(self)
+        self.le_pending_changes.setFont(le_font_m)
+        # always disabled
+        self.le_pending_changes.setEnabled(False)
+        self.edit_session_grb.layout().addWidget(self.le_pending_changes, 0, 2)
+
+        self.edit_session_grb.layout().addWidget(QtWidgets.QLabel(QtCore.QCoreApplication.translate('PolDialog',"Auto-save after:"), self), 1, 0)
+        self.qspb_auto_commit_count = QtWidgets.QSpinBox(self)
+        self.qspb_auto_commit_count.setFont(spbx_font_m)
+        self.qspb_auto_commit_count.setRange(0, 100000)
+        self.qspb_auto_commit_count.setSuffix(QtCore.QCoreApplication.translate('PolDialog'," changes"))
+        self.qspb_auto_commit_count.setSpecialValueText(QtCore.QCoreApplication.translate('PolDialog','off'))
+        self.qspb_auto_commit_count.setToolTip(qt_format(QtCore.QCoreApplication.translate('PolDialog',"Auto-save by number of pending changes, 0 {arrow} off")))
+        self.edit_session_grb.layout().addWidget(self.qspb_auto_commit_count, 1, 1)
+        self.qspb_auto_commit_seconds = QtWidgets.QSpinBox(self)
+        self.qspb_auto_commit_seconds.setFont(spbx_font_m)
+        self.qspb_auto_commit_seconds.setRange(0, 86400)
+        self.qspb_auto_commit_seconds.setSuffix(QtCore.QCoreApplication.translate('PolDialog'," s"))
+        self.qspb_auto_commit_seconds.setSpecialValueText(QtCore.QCoreApplication.translate('PolDialog','off'))
+        self.qspb_auto_commit_seconds.setToolTip(qt_format(QtCore.QCoreApplication.translate('PolDialog',"Auto-save by seconds after the first unsaved change, 0 {arrow} off")))
+        self.edit_session_grb.layout().addWidget(self.qspb_auto_commit_seconds, 1, 2)
+
+        self.pbtn_commit_edits = QtWidgets.QPushButton(self)
+        self.pbtn_commit_edits.setText(QtCore.QCoreApplication.translate('PolDialog',"Save"))
+        self.pbtn_commit_edits.setIconSize(QtCore.QSize(25, 25))
+        self.pbtn_commit_edits.setIcon(QtGui.QIcon(':icons/mActionFileSave.svg'))
+        self.pbtn_commit_edits.setToolTip(QtCore.QCoreApplication.translate('PolDialog',"Commit all pending changes..."))
+        self.edit_session_grb.layout().addWidget(self.pbtn_commit_edits, 2, 1)
+        self.pbtn_rollback_edits = QtWidgets.QPushButton(self)
+        self.pbtn_rollback_edits.setText(QtCore.QCoreApplication.translate('PolDialog',"Discard"))
+        self.pbtn_rollback_edits.setIconSize(QtCore.QSize(25, 25))
+        self.pbtn_rollback_edits.setIcon(QtGui.QIcon(':icons/mActionDeleteSelectedFeatures.svg'))
+        self.pbtn_rollback_edits.setToolTip(QtCore.QCoreApplication.translate('PolDialog',"Discard all pending changes..."))
+        self.edit_session_grb.layout().addWidget(self.pbtn_rollback_edits, 2, 2)
+
+        self.measure_container_wdg.layout().addWidget(self.edit_session_grb)
+
         self.selection_grb = QtWidgets.QGroupBox(QtCore.QCoreApplication.translate('PolDialog','Feature-Selection:'), self)
         self.selection_grb.setCheckable(True)
         self.selection_grb.setChecked(False)
@@ -342,8 +402,8 @@ class PolDialog(QtWidgets.QDockWidget):
 
         self.selection_grb.layout().addWidget(sub_sub_wdg)
 
-        # table to show the selected edit-features
-        self.qtw_selected_pks = QtWidgets.QTableWidget()
+        # table to show the selected edit-features, QTableView with tools.MyQtWidgets.LazyTableModel, see dlg_refresh_feature_selection_section
+        self.qtw_selected_pks = QtWidgets.QTableView()
         self.qtw_selected_pks.setFont(default_font_m)
         self.qtw_selected_pks.setIconSize(QtCore.QSize(20, 20))
         # ➜ minimum row height
@@ -381,6 +441,36 @@ class PolDialog(QtWidgets.QDockWidget):
 
         self.selection_grb.layout().addWidget(sub_sub_wdg)
 
+        # bulk-operations on all selected features, see tools.MyBatchTools.SelectionBulkEditor
+        sub_sub_wdg = QtWidgets.QWidget()
+        sub_sub_wdg.setLayout(QtWidgets.QHBoxLayout())
+
+        self.pbtn_bulk_shift = QtWidgets.QPushButton(self)
+        self.pbtn_bulk_shift.setText(QtCore.QCoreApplication.translate('PolDialog',"Shift..."))
+        self.pbtn_bulk_shift.setMinimumWidth(25)
+        self.pbtn_bulk_shift.setIcon(QtGui.QIcon(':icons/mActionDoubleArrowRight.svg'))
+        self.pbtn_bulk_shift.setToolTip(QtCore.QCoreApplication.translate('PolDialog',"Shift the measures of all selected features, truncated to the Reference-line-length"))
+        self.pbtn_bulk_shift.setEnabled(False)
+        sub_sub_wdg.layout().addWidget(self.pbtn_bulk_shift)
+
+        self.pbtn_bulk_rereference = QtWidgets.QPushButton(self)
+        self.pbtn_bulk_rereference.setText(QtCore.QCoreApplication.translate('PolDialog',"Re-reference..."))
+        self.pbtn_bulk_rereference.setMinimumWidth(25)
+        self.pbtn_bulk_rereference.setIcon(QtGui.QIcon(':icons/mActionMoveVertex.svg'))
+        self.pbtn_bulk_rereference.setToolTip(QtCore.QCoreApplication.translate('PolDialog',"Assign all selected features to another Reference-line, measures proportional to the line-lengths"))
+        self.pbtn_bulk_rereference.setEnabled(False)
+        sub_sub_wdg.layout().addWidget(self.pbtn_bulk_rereference)
+
+        self.pbtn_bulk_delete = QtWidgets.QPushButton(self)
+        self.pbtn_bulk_delete.setText(QtCore.QCoreApplication.translate('PolDialog',"Delete..."))
+        self.pbtn_bulk_delete.setMinimumWidth(25)
+        self.pbtn_bulk_delete.setIcon(QtGui.QIcon(':icons/mActionDeleteSelectedFeatures.svg'))
+        self.pbtn_bulk_delete.setToolTip(QtCore.QCoreApplication.translate('PolDialog',"Delete all selected features from Data-Layer"))
+        self.pbtn_bulk_delete.setEnabled(False)
+        sub_sub_wdg.layout().addWidget(self.pbtn_bulk_delete)
+
+        self.selection_grb.layout().addWidget(sub_sub_wdg)
+
         row += 1
         # the number 1 let grow this group-box over the Stretch below, undocumented feature or bug?
         self.measure_container_wdg.layout().addWidget(self.selection_grb, 1)
@@ -605,6 +695,146 @@ class PolDialog(QtWidgets.QDockWidget):
 
         self.settings_container_wdg.layout().addWidget(self.layers_and_fields_grb)
 
+        self.batch_locate_grb = QtWidgets.QGroupBox(QtCore.QCoreApplication.translate('PolDialog','Batch-Locate:'), self)
+        self.batch_locate_grb.setCheckable(True)
+        self.batch_locate_grb.setChecked(False)
+        self.batch_locate_grb.setMaximumHeight(20)
+        self.batch_locate_grb.setStyle(tools.MyQtWidgets.GroupBoxProxyStyle())
+        self.batch_locate_grb.setLayout(QtWidgets.QGridLayout())
+
+        row = 0
+        self.batch_locate_grb.layout().addWidget(QtWidgets.QLabel(QtCore.QCoreApplication.translate('PolDialog','Point-Layer:'), self), row, 0)
+        self.qcbn_batch_point_layer = tools.MyQtWidgets.QComboBoxN(
+            self,
+            show_clear_button=True,
+            append_index_col=True,
+            col_names=['Layer', 'Geometry', 'Provider', 'idx'],
+            enable_row_by_col_idx=0,
+            column_resize_mode=QtWidgets.QHeaderView.ResizeToContents,
+            sorting_enabled=True,
+            initial_sort_col_idx=3,
+            initial_sort_order=QtCore.Qt.AscendingOrder,
+            clear_button_icon=QtGui.QIcon(':icons/backspace-outline.svg')
+        )
+        self.qcbn_batch_point_layer.setFont(cbx_font_m)
+        self.qcbn_batch_point_layer.setToolTip(qt_format(QtCore.QCoreApplication.translate('PolDialog',"Point-Layer to locate on the Reference-Layer{br}{nbsp}{nbsp}{nbsp}-one Data-Layer-feature per located point{br}{nbsp}{nbsp}{nbsp}-nearest Reference-line")))
+        self.batch_locate_grb.layout().addWidget(self.qcbn_batch_point_layer, row, 1)
+
+        row += 1
+        self.cb_batch_selected_only = QtWidgets.QCheckBox(QtCore.QCoreApplication.translate('PolDialog','only selected features'), self)
+        self.batch_locate_grb.layout().addWidget(self.cb_batch_selected_only, row, 1)
+
+        row += 1
+        self.batch_locate_grb.layout().addWidget(QtWidgets.QLabel(QtCore.QCoreApplication.translate('PolDialog','Max. Distance:'), self), row, 0)
+        self.dspbx_batch_max_distance = tools.MyQtWidgets.QDoubleSpinBoxDefault(self)
+        self.dspbx_batch_max_distance.setFont(spbx_font_m)
+        self.dspbx_batch_max_distance.setSpecialValueText(QtCore.QCoreApplication.translate('PolDialog','unlimited'))
+        self.dspbx_batch_max_distance.setToolTip(qt_format(QtCore.QCoreApplication.translate('PolDialog',"Search-radius around the points{br}{nbsp}{nbsp}{nbsp}-units accordingly Reference-Layer{br}{nbsp}{nbsp}{nbsp}-0 {arrow} unlimited")))
+        self.batch_locate_grb.layout().addWidget(self.dspbx_batch_max_distance, row, 1)
+
+        row += 1
+        self.batch_locate_grb.layout().addWidget(QtWidgets.QLabel(QtCore.QCoreApplication.translate('PolDialog','Side-Field:'), self), row, 0)
+        self.qcbn_batch_side_field = tools.MyQtWidgets.QComboBoxN(
+            self,
+            show_clear_button=True,
+            append_index_col=True,
+            col_names=['Field', 'Type', 'PK', 'idx'],
+            enable_row_by_col_idx=0,
+            column_resize_mode=QtWidgets.QHeaderView.ResizeToContents,
+            sorting_enabled=True,
+            initial_sort_col_idx=3,
+            initial_sort_order=QtCore.Qt.AscendingOrder,
+            clear_button_icon=QtGui.QIcon(':icons/backspace-outline.svg')
+        )
+        self.qcbn_batch_side_field.setFont(cbx_font_m)
+        self.qcbn_batch_side_field.setToolTip(qt_format(QtCore.QCoreApplication.translate('PolDialog',"optional Data-Layer-field for the side of the point{br}{nbsp}{nbsp}{nbsp}-numeric data-type{br}{nbsp}{nbsp}{nbsp}--1 {arrow} left, 1 {arrow} right, 0 {arrow} on the line")))
+        self.batch_locate_grb.layout().addWidget(self.qcbn_batch_side_field, row, 1)
+
+        row += 1
+        self.batch_locate_grb.layout().addWidget(QtWidgets.QLabel(QtCore.QCoreApplication.translate('PolDialog','Distance-Field:'), self), row, 0)
+        self.qcbn_batch_distance_field = tools.MyQtWidgets.QComboBoxN(
+            self,
+            show_clear_button=True,
+            append_index_col=True,
+            col_names=['Field', 'Type', 'PK', 'idx'],
+            enable_row_by_col_idx=0,
+            column_resize_mode=QtWidgets.QHeaderView.ResizeToContents,
+            sorting_enabled=True,
+            initial_sort_col_idx=3,
+            initial_sort_order=QtCore.Qt.AscendingOrder,
+            clear_button_icon=QtGui.QIcon(':icons/backspace-outline.svg')
+        )
+        self.qcbn_batch_distance_field.setFont(cbx_font_m)
+        self.qcbn_batch_distance_field.setToolTip(qt_format(QtCore.QCoreApplication.translate('PolDialog',"optional Data-Layer-field for the distance of the point to the Reference-line{br}{nbsp}{nbsp}{nbsp}-numeric data-type{br}{nbsp}{nbsp}{nbsp}-units accordingly Reference-Layer")))
+        self.batch_locate_grb.layout().addWidget(self.qcbn_batch_distance_field, row, 1)
+
+        row += 1
+        self.batch_locate_grb.layout().addWidget(QtWidgets.QLabel(QtCore.QCoreApplication.translate('PolDialog','Point-ID-Field:'), self), row, 0)
+        self.qcbn_batch_point_fid_field = tools.MyQtWidgets.QComboBoxN(
+            self,
+            show_clear_button=True,
+            append_index_col=True,
+            col_names=['Field', 'Type', 'PK', 'idx'],
+            enable_row_by_col_idx=0,
+            column_resize_mode=QtWidgets.QHeaderView.ResizeToContents,
+            sorting_enabled=True,
+            initial_sort_col_idx=3,
+            initial_sort_order=QtCore.Qt.AscendingOrder,
+            clear_button_icon=QtGui.QIcon(':icons/backspace-outline.svg')
+        )
+        self.qcbn_batch_point_fid_field.setFont(cbx_font_m)
+        self.qcbn_batch_point_fid_field.setToolTip(qt_format(QtCore.QCoreApplication.translate('PolDialog',"optional Data-Layer-field for the feature-id of the located point{br}{nbsp}{nbsp}{nbsp}-integer data-type{br}{nbsp}{nbsp}{nbsp}-back-reference to the Point-Layer")))
+        self.batch_locate_grb.layout().addWidget(self.qcbn_batch_point_fid_field, row, 1)
+
+        row += 1
+        sub_sub_wdg = QtWidgets.QWidget()
+        sub_sub_wdg.setLayout(QtWidgets.QHBoxLayout())
+        self.pbtn_batch_locate = QtWidgets.QPushButton(QtCore.QCoreApplication.translate('PolDialog',"Locate points..."), self)
+        self.pbtn_batch_locate.setToolTip(QtCore.QCoreApplication.translate('PolDialog',"Locate the points in background and insert the results into Data-Layer"))
+        sub_sub_wdg.layout().addWidget(self.pbtn_batch_locate)
+        self.pbtn_batch_cancel = QtWidgets.QPushButton(QtCore.QCoreApplication.translate('PolDialog',"Cancel"), self)
+        self.pbtn_batch_cancel.setEnabled(False)
+        sub_sub_wdg.layout().addWidget(self.pbtn_batch_cancel)
+        self.batch_locate_grb.layout().addWidget(sub_sub_wdg, row, 0, 1, 2)
+
+        self.settings_container_wdg.layout().addWidget(self.batch_locate_grb)
+
+        self.bulk_import_grb = QtWidgets.QGroupBox(QtCore.QCoreApplication.translate('PolDialog','Bulk-Import:'), self)
+        self.bulk_import_grb.setCheckable(True)
+        self.bulk_import_grb.setChecked(False)
+        self.bulk_import_grb.setMaximumHeight(20)
+        self.bulk_import_grb.setStyle(tools.MyQtWidgets.GroupBoxProxyStyle())
+        self.bulk_import_grb.setLayout(QtWidgets.QGridLayout())
+
+        row = 0
+        self.bulk_import_grb.layout().addWidget(QtWidgets.QLabel(qt_format(QtCore.QCoreApplication.translate('PolDialog',"Columns matched by name to the Data-Layer-fields:{br}{nbsp}{nbsp}{nbsp}-Reference-Field, Measurement-Field{br}{nbsp}{nbsp}{nbsp}-ID-Field, if not integer{br}{nbsp}{nbsp}{nbsp}-further Data-Layer-fields optional")), self), row, 0)
+
+        row += 1
+        self.pbtn_import_measure_table = QtWidgets.QPushButton(QtCore.QCoreApplication.translate('PolDialog',"Import measure-table..."), self)
+        self.pbtn_import_measure_table.setToolTip(qt_format(QtCore.QCoreApplication.translate('PolDialog',"Import CSV, XLSX, ODS, GPKG or DBF into Data-Layer{br}{nbsp}{nbsp}{nbsp}-rows validated against the Reference-line-lengths{br}{nbsp}{nbsp}{nbsp}-one edit-session for all accepted rows{br}{nbsp}{nbsp}{nbsp}-rejected rows listed in a temporary table")))
+        self.bulk_import_grb.layout().addWidget(self.pbtn_import_measure_table, row, 0)
+
+        self.settings_container_wdg.layout().addWidget(self.bulk_import_grb)
+
+        self.integrity_grb = QtWidgets.QGroupBox(QtCore.QCoreApplication.translate('PolDialog','Integrity-Check:'), self)
+        self.integrity_grb.setCheckable(True)
+        self.integrity_grb.setChecked(False)
+        self.integrity_grb.setMaximumHeight(20)
+        self.integrity_grb.setStyle(tools.MyQtWidgets.GroupBoxProxyStyle())
+        self.integrity_grb.setLayout(QtWidgets.QGridLayout())
+
+        sub_sub_wdg = QtWidgets.QWidget()
+        sub_sub_wdg.setLayout(QtWidgets.QHBoxLayout())
+        self.pbtn_check_integrity = QtWidgets.QPushButton(QtCore.QCoreApplication.translate('PolDialog',"Check all"), self)
+        self.pbtn_check_integrity.setToolTip(qt_format(QtCore.QCoreApplication.translate('PolDialog',"Check all Data-features{br}{nbsp}{nbsp}{nbsp}-ID unique, not null{br}{nbsp}{nbsp}{nbsp}-Reference-feature exists, single-part{br}{nbsp}{nbsp}{nbsp}-measures within 0 ... length{br}{nbsp}{nbsp}{nbsp}-Show-feature exists{br}Issues are listed in a temporary table")))
+        sub_sub_wdg.layout().addWidget(self.pbtn_check_integrity)
+        self.pbtn_check_integrity_changes = QtWidgets.QPushButton(QtCore.QCoreApplication.translate('PolDialog',"Check changes"), self)
+        self.pbtn_check_integrity_changes.setToolTip(QtCore.QCoreApplication.translate('PolDialog',"Re-check only the Data- and Reference-features changed since the last check"))
+        sub_sub_wdg.layout().addWidget(self.pbtn_check_integrity_changes)
+        self.integrity_grb.layout().addWidget(sub_sub_wdg, 0, 0)
+
+        self.settings_container_wdg.layout().addWidget(self.integrity_grb)
+
         self.style_grb = QtWidgets.QGroupBox(QtCore.QCoreApplication.translate('PolDialog','Styles:'), self)
         self.style_grb.setCheckable(True)
         self.style_grb.setChecked(False)
@@ -39,7 +39,7 @@ iface = qgis.utils.iface
 
 _plugin_name = 'LinearReferencing'
 
-from LinearReferencing.tools.MyToolFunctions import qt_format
+from LinearReferencing.tools.MyToolFunctions import qt_format, get_feature_by_fid
 
 def edit_line_on_line_feature(fid: int, layer_id: str, zoom_to_feature: bool) -> None:
     """
@@ -73,7 +73,7 @@ def edit_line_on_line_feature(fid: int, layer_id: str, zoom_to_feature: bool) ->
 
             if data_or_show_lyr == mt.ds.dataLyr:
                 if mt.cf.data_layer_complete:
-                    data_feature = data_or_show_lyr.getFeature(fid)
+                    data_feature = get_feature_by_fid(data_or_show_lyr, fid, mt.get_attribute_request(data_or_show_lyr))
                     if data_feature.isValid():
                         edit_pk = data_feature[mt.ds.dataLyrIdField.name()]
                         mt.set_edit_pk(edit_pk, zoom_to_feature)
@@ -87,7 +87,7 @@ def edit_line_on_line_feature(fid: int, layer_id: str, zoom_to_feature: bool) ->
 
             elif data_or_show_lyr == mt.ds.showLyr:
                 if mt.cf.show_layer_complete:
-                    show_feature = data_or_show_lyr.getFeature(fid)
+                    show_feature = get_feature_by_fid(data_or_show_lyr, fid, mt.get_attribute_request(data_or_show_lyr))
                     if show_feature.isValid():
                         edit_pk = show_feature[mt.ds.showLyrBackReferenceField.name()]
                         mt.set_edit_pk(edit_pk, zoom_to_feature)
@@ -144,7 +144,7 @@ def edit_point_on_line_feature(fid: int, layer_id: str, pan_to_feature: bool) ->
             data_or_show_lyr = QgsProject.instance().mapLayer(layer_id)
             if data_or_show_lyr == mt.ds.dataLyr:
                 if mt.cf.data_layer_complete:
-                    data_feature = data_or_show_lyr.getFeature(fid)
+                    data_feature = get_feature_by_fid(data_or_show_lyr, fid, mt.get_attribute_request(data_or_show_lyr))
                     if data_feature.isValid():
                         edit_pk = data_feature[mt.ds.dataLyrIdField.name()]
                         mt.set_edit_pk(edit_pk, pan_to_feature)
@@ -157,7 +157,7 @@ def edit_point_on_line_feature(fid: int, layer_id: str, pan_to_feature: bool) ->
                     mt.my_dialogue.tbw_central.setCurrentIndex(1)
             elif data_or_show_lyr == mt.ds.showLyr:
                 if mt.cf.show_layer_complete:
-                    show_feature = data_or_show_lyr.getFeature(fid)
+                    show_feature = get_feature_by_fid(data_or_show_lyr, fid, mt.get_attribute_request(data_or_show_lyr))
                     if show_feature.isValid():
                         edit_pk = show_feature[mt.ds.showLyrBackReferenceField.name()]
                         mt.set_edit_pk(edit_pk, pan_to_feature)
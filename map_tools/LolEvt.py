@@ -22,7 +22,7 @@ the Free Software Foundation; either version 2 of the License, or
 ********************************************************************
 """
 from __future__ import annotations
-import os, qgis, osgeo, math, datetime, sys
+import os, qgis, osgeo, math, datetime, functools
 from PyQt5 import QtCore, QtGui, QtWidgets
 from LinearReferencing import tools, dialogs
 from LinearReferencing.icons import resources
@@ -447,6 +447,15 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         reference_layer_connections = []
         show_layer_connections = []
 
+        # MyLayerCaches.ReferenceListTask, streams the List of Reference-Layer-Features into the dialog
+        reference_list_task = None
+
+        # temporary report-layer of the last integrity-check, replaced by the next check
+        integrity_report_layer_id = None
+
+        # MyOverlay.OverlayTask, dynamic segmentation in background
+        overlay_task = None
+
     def __init__(self, iface: qgis.gui.QgisInterface):
         """initialize
         :param iface: qgis.gui.QgisInterface "Abstract base class defining interfaces exposed by QgisApp and made available to plugins."
@@ -475,7 +484,7 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
 
             'disabled': QtCore.QCoreApplication.translate('LolEvt',"no Reference-Layer (linestring) found or configured, check settings..."),
 
-            'select_features': QtCore.QCoreApplication.translate('LolEvt',"click or draw rect to select features for edit"),
+            'select_features': QtCore.QCoreApplication.translate('LolEvt',"click or draw rect to select features for edit, hover to identify"),
 
         }
 
@@ -484,6 +493,21 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         self.ds = self.DeferedSettings()
         self.cf = self.CheckFlags()
         self.rs = self.RuntimeSettings()
+
+        # latest-wins-coalescer for canvasMoveEvent
+        self.move_coalescer = tools.MyQtWidgets.LatestEventCoalescer(self.process_canvas_move, parent=self)
+
+        # own snapping-engine for the Reference-Layer, see connect_reference_layer
+        self.ref_snapper = tools.MySnapping.ReferenceSnapper()
+
+        # whole-table integrity-checks, changed features marked by the layer-signals, see connect_data_layer
+        self.integrity_scanner = tools.MyIntegrity.IntegrityScanner()
+
+        # optional edit-session on the Data-Layer, see s_toggle_edit_session
+        self.edit_session = tools.MyEditSession.EditSession(self)
+        self.edit_session.pending_changed.connect(self.dlg_refresh_pending_changes)
+        self.edit_session.committed.connect(self.s_edit_session_committed)
+
         self.restore_settings()
 
         # the order added to canvas determines the drawing-order, latter ones appear on-top
@@ -550,6 +574,13 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         self.my_dialogue.pbtn_update_feature.clicked.connect(self.s_update_feature)
         self.my_dialogue.pbtn_insert_feature.clicked.connect(self.s_insert_feature)
         self.my_dialogue.pbtn_delete_feature.clicked.connect(self.s_delete_feature)
+        # edit-session
+        self.my_dialogue.edit_session_grb.toggled.connect(self.s_edit_session_grb_toggle)
+        self.my_dialogue.cb_edit_session.toggled.connect(self.s_toggle_edit_session)
+        self.my_dialogue.qspb_auto_commit_count.valueChanged.connect(self.s_change_edit_session_thresholds)
+        self.my_dialogue.qspb_auto_commit_seconds.valueChanged.connect(self.s_change_edit_session_thresholds)
+        self.my_dialogue.pbtn_commit_edits.clicked.connect(self.s_commit_edits)
+        self.my_dialogue.pbtn_rollback_edits.clicked.connect(self.s_rollback_edits)
 
 
         # feature-selection-Section
@@ -560,6 +591,10 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         self.my_dialogue.pbtn_insert_selected_data_features.clicked.connect(self.s_append_data_features)
         self.my_dialogue.pbtn_insert_selected_show_features.clicked.connect(self.s_append_show_features)
         self.my_dialogue.pbtn_zoom_to_feature_selection.clicked.connect(self.s_zoom_to_feature_selection)
+        self.my_dialogue.pbtn_bulk_shift.clicked.connect(self.s_bulk_shift)
+        self.my_dialogue.pbtn_bulk_offset.clicked.connect(self.s_bulk_offset)
+        self.my_dialogue.pbtn_bulk_rereference.clicked.connect(self.s_bulk_rereference)
+        self.my_dialogue.pbtn_bulk_delete.clicked.connect(self.s_bulk_delete)
         
 
 
@@ -625,6 +660,13 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
 
 
         self.my_dialogue.layers_and_fields_grb.toggled.connect(self.s_layers_and_fields_grb_toggle)
+        self.my_dialogue.bulk_import_grb.toggled.connect(self.s_bulk_import_grb_toggle)
+        self.my_dialogue.pbtn_import_measure_table.clicked.connect(self.s_import_measure_table)
+        self.my_dialogue.integrity_grb.toggled.connect(self.s_integrity_grb_toggle)
+        self.my_dialogue.pbtn_check_integrity.clicked.connect(functools.partial(self.s_check_integrity, False))
+        self.my_dialogue.pbtn_check_integrity_changes.clicked.connect(functools.partial(self.s_check_integrity, True))
+        self.my_dialogue.overlay_grb.toggled.connect(self.s_overlay_grb_toggle)
+        self.my_dialogue.pbtn_overlay.clicked.connect(self.s_overlay_data_layers)
         self.my_dialogue.style_grb.toggled.connect(self.s_style_grb_toggle)
 
         self.my_dialogue.store_configurations_gb.toggled.connect(self.s_store_configurations_gb_toggle)
@@ -838,6 +880,36 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         else:
             self.my_dialogue.layers_and_fields_grb.setMaximumHeight(20)
 
+    def s_bulk_import_grb_toggle(self, status):
+        """Toggle Group-Box in Dialog
+        :param status: isChecked()-State
+        """
+        # Rev. 2023-08-31
+        if status:
+            self.my_dialogue.bulk_import_grb.setMaximumHeight(16777215)
+        else:
+            self.my_dialogue.bulk_import_grb.setMaximumHeight(20)
+
+    def s_integrity_grb_toggle(self, status):
+        """Toggle Group-Box in Dialog
+        :param status: isChecked()-State
+        """
+        # Rev. 2023-09-01
+        if status:
+            self.my_dialogue.integrity_grb.setMaximumHeight(16777215)
+        else:
+            self.my_dialogue.integrity_grb.setMaximumHeight(20)
+
+    def s_overlay_grb_toggle(self, status):
+        """Toggle Group-Box in Dialog
+        :param status: isChecked()-State
+        """
+        # Rev. 2023-09-05
+        if status:
+            self.my_dialogue.overlay_grb.setMaximumHeight(16777215)
+        else:
+            self.my_dialogue.overlay_grb.setMaximumHeight(20)
+
     def s_selection_grb_toggle(self, status):
         """Toggle Group-Box in Dialog
         :param status: isChecked()-State
@@ -859,6 +931,16 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         else:
             self.my_dialogue.measure_grb.setMaximumHeight(20)
 
+    def s_edit_session_grb_toggle(self, status):
+        """Toggle Group-Box in Dialog
+        :param status: isChecked()-State
+        """
+        # Rev. 2023-09-09
+        if status:
+            self.my_dialogue.edit_session_grb.setMaximumHeight(16777215)
+        else:
+            self.my_dialogue.edit_session_grb.setMaximumHeight(20)
+
     def s_edit_grb_toggle(self, status):
         """Toggle Group-Box in Dialog
         :param status: isChecked()-State
@@ -1004,14 +1086,81 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
             # print(f"Expected exception in {gdp()}: \"{e}\"")
             pass
 
-    def check_data_feature(self,check_pk):
-        """check data-feature: detect Null-Values"""
+    def get_attribute_request(self, vlayer: qgis.core.QgsVectorLayer, with_geometry: bool = False) -> qgis.core.QgsFeatureRequest:
+        """request for read-only queries on Reference-, Data- or Show-Layer with only the fields configured in StoredSettings
+        not for features which are edited and updated, they would loose their unqueried attributes
+        :param vlayer: self.ds.refLyr, self.ds.dataLyr or self.ds.showLyr
+        :param with_geometry: True ➜ query the geometry too, f.e. Reference-features for validation
+        """
+        # Rev. 2023-08-25
+        field_names = []
+        if vlayer == self.ds.refLyr:
+            field_names = [self.ss.refLyrIdFieldName]
+        elif vlayer == self.ds.dataLyr:
+            field_names = [self.ss.dataLyrIdFieldName, self.ss.dataLyrReferenceFieldName, self.ss.dataLyrMeasureFromFieldName, self.ss.dataLyrMeasureToFieldName, self.ss.dataLyrOffsetFieldName]
+        elif vlayer == self.ds.showLyr:
+            field_names = [self.ss.showLyrBackReferenceFieldName]
+        return tools.MyToolFunctions.get_attribute_request(vlayer, field_names, with_geometry)
+
+    def snap_to_reference(self, pos: QtCore.QPoint, ref_fid: int = None) -> tuple:
+        """snaps the canvas-position on the Reference-Layer, replacement for snappingUtils().snapToMap with OneLayerFilter/OneFeatureFilter
+        uses the own segment-index of self.ref_snapper, the QGis-snapping only as fallback while the index is built
+        :param pos: canvas-position from mouse-event
+        :param ref_fid: optional, snap only on this Reference-feature
+        :returns tuple (QgsPointLocator.Match with point in canvas-crs, measure) measure None if no match
+        """
+        # Rev. 2023-08-29
+        canvas_crs = self.iface.mapCanvas().mapSettings().destinationCrs()
+        map_point = self.iface.mapCanvas().getCoordinateTransform().toMapCoordinates(pos.x(), pos.y())
+        if self.ref_snapper.is_ready(self.ds.refLyr.id()):
+            # same tolerance as in the snapping-config, see connect_reference_layer
+            tolerance = qgis.core.QgsTolerance.toleranceInMapUnits(10, self.ds.refLyr, self.iface.mapCanvas().mapSettings(), qgis.core.QgsTolerance.UnitType.Pixels)
+            layer_point = tools.MyTransforms.get_transform(canvas_crs, self.ds.refLyr.crs()).transform(map_point)
+            snap_result = self.ref_snapper.snap(layer_point, tolerance, ref_fid)
+            if snap_result:
+                snapped_ref_fid, snapped_point_xy, measure, distance, side, segment_index = snap_result
+                snapped_point_xy = tools.MyTransforms.get_transform(self.ds.refLyr.crs(), canvas_crs).transform(snapped_point_xy)
+                m = qgis.core.QgsPointLocator.Match(qgis.core.QgsPointLocator.Edge, self.ds.refLyr, snapped_ref_fid, map_point.distance(snapped_point_xy), snapped_point_xy, segment_index - 1)
+                return m, measure
+            return qgis.core.QgsPointLocator.Match(), None
+
+        if ref_fid is None:
+            snap_filter = tools.MyToolFunctions.OneLayerFilter(self.ds.refLyr)
+        else:
+            snap_filter = tools.MyToolFunctions.OneFeatureFilter(self.ds.refLyr, ref_fid)
+        m = self.iface.mapCanvas().snappingUtils().snapToMap(pos, snap_filter)
+        if m.type():
+            ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, m.featureId())
+            if ref_geom:
+                layer_point = tools.MyTransforms.get_transform(canvas_crs, self.ds.refLyr.crs()).transform(m.point())
+                return m, ref_geom.locate_point(layer_point)[0]
+        return m, None
+
+    def get_canvas_ref_geometry(self, ref_fid: int):
+        """cached Reference-geometry with vertices pre-projected to canvas-crs, measures in Reference-Layer-units
+        for the draw-functions, which otherwise would transform each interpolated point or segment on every mouse-move
+        :param ref_fid: FID of reference-line
+        :returns CanvasRefGeometry, the RefGeometry itself if canvas-crs == Reference-Layer-crs, None if not found
+        """
+        # Rev. 2023-08-28
+        ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, ref_fid)
+        if ref_geom:
+            return ref_geom.projected(tools.MyTransforms.get_transform(self.ds.refLyr.crs(), self.iface.mapCanvas().mapSettings().destinationCrs()))
+
+    def check_data_feature(self, check_pk, data_feature: qgis.core.QgsFeature = None, ref_feature: qgis.core.QgsFeature = None):
+        """check data-feature: detect Null-Values
+        :param check_pk:
+        :param data_feature: optional, already queried Data-feature, f.e. from bulk-query in dlg_refresh_feature_selection_section
+        :param ref_feature: optional, already queried Reference-feature
+        """
         # TODO: apply filter on Data-Layer
         warning_msg=''
         if self.cf.data_layer_complete and self.cf.reference_layer_complete:
-            data_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.dataLyr, self.ds.dataLyrIdField, check_pk)
+            if data_feature is None:
+                data_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.dataLyr, self.ds.dataLyrIdField, check_pk, self.get_attribute_request(self.ds.dataLyr))
             if data_feature and data_feature.isValid():
-                ref_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.refLyr, self.ds.refLyrPkField, data_feature[self.ds.dataLyrReferenceField.name()])
+                if ref_feature is None:
+                    ref_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.refLyr, self.ds.refLyrPkField, data_feature[self.ds.dataLyrReferenceField.name()], self.get_attribute_request(self.ds.refLyr, True))
                 if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
                     measure_from = data_feature[self.ds.dataLyrMeasureFromField.name()]
                     measure_to = data_feature[self.ds.dataLyrMeasureToField.name()]
@@ -1048,8 +1197,8 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
 
         if self.check_data_feature(edit_pk):
 
-            data_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk)
-            ref_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.refLyr, self.ds.refLyrPkField, data_feature[self.ds.dataLyrReferenceField.name()])
+            data_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk, self.get_attribute_request(self.ds.dataLyr))
+            ref_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.refLyr, self.ds.refLyrPkField, data_feature[self.ds.dataLyrReferenceField.name()], self.get_attribute_request(self.ds.refLyr))
             measure_from = data_feature[self.ds.dataLyrMeasureFromField.name()]
             measure_to = data_feature[self.ds.dataLyrMeasureToField.name()]
             offset = data_feature[self.ds.dataLyrOffsetField.name()]
@@ -1092,7 +1241,7 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
             self.ds.dataLyr.removeSelection()
             self.ds.dataLyr.select(data_feature.id())
             if self.cf.show_layer_complete:
-                show_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.showLyr, self.ds.showLyrBackReferenceField, edit_pk)
+                show_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.showLyr, self.ds.showLyrBackReferenceField, edit_pk, self.get_attribute_request(self.ds.showLyr))
                 if show_feature and show_feature.isValid():
                     self.ds.showLyr.removeSelection()
                     self.ds.showLyr.select(show_feature.id())
@@ -1104,17 +1253,18 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
 
 
     def s_select_features(self, checked: bool):
-        """toggles tool-mode for selecting features from showLyr
+        """toggles tool-mode for selecting features via the event-index, see get_event_index
         :param checked: status of self.my_dialogue.pbtn_select_features
         """
-        # Rev. 2023-05-08
+        # Rev. 2023-09-03
         self.rb_ref.hide()
         self.rb_segment.hide()
         self.vm_pt_measure_from.hide()
         self.vm_pt_measure_to.hide()
         tool_mode = None
-        if self.cf.reference_layer_complete and self.cf.data_layer_complete and self.cf.show_layer_complete:
-            self.ds.showLyr.removeSelection()
+        if self.cf.reference_layer_complete and self.cf.data_layer_complete:
+            if self.cf.show_layer_complete:
+                self.ds.showLyr.removeSelection()
             if checked or type(self.iface.mapCanvas().mapTool()) != LolEvt:
                 tool_mode = 'select_features'
             else:
@@ -1138,7 +1288,8 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         """Adds all Features to self.rs.selected_pks"""
         # Rev. 2023-05-03
         if self.cf.reference_layer_complete and self.cf.data_layer_complete:
-            self.rs.selected_pks = qgis.core.QgsVectorLayerUtils.getValues(self.ds.dataLyr, self.ds.dataLyrIdField.name(), selectedOnly=False)[0]
+            request = tools.MyToolFunctions.get_attribute_request(self.ds.dataLyr, [self.ss.dataLyrIdFieldName])
+            self.rs.selected_pks = [data_feature[self.ds.dataLyrIdField.name()] for data_feature in self.ds.dataLyr.getFeatures(request)]
             self.check_settings()
             self.dlg_refresh_feature_selection_section()
         else:
@@ -1149,7 +1300,8 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         """Adds current selected Features from dataLyr to self.rs.selected_pks"""
         # Rev. 2023-05-03
         if self.cf.reference_layer_complete and self.cf.data_layer_complete:
-            additional_features = qgis.core.QgsVectorLayerUtils.getValues(self.ds.dataLyr, self.ds.dataLyrIdField.name(), selectedOnly=True)[0]
+            request = tools.MyToolFunctions.get_attribute_request(self.ds.dataLyr, [self.ss.dataLyrIdFieldName])
+            additional_features = [data_feature[self.ds.dataLyrIdField.name()] for data_feature in self.ds.dataLyr.getSelectedFeatures(request)]
             if len(additional_features):
                 if QtWidgets.QApplication.keyboardModifiers() == QtCore.Qt.ShiftModifier:
                     self.rs.selected_pks += additional_features
@@ -1164,78 +1316,244 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
             self.my_dialogue.tbw_central.setCurrentIndex(1)
 
 
-    def s_zoom_to_feature_selection(self):
-        """Zooms canvas to selected Features"""
-        # Rev. 2023-05-08
-        if self.cf.reference_layer_complete and self.cf.data_layer_complete and self.rs.selected_pks.__len__():
-            data_fids = []
-            show_fids = []
-
-            # calculate extent of the selected LoL-Features
-            top = -sys.float_info.max
-            right = -sys.float_info.max
-            left = sys.float_info.max
-            bottom = sys.float_info.max
-
-            for edit_pk in self.rs.selected_pks:
-                data_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk)
-                if data_feature and data_feature.isValid():
-                    ref_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.refLyr, self.ds.refLyrPkField, data_feature[self.ds.dataLyrReferenceField.name()])
-                    if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
+    def get_bulk_editor(self) -> tools.MyBatchTools.SelectionBulkEditor:
+        """SelectionBulkEditor for the current layers"""
+        # Rev. 2023-09-10
+        return tools.MyBatchTools.SelectionBulkEditor(
+            self.ds.refLyr,
+            self.ds.refLyrPkField,
+            self.ds.dataLyr,
+            self.ds.dataLyrIdField,
+            self.ds.dataLyrReferenceField,
+            [self.ds.dataLyrMeasureFromField, self.ds.dataLyrMeasureToField],
+            self.ds.dataLyrOffsetField
+        )
 
-                        measure_from = data_feature[self.ds.dataLyrMeasureFromField.name()]
-                        measure_to = data_feature[self.ds.dataLyrMeasureToField.name()]
-                        offset = data_feature[self.ds.dataLyrOffsetField.name()]
-                        # detect Null-Values
-                        if offset == '' or offset is None or repr(offset) == 'NULL':
-                            offset = 0
+    def check_bulk_edit(self, enabled: bool) -> bool:
+        """pre-check for bulk-operations: Feature-Selection, privileges, no uncommitted edits outside an edit-session
+        :param enabled: privilege-flag, self.cf.update_enabled or self.cf.delete_enabled
+        """
+        # Rev. 2023-09-10
+        if not (self.my_dialogue and self.cf.reference_layer_complete and self.cf.data_layer_complete and self.rs.selected_pks):
+            return False
+        if not enabled:
+            self.push_messages(critical_msg=qt_format(QtCore.QCoreApplication.translate('LolEvt',"Bulk-operation failed, missing privileges in Data-Layer {apos}{0}{apos}..."), self.ds.dataLyr.name()))
+            return False
+        if self.ds.dataLyr.isModified() and not self.edit_session.active:
+            # the bulk-operation commits, uncommitted edits would be committed too
+            self.push_messages(warning_msg=qt_format(QtCore.QCoreApplication.translate('LolEvt',"Layer {apos}{0}{apos} has uncommitted edits, please save or discard..."), self.ds.dataLyr.name()))
+            return False
+        return True
 
-                        segment_geom = tools.MyToolFunctions.get_segment_geom(ref_feature.geometry(), measure_from, measure_to, offset)
-                        if segment_geom:
-                            segment_geom.transform(qgis.core.QgsCoordinateTransform(self.ds.refLyr.crs(), self.iface.mapCanvas().mapSettings().destinationCrs(), qgis.core.QgsProject.instance()))
+    def run_bulk_edit(self, text: str, calc_function):
+        """calculates and writes a bulk-operation on the Feature-Selection in one edit-command with one commit, see tools.MyBatchTools.SelectionBulkEditor
+        progress-dialog with cancel for selections with more than 1000 features
+        :param text: for undo-stack and messages
+        :param calc_function: function(bulk_editor, feedback) ➜ tuple (changes, skipped), f.e. lambda with bulk_editor.shift_changes
+        """
+        # Rev. 2023-09-10
+        critical_msg = ''
+        success_msg = ''
+        info_msg = ''
+        warning_msg = ''
+        bulk_editor = self.get_bulk_editor()
+        feedback = qgis.core.QgsFeedback()
+        progress_dialog = None
+        if len(self.rs.selected_pks) > 1000:
+            progress_dialog = QtWidgets.QProgressDialog(f"LinearReferencing: {text}", QtCore.QCoreApplication.translate('LolEvt',"Cancel"), 0, 100, self.iface.mainWindow())
+            progress_dialog.setWindowModality(QtCore.Qt.WindowModal)
+            progress_dialog.setMinimumDuration(0)
+            # modal QProgressDialog processes the events in setValue, so cancel is possible during the loops
+            feedback.progressChanged.connect(lambda progress: progress_dialog.setValue(int(progress)))
+            progress_dialog.canceled.connect(feedback.cancel)
+
+        QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
+        try:
+            changes, skipped = calc_function(bulk_editor, feedback)
+            if changes is None:
+                info_msg = QtCore.QCoreApplication.translate('LolEvt',"Canceled by user...")
+            elif changes:
+                self.start_data_edit(f"LinearReferencing: {text}")
+                if bulk_editor.apply_changes(changes, feedback):
+                    if self.commit_data_edit():
+                        success_msg = qt_format(QtCore.QCoreApplication.translate('LolEvt',"{0}: {1} features changed in Data-Layer {apos}{2}{apos}..."), text, len(changes), self.ds.dataLyr.name())
+                    else:
+                        self.rollback_data_edit()
+                        critical_msg = str(self.ds.dataLyr.commitErrors())
+                else:
+                    self.rollback_data_edit()
+                    if feedback.isCanceled():
+                        info_msg = QtCore.QCoreApplication.translate('LolEvt',"Canceled by user...")
+                    else:
+                        critical_msg = qt_format(QtCore.QCoreApplication.translate('LolEvt',"{0} failed in Data-Layer {apos}{1}{apos}, edits rolled back..."), text, self.ds.dataLyr.name())
+            if skipped:
+                warning_msg = qt_format(QtCore.QCoreApplication.translate('LolEvt',"{0}: {1} features skipped, missing Reference-line or measure..."), text, len(skipped))
+        except Exception as err:
+            self.rollback_data_edit()
+            critical_msg = f"Exception '{err.__class__.__name__}' in {gdp()}: {err}"
+        finally:
+            QtWidgets.QApplication.restoreOverrideCursor()
+            if progress_dialog:
+                progress_dialog.close()
 
-                            extent = segment_geom.boundingBox()
-                            left = min(left, extent.xMinimum())
-                            bottom = min(bottom, extent.yMinimum())
-                            right = max(right, extent.xMaximum())
-                            top = max(top, extent.yMaximum())
+        if success_msg:
+            self.dlg_refresh_feature_selection_section()
+            if self.rs.edit_pk in self.rs.selected_pks:
+                self.set_edit_pk(self.rs.edit_pk, False)
+            if not self.edit_session.active:
+                self.refresh_show_layer()
 
+        self.push_messages(success_msg, info_msg, warning_msg, critical_msg)
 
-                            data_fids.append(data_feature.id())
+    def s_bulk_shift(self):
+        """shifts the measures of all selected features, truncated to the Reference-line-lengths"""
+        # Rev. 2023-09-10
+        if self.check_bulk_edit(self.cf.update_enabled):
+            delta, ok = QtWidgets.QInputDialog.getDouble(None, f"LinearReferencing ({gdp()})", qt_format(QtCore.QCoreApplication.translate('LolEvt',"Shift measures of {0} selected features by:"), len(self.rs.selected_pks)), 0, -1000000000, 1000000000, self.rs.num_digits)
+            if ok and delta:
+                self.run_bulk_edit("bulk shift", lambda bulk_editor, feedback: bulk_editor.shift_changes(self.rs.selected_pks, delta, feedback))
+            elif not ok:
+                self.push_messages(info_msg=QtCore.QCoreApplication.translate('LolEvt',"Canceled by user..."))
+
+    def s_bulk_offset(self):
+        """sets or scales the offsets of all selected features"""
+        # Rev. 2023-09-10
+        if self.check_bulk_edit(self.cf.update_enabled) and self.ds.dataLyrOffsetField is not None:
+            modes = [QtCore.QCoreApplication.translate('LolEvt',"Set offset"), QtCore.QCoreApplication.translate('LolEvt',"Scale offset")]
+            mode, ok = QtWidgets.QInputDialog.getItem(None, f"LinearReferencing ({gdp()})", QtCore.QCoreApplication.translate('LolEvt',"Offset of the selected features:"), modes, 0, False)
+            if ok:
+                scale = mode == modes[1]
+                if scale:
+                    value, ok = QtWidgets.QInputDialog.getDouble(None, f"LinearReferencing ({gdp()})", QtCore.QCoreApplication.translate('LolEvt',"Factor:"), 1, -1000, 1000, 3)
+                else:
+                    value, ok = QtWidgets.QInputDialog.getDouble(None, f"LinearReferencing ({gdp()})", QtCore.QCoreApplication.translate('LolEvt',"Offset:"), 0, -1000000, 1000000, self.rs.num_digits)
+            if ok:
+                self.run_bulk_edit("bulk offset", lambda bulk_editor, feedback: bulk_editor.offset_changes(self.rs.selected_pks, value, scale, feedback))
+            else:
+                self.push_messages(info_msg=QtCore.QCoreApplication.translate('LolEvt',"Canceled by user..."))
 
-                        if self.cf.show_layer_complete:
-                            show_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.showLyr, self.ds.showLyrBackReferenceField, edit_pk)
-                            if show_feature and show_feature.isValid():
-                                show_fids.append(show_feature.id())
+    def s_bulk_rereference(self):
+        """assigns all selected features to another Reference-line, measures proportional to the line-lengths"""
+        # Rev. 2023-09-10
+        if self.check_bulk_edit(self.cf.update_enabled):
+            default_ref_id = ''
+            if self.rs.snapped_ref_fid is not None:
+                snapped_ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
+                if snapped_ref_feature.isValid():
+                    default_ref_id = str(snapped_ref_feature[self.ds.refLyrPkField.name()])
+            ref_id_text, ok = QtWidgets.QInputDialog.getText(None, f"LinearReferencing ({gdp()})", qt_format(QtCore.QCoreApplication.translate('LolEvt',"Assign {0} selected features to Reference-ID:"), len(self.rs.selected_pks)), QtWidgets.QLineEdit.Normal, default_ref_id)
+            if ok and ref_id_text:
+                try:
+                    new_ref_id = self.ds.refLyrPkField.convertCompatible(ref_id_text)
+                except ValueError:
+                    new_ref_id = None
+                if new_ref_id is None or not self.get_bulk_editor().get_reference_lengths([new_ref_id]):
+                    self.push_messages(warning_msg=qt_format(QtCore.QCoreApplication.translate('LolEvt',"No feature with ID {apos}{0}{apos} and valid geometry in Reference-Layer {apos}{1}{apos}..."), ref_id_text, self.ds.refLyr.name()))
+                else:
+                    self.run_bulk_edit("bulk re-reference", lambda bulk_editor, feedback: bulk_editor.rereference_changes(self.rs.selected_pks, new_ref_id, feedback))
+            else:
+                self.push_messages(info_msg=QtCore.QCoreApplication.translate('LolEvt',"Canceled by user..."))
 
+    def s_bulk_delete(self):
+        """deletes all selected features after confirmation, one deleteFeatures and one commit"""
+        # Rev. 2023-09-10
+        critical_msg = ''
+        success_msg = ''
+        info_msg = ''
+        warning_msg = ''
+        if self.check_bulk_edit(self.cf.delete_enabled):
+            dialog_result = QtWidgets.QMessageBox.question(
+                None,
+                f"LinearReferencing ({gdp()})",
+                qt_format(QtCore.QCoreApplication.translate('LolEvt',"Delete {0} selected features from Data-Layer {apos}{1}{apos}?"), len(self.rs.selected_pks), self.ds.dataLyr.name()),
+                buttons=QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.Cancel,
+                defaultButton=QtWidgets.QMessageBox.Cancel
+            )
+            if dialog_result == QtWidgets.QMessageBox.Yes:
+                QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
+                try:
+                    delete_fids = self.get_bulk_editor().get_fids(self.rs.selected_pks)
+                    self.start_data_edit("LinearReferencing: bulk delete")
+                    if self.ds.dataLyr.deleteFeatures(delete_fids) and self.commit_data_edit():
+                        success_msg = qt_format(QtCore.QCoreApplication.translate('LolEvt',"{0} features deleted in Data-Layer {apos}{1}{apos}..."), len(delete_fids), self.ds.dataLyr.name())
+                        if self.rs.edit_pk in self.rs.selected_pks:
+                            self.rs.edit_pk = None
+                        self.rs.selected_pks = []
+                    else:
+                        self.rollback_data_edit()
+                        critical_msg = str(self.ds.dataLyr.commitErrors())
+                except Exception as err:
+                    self.rollback_data_edit()
+                    critical_msg = f"Exception '{err.__class__.__name__}' in {gdp()}: {err}"
+                finally:
+                    QtWidgets.QApplication.restoreOverrideCursor()
+
+                if success_msg:
+                    self.dlg_refresh_feature_selection_section()
+                    self.dlg_refresh_edit_section()
+                    if not self.edit_session.active:
+                        self.refresh_show_layer(False)
+            else:
+                info_msg = QtCore.QCoreApplication.translate('LolEvt',"Canceled by user...")
+
+        self.push_messages(success_msg, info_msg, warning_msg, critical_msg)
+
+    def s_zoom_to_feature_selection(self):
+        """Zooms canvas to selected Features, extent of the calculated LoL-segments from the event-index, see get_event_index"""
+        # Rev. 2023-09-03
+        event_index = self.get_event_index()
+        if event_index and self.rs.selected_pks.__len__():
+            entries = event_index.get_entries_by_pks(self.rs.selected_pks)
             self.ds.dataLyr.removeSelection()
-            self.ds.dataLyr.selectByIds(data_fids)
+            self.ds.dataLyr.selectByIds(list(entries.keys()))
 
             if self.cf.show_layer_complete:
+                show_features = tools.MyLayerCaches.get_features_by_pks(self.ds.showLyr, self.ds.showLyrBackReferenceField, self.rs.selected_pks, self.get_attribute_request(self.ds.showLyr))
                 self.ds.showLyr.removeSelection()
-                self.ds.showLyr.selectByIds(show_fids)
-                #self.iface.mapCanvas().zoomToSelected(self.ds.showLyr)
+                self.ds.showLyr.selectByIds([show_feature.id() for show_feature in show_features.values() if show_feature.isValid()])
 
-            # zoomToSelected without layer:
-            if left < right or bottom < top:
-                # valuable extent ➜ zoom
-                extent = qgis.core.QgsRectangle(left, bottom, right, top)
-                self.iface.mapCanvas().setExtent(extent)
-                self.iface.mapCanvas().zoomByFactor(1.1)
-            elif left == right and bottom == top:
-                # theoretical: feature(s) with single point ➜ pan
-                center_point = qgis.core.QgsPointXY(left,bottom)
-                self.iface.mapCanvas().setCenter(center_point)
-            else:
-                # no feature or no point calculable, left/top/right/bottom as initialized with +- sys.float_info.max
+            extent = event_index.extent(self.rs.selected_pks)
+            if extent is None:
                 self.push_messages(warning_msg=QtCore.QCoreApplication.translate('LolEvt',"no extent calculable for these features"))
+            else:
+                # zoomToSelected without layer:
+                extent = tools.MyTransforms.get_transform(self.ds.refLyr.crs(), self.iface.mapCanvas().mapSettings().destinationCrs()).transformBoundingBox(extent)
+                if extent.width() > 0 or extent.height() > 0:
+                    # valuable extent ➜ zoom
+                    self.iface.mapCanvas().setExtent(extent)
+                    self.iface.mapCanvas().zoomByFactor(1.1)
+                else:
+                    # theoretical: feature(s) with single point ➜ pan
+                    self.iface.mapCanvas().setCenter(extent.center())
+
+    def identify_event(self, pos: QtCore.QPoint):
+        """hover-identify in tool_mode 'select_features': tooltip with the display-value of the nearest LoL-feature, queried from the event-index
+        :param pos: canvas-pixel-position
+        """
+        # Rev. 2023-09-03
+        event_index = self.get_event_index()
+        if event_index:
+            point_xy = self.iface.mapCanvas().getCoordinateTransform().toMapCoordinates(pos.x(), pos.y())
+            point_xy = tools.MyTransforms.get_transform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.refLyr.crs()).transform(point_xy)
+            tolerance = qgis.core.QgsTolerance.toleranceInMapUnits(10, self.ds.refLyr, self.iface.mapCanvas().mapSettings(), qgis.core.QgsTolerance.Pixels)
+            nearest = event_index.nearest(point_xy, tolerance)
+            if nearest:
+                data_fid, data_pk, distance = nearest
+                display_value = tools.MyLayerCaches.get_display_values(self.ds.dataLyr, [data_fid]).get(data_fid)
+                tool_tip = f"{self.ds.dataLyrIdField.name()}: {data_pk}"
+                if display_value is not None and str(display_value) != str(data_pk):
+                    tool_tip += f"\n{display_value}"
+                QtWidgets.QToolTip.showText(self.iface.mapCanvas().mapToGlobal(pos), tool_tip, self.iface.mapCanvas())
+            else:
+                QtWidgets.QToolTip.hideText()
 
     def s_append_show_features(self):
         """Adds current selected Features from showLyr to self.rs.selected_pks"""
         # Rev. 2023-05-03
         if self.cf.reference_layer_complete and self.cf.data_layer_complete and self.cf.show_layer_complete:
 
-            additional_features = qgis.core.QgsVectorLayerUtils.getValues(self.ds.showLyr, self.ds.showLyrBackReferenceField.name(), selectedOnly=True)[0]
+            request = tools.MyToolFunctions.get_attribute_request(self.ds.showLyr, [self.ss.showLyrBackReferenceFieldName])
+            additional_features = [show_feature[self.ds.showLyrBackReferenceField.name()] for show_feature in self.ds.showLyr.getSelectedFeatures(request)]
             if len(additional_features):
                 if QtWidgets.QApplication.keyboardModifiers() == QtCore.Qt.ShiftModifier:
                     self.rs.selected_pks +=additional_features
@@ -1250,9 +1568,126 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
             self.push_messages(warning_msg=QtCore.QCoreApplication.translate('LolEvt',"Missing requirements, Reference-, Data- and Show-Layer required, check Line-on-Line-settings..."))
             self.my_dialogue.tbw_central.setCurrentIndex(1)
 
+    def start_data_edit(self, text: str):
+        """sets the Data-Layer editable for one edit, in edit-session-mode as edit-command, see tools.MyEditSession
+        :param text: text for the undo-stack
+        """
+        # Rev. 2023-09-09
+        self.ds.dataLyr.startEditing()
+        self.edit_session.begin_edit(text)
+
+    def commit_data_edit(self) -> bool:
+        """commits the edit, in edit-session-mode only the edit-command is closed and the commit deferred
+        :returns commit-result, always True in edit-session-mode, errors of auto-commits see s_edit_session_committed
+        """
+        # Rev. 2023-09-09
+        if self.edit_session.active:
+            self.edit_session.end_edit()
+            return True
+        return self.ds.dataLyr.commitChanges()
+
+    def rollback_data_edit(self):
+        """discards the edit, in edit-session-mode only this edit, the other pending changes remain"""
+        # Rev. 2023-09-09
+        if self.edit_session.active:
+            self.edit_session.discard_edit()
+        else:
+            self.ds.dataLyr.rollBack()
+
+    def s_toggle_edit_session(self, checked: bool):
+        """starts or ends the edit-session on the Data-Layer
+        :param checked: checked-status of cb_edit_session
+        """
+        # Rev. 2023-09-09
+        critical_msg = ''
+        success_msg = ''
+        info_msg = ''
+        warning_msg = ''
+        if checked:
+            if self.cf.data_layer_complete and self.edit_session.start(self.ds.dataLyr, self.my_dialogue.qspb_auto_commit_count.value(), self.my_dialogue.qspb_auto_commit_seconds.value()):
+                info_msg = qt_format(QtCore.QCoreApplication.translate('LolEvt',"Edit-session on {apos}{0}{apos} started, edits are collected until Save..."), self.ds.dataLyr.name())
+            else:
+                critical_msg = QtCore.QCoreApplication.translate('LolEvt',"Edit-session not started, Data-Layer missing or not editable...")
+        elif self.edit_session.active:
+            data_lyr = self.edit_session.layer
+            save_changes = True
+            if self.edit_session.pending_count():
+                dialog_result = QtWidgets.QMessageBox.question(
+                    None,
+                    f"LinearReferencing ({gdp()})",
+                    qt_format(QtCore.QCoreApplication.translate('LolEvt',"End edit-session: save {0} pending changes in {apos}{1}{apos}?"), self.edit_session.pending_count(), data_lyr.name()),
+                    buttons=QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
+                    defaultButton=QtWidgets.QMessageBox.Yes
+                )
+                save_changes = dialog_result == QtWidgets.QMessageBox.Yes
+            self.edit_session.stop()
+            if save_changes:
+                if data_lyr.commitChanges():
+                    success_msg = QtCore.QCoreApplication.translate('LolEvt',"Edit-session ended, changes saved...")
+                else:
+                    critical_msg = str(data_lyr.commitErrors())
+            else:
+                data_lyr.rollBack()
+                info_msg = QtCore.QCoreApplication.translate('LolEvt',"Edit-session ended, changes discarded...")
+            self.refresh_show_layer()
+
+        self.dlg_refresh_pending_changes(self.edit_session.pending_count())
+        self.push_messages(success_msg, info_msg, warning_msg, critical_msg)
+
+    def s_change_edit_session_thresholds(self, *args):
+        """applies the auto-commit-thresholds from dialog"""
+        # Rev. 2023-09-09
+        self.edit_session.set_thresholds(self.my_dialogue.qspb_auto_commit_count.value(), self.my_dialogue.qspb_auto_commit_seconds.value())
+
+    def s_commit_edits(self):
+        """explicit commit of the edit-session, result see s_edit_session_committed"""
+        # Rev. 2023-09-09
+        self.edit_session.commit()
+
+    def s_rollback_edits(self):
+        """discards all pending changes of the edit-session after confirmation"""
+        # Rev. 2023-09-09
+        if self.edit_session.active and self.edit_session.pending_count():
+            dialog_result = QtWidgets.QMessageBox.question(
+                None,
+                f"LinearReferencing ({gdp()})",
+                qt_format(QtCore.QCoreApplication.translate('LolEvt',"Discard {0} pending changes in {apos}{1}{apos}?"), self.edit_session.pending_count(), self.edit_session.layer.name()),
+                buttons=QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.Cancel,
+                defaultButton=QtWidgets.QMessageBox.Cancel
+            )
+            if dialog_result == QtWidgets.QMessageBox.Yes:
+                self.edit_session.rollback()
+                self.dlg_refresh_edit_section()
+                self.refresh_show_layer()
+                self.push_messages(info_msg=QtCore.QCoreApplication.translate('LolEvt',"Pending changes discarded..."))
+
+    def s_edit_session_committed(self, errors: list):
+        """slot for EditSession.committed, explicit or auto-commit
+        :param errors: commit-errors, empty on success
+        """
+        # Rev. 2023-09-09
+        if errors:
+            self.push_messages(critical_msg=qt_format(QtCore.QCoreApplication.translate('LolEvt',"Commit failed, changes kept in edit-buffer:{br}{0}"), '{br}'.join(errors)))
+        else:
+            self.refresh_show_layer()
+            self.push_messages(success_msg=QtCore.QCoreApplication.translate('LolEvt',"Pending changes saved..."))
+
+    def dlg_refresh_pending_changes(self, pending_count: int):
+        """refreshes the edit-session-widgets in dialog, slot for EditSession.pending_changed
+        :param pending_count:
+        """
+        # Rev. 2023-09-09
+        if self.my_dialogue:
+            self.my_dialogue.cb_edit_session.blockSignals(True)
+            self.my_dialogue.cb_edit_session.setChecked(self.edit_session.active)
+            self.my_dialogue.cb_edit_session.blockSignals(False)
+            self.my_dialogue.le_pending_changes.setText(str(pending_count) if self.edit_session.active else '')
+            self.my_dialogue.pbtn_commit_edits.setEnabled(self.edit_session.active and pending_count > 0)
+            self.my_dialogue.pbtn_rollback_edits.setEnabled(self.edit_session.active and pending_count > 0)
+
     def s_update_feature(self):
         """Show feature-form for edit and save segment to Data-Layer"""
-        # Rev. 2023-04-27
+        # Rev. 2023-09-09
         try_it = True
         did_it = False
         critical_msg = ''
@@ -1263,7 +1698,7 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         if self.cf.update_enabled:
 
             # get current edit-values from runtime-settings, not from dialogue-widgets
-            data_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.dataLyr, self.ds.dataLyrIdField, self.rs.edit_pk)
+            data_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.dataLyr, self.ds.dataLyrIdField, self.rs.edit_pk)
             ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
             if data_feature and data_feature.isValid() and ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
                 num_digits = 2
@@ -1279,7 +1714,7 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
                 data_feature[self.ds.dataLyrMeasureToField.name()] = measure_to
                 data_feature[self.ds.dataLyrOffsetField.name()] = offset
 
-                if self.ds.dataLyr.isEditable():
+                if self.ds.dataLyr.isEditable() and not self.edit_session.active:
                     if self.ds.dataLyr.isModified():
                         dialog_result = QtWidgets.QMessageBox.question(
                             self.my_dialogue,
@@ -1301,13 +1736,13 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
 
                 if try_it:
                     try:
-                        self.ds.dataLyr.startEditing()
+                        self.start_data_edit("LinearReferencing: update feature")
                         dlg_result = self.iface.openFeatureForm(self.ds.dataLyr, data_feature)
                         if dlg_result:
                             update_ref_pk = data_feature[self.ds.dataLyrReferenceField.name()]
                             update_measure_from = data_feature[self.ds.dataLyrMeasureFromField.name()]
                             update_measure_to = data_feature[self.ds.dataLyrMeasureToField.name()]
-                            update_ref_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.refLyr, self.ds.refLyrPkField, update_ref_pk)
+                            update_ref_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.refLyr, self.ds.refLyrPkField, update_ref_pk)
                             # User could have changed feature-data in dialog (PK, reference-id, measure)
                             # ➜ validity-check like "reference-id exists in refLyr?" "measure 0 ...referenced_line_length?"
                             if update_ref_feature and update_ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
@@ -1323,23 +1758,23 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
 
                                 self.ds.dataLyr.updateFeature(data_feature)
 
-                                commit_result = self.ds.dataLyr.commitChanges()
+                                commit_result = self.commit_data_edit()
                                 if commit_result:
                                     did_it = True
                                     success_msg = qt_format(QtCore.QCoreApplication.translate('LolEvt',"Feature with ID {apos}{0}{apos} successfully updated in {apos}{1}{apos}..."),self.rs.edit_pk, self.ds.dataLyr.name())
                                 else:
-                                    self.ds.dataLyr.rollBack()
+                                    self.rollback_data_edit()
                                     critical_msg = str(self.ds.dataLyr.commitErrors())
 
                             else:
-                                self.ds.dataLyr.rollBack()
+                                self.rollback_data_edit()
                                 critical_msg = qt_format(QtCore.QCoreApplication.translate('LolEvt',"Update feature failed, no feature with PK {apos}{0}{apos} in Reference-Layer {apos}{1}{apos} ..."),update_ref_pk,self.ds.refLyr.name())
                         else:
-                            self.ds.dataLyr.rollBack()
+                            self.rollback_data_edit()
                             info_msg = QtCore.QCoreApplication.translate('LolEvt',"Canceled by user...")
 
                     except Exception as err:
-                        self.ds.dataLyr.rollBack()
+                        self.rollback_data_edit()
                         critical_msg = f"Exception {apos}{err.__class__.__name__}{apos} in {gdp()}: {err}"
             else:
                 critical_msg = qt_format(QtCore.QCoreApplication.translate('LolEvt',"Update feature failed, no feature {apos}{0}{apos} in Data-layer {apos}{1}{apos} or {apos}{2}{apos} in Reference-Layer {apos}{3}{apos} ..."),self.rs.edit_pk,self.ds.dataLyr.name(),self.rs.snapped_ref_fid,self.ds.refLyr.name())
@@ -1347,12 +1782,8 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
             critical_msg = qt_format(QtCore.QCoreApplication.translate('LolEvt',"Update feature failed, missing privileges in layer {apos}{0}{apos}..."),self.ds.dataLyr.name())
 
         if did_it:
-            if self.cf.show_layer_complete:
-                self.ds.showLyr.updateExtents()
-                if self.iface.mapCanvas().isCachingEnabled():
-                    self.ds.showLyr.triggerRepaint()
-                else:
-                    self.iface.mapCanvas().refresh()
+            if not self.edit_session.active:
+                self.refresh_show_layer()
             self.set_edit_pk(self.rs.edit_pk, False)
 
         self.push_messages(success_msg,info_msg,warning_msg,critical_msg)
@@ -1363,16 +1794,16 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         if self.cf.reference_layer_defined:
             ref_fid = self.my_dialogue.qcbn_snapped_ref_fid.currentData()
             if ref_fid is not None:
-                ref_feature = self.ds.refLyr.getFeature(ref_fid)
-                if ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
-                    extent = ref_feature.geometry().boundingBox()
+                ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, ref_fid)
+                if ref_geom:
+                    extent = ref_geom.geometry.boundingBox()
                     source_crs = self.ds.refLyr.crs()
                     target_crs = self.iface.mapCanvas().mapSettings().destinationCrs()
-                    tr = qgis.core.QgsCoordinateTransform(source_crs, target_crs, qgis.core.QgsProject.instance())
+                    tr = tools.MyTransforms.get_transform(source_crs, target_crs)
                     extent = tr.transformBoundingBox(extent)
                     self.iface.mapCanvas().setExtent(extent)
                     self.iface.mapCanvas().zoomByFactor(1.1)
-                    self.rb_ref.setToGeometry(ref_feature.geometry(), self.ds.refLyr)
+                    self.rb_ref.setToGeometry(ref_geom.geometry, self.ds.refLyr)
                     self.rb_ref.show()
                 else:
                     self.push_messages(warning_msg = qt_format(QtCore.QCoreApplication.translate('LolEvt',"No valid feature with fid {apos}{0}{apos} in Reference-Layer"),ref_fid))
@@ -1475,9 +1906,9 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         :param measure_from:"""
         # Rev. 2023-05-08
         if self.cf.measure_completed:
-            ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
-            if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
-                self.rs.current_measure_from = min(max(0, measure_from), ref_feature.geometry().length())
+            ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, self.rs.snapped_ref_fid)
+            if ref_geom:
+                self.rs.current_measure_from = min(max(0, measure_from), ref_geom.length)
                 self.draw_segment(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to, self.rs.current_offset)
                 self.draw_from_point(self.rs.snapped_ref_fid, self.rs.current_measure_from)
                 self.dlg_refresh_measure_from(self.rs.snapped_ref_fid, self.rs.current_measure_from)
@@ -1489,10 +1920,10 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         """
         # Rev. 2023-05-08
         if self.cf.measure_completed:
-            ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
-            if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
+            ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, self.rs.snapped_ref_fid)
+            if ref_geom:
                 measure_fract_from = min(max(0, measure_fract_from), 1)
-                self.rs.current_measure_from = measure_fract_from * ref_feature.geometry().length()
+                self.rs.current_measure_from = measure_fract_from * ref_geom.length
                 self.draw_segment(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to, self.rs.current_offset)
                 self.draw_from_point(self.rs.snapped_ref_fid, self.rs.current_measure_from)
                 self.draw_to_point(self.rs.snapped_ref_fid, self.rs.current_measure_to)
@@ -1505,10 +1936,10 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         """
         # Rev. 2023-05-08
         if self.cf.measure_completed:
-            ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
-            if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
+            ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, self.rs.snapped_ref_fid)
+            if ref_geom:
                 measure_fract_to = min(max(0, measure_fract_to), 1)
-                self.rs.current_measure_to = measure_fract_to * ref_feature.geometry().length()
+                self.rs.current_measure_to = measure_fract_to * ref_geom.length
                 self.draw_segment(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to, self.rs.current_offset)
                 self.draw_from_point(self.rs.snapped_ref_fid, self.rs.current_measure_from)
                 self.draw_to_point(self.rs.snapped_ref_fid, self.rs.current_measure_to)
@@ -1525,9 +1956,9 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         """moves current segment to end of reference-line"""
         # Rev. 2023-05-08
         if self.cf.measure_completed:
-            ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
-            if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
-                delta = min((ref_feature.geometry().length() - self.rs.current_measure_from), (ref_feature.geometry().length() - self.rs.current_measure_to))
+            ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, self.rs.snapped_ref_fid)
+            if ref_geom:
+                delta = min((ref_geom.length - self.rs.current_measure_from), (ref_geom.length - self.rs.current_measure_to))
 
                 self.rs.current_measure_from += delta
                 self.rs.current_measure_to += delta
@@ -1545,8 +1976,8 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
             self.rs.current_measure_from -= delta
             self.rs.current_measure_to -= delta
 
-            ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
-            if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
+            ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, self.rs.snapped_ref_fid)
+            if ref_geom:
                 self.draw_segment(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to, self.rs.current_offset)
                 self.draw_from_point(self.rs.snapped_ref_fid, self.rs.current_measure_from)
                 self.draw_to_point(self.rs.snapped_ref_fid, self.rs.current_measure_to)
@@ -1558,8 +1989,8 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         """prepends current segment in direction of start of reference-line"""
         # Rev. 2023-05-08
         if self.cf.measure_completed:
-            ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
-            if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
+            ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, self.rs.snapped_ref_fid)
+            if ref_geom:
                 m_from = min(self.rs.current_measure_from, self.rs.current_measure_to)
                 m_to = max(self.rs.current_measure_from, self.rs.current_measure_to)
                 dist = m_to - m_from
@@ -1584,15 +2015,15 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         """appends current segment in direction of end of reference-line"""
         # Rev. 2023-05-08
         if self.cf.measure_completed:
-            ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
-            if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
+            ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, self.rs.snapped_ref_fid)
+            if ref_geom:
                 m_from = min(self.rs.current_measure_from,self.rs.current_measure_to)
                 m_to = max(self.rs.current_measure_from, self.rs.current_measure_to)
                 dist = m_to - m_from
                 new_from = m_from + dist
                 new_to = m_to + dist
-                if new_to > ref_feature.geometry().length():
-                    new_to = ref_feature.geometry().length()
+                if new_to > ref_geom.length:
+                    new_to = ref_geom.length
                     #new_from = new_to - dist
 
 
@@ -1623,11 +2054,11 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
             elif QtWidgets.QApplication.keyboardModifiers() == (QtCore.Qt.ShiftModifier | QtCore.Qt.ControlModifier):
                 delta *= 1000
 
-            ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
+            ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, self.rs.snapped_ref_fid)
 
-            if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
+            if ref_geom:
                 # not further then line-end
-                delta = min((ref_feature.geometry().length() - self.rs.current_measure_from), (ref_feature.geometry().length() - self.rs.current_measure_to), delta)
+                delta = min((ref_geom.length - self.rs.current_measure_from), (ref_geom.length - self.rs.current_measure_to), delta)
 
                 self.rs.current_measure_from += delta
                 self.rs.current_measure_to += delta
@@ -1680,9 +2111,9 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         :param measure_to:"""
         # Rev. 2023-05-08
         if self.cf.measure_completed:
-            ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
-            if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
-                self.rs.current_measure_to = min(max(0, measure_to), ref_feature.geometry().length())
+            ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, self.rs.snapped_ref_fid)
+            if ref_geom:
+                self.rs.current_measure_to = min(max(0, measure_to), ref_geom.length)
                 self.draw_segment(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to, self.rs.current_offset)
                 self.draw_to_point(self.rs.snapped_ref_fid, self.rs.current_measure_to)
                 self.dlg_refresh_measure_to(self.rs.snapped_ref_fid, self.rs.current_measure_to)
@@ -1693,12 +2124,12 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         :param distance:"""
         # Rev. 2023-05-08
         if self.cf.measure_completed:
-            ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
-            if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
+            ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, self.rs.snapped_ref_fid)
+            if ref_geom:
                 old_distance = self.rs.current_measure_to - self.rs.current_measure_from
                 delta_distance = distance - old_distance
                 self.rs.current_measure_to += delta_distance
-                self.rs.current_measure_to = min(ref_feature.geometry().length(), max(0, self.rs.current_measure_to))
+                self.rs.current_measure_to = min(ref_geom.length, max(0, self.rs.current_measure_to))
 
                 self.draw_segment(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to, self.rs.current_offset)
                 self.draw_to_point(self.rs.snapped_ref_fid, self.rs.current_measure_to)
@@ -1714,18 +2145,18 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         :param offset: offset of line-segment
         """
         # Rev. 2023-05-08
-        ref_feature = self.ds.refLyr.getFeature(ref_fid)
-        if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
-            segment_geom = tools.MyToolFunctions.get_segment_geom(ref_feature.geometry(), measure_from, measure_to, offset)
+        ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, ref_fid)
+        if ref_geom:
+            segment_geom = tools.MyToolFunctions.get_segment_geom(ref_geom, measure_from, measure_to, offset)
             if segment_geom:
                 extent = segment_geom.boundingBox()
                 source_crs = self.ds.refLyr.crs()
                 target_crs = self.iface.mapCanvas().mapSettings().destinationCrs()
-                tr = qgis.core.QgsCoordinateTransform(source_crs, target_crs, qgis.core.QgsProject.instance())
+                tr = tools.MyTransforms.get_transform(source_crs, target_crs)
                 extent = tr.transformBoundingBox(extent)
                 self.iface.mapCanvas().setExtent(extent)
                 self.iface.mapCanvas().zoomByFactor(1.1)
-                #self.rb_ref.setToGeometry(ref_feature.geometry(), self.ds.refLyr)
+                #self.rb_ref.setToGeometry(ref_geom.geometry, self.ds.refLyr)
                 #self.rb_ref.show()
         else:
             self.push_messages(warning_msg = qt_format(QtCore.QCoreApplication.translate('LolEvt',"Reference-feature without geometry (Reference-Layer {apos}{0}{apos}, field {apos}{1}{apos}, value {apos}{2}{apos})"),self.ds.refLyr.name(),self.ds.dataLyrReferenceField.name(),data_feature[self.ds.dataLyrReferenceField.name()]))
@@ -1739,26 +2170,35 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         :param measure_to: distance of segment-end-point to start of referenced line
         :param offset: offset of line-segment
         """
-        # Rev. 2023-05-08
-        ref_feature = self.ds.refLyr.getFeature(ref_fid)
-        if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
-            segment_geom = tools.MyToolFunctions.get_segment_geom(ref_feature.geometry(), measure_from, measure_to, offset)
-            if segment_geom:
-                self.rb_segment.setToGeometry(segment_geom, self.ds.refLyr)
-                self.rb_segment.show()
+        # Rev. 2023-08-28
+        if offset:
+            # offset is in Reference-Layer-units, so offsetCurve must be calculated on the untransformed geometry
+            ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, ref_fid)
+            if ref_geom:
+                segment_geom = tools.MyToolFunctions.get_segment_geom(ref_geom, measure_from, measure_to, offset)
+                if segment_geom:
+                    self.rb_segment.setToGeometry(segment_geom, self.ds.refLyr)
+                    self.rb_segment.show()
+        else:
+            canvas_ref_geom = self.get_canvas_ref_geometry(ref_fid)
+            if canvas_ref_geom:
+                segment_geom = tools.MyToolFunctions.get_segment_geom(canvas_ref_geom, measure_from, measure_to)
+                if segment_geom:
+                    # already in canvas-crs
+                    self.rb_segment.setToGeometry(segment_geom, None)
+                    self.rb_segment.show()
 
     def draw_from_point(self, ref_fid:int, measure:float):
         """positions and shows vm_pt_measure_from on canvas
         :param ref_fid: ID of feature in Reference-Layer
         :param measure: distance to start of linestring_geom
         """
-        # Rev. 2023-05-08
+        # Rev. 2023-08-28
         self.vm_pt_measure_from.hide()
-        ref_feature = self.ds.refLyr.getFeature(ref_fid)
-        if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
-            point_geom = ref_feature.geometry().interpolate(measure)
+        canvas_ref_geom = self.get_canvas_ref_geometry(ref_fid)
+        if canvas_ref_geom:
+            point_geom = canvas_ref_geom.interpolate(measure)
             if point_geom:
-                point_geom.transform(qgis.core.QgsCoordinateTransform(self.ds.refLyr.crs(), self.iface.mapCanvas().mapSettings().destinationCrs(), qgis.core.QgsProject.instance()))
                 self.vm_pt_measure_from.setCenter(point_geom.asPoint())
                 self.vm_pt_measure_from.show()
 
@@ -1767,27 +2207,49 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         :param ref_fid: ID of feature in Reference-Layer
         :param measure: distance to start of linestring_geom
         """
-        # Rev. 2023-05-08
+        # Rev. 2023-08-28
         self.vm_pt_measure_to.hide()
-        ref_feature = self.ds.refLyr.getFeature(ref_fid)
-        if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
-            point_geom = ref_feature.geometry().interpolate(measure)
+        canvas_ref_geom = self.get_canvas_ref_geometry(ref_fid)
+        if canvas_ref_geom:
+            point_geom = canvas_ref_geom.interpolate(measure)
             if point_geom:
-                point_geom.transform(qgis.core.QgsCoordinateTransform(self.ds.refLyr.crs(), self.iface.mapCanvas().mapSettings().destinationCrs(), qgis.core.QgsProject.instance()))
                 self.vm_pt_measure_to.setCenter(point_geom.asPoint())
                 self.vm_pt_measure_to.show()
 
 
+    def dlg_refresh_events_at_cursor(self, ref_fid: int, measure: float):
+        """shows the PKs of the LoL-features at the snapped measure in dialogue, the nearest one if none, queried from the measure-index
+        :param ref_fid: fid of referenced line
+        :param measure: distance to start-point of referenced line
+        """
+        # Rev. 2023-09-04
+        events_text = ''
+        measure_index = self.get_measure_index()
+        ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, ref_fid)
+        if measure_index and ref_geom and measure is not None:
+            ref_id = ref_geom.feature[self.ds.refLyrPkField.name()]
+            stabbed = measure_index.stab(ref_id, measure)
+            if stabbed:
+                events_text = ', '.join(str(pk) for fid, pk, start, end in stabbed)
+            else:
+                nearest = measure_index.nearest(ref_id, measure)
+                if nearest:
+                    fid, pk, start, end, distance = nearest
+                    events_text = qt_format(QtCore.QCoreApplication.translate('LolEvt',"none, nearest {apos}{0}{apos} at {1}"), pk, '{:.{prec}f}'.format(distance, prec=self.rs.num_digits))
+
+        with QtCore.QSignalBlocker(self.my_dialogue.le_events_at_cursor):
+            self.my_dialogue.le_events_at_cursor.setText(events_text)
+
     def dlg_refresh_measure_from(self,ref_fid:int,measure:float):
         """shows the from-point-coords (transformed snapped to line-position), measure and fraction in dialogue
         :param ref_fid: fid of referenced line
         :param measure: distance to start-point of referenced line
         """
         # Rev. 2023-05-27
-        ref_feature = self.ds.refLyr.getFeature(ref_fid)
+        ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, ref_fid)
 
-        if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
-            point_geom = ref_feature.geometry().interpolate(measure)
+        if ref_geom:
+            point_geom = ref_geom.interpolate(measure)
 
             if point_geom:
                 self.my_dialogue.le_snap_pt_from_x.blockSignals(True)
@@ -1808,8 +2270,8 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
                 self.my_dialogue.le_snap_pt_from_y.setText(str_snap_y)
 
                 self.my_dialogue.dspbx_measure_from.setValue(measure)
-                self.my_dialogue.dspbx_measure_from.setRange(0,ref_feature.geometry().length())
-                self.my_dialogue.dspbx_measure_fract_from.setValue(measure / ref_feature.geometry().length())
+                self.my_dialogue.dspbx_measure_from.setRange(0,ref_geom.length)
+                self.my_dialogue.dspbx_measure_fract_from.setValue(measure / ref_geom.length)
 
                 self.my_dialogue.le_snap_pt_from_x.blockSignals(False)
                 self.my_dialogue.le_snap_pt_from_y.blockSignals(False)
@@ -1823,10 +2285,10 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         """
         # Rev. 2023-05-27
 
-        ref_feature = self.ds.refLyr.getFeature(ref_fid)
+        ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, ref_fid)
 
-        if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
-            point_geom = ref_feature.geometry().interpolate(measure)
+        if ref_geom:
+            point_geom = ref_geom.interpolate(measure)
             if point_geom:
                 self.my_dialogue.le_snap_pt_to_x.blockSignals(True)
                 self.my_dialogue.le_snap_pt_to_y.blockSignals(True)
@@ -1847,8 +2309,8 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
                 self.my_dialogue.le_snap_pt_to_y.setText(str_snap_y)
 
                 self.my_dialogue.dspbx_measure_to.setValue(measure)
-                self.my_dialogue.dspbx_measure_to.setRange(0,ref_feature.geometry().length())
-                self.my_dialogue.dspbx_measure_fract_to.setValue(measure / ref_feature.geometry().length())
+                self.my_dialogue.dspbx_measure_to.setRange(0,ref_geom.length)
+                self.my_dialogue.dspbx_measure_fract_to.setValue(measure / ref_geom.length)
 
 
                 self.my_dialogue.le_snap_pt_to_x.blockSignals(False)
@@ -2028,13 +2490,16 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         connects signals
         cleans previous refLyr
         """
-        # Rev. 2023-05-03
+        # Rev. 2023-09-11
         # disconnect all previously connected Reference-Layer
         self.disconnect_reference_layers()
+        self.ref_snapper.cancel()
         prev_refLyrId = self.ss.refLyrId
         self.ss.refLyrId = None
         if reference_layer:
             self.ss.refLyrId = reference_layer.id()
+            # own snapping-engine, the segment-index is built in background, until then the QGis-snapping configured below is used
+            self.ref_snapper.build(reference_layer)
             # snapping settings ar stored in canvas, not in layer
             my_snap_config = self.iface.mapCanvas().snappingUtils().config()
             # clear all previous settings
@@ -2054,6 +2519,46 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
             # displayExpressionChanged not triggered with configChanged
             # afterCommitChanges ➜ refresh too, if the Reference-Layer was edited
             # QtCore.Qt.UniqueConnection avoids double-connects (throws Exception if already connected)
+            # PK-index must be invalidated before the refresh-slots below are called
+            for signal in [reference_layer.afterCommitChanges, reference_layer.subsetStringChanged]:
+                self.rs.reference_layer_connections.append(signal.connect(functools.partial(tools.MyLayerCaches.invalidate_layer, reference_layer.id())))
+            # single feature for edits in the edit-buffer
+            self.rs.reference_layer_connections.append(reference_layer.featureAdded.connect(functools.partial(tools.MyLayerCaches.add_pk_index_feature, reference_layer)))
+            self.rs.reference_layer_connections.append(reference_layer.featureDeleted.connect(functools.partial(tools.MyLayerCaches.remove_pk_index_feature, reference_layer.id())))
+            for signal in [reference_layer.featureAdded, reference_layer.featureDeleted]:
+                self.rs.reference_layer_connections.append(signal.connect(functools.partial(tools.MyLayerCaches.invalidate_display_value, reference_layer.id())))
+            # cached Reference-geometries: single feature on geometry-edits, complete layer after rollBack
+            for signal in [reference_layer.geometryChanged, reference_layer.featureDeleted]:
+                self.rs.reference_layer_connections.append(signal.connect(functools.partial(tools.MyLayerCaches.invalidate_feature, reference_layer.id())))
+            self.rs.reference_layer_connections.append(reference_layer.afterRollBack.connect(functools.partial(tools.MyLayerCaches.invalidate_layer, reference_layer.id())))
+            # cached displayExpression-values: single feature on attribute-edits, complete layer if the expression changes
+            self.rs.reference_layer_connections.append(reference_layer.attributeValueChanged.connect(functools.partial(tools.MyLayerCaches.invalidate_display_value, reference_layer.id())))
+            # PK-index: changed ID-values in the edit-buffer
+            self.rs.reference_layer_connections.append(reference_layer.attributeValueChanged.connect(functools.partial(tools.MyLayerCaches.update_pk_index, reference_layer)))
+            self.rs.reference_layer_connections.append(reference_layer.displayExpressionChanged.connect(functools.partial(tools.MyLayerCaches.invalidate_display_values, reference_layer.id())))
+            # cached coordinate-transforms and pre-projected Reference-geometries
+            self.rs.reference_layer_connections.append(reference_layer.crsChanged.connect(tools.MyTransforms.invalidate_transforms))
+            # snapping-index: incremental updates on geometry-edits, rebuild after rollBack and filter-changes
+            self.rs.reference_layer_connections.append(reference_layer.geometryChanged.connect(functools.partial(self.ref_snapper.update_feature, reference_layer)))
+            self.rs.reference_layer_connections.append(reference_layer.featureAdded.connect(functools.partial(self.ref_snapper.update_feature, reference_layer)))
+            self.rs.reference_layer_connections.append(reference_layer.featureDeleted.connect(self.ref_snapper.remove_feature))
+            for signal in [reference_layer.afterRollBack, reference_layer.subsetStringChanged]:
+                self.rs.reference_layer_connections.append(signal.connect(functools.partial(self.ref_snapper.build, reference_layer)))
+            # event-index: re-calculate the LoL-segments on the changed Reference-lines
+            for signal in [reference_layer.geometryChanged, reference_layer.attributeValueChanged, reference_layer.featureAdded, reference_layer.featureDeleted]:
+                self.rs.reference_layer_connections.append(signal.connect(functools.partial(tools.MyEventIndex.mark_reference_dirty, reference_layer.id())))
+            for signal in [reference_layer.afterRollBack, reference_layer.subsetStringChanged]:
+                self.rs.reference_layer_connections.append(signal.connect(functools.partial(tools.MyEventIndex.invalidate_events, reference_layer.id())))
+            # integrity-scanner: mark changed Reference-features for the incremental check
+            for signal in [reference_layer.geometryChanged, reference_layer.attributeValueChanged, reference_layer.featureAdded, reference_layer.featureDeleted]:
+                self.rs.reference_layer_connections.append(signal.connect(functools.partial(self.integrity_scanner.mark_dirty, 'ref')))
+            self.rs.reference_layer_connections.append(reference_layer.committedFeaturesAdded.connect(functools.partial(self.integrity_scanner.mark_committed, 'ref')))
+            for signal in [reference_layer.afterRollBack, reference_layer.subsetStringChanged]:
+                self.rs.reference_layer_connections.append(signal.connect(self.integrity_scanner.invalidate))
+            # materialized Show-Layer: re-calculate the rows on the committed Reference-lines
+            self.rs.reference_layer_connections.append(reference_layer.committedGeometriesChanges.connect(self.s_materialize_changed_references))
+            self.rs.reference_layer_connections.append(reference_layer.committedAttributeValuesChanges.connect(self.s_materialize_changed_reference_ids))
+            self.rs.reference_layer_connections.append(reference_layer.committedFeaturesRemoved.connect(self.s_materialize_removed_references))
             self.rs.reference_layer_connections.append(reference_layer.configChanged.connect(self.refresh_gui))
             self.rs.reference_layer_connections.append(reference_layer.displayExpressionChanged.connect(self.refresh_gui))
             self.rs.reference_layer_connections.append(reference_layer.afterCommitChanges.connect(self.dlg_refresh_feature_selection_section))
@@ -2236,6 +2741,9 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
 
     def disconnect_data_layer(self):
         """disconnects currently registered Data-Layer"""
+        # Rev. 2023-09-09
+        # edit-session ends, pending changes remain in the edit-buffer of the previous Data-Layer
+        self.edit_session.stop()
         if self.ds.dataLyr:
             action_list = [action for action in self.ds.dataLyr.actions().actions() if action.id() in [self._lyr_act_id_1, self._lyr_act_id_2]]
             for action in action_list:
@@ -2262,7 +2770,7 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         connects signals
         disconnects previous dataLyr
         """
-        # Rev. 2023-05-08
+        # Rev. 2023-09-11
         critical_msg = ''
         success_msg = ''
         info_msg = ''
@@ -2276,7 +2784,55 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         if data_layer:
 
             #https://doc.qt.io/qt-5/qmetaobject-connection.html
+            # PK-indices must be invalidated/updated before dlg_refresh_data_sections is called
+            # complete: after commit (fids of added features are remapped) and if the features change outside the edit-buffer
+            for signal in [data_layer.afterCommitChanges, data_layer.afterRollBack, data_layer.subsetStringChanged]:
+                self.rs.data_layer_connections.append(signal.connect(self.s_invalidate_data_caches))
+            # single feature for edits in the edit-buffer
+            self.rs.data_layer_connections.append(data_layer.featureAdded.connect(functools.partial(tools.MyLayerCaches.add_pk_index_feature, data_layer)))
+            self.rs.data_layer_connections.append(data_layer.featureDeleted.connect(functools.partial(tools.MyLayerCaches.remove_pk_index_feature, data_layer.id())))
+            for signal in [data_layer.featureAdded, data_layer.featureDeleted]:
+                self.rs.data_layer_connections.append(signal.connect(functools.partial(tools.MyLayerCaches.invalidate_display_value, data_layer.id())))
+            # cached displayExpression-values: single feature on attribute-edits, complete layer if the expression changes or after rollBack
+            self.rs.data_layer_connections.append(data_layer.attributeValueChanged.connect(functools.partial(tools.MyLayerCaches.invalidate_display_value, data_layer.id())))
+            # PK-index: changed PK-values in the edit-buffer
+            self.rs.data_layer_connections.append(data_layer.attributeValueChanged.connect(functools.partial(tools.MyLayerCaches.update_pk_index, data_layer)))
+            for signal in [data_layer.displayExpressionChanged, data_layer.afterRollBack]:
+                self.rs.data_layer_connections.append(signal.connect(functools.partial(tools.MyLayerCaches.invalidate_display_values, data_layer.id())))
+            # materialized Show-Layer: only the committed rows are re-calculated
+            self.rs.data_layer_connections.append(data_layer.committedFeaturesAdded.connect(self.s_materialize_added_features))
+            self.rs.data_layer_connections.append(data_layer.committedAttributeValuesChanges.connect(self.s_materialize_changed_features))
+            self.rs.data_layer_connections.append(data_layer.committedFeaturesRemoved.connect(self.s_materialize_removed_features))
+            # PK-allocator for inserts: counter re-queried once per connect and per commit, in between kept current by the edit-buffer-signals
+            tools.MyLayerCaches.invalidate_pks(data_layer.id())
+            self.rs.data_layer_connections.append(data_layer.featureAdded.connect(functools.partial(tools.MyLayerCaches.register_pk_feature, data_layer)))
+            self.rs.data_layer_connections.append(data_layer.attributeValueChanged.connect(functools.partial(tools.MyLayerCaches.register_pk_value, data_layer)))
+            self.rs.data_layer_connections.append(data_layer.committedFeaturesAdded.connect(tools.MyLayerCaches.register_committed_pks))
+            # beforeCommitChanges: re-query also if the commit fails, inserts of other users are found after each commit
+            for signal in [data_layer.beforeCommitChanges, data_layer.afterCommitChanges, data_layer.afterRollBack, data_layer.subsetStringChanged]:
+                self.rs.data_layer_connections.append(signal.connect(functools.partial(tools.MyLayerCaches.invalidate_pks, data_layer.id())))
+            # measure-index: re-read the changed Data-features
+            for signal in [data_layer.attributeValueChanged, data_layer.featureAdded, data_layer.featureDeleted]:
+                self.rs.data_layer_connections.append(signal.connect(functools.partial(tools.MyMeasureIndex.mark_dirty, data_layer.id())))
+            self.rs.data_layer_connections.append(data_layer.committedFeaturesAdded.connect(tools.MyMeasureIndex.mark_committed))
+            for signal in [data_layer.afterRollBack, data_layer.subsetStringChanged]:
+                self.rs.data_layer_connections.append(signal.connect(functools.partial(tools.MyMeasureIndex.invalidate_measures, data_layer.id())))
+
+            # event-index: re-calculate the changed Data-features
+            for signal in [data_layer.attributeValueChanged, data_layer.featureAdded, data_layer.featureDeleted]:
+                self.rs.data_layer_connections.append(signal.connect(functools.partial(tools.MyEventIndex.mark_data_dirty, data_layer.id())))
+            self.rs.data_layer_connections.append(data_layer.committedFeaturesAdded.connect(tools.MyEventIndex.mark_data_committed))
+            for signal in [data_layer.afterRollBack, data_layer.subsetStringChanged]:
+                self.rs.data_layer_connections.append(signal.connect(functools.partial(tools.MyEventIndex.invalidate_events, data_layer.id())))
+            # integrity-scanner: mark changed Data-features for the incremental check
+            for signal in [data_layer.attributeValueChanged, data_layer.featureAdded, data_layer.featureDeleted]:
+                self.rs.data_layer_connections.append(signal.connect(functools.partial(self.integrity_scanner.mark_dirty, 'data')))
+            self.rs.data_layer_connections.append(data_layer.committedFeaturesAdded.connect(functools.partial(self.integrity_scanner.mark_committed, 'data')))
+            for signal in [data_layer.afterRollBack, data_layer.subsetStringChanged]:
+                self.rs.data_layer_connections.append(signal.connect(self.integrity_scanner.invalidate))
             self.rs.data_layer_connections.append(data_layer.configChanged.connect(self.refresh_gui))
+            # bulk-load: deferred GeoPackage-indexes
+            self.rs.data_layer_connections.append(data_layer.afterCommitChanges.connect(functools.partial(tools.MyGeoPackage.create_deferred_indexes, data_layer.id())))
             self.rs.data_layer_connections.append(data_layer.afterCommitChanges.connect(self.dlg_refresh_data_sections))
             self.rs.data_layer_connections.append(data_layer.displayExpressionChanged.connect(self.refresh_gui))
 
@@ -2313,6 +2869,149 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         self.dlg_refresh_edit_section()
         self.dlg_refresh_feature_selection_section()
 
+    def s_invalidate_data_caches(self, *args):
+        """slot for Data-Layer-signals afterCommitChanges/afterRollBack/subsetStringChanged:
+        invalidates the cached PK-indices of Data-Layer and Show-Layer, because the Show-Layer depends on the Data-Layer
+        :param args: signal-arguments, unused
+        """
+        # Rev. 2023-09-12
+        if self.ss.dataLyrId:
+            tools.MyLayerCaches.invalidate_layer(self.ss.dataLyrId)
+        if self.ss.showLyrId:
+            tools.MyLayerCaches.invalidate_layer(self.ss.showLyrId)
+
+    def get_show_layer_materializer(self) -> tools.MyShowLayers.ShowLayerMaterializer | None:
+        """returns the materializer, if the current Show-Layer is a materialized one and the settings are complete"""
+        # Rev. 2023-08-21
+        if self.cf.reference_layer_complete and self.cf.data_layer_complete and self.cf.show_layer_complete and tools.MyShowLayers.is_materialized(self.ds.showLyr):
+            return tools.MyShowLayers.get_materializer(
+                self.ds.showLyr,
+                self.ds.refLyr,
+                self.ds.refLyrPkField,
+                self.ds.dataLyr,
+                self.ds.dataLyrIdField,
+                self.ds.dataLyrReferenceField,
+                [self.ds.dataLyrIdField, self.ds.dataLyrReferenceField, self.ds.dataLyrMeasureFromField, self.ds.dataLyrMeasureToField, self.ds.dataLyrOffsetField],
+                self.calc_show_geometry
+            )
+
+    def get_event_index(self) -> tools.MyEventIndex.EventIndex | None:
+        """returns the spatial index of the calculated LoL-segments, if Reference- and Data-Layer are complete, no Show-Layer required"""
+        # Rev. 2023-09-03
+        if self.cf.reference_layer_complete and self.cf.data_layer_complete:
+            return tools.MyEventIndex.get_event_index(
+                self.ds.refLyr,
+                self.ds.refLyrPkField,
+                self.ds.dataLyr,
+                self.ds.dataLyrIdField,
+                self.ds.dataLyrReferenceField,
+                [self.ds.dataLyrIdField, self.ds.dataLyrReferenceField, self.ds.dataLyrMeasureFromField, self.ds.dataLyrMeasureToField, self.ds.dataLyrOffsetField],
+                self.calc_show_geometry
+            )
+
+    def get_measure_index(self) -> tools.MyMeasureIndex.MeasureIntervalIndex | None:
+        """returns the per-route measure-interval-index of the Data-Layer, if Reference- and Data-Layer are complete"""
+        # Rev. 2023-09-04
+        if self.cf.reference_layer_complete and self.cf.data_layer_complete:
+            return tools.MyMeasureIndex.get_measure_index(
+                self.ds.dataLyr,
+                self.ds.dataLyrIdField.name(),
+                self.ds.dataLyrReferenceField.name(),
+                self.ds.dataLyrMeasureFromField.name(),
+                self.ds.dataLyrMeasureToField.name()
+            )
+
+    def calc_show_geometry(self, ref_geom: tools.MyLayerCaches.RefGeometry, data_feature: qgis.core.QgsFeature) -> qgis.core.QgsGeometry | None:
+        """callback for the materialized Show-Layer: segment-geometry for a Data-feature
+        :param ref_geom: Reference-geometry
+        :param data_feature: Data-feature
+        """
+        # Rev. 2023-08-21
+        measure_from = data_feature[self.ds.dataLyrMeasureFromField.name()]
+        measure_to = data_feature[self.ds.dataLyrMeasureToField.name()]
+        offset = data_feature[self.ds.dataLyrOffsetField.name()]
+        if not (measure_from is None or measure_from == qgis.core.NULL or measure_to is None or measure_to == qgis.core.NULL):
+            if offset is None or offset == qgis.core.NULL:
+                offset = 0
+            return tools.MyToolFunctions.get_segment_geom(ref_geom, measure_from, measure_to, offset)
+
+    def s_materialize_added_features(self, layer_id: str, added_features: list):
+        """slot for committedFeaturesAdded on Data-Layer: calculates these rows in materialized Show-Layer
+        :param layer_id:
+        :param added_features: committed features with their new fids
+        """
+        # Rev. 2023-08-21
+        show_layer_materializer = self.get_show_layer_materializer()
+        if show_layer_materializer:
+            show_layer_materializer.update_features([feature.id() for feature in added_features])
+
+    def s_materialize_changed_features(self, layer_id: str, changed_attribute_values: dict):
+        """slot for committedAttributeValuesChanges on Data-Layer: re-calculates these rows in materialized Show-Layer
+        :param layer_id:
+        :param changed_attribute_values: key: fid value: dict field-index ➜ value
+        """
+        # Rev. 2023-08-21
+        show_layer_materializer = self.get_show_layer_materializer()
+        if show_layer_materializer:
+            show_layer_materializer.update_features(list(changed_attribute_values.keys()))
+
+    def s_materialize_removed_features(self, layer_id: str, deleted_fids: list):
+        """slot for committedFeaturesRemoved on Data-Layer: removes these rows from materialized Show-Layer
+        :param layer_id:
+        :param deleted_fids:
+        """
+        # Rev. 2023-08-21
+        show_layer_materializer = self.get_show_layer_materializer()
+        if show_layer_materializer:
+            show_layer_materializer.remove_features(deleted_fids)
+
+    def s_materialize_changed_references(self, layer_id: str, changed_geometries: dict):
+        """slot for committedGeometriesChanges on Reference-Layer: re-calculates the referencing rows in materialized Show-Layer
+        :param layer_id:
+        :param changed_geometries: key: fid value: new geometry
+        """
+        # Rev. 2023-08-22
+        show_layer_materializer = self.get_show_layer_materializer()
+        if show_layer_materializer:
+            show_layer_materializer.update_references(list(changed_geometries.keys()))
+
+    def s_materialize_changed_reference_ids(self, layer_id: str, changed_attribute_values: dict):
+        """slot for committedAttributeValuesChanges on Reference-Layer: changed PKs affect the join ➜ re-calculate materialized Show-Layer
+        :param layer_id:
+        :param changed_attribute_values: key: fid value: dict field-index ➜ value
+        """
+        # Rev. 2023-08-22
+        show_layer_materializer = self.get_show_layer_materializer()
+        if show_layer_materializer:
+            pk_field_idx = self.ds.refLyr.fields().indexOf(self.ds.refLyrPkField.name())
+            if any(pk_field_idx in changed_values for changed_values in changed_attribute_values.values()):
+                show_layer_materializer.materialize()
+
+    def s_materialize_removed_references(self, layer_id: str, deleted_fids: list):
+        """slot for committedFeaturesRemoved on Reference-Layer: the PKs of the removed features are unknown ➜ re-calculate materialized Show-Layer
+        :param layer_id:
+        :param deleted_fids:
+        """
+        # Rev. 2023-08-22
+        show_layer_materializer = self.get_show_layer_materializer()
+        if show_layer_materializer:
+            show_layer_materializer.materialize()
+
+    def refresh_show_layer(self, update_extents: bool = True):
+        """refreshes Show-Layer after edits in Data-Layer
+        materialized Show-Layer: already patched row by row via the committed...-signals, see s_materialize_added_features...
+        virtual layer or database-view: the whole layer must be re-queried
+        :param update_extents: False after delete, removed features don't expand the extent
+        """
+        # Rev. 2023-08-22
+        if self.cf.show_layer_complete and not tools.MyShowLayers.is_materialized(self.ds.showLyr):
+            if update_extents:
+                self.ds.showLyr.updateExtents()
+            if self.iface.mapCanvas().isCachingEnabled():
+                self.ds.showLyr.triggerRepaint()
+            else:
+                self.iface.mapCanvas().refresh()
+
     def refresh_canvas_graphics(self):
         """applies self.ss to canvas-grafics"""
         # Rev. 2023-05-08
@@ -2385,6 +3084,12 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         self.ss.showLyrId = None
         if show_layer:
             self.ss.showLyrId = show_layer.id()
+            for signal in [show_layer.afterCommitChanges, show_layer.featureAdded, show_layer.featureDeleted]:
+                self.rs.show_layer_connections.append(signal.connect(functools.partial(tools.MyLayerCaches.invalidate_layer, show_layer.id())))
+            self.rs.show_layer_connections.append(show_layer.attributeValueChanged.connect(functools.partial(tools.MyLayerCaches.invalidate_display_value, show_layer.id())))
+            self.rs.show_layer_connections.append(show_layer.crsChanged.connect(tools.MyTransforms.invalidate_transforms))
+            for signal in [show_layer.displayExpressionChanged, show_layer.afterRollBack]:
+                self.rs.show_layer_connections.append(signal.connect(functools.partial(tools.MyLayerCaches.invalidate_display_values, show_layer.id())))
             self.rs.show_layer_connections.append(show_layer.configChanged.connect(self.refresh_gui))
             self.rs.show_layer_connections.append(show_layer.displayExpressionChanged.connect(self.refresh_gui))
             self.ds.showLyr = show_layer
@@ -2466,157 +3171,152 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         """
         # Rev. 2023-05-08
         self.my_dialogue.dspbx_distance.clear()
-        ref_feature = self.ds.refLyr.getFeature(ref_fid)
+        ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, ref_fid)
 
-        if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
-            point_from_geom = ref_feature.geometry().interpolate(measure_from)
-            point_to_geom = ref_feature.geometry().interpolate(measure_to)
+        if ref_geom:
+            point_from_geom = ref_geom.interpolate(measure_from)
+            point_to_geom = ref_geom.interpolate(measure_to)
 
             if point_from_geom and point_to_geom:
 
                 with QtCore.QSignalBlocker(self.my_dialogue.dspbx_distance):
                     self.my_dialogue.dspbx_distance.setValue(measure_to - measure_from)
-                    self.my_dialogue.dspbx_distance.setRange(0,ref_feature.geometry().length())
+                    self.my_dialogue.dspbx_distance.setRange(0,ref_geom.length)
 
     def canvasMoveEvent(self, event: qgis.gui.QgsMapMouseEvent) -> None:
         """reimplemented: MouseMove on canvas
-        further action depending on rs.tool_mode
+        coalesced, only the latest position is processed once per frame, see process_canvas_move
         :param event:
         """
-        # Rev. 2023-05-08
+        # Rev. 2023-08-27
+        # copy, the event is deleted after return
+        self.move_coalescer.push(QtCore.QPoint(event.pos()))
+
+    def process_canvas_move(self, pos: QtCore.QPoint) -> None:
+        """coalesced MouseMove on canvas, called by self.move_coalescer
+        further action depending on rs.tool_mode
+        :param pos: canvas-pixel-position of the latest mouse-move-event
+        """
+        # Rev. 2023-09-04
         # always show cursor-map-coords
-        point_xy = self.iface.mapCanvas().getCoordinateTransform().toMapCoordinates(event.x(), event.y())
+        point_xy = self.iface.mapCanvas().getCoordinateTransform().toMapCoordinates(pos.x(), pos.y())
         self.show_map_coords_in_dialogue(point_xy)
 
         if self.rs.tool_mode == 'move_segment':
             if self.rs.snapped_ref_fid is not None:
-                ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
-
-                ref_projected_point_geom = qgis.core.QgsGeometry.fromPointXY(point_xy)
-                ref_projected_point_geom.transform(qgis.core.QgsCoordinateTransform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.refLyr.crs(), qgis.core.QgsProject.instance()))
-
-                # see https://qgis.org/pyqgis/master/core/QgsGeometry.html#qgis.core.QgsGeometry.closestSegmentWithContext
-                # returns tuple: (sqrDist, minDistPoint, nextVertexIndex, leftOrRightOfSegment)
-                point_on_line = ref_feature.geometry().closestSegmentWithContext(ref_projected_point_geom.asPoint())
-                sqr_dist = point_on_line[0]
-                # <0 left, >0 right, ==0 on the line
-                side = point_on_line[3]
-                abs_dist = math.sqrt(sqr_dist)
-                offset = abs_dist * side * -1
-
-                current_measure = ref_feature.geometry().lineLocatePoint(qgis.core.QgsGeometry.fromPointXY(point_on_line[1]))
-
-                delta = current_measure - self.rs.last_measure
-
-                if QtWidgets.QApplication.keyboardModifiers() == QtCore.Qt.ControlModifier:
-                    # change offset and measure
-                    next_measure_from = self.rs.current_measure_from + delta
-                    next_measure_to = self.rs.current_measure_to + delta
-                    next_offset = offset
-                elif QtWidgets.QApplication.keyboardModifiers() == QtCore.Qt.ShiftModifier:
-                    # change offset, keep measure
-                    next_measure_from = self.rs.current_measure_from
-                    next_measure_to = self.rs.current_measure_to
-                    next_offset = offset
-                else:
-                    # change measure, keep offset
-                    next_measure_from = self.rs.current_measure_from + delta
-                    next_measure_to = self.rs.current_measure_to + delta
-                    next_offset = self.rs.current_offset
+                ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, self.rs.snapped_ref_fid)
+                if ref_geom:
+                    ref_projected_point_geom = qgis.core.QgsGeometry.fromPointXY(point_xy)
+                    ref_projected_point_geom.transform(tools.MyTransforms.get_transform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.refLyr.crs()))
+
+                    # measure, squared distance and side (<0 left, >0 right, ==0 on the line) in one query,
+                    # only the segments near the last measure are checked, see MyLayerCaches.RefGeometry.locate_point
+                    current_measure, sqr_dist, side = ref_geom.locate_point(ref_projected_point_geom.asPoint(), self.rs.last_measure)
+                    abs_dist = math.sqrt(sqr_dist)
+                    offset = abs_dist * side * -1
+
+
+                    delta = current_measure - self.rs.last_measure
+
+                    if QtWidgets.QApplication.keyboardModifiers() == QtCore.Qt.ControlModifier:
+                        # change offset and measure
+                        next_measure_from = self.rs.current_measure_from + delta
+                        next_measure_to = self.rs.current_measure_to + delta
+                        next_offset = offset
+                    elif QtWidgets.QApplication.keyboardModifiers() == QtCore.Qt.ShiftModifier:
+                        # change offset, keep measure
+                        next_measure_from = self.rs.current_measure_from
+                        next_measure_to = self.rs.current_measure_to
+                        next_offset = offset
+                    else:
+                        # change measure, keep offset
+                        next_measure_from = self.rs.current_measure_from + delta
+                        next_measure_to = self.rs.current_measure_to + delta
+                        next_offset = self.rs.current_offset
 
-                self.rs.current_offset = next_offset
+                    self.rs.current_offset = next_offset
 
-                # don't move beyond start/end of reference-line
-                if next_measure_from >= 0 and next_measure_from <= ref_feature.geometry().length() and next_measure_to >= 0 and next_measure_to <= ref_feature.geometry().length():
-                    self.rs.current_measure_from = next_measure_from
-                    self.rs.current_measure_to = next_measure_to
-                    self.rs.last_measure = current_measure
+                    # don't move beyond start/end of reference-line
+                    if next_measure_from >= 0 and next_measure_from <= ref_geom.length and next_measure_to >= 0 and next_measure_to <= ref_geom.length:
+                        self.rs.current_measure_from = next_measure_from
+                        self.rs.current_measure_to = next_measure_to
+                        self.rs.last_measure = current_measure
 
-                self.draw_segment(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to, self.rs.current_offset)
-                self.draw_from_point(self.rs.snapped_ref_fid, self.rs.current_measure_from)
-                self.draw_to_point(self.rs.snapped_ref_fid, self.rs.current_measure_to)
-                self.dlg_refresh_measure_from(self.rs.snapped_ref_fid, self.rs.current_measure_from)
-                self.dlg_refresh_measure_to(self.rs.snapped_ref_fid, self.rs.current_measure_to)
-                self.dlg_refresh_offset(self.rs.current_offset)
+                    self.draw_segment(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to, self.rs.current_offset)
+                    self.draw_from_point(self.rs.snapped_ref_fid, self.rs.current_measure_from)
+                    self.draw_to_point(self.rs.snapped_ref_fid, self.rs.current_measure_to)
+                    self.dlg_refresh_measure_from(self.rs.snapped_ref_fid, self.rs.current_measure_from)
+                    self.dlg_refresh_measure_to(self.rs.snapped_ref_fid, self.rs.current_measure_to)
+                    self.dlg_refresh_offset(self.rs.current_offset)
         elif self.rs.tool_mode == 'before_measure':
             # pre-reset dialog-widgets for cursor-coordinates, reference-ids and measures
-            snap_filter = tools.MyToolFunctions.OneLayerFilter(self.ds.refLyr)
-
-            m = self.iface.mapCanvas().snappingUtils().snapToMap(event.pos(), snap_filter)
+            m, snapped_measure = self.snap_to_reference(pos)
             self.snap_indicator.setMatch(m)
 
             if self.snap_indicator.match().type():
                 snapped_ref_fid = m.featureId()
                 self.my_dialogue.qcbn_snapped_ref_fid.select_by_value(0, 256, snapped_ref_fid)
 
-                ref_feature = self.ds.refLyr.getFeature(snapped_ref_fid)
-
-                # temporary highlight line under cursor
-                self.rb_ref.setToGeometry(ref_feature.geometry(), self.ds.refLyr)
-                self.rb_ref.show()
+                ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, snapped_ref_fid)
+                if ref_geom:
+                    # temporary highlight line under cursor
+                    self.rb_ref.setToGeometry(ref_geom.geometry, self.ds.refLyr)
+                    self.rb_ref.show()
 
-                # show snap-coords
-                snapped_point_xy = self.snap_indicator.match().point()
-                snapped_point_geom = qgis.core.QgsGeometry.fromPointXY(snapped_point_xy)
-                snapped_point_geom.transform(qgis.core.QgsCoordinateTransform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.refLyr.crs(), qgis.core.QgsProject.instance()))
-                measure = ref_feature.geometry().lineLocatePoint(snapped_point_geom)
+                    # show measure of snap-point
+                    measure = snapped_measure
 
-                self.dlg_refresh_measure_from(snapped_ref_fid, measure)
+                    self.dlg_refresh_measure_from(snapped_ref_fid, measure)
+                    self.dlg_refresh_events_at_cursor(snapped_ref_fid, measure)
+            else:
+                self.my_dialogue.le_events_at_cursor.clear()
         elif self.rs.tool_mode == 'measuring':
             if self.rs.snapped_ref_fid is not None and self.rs.current_measure_from is not None:
-                snap_filter = tools.MyToolFunctions.OneFeatureFilter(self.ds.refLyr, self.rs.snapped_ref_fid)
-                m = self.iface.mapCanvas().snappingUtils().snapToMap(event.pos(), snap_filter)
+                m, snapped_measure = self.snap_to_reference(pos, self.rs.snapped_ref_fid)
                 self.snap_indicator.setMatch(m)
 
                 if self.snap_indicator.match().type():
                     # == self.rs.snapped_ref_fid
                     # snapped_ref_fid = m.featureId()
-                    ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
-                    snapped_point_xy = self.snap_indicator.match().point()
-                    snapped_point_geom = qgis.core.QgsGeometry.fromPointXY(snapped_point_xy)
-                    snapped_point_geom.transform(qgis.core.QgsCoordinateTransform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.refLyr.crs(), qgis.core.QgsProject.instance()))
-
-                    self.rs.current_measure_to = ref_feature.geometry().lineLocatePoint(snapped_point_geom)
-                    self.draw_segment(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to, self.rs.current_offset)
-                    self.dlg_refresh_measure_from(self.rs.snapped_ref_fid, self.rs.current_measure_from)
-                    self.dlg_refresh_measure_to(self.rs.snapped_ref_fid, self.rs.current_measure_to)
-                    self.dlg_refresh_distance(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to)
+                    ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, self.rs.snapped_ref_fid)
+                    if ref_geom:
+                        self.rs.current_measure_to = snapped_measure
+                        self.draw_segment(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to, self.rs.current_offset)
+                        self.dlg_refresh_measure_from(self.rs.snapped_ref_fid, self.rs.current_measure_from)
+                        self.dlg_refresh_measure_to(self.rs.snapped_ref_fid, self.rs.current_measure_to)
+                        self.dlg_refresh_distance(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to)
         elif self.rs.tool_mode == 'move_from_point':
             if self.cf.measure_completed:
-                ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
-                snap_filter = tools.MyToolFunctions.OneFeatureFilter(self.ds.refLyr, self.rs.snapped_ref_fid)
-                m = self.iface.mapCanvas().snappingUtils().snapToMap(event.pos(), snap_filter)
-                self.snap_indicator.setMatch(m)
-                if self.snap_indicator.match().type():
-                    snapped_point_xy = self.snap_indicator.match().point()
-                    snapped_point_geom = qgis.core.QgsGeometry.fromPointXY(snapped_point_xy)
-                    snapped_point_geom.transform(qgis.core.QgsCoordinateTransform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.refLyr.crs(), qgis.core.QgsProject.instance()))
-                    self.rs.current_measure_from = ref_feature.geometry().lineLocatePoint(snapped_point_geom)
-                    self.draw_segment(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to, self.rs.current_offset)
-                    self.draw_from_point(self.rs.snapped_ref_fid, self.rs.current_measure_from)
-                    self.dlg_refresh_measure_from(self.rs.snapped_ref_fid, self.rs.current_measure_from)
-                    self.dlg_refresh_distance(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to)
+                ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, self.rs.snapped_ref_fid)
+                if ref_geom:
+                    m, snapped_measure = self.snap_to_reference(pos, self.rs.snapped_ref_fid)
+                    self.snap_indicator.setMatch(m)
+                    if self.snap_indicator.match().type():
+                        self.rs.current_measure_from = snapped_measure
+                        self.draw_segment(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to, self.rs.current_offset)
+                        self.draw_from_point(self.rs.snapped_ref_fid, self.rs.current_measure_from)
+                        self.dlg_refresh_measure_from(self.rs.snapped_ref_fid, self.rs.current_measure_from)
+                        self.dlg_refresh_distance(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to)
         elif self.rs.tool_mode == 'move_to_point':
             if self.cf.measure_completed:
-                ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
-                snap_filter = tools.MyToolFunctions.OneFeatureFilter(self.ds.refLyr, self.rs.snapped_ref_fid)
-                m = self.iface.mapCanvas().snappingUtils().snapToMap(event.pos(), snap_filter)
-                self.snap_indicator.setMatch(m)
-                if self.snap_indicator.match().type():
-                    snapped_point_xy = self.snap_indicator.match().point()
-                    snapped_point_geom = qgis.core.QgsGeometry.fromPointXY(snapped_point_xy)
-                    snapped_point_geom.transform(qgis.core.QgsCoordinateTransform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.refLyr.crs(), qgis.core.QgsProject.instance()))
-                    self.rs.current_measure_to = ref_feature.geometry().lineLocatePoint(snapped_point_geom)
-                    self.draw_segment(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to, self.rs.current_offset)
-                    self.draw_to_point(self.rs.snapped_ref_fid, self.rs.current_measure_to)
-                    self.dlg_refresh_measure_to(self.rs.snapped_ref_fid, self.rs.current_measure_to)
+                ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, self.rs.snapped_ref_fid)
+                if ref_geom:
+                    m, snapped_measure = self.snap_to_reference(pos, self.rs.snapped_ref_fid)
+                    self.snap_indicator.setMatch(m)
+                    if self.snap_indicator.match().type():
+                        self.rs.current_measure_to = snapped_measure
+                        self.draw_segment(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to, self.rs.current_offset)
+                        self.draw_to_point(self.rs.snapped_ref_fid, self.rs.current_measure_to)
+                        self.dlg_refresh_measure_to(self.rs.snapped_ref_fid, self.rs.current_measure_to)
         elif self.rs.tool_mode == 'select_features':
             if self.rs.mouse_down_point:
                 # draw selection-rectangle
-                mouse_move_point = self.iface.mapCanvas().getCoordinateTransform().toMapCoordinates(event.x(), event.y())
+                mouse_move_point = self.iface.mapCanvas().getCoordinateTransform().toMapCoordinates(pos.x(), pos.y())
                 geom = qgis.core.QgsGeometry.fromRect(qgis.core.QgsRectangle(self.rs.mouse_down_point, mouse_move_point))
                 self.rb_selection_rect.setToGeometry(geom, None)
                 self.rb_selection_rect.show()
+            else:
+                self.identify_event(pos)
 
     def dlg_refresh_offset(self,offset:float)->None:
         """sets the offset-Spinbox
@@ -2632,94 +3332,89 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
        :param event:
        """
         # Rev. 2023-05-08
+        # pending mouse-move first
+        self.move_coalescer.flush()
         # qgis.core.QgsPointXY
         point_xy = self.iface.mapCanvas().getCoordinateTransform().toMapCoordinates(event.x(), event.y())
         self.show_map_coords_in_dialogue(point_xy)
 
         if self.rs.tool_mode == 'move_segment':
             if self.cf.measure_completed:
-                ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
+                ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, self.rs.snapped_ref_fid)
+                if ref_geom:
+                    ref_projected_point_geom = qgis.core.QgsGeometry.fromPointXY(point_xy)
+                    ref_projected_point_geom.transform(tools.MyTransforms.get_transform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.refLyr.crs()))
+
+                    # measure, squared distance and side (<0 left, >0 right, ==0 on the line) in one query,
+                    # only the segments near the last measure are checked, see MyLayerCaches.RefGeometry.locate_point
+                    current_measure, sqr_dist, side = ref_geom.locate_point(ref_projected_point_geom.asPoint(), self.rs.last_measure)
+                    abs_dist = math.sqrt(sqr_dist)
+
+                    offset = abs_dist * side * -1
+
+
+                    delta = current_measure - self.rs.last_measure
+
+                    if QtWidgets.QApplication.keyboardModifiers() == QtCore.Qt.ControlModifier:
+                        #change offset and measure
+                        next_measure_from = self.rs.current_measure_from + delta
+                        next_measure_to = self.rs.current_measure_to + delta
+                        next_offset = offset
+                    elif QtWidgets.QApplication.keyboardModifiers() == QtCore.Qt.ShiftModifier:
+                        #change offset, keep measure
+                        next_measure_from = self.rs.current_measure_from
+                        next_measure_to = self.rs.current_measure_to
+                        next_offset = offset
+                    else:
+                        #change measure, keep offset
+                        next_measure_from = self.rs.current_measure_from + delta
+                        next_measure_to = self.rs.current_measure_to + delta
+                        next_offset = self.rs.current_offset
 
-                ref_projected_point_geom = qgis.core.QgsGeometry.fromPointXY(point_xy)
-                ref_projected_point_geom.transform(qgis.core.QgsCoordinateTransform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.refLyr.crs(), qgis.core.QgsProject.instance()))
-
-                # see https://qgis.org/pyqgis/master/core/QgsGeometry.html#qgis.core.QgsGeometry.closestSegmentWithContext
-                # returns tuple: (sqrDist, minDistPoint, nextVertexIndex, leftOrRightOfSegment)
-                point_on_line = ref_feature.geometry().closestSegmentWithContext(ref_projected_point_geom.asPoint())
-                sqr_dist = point_on_line[0]
-                # <0 left, >0 right, ==0 on the line
-                side = point_on_line[3]
-                abs_dist = math.sqrt(sqr_dist)
-
-                offset = abs_dist * side * -1
-
-                current_measure = ref_feature.geometry().lineLocatePoint(qgis.core.QgsGeometry.fromPointXY(point_on_line[1]))
-
-                delta = current_measure - self.rs.last_measure
-
-                if QtWidgets.QApplication.keyboardModifiers() == QtCore.Qt.ControlModifier:
-                    #change offset and measure
-                    next_measure_from = self.rs.current_measure_from + delta
-                    next_measure_to = self.rs.current_measure_to + delta
-                    next_offset = offset
-                elif QtWidgets.QApplication.keyboardModifiers() == QtCore.Qt.ShiftModifier:
-                    #change offset, keep measure
-                    next_measure_from = self.rs.current_measure_from
-                    next_measure_to = self.rs.current_measure_to
-                    next_offset = offset
-                else:
-                    #change measure, keep offset
-                    next_measure_from = self.rs.current_measure_from + delta
-                    next_measure_to = self.rs.current_measure_to + delta
-                    next_offset = self.rs.current_offset
+                    if next_measure_from >= 0 and next_measure_from <= ref_geom.length and next_measure_to >= 0 and next_measure_to <= ref_geom.length:
+                        self.rs.current_offset = next_offset
+                        self.rs.current_measure_from = next_measure_from
+                        self.rs.current_measure_to = next_measure_to
 
-                if next_measure_from >= 0 and next_measure_from <= ref_feature.geometry().length() and next_measure_to >= 0 and next_measure_to <= ref_feature.geometry().length():
-                    self.rs.current_offset = next_offset
-                    self.rs.current_measure_from = next_measure_from
-                    self.rs.current_measure_to = next_measure_to
-
-                    self.draw_segment(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to, self.rs.current_offset)
-                    self.draw_from_point(self.rs.snapped_ref_fid, self.rs.current_measure_from)
-                    self.draw_to_point(self.rs.snapped_ref_fid, self.rs.current_measure_to)
-                    self.dlg_refresh_measure_from(self.rs.snapped_ref_fid, self.rs.current_measure_from)
-                    self.dlg_refresh_measure_to(self.rs.snapped_ref_fid, self.rs.current_measure_to)
+                        self.draw_segment(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to, self.rs.current_offset)
+                        self.draw_from_point(self.rs.snapped_ref_fid, self.rs.current_measure_from)
+                        self.draw_to_point(self.rs.snapped_ref_fid, self.rs.current_measure_to)
+                        self.dlg_refresh_measure_from(self.rs.snapped_ref_fid, self.rs.current_measure_from)
+                        self.dlg_refresh_measure_to(self.rs.snapped_ref_fid, self.rs.current_measure_to)
 
 
             self.check_settings('before_move_segment')
         elif self.rs.tool_mode == 'measuring':
             self.snap_indicator.setVisible(False)
             if self.rs.snapped_ref_fid is not None and self.rs.current_measure_from is not None:
-                snap_filter = tools.MyToolFunctions.OneFeatureFilter(self.ds.refLyr, self.rs.snapped_ref_fid)
-                m = self.iface.mapCanvas().snappingUtils().snapToMap(event.pos(), snap_filter)
+                m, snapped_measure = self.snap_to_reference(event.pos(), self.rs.snapped_ref_fid)
                 self.snap_indicator.setMatch(m)
 
                 if self.snap_indicator.match().type():
                     snapped_ref_fid = m.featureId()
-                    ref_feature = self.ds.refLyr.getFeature(snapped_ref_fid)
-
-                    snapped_point_xy = self.snap_indicator.match().point()
-
-                    snapped_point_geom = qgis.core.QgsGeometry.fromPointXY(snapped_point_xy)
-                    snapped_point_geom.transform(qgis.core.QgsCoordinateTransform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.refLyr.crs(), qgis.core.QgsProject.instance()))
-
-                    self.rs.current_measure_to = ref_feature.geometry().lineLocatePoint(snapped_point_geom)
-
-                    self.draw_segment(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to, self.rs.current_offset)
-                    self.draw_from_point(self.rs.snapped_ref_fid, self.rs.current_measure_from)
-                    self.dlg_refresh_measure_from(self.rs.snapped_ref_fid, self.rs.current_measure_from)
-                    self.draw_to_point(self.rs.snapped_ref_fid, self.rs.current_measure_to)
-                    self.dlg_refresh_measure_to(self.rs.snapped_ref_fid, self.rs.current_measure_to)
-                    self.check_settings('after_measure')
-                    self.dlg_refresh_measure_section()
-                    self.dlg_refresh_edit_section()
+                    ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, snapped_ref_fid)
+                    if ref_geom:
+
+                        self.rs.current_measure_to = snapped_measure
+
+                        self.draw_segment(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to, self.rs.current_offset)
+                        self.draw_from_point(self.rs.snapped_ref_fid, self.rs.current_measure_from)
+                        self.dlg_refresh_measure_from(self.rs.snapped_ref_fid, self.rs.current_measure_from)
+                        self.draw_to_point(self.rs.snapped_ref_fid, self.rs.current_measure_to)
+                        self.dlg_refresh_measure_to(self.rs.snapped_ref_fid, self.rs.current_measure_to)
+                        self.check_settings('after_measure')
+                        self.dlg_refresh_measure_section()
+                        self.dlg_refresh_edit_section()
         elif self.rs.tool_mode == 'select_features':
             # end of selection
             self.rb_ref.hide()
             self.rb_segment.hide()
             self.vm_pt_measure_from.hide()
             self.vm_pt_measure_to.hide()
-            if self.cf.show_layer_complete:
-                self.ds.showLyr.removeSelection()
+            event_index = self.get_event_index()
+            if event_index:
+                if self.cf.show_layer_complete:
+                    self.ds.showLyr.removeSelection()
 
                 if self.rs.mouse_down_point:
                     self.rs.mouse_up_point = point_xy
@@ -2732,17 +3427,11 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
                     else:
                         rect = qgis.core.QgsRectangle(self.rs.mouse_down_point.x(), self.rs.mouse_down_point.y(), self.rs.mouse_up_point.x(), self.rs.mouse_up_point.y())
 
-                    tr = qgis.core.QgsCoordinateTransform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.showLyr.crs(), qgis.core.QgsProject.instance())
+                    tr = tools.MyTransforms.get_transform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.refLyr.crs())
                     projected_rect = tr.transformBoundingBox(rect)
 
-                    request = qgis.core.QgsFeatureRequest()
-                    request.setFilterRect(projected_rect)
-                    request.setFlags(qgis.core.QgsFeatureRequest.ExactIntersect)
-
-                    new_selected_pks = []
-                    for feature in self.ds.showLyr.getFeatures(request):
-                        pk = feature[self.ds.dataLyrIdField.name()]
-                        new_selected_pks.append(pk)
+                    # calculated LoL-segments in the event-index instead of ExactIntersect on the Show-Layer
+                    new_selected_pks = list(event_index.query_rect(projected_rect).values())
 
                     if len(new_selected_pks) > 0:
                         # like implemented in QGis-Select-Features:
@@ -2765,23 +3454,18 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
                         self.rs.selected_pks = list(dict.fromkeys(self.rs.selected_pks))
 
                         # validate self.rs.selected_pks and select features:
-                        data_fids = []
-                        show_fids = []
-                        for edit_pk in self.rs.selected_pks:
-                            data_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk)
-                            if data_feature:
-                                data_fids.append(data_feature.id())
-
-                            show_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.showLyr, self.ds.showLyrBackReferenceField, edit_pk)
-                            if show_feature and show_feature.isValid():
-                                show_fids.append(show_feature.id())
-                        self.ds.showLyr.removeSelection()
-                        self.ds.showLyr.select(show_fids)
+                        # Data-fids from the event-index, one bulk-query for the optional Show-Layer
+                        data_fids = list(event_index.get_entries_by_pks(self.rs.selected_pks).keys())
                         self.ds.dataLyr.removeSelection()
                         self.ds.dataLyr.select(data_fids)
+                        if self.cf.show_layer_complete:
+                            show_features = tools.MyLayerCaches.get_features_by_pks(self.ds.showLyr, self.ds.showLyrBackReferenceField, self.rs.selected_pks, self.get_attribute_request(self.ds.showLyr))
+                            show_fids = [show_feature.id() for show_feature in show_features.values() if show_feature.isValid()]
+                            self.ds.showLyr.removeSelection()
+                            self.ds.showLyr.select(show_fids)
 
             else:
-                self.push_messages(warning_msg=QtCore.QCoreApplication.translate('LolEvt',"Missing requirements: No Show-Layer configured, check Line-on-Line-settings..."))
+                self.push_messages(warning_msg=QtCore.QCoreApplication.translate('LolEvt',"Missing requirements, Reference- and Data-Layer required, check Line-on-Line-settings..."))
                 self.my_dialogue.tbw_central.setCurrentIndex(1)
 
             self.rb_selection_rect.hide()
@@ -2791,36 +3475,30 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         elif self.rs.tool_mode == 'move_from_point':
             self.snap_indicator.setVisible(False)
             if self.cf.measure_completed:
-                ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
-                snap_filter = tools.MyToolFunctions.OneFeatureFilter(self.ds.refLyr, self.rs.snapped_ref_fid)
-                m = self.iface.mapCanvas().snappingUtils().snapToMap(event.pos(), snap_filter)
-                self.snap_indicator.setMatch(m)
-                if self.snap_indicator.match().type():
-                    snapped_point_xy = self.snap_indicator.match().point()
-                    snapped_point_geom = qgis.core.QgsGeometry.fromPointXY(snapped_point_xy)
-                    snapped_point_geom.transform(qgis.core.QgsCoordinateTransform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.refLyr.crs(), qgis.core.QgsProject.instance()))
-                    self.rs.current_measure_from = ref_feature.geometry().lineLocatePoint(snapped_point_geom)
-                    self.dlg_refresh_measure_from(self.rs.snapped_ref_fid, self.rs.current_measure_from)
-                    self.draw_from_point(self.rs.snapped_ref_fid, self.rs.current_measure_from)
-                    self.draw_segment(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to, self.rs.current_offset)
+                ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, self.rs.snapped_ref_fid)
+                if ref_geom:
+                    m, snapped_measure = self.snap_to_reference(event.pos(), self.rs.snapped_ref_fid)
+                    self.snap_indicator.setMatch(m)
+                    if self.snap_indicator.match().type():
+                        self.rs.current_measure_from = snapped_measure
+                        self.dlg_refresh_measure_from(self.rs.snapped_ref_fid, self.rs.current_measure_from)
+                        self.draw_from_point(self.rs.snapped_ref_fid, self.rs.current_measure_from)
+                        self.draw_segment(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to, self.rs.current_offset)
 
             self.check_settings('before_move_from_point')
 
         elif self.rs.tool_mode == 'move_to_point':
             self.snap_indicator.setVisible(False)
             if self.cf.measure_completed:
-                ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
-                snap_filter = tools.MyToolFunctions.OneFeatureFilter(self.ds.refLyr, self.rs.snapped_ref_fid)
-                m = self.iface.mapCanvas().snappingUtils().snapToMap(event.pos(), snap_filter)
-                self.snap_indicator.setMatch(m)
-                if self.snap_indicator.match().type():
-                    snapped_point_xy = self.snap_indicator.match().point()
-                    snapped_point_geom = qgis.core.QgsGeometry.fromPointXY(snapped_point_xy)
-                    snapped_point_geom.transform(qgis.core.QgsCoordinateTransform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.refLyr.crs(), qgis.core.QgsProject.instance()))
-                    self.rs.current_measure_to = ref_feature.geometry().lineLocatePoint(snapped_point_geom)
-                    self.draw_to_point(self.rs.snapped_ref_fid, self.rs.current_measure_to)
-                    self.draw_segment(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to, self.rs.current_offset)
-                    self.dlg_refresh_measure_to(self.rs.snapped_ref_fid, self.rs.current_measure_to)
+                ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, self.rs.snapped_ref_fid)
+                if ref_geom:
+                    m, snapped_measure = self.snap_to_reference(event.pos(), self.rs.snapped_ref_fid)
+                    self.snap_indicator.setMatch(m)
+                    if self.snap_indicator.match().type():
+                        self.rs.current_measure_to = snapped_measure
+                        self.draw_to_point(self.rs.snapped_ref_fid, self.rs.current_measure_to)
+                        self.draw_segment(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to, self.rs.current_offset)
+                        self.dlg_refresh_measure_to(self.rs.snapped_ref_fid, self.rs.current_measure_to)
 
             self.check_settings('before_move_to_point')
 
@@ -2830,71 +3508,61 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         :param event:
         """
         # Rev. 2023-05-08
+        # pending mouse-move first
+        self.move_coalescer.flush()
         # qgis.core.QgsPointXY
         point_xy = self.iface.mapCanvas().getCoordinateTransform().toMapCoordinates(event.x(), event.y())
 
         if self.rs.tool_mode == 'before_move_segment':
             if self.cf.measure_completed:
-                ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
-                ref_projected_point_geom = qgis.core.QgsGeometry.fromPointXY(point_xy)
-                ref_projected_point_geom.transform(qgis.core.QgsCoordinateTransform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.refLyr.crs(), qgis.core.QgsProject.instance()))
-
-                # see https://qgis.org/pyqgis/master/core/QgsGeometry.html#qgis.core.QgsGeometry.closestSegmentWithContext
-                # returns tuple: (sqrDist, minDistPoint, nextVertexIndex, leftOrRightOfSegment)
-                point_on_line = ref_feature.geometry().closestSegmentWithContext(ref_projected_point_geom.asPoint())
-                current_measure = ref_feature.geometry().lineLocatePoint(qgis.core.QgsGeometry.fromPointXY(point_on_line[1]))
-                self.rs.last_measure = current_measure
-                self.check_settings('move_segment')
+                ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, self.rs.snapped_ref_fid)
+                if ref_geom:
+                    ref_projected_point_geom = qgis.core.QgsGeometry.fromPointXY(point_xy)
+                    ref_projected_point_geom.transform(tools.MyTransforms.get_transform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.refLyr.crs()))
+
+                    # measure, squared distance and side (<0 left, >0 right, ==0 on the line) in one query,
+                    # see MyLayerCaches.RefGeometry.locate_point
+                    current_measure, sqr_dist, side = ref_geom.locate_point(ref_projected_point_geom.asPoint())
+                    self.rs.last_measure = current_measure
+                    self.check_settings('move_segment')
 
         elif self.rs.tool_mode == 'before_measure':
-            snap_filter = tools.MyToolFunctions.OneLayerFilter(self.ds.refLyr)
-
-            m = self.iface.mapCanvas().snappingUtils().snapToMap(event.pos(), snap_filter)
-
-            if self.snap_indicator.match().type():
-                snapped_point_xy = self.snap_indicator.match().point()
-                snapped_point_geom = qgis.core.QgsGeometry.fromPointXY(snapped_point_xy)
-                snapped_point_geom.transform(qgis.core.QgsCoordinateTransform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.refLyr.crs(), qgis.core.QgsProject.instance()))
+            m, snapped_measure = self.snap_to_reference(event.pos())
 
+            if m.type():
                 snapped_ref_fid = m.featureId()
-                ref_feature = self.ds.refLyr.getFeature(snapped_ref_fid)
-                snapped_ref_geom = ref_feature.geometry()
-                self.rs.snapped_ref_fid = ref_feature.id()
-                self.my_dialogue.qcbn_snapped_ref_fid.select_by_value(0, 256, self.rs.snapped_ref_fid)
-                self.rs.current_measure_from = snapped_ref_geom.lineLocatePoint(snapped_point_geom)
-                self.dlg_refresh_measure_from(self.rs.snapped_ref_fid, self.rs.current_measure_from)
-                self.draw_from_point(self.rs.snapped_ref_fid, self.rs.current_measure_from)
-                self.check_settings('measuring')
+                ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, snapped_ref_fid)
+                if ref_geom:
+                    self.rs.snapped_ref_fid = ref_geom.fid
+                    self.my_dialogue.qcbn_snapped_ref_fid.select_by_value(0, 256, self.rs.snapped_ref_fid)
+                    self.rs.current_measure_from = snapped_measure
+                    self.dlg_refresh_measure_from(self.rs.snapped_ref_fid, self.rs.current_measure_from)
+                    self.draw_from_point(self.rs.snapped_ref_fid, self.rs.current_measure_from)
+                    self.check_settings('measuring')
         elif self.rs.tool_mode == 'before_move_from_point':
             if self.cf.measure_completed:
-                ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
-                snap_filter = tools.MyToolFunctions.OneFeatureFilter(self.ds.refLyr, self.rs.snapped_ref_fid)
-                m = self.iface.mapCanvas().snappingUtils().snapToMap(event.pos(), snap_filter)
-                self.snap_indicator.setMatch(m)
-                if self.snap_indicator.match().type():
-                    snapped_point_xy = self.snap_indicator.match().point()
-                    snapped_point_geom = qgis.core.QgsGeometry.fromPointXY(snapped_point_xy)
-                    snapped_point_geom.transform(qgis.core.QgsCoordinateTransform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.refLyr.crs(), qgis.core.QgsProject.instance()))
-                    self.rs.current_measure_from = ref_feature.geometry().lineLocatePoint(snapped_point_geom)
-                    self.draw_segment(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to, self.rs.current_offset)
-                    self.draw_from_point(self.rs.snapped_ref_fid, self.rs.current_measure_from)
-                    self.dlg_refresh_measure_from(self.rs.snapped_ref_fid, self.rs.current_measure_from)
-                    self.check_settings('move_from_point')
+                ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, self.rs.snapped_ref_fid)
+                if ref_geom:
+                    m, snapped_measure = self.snap_to_reference(event.pos(), self.rs.snapped_ref_fid)
+                    self.snap_indicator.setMatch(m)
+                    if self.snap_indicator.match().type():
+                        self.rs.current_measure_from = snapped_measure
+                        self.draw_segment(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to, self.rs.current_offset)
+                        self.draw_from_point(self.rs.snapped_ref_fid, self.rs.current_measure_from)
+                        self.dlg_refresh_measure_from(self.rs.snapped_ref_fid, self.rs.current_measure_from)
+                        self.check_settings('move_from_point')
         elif self.rs.tool_mode == 'before_move_to_point':
             if self.cf.measure_completed:
-                ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
-                snap_filter = tools.MyToolFunctions.OneFeatureFilter(self.ds.refLyr, self.rs.snapped_ref_fid)
-                m = self.iface.mapCanvas().snappingUtils().snapToMap(event.pos(), snap_filter)
-                self.snap_indicator.setMatch(m)
-                if self.snap_indicator.match().type():
-                    snapped_point_xy = self.snap_indicator.match().point()
-                    snapped_point_geom = qgis.core.QgsGeometry.fromPointXY(snapped_point_xy)
-                    snapped_point_geom.transform(qgis.core.QgsCoordinateTransform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.refLyr.crs(), qgis.core.QgsProject.instance()))
-                    self.rs.current_measure_to = ref_feature.geometry().lineLocatePoint(snapped_point_geom)
-                    self.draw_segment(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to, self.rs.current_offset)
-                    self.draw_to_point(self.rs.snapped_ref_fid, self.rs.current_measure_to)
-                    self.dlg_refresh_measure_to(self.rs.snapped_ref_fid, self.rs.current_measure_to)
-                    self.check_settings('move_to_point')
+                ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, self.rs.snapped_ref_fid)
+                if ref_geom:
+                    m, snapped_measure = self.snap_to_reference(event.pos(), self.rs.snapped_ref_fid)
+                    self.snap_indicator.setMatch(m)
+                    if self.snap_indicator.match().type():
+                        self.rs.current_measure_to = snapped_measure
+                        self.draw_segment(self.rs.snapped_ref_fid, self.rs.current_measure_from, self.rs.current_measure_to, self.rs.current_offset)
+                        self.draw_to_point(self.rs.snapped_ref_fid, self.rs.current_measure_to)
+                        self.dlg_refresh_measure_to(self.rs.snapped_ref_fid, self.rs.current_measure_to)
+                        self.check_settings('move_to_point')
 
         elif self.rs.tool_mode == 'show_re_digitized_feature':
             pass
@@ -2910,7 +3578,7 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
 
     def s_create_data_layer(self):
         """create a GeoPackage-"layer" (geometry-less) for storing the linear-references"""
-        # Rev. 2023-05-08
+        # Rev. 2023-09-08
         try_it = True
         did_it = False
         critical_msg = ''
@@ -2971,6 +3639,7 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
                 table_name, ok = QtWidgets.QInputDialog.getText(None, f"LinearReferencing ({gdp()})", QtCore.QCoreApplication.translate('LolEvt',"Name for table in GeoPackage:"), QtWidgets.QLineEdit.Normal, table_name)
                 if not ok or not table_name:
                     info_msg = QtCore.QCoreApplication.translate('LolEvt',"Canceled by user")
+                    try_it = False
                 elif table_name in used_layer_names:
 
                     dialog_result = QtWidgets.QMessageBox.question(
@@ -2986,6 +3655,15 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
                         try_it = False
 
                 if try_it:
+                    # indexes and storage-options, see tools.MyGeoPackage
+                    storage_options = [QtCore.QCoreApplication.translate('LolEvt',"Indexed"), QtCore.QCoreApplication.translate('LolEvt',"Indexed, WAL-journal, page-size 8192 (new GeoPackage)"), QtCore.QCoreApplication.translate('LolEvt',"Bulk load: index after first commit, WAL-journal, page-size 8192 (new GeoPackage)")]
+                    storage_option, ok = QtWidgets.QInputDialog.getItem(None, f"LinearReferencing ({gdp()})", QtCore.QCoreApplication.translate('LolEvt',"GeoPackage-options:"), storage_options, 0, False)
+                    if not ok:
+                        info_msg = QtCore.QCoreApplication.translate('LolEvt',"Canceled by user")
+                        try_it = False
+
+                if try_it:
+                    is_new = not os.path.isfile(gpkg_path)
                     options.layerName = table_name
                     # geometry-less table needs anyway three Dummy-Attributes for geometrie-type, projection and transformation
                     writer = qgis.core.QgsVectorFileWriter.create(
@@ -3006,10 +3684,18 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
                         # perhaps layer is physically created after "del writer"?
                         del writer
 
+                        # page-size and journal-mode before the layer is opened
+                        tune_msg = tools.MyGeoPackage.tune(gpkg_path, 8192 if storage_option != storage_options[0] else 0, storage_option != storage_options[0], is_new)
+
                         uri = gpkg_path + '|layername=' + table_name
                         data_lyr = self.iface.addVectorLayer(uri, table_name, "ogr")
 
                         if data_lyr and data_lyr.isValid():
+                            # bulk-load: index created after the first commit, f.e. the import of a measure-table
+                            index_msg = tools.MyGeoPackage.create_indexes(data_lyr.id(), gpkg_path, table_name, data_lyr_reference_field.name(), [data_lyr_measure_from_field.name(), data_lyr_measure_to_field.name()], storage_option == storage_options[2])
+                            if tune_msg or index_msg:
+                                warning_msg = qt_format(QtCore.QCoreApplication.translate('LolEvt',"GeoPackage-options not applied: {0}"), tune_msg or index_msg)
+
                             # very unfortunately: constraints only affects the form, edits in the table ar not affected and must be checked by provider
                             data_lyr.setFieldConstraint(0, qgis.core.QgsFieldConstraints.Constraint.ConstraintUnique)
                             data_lyr.setFieldConstraint(0, qgis.core.QgsFieldConstraints.Constraint.ConstraintNotNull)
@@ -3050,9 +3736,50 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
 
         self.push_messages(success_msg, info_msg, warning_msg, critical_msg)
 
+    def create_db_show_layer(self, layer_name: str) -> tuple:
+        """creates a PostGIS-view or a trigger-maintained table in PostGIS/SpatiaLite, see tools.MyDbViews
+        the SQL is shown for confirmation before execution
+        :param layer_name: name of the layer, database-object-name derived from it
+        :returns tuple (show_lyr, error_msg), show_lyr None if canceled or failed, error_msg empty if canceled
+        """
+        # Rev. 2023-09-07
+        modes = [QtCore.QCoreApplication.translate('LolEvt', "View (PostGIS)"), QtCore.QCoreApplication.translate('LolEvt', "Trigger-maintained table (PostGIS/SpatiaLite)")]
+        mode, ok = QtWidgets.QInputDialog.getItem(None, f"LinearReferencing ({gdp()})", QtCore.QCoreApplication.translate('LolEvt', "Type of database-object:"), modes, 0, False)
+        if not ok:
+            return None, ''
+
+        generator = tools.MyDbViews.ShowObjectGenerator(
+            'LolEvt',
+            self.ds.refLyr,
+            self.ds.refLyrPkField.name(),
+            self.ds.dataLyr,
+            self.ds.dataLyrIdField.name(),
+            self.ds.dataLyrReferenceField.name(),
+            [self.ds.dataLyrMeasureFromField.name(), self.ds.dataLyrMeasureToField.name(), self.ds.dataLyrOffsetField.name()],
+            tools.MyDbViews.get_object_name(layer_name),
+            'view' if mode == modes[0] else 'table'
+        )
+        error_msg = generator.check()
+        if error_msg:
+            return None, error_msg
+
+        msg_box = QtWidgets.QMessageBox(QtWidgets.QMessageBox.Question, f"LinearReferencing ({gdp()})", qt_format(QtCore.QCoreApplication.translate('LolEvt', "Create {apos}{0}{apos} in the database of the Data-Layer?{br}SQL see details..."), generator.object_qualified_name), QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.Cancel)
+        msg_box.setDetailedText(generator.sql_script())
+        if msg_box.exec_() != QtWidgets.QMessageBox.Yes:
+            return None, ''
+
+        error_msg = generator.execute()
+        if error_msg:
+            return None, error_msg
+
+        show_lyr = generator.load_layer(layer_name)
+        if not show_lyr.isValid():
+            return None, qt_format(QtCore.QCoreApplication.translate('LolEvt', "{apos}{0}{apos} created, but not loadable as layer"), generator.object_qualified_name)
+        return show_lyr, ''
+
     def s_create_show_layer(self):
         """create a virtual layer combining the Data-Layer and the Reference-Layer"""
-        # Rev. 2023-05-08
+        # Rev. 2023-09-07
         try_it = True
         did_it = False
         critical_msg = ''
@@ -3069,71 +3796,101 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
 
             layer_name, ok = QtWidgets.QInputDialog.getText(None, f"LinearReferencing ({gdp()})", QtCore.QCoreApplication.translate('LolEvt',"Name for virtual Show-Layer:"), QtWidgets.QLineEdit.Normal, layer_name)
             if ok and layer_name:
-                show_lyr_sql = "SELECT"
-                field_sql_lst = []
-
-                # only the necessary attributes of Data-Layer are included, the other come via join, reuse the original field-names as aliases
-                field_sql_lst.append(f" data_lyr.{self.ds.dataLyrIdField.name()} as \"{self.ds.dataLyrIdField.name()}\"")
-                field_sql_lst.append(f" data_lyr.{self.ds.dataLyrReferenceField.name()} as \"{self.ds.dataLyrReferenceField.name()}\"")
-                field_sql_lst.append(f" data_lyr.{self.ds.dataLyrMeasureFromField.name()} as \"{self.ds.dataLyrMeasureFromField.name()}\"")
-                field_sql_lst.append(f" data_lyr.{self.ds.dataLyrMeasureToField.name()} as \"{self.ds.dataLyrMeasureToField.name()}\"")
-                field_sql_lst.append(f" data_lyr.{self.ds.dataLyrOffsetField.name()} as \"{self.ds.dataLyrOffsetField.name()}\"")
-                # no refLyr-fields in query, solved via Table-Join
-
-                # Problem/Bug only under windows:
-                # if dataLyr has no records ➜ show_lyr.renderer() == None
-                # Workaround:
-                # Geometry-Expression with "special comment" according https://docs.qgis.org/testing/en/docs/user_manual/managing_data_source/create_layers.html#creating-virtual-layers
-
-                # Bug 2 (only in Windows!):
-                # offset == 0 ➜ no result
-                # therefore a more complex query:
-                no_offset = f"data_lyr.\"{self.ds.dataLyrOffsetField.name()}\" is null or data_lyr.\"{self.ds.dataLyrOffsetField.name()}\" = 0"
-                geom_without_offset = f"ST_Line_Substring(ref_lyr.geometry, min(data_lyr.\"{self.ds.dataLyrMeasureFromField.name()}\",data_lyr.\"{self.ds.dataLyrMeasureToField.name()}\")/st_length(ref_lyr.geometry),max(data_lyr.\"{self.ss.dataLyrMeasureFromFieldName}\",data_lyr.\"{self.ss.dataLyrMeasureToFieldName}\")/st_length(ref_lyr.geometry))"
-                geom_with_offset = f"ST_OffsetCurve(ST_Line_Substring(ref_lyr.geometry, min(data_lyr.\"{self.ds.dataLyrMeasureFromField.name()}\",data_lyr.\"{self.ds.dataLyrMeasureToField.name()}\")/st_length(ref_lyr.geometry),max(data_lyr.\"{self.ds.dataLyrMeasureFromField.name()}\",data_lyr.\"{self.ds.dataLyrMeasureToField.name()}\")/st_length(ref_lyr.geometry)),data_lyr.\"{self.ds.dataLyrOffsetField.name()}\")"
-
-                field_sql_lst.append(f" CASE WHEN {no_offset} THEN {geom_without_offset} ELSE {geom_with_offset} END as line_geom /*:linestring:{self.ds.refLyr.crs().postgisSrid()}*/")
-
-                # field_sql_lst.append(f" {geom_with_offset} as line_geom /*:linestring:{self.ds.refLyr.crs().postgisSrid()}*/")
-
-                show_lyr_sql += ',\n'.join(field_sql_lst)
-                show_lyr_sql += f"\nFROM  \"{self.ds.dataLyr.id()}\" as data_lyr"
-                show_lyr_sql += f"\n  INNER JOIN \"{self.ds.refLyr.id()}\" as ref_lyr"
-                integer_field_types = [QtCore.QVariant.Int, QtCore.QVariant.UInt, QtCore.QVariant.LongLong, QtCore.QVariant.ULongLong]
-                if self.ds.dataLyrReferenceField.type() in integer_field_types:
-                    show_lyr_sql += f" ON data_lyr.\"{self.ds.dataLyrReferenceField.name()}\" = ref_lyr.\"{self.ds.refLyrPkField.name()}\""
+                # virtual layer, materialized memory-layer, see tools.MyShowLayers, or layer with the plugin-provider, see tools.MyShowProvider
+                layer_types = [QtCore.QCoreApplication.translate('LolEvt', "Virtual layer"), QtCore.QCoreApplication.translate('LolEvt', "Materialized memory-layer"), QtCore.QCoreApplication.translate('LolEvt', "Calculated layer (provider linref)"), QtCore.QCoreApplication.translate('LolEvt', "Database view/table (PostGIS/SpatiaLite)")]
+                layer_type, ok = QtWidgets.QInputDialog.getItem(None, f"LinearReferencing ({gdp()})", QtCore.QCoreApplication.translate('LolEvt', "Type of Show-Layer:"), layer_types, 0, False)
+
+            if ok and layer_name:
+                is_materialized = layer_type == layer_types[1]
+                is_linref = layer_type == layer_types[2]
+                is_db = layer_type == layer_types[3]
+                db_msg = ''
+                if is_materialized:
+                    # the geometries are calculated by the plugin and updated on Data-Layer-commits
+                    show_lyr = tools.MyShowLayers.create_memory_layer(layer_name, 'linestring', self.ds.refLyr.crs(), [self.ds.dataLyrIdField, self.ds.dataLyrReferenceField, self.ds.dataLyrMeasureFromField, self.ds.dataLyrMeasureToField, self.ds.dataLyrOffsetField], 'LolEvt')
+                elif is_db:
+                    # the geometries are calculated by the database, view or trigger-maintained table, see tools.MyDbViews
+                    show_lyr, db_msg = self.create_db_show_layer(layer_name)
+                elif is_linref:
+                    # the geometries are calculated by the provider on request, only for the features in the filter-rect
+                    uri = tools.MyShowProvider.build_uri(
+                        'LolEvt',
+                        self.ds.refLyr.crs(),
+                        self.ds.refLyr.id(),
+                        self.ds.refLyrPkField.name(),
+                        self.ds.dataLyr.id(),
+                        [self.ds.dataLyrIdField, self.ds.dataLyrReferenceField, self.ds.dataLyrMeasureFromField, self.ds.dataLyrMeasureToField, self.ds.dataLyrOffsetField],
+                        self.ds.dataLyrIdField.name(),
+                        self.ds.dataLyrReferenceField.name(),
+                        [self.ds.dataLyrMeasureFromField.name(), self.ds.dataLyrMeasureToField.name(), self.ds.dataLyrOffsetField.name()]
+                    )
+                    show_lyr = qgis.core.QgsVectorLayer(uri, layer_name, tools.MyShowProvider.provider_key)
                 else:
-                    # needed with non-integer join-fields,
-                    # makes the query/layer *very* slow, presumably because of missing indexes?
-                    # ➜ better avoid non-integer PKs
-                    show_lyr_sql += f" ON (data_lyr.\"{self.ds.dataLyrReferenceField.name()}\" = ref_lyr.\"{self.ds.refLyrPkField.name()}\") = True"
-
-                # urllib.parse.quote? https://docs.python.org/3/library/urllib.parse.html
-                # Perhaps not necessary, but "iface.activeLayer().dataProvider().uri().uri()"
-                # show_lyr_sql_q = urllib.parse.quote(show_lyr_sql)
-
-                uri = f"?query={show_lyr_sql}"
-
-                # set uid-Field for virtual Layer via "&uid="
-                # only for integer-PKs
-                # advantage: no artificial fid used, feature.id() returns this value
-                # if the Name of a string-PK would be used for that param
-                # ➜ no error
-                # ➜ the layer will show in canvas
-                # ➜ but the associated table has only *one* record
-                if self.ds.dataLyrIdField.type() in integer_field_types:
-                    uri += f"&uid={self.ds.dataLyrIdField.name()}"
-
-                # &geometry=alias used in show_lyr_sql
-                # :2: ➜ :linestring:
-                # {epsg} ➜ same as Reference-Layer
-                # anyway:
-                # under windows:
-                # the "Virtual Layer Dialog shows for "Geometry" allways "Autodetect" instead "Manually defined", so the whole
-                # "&geometry=point_geom:linestring:25832"-part seems to be ignored
-                uri += f"&geometry=line_geom:2:{self.ds.refLyr.crs().postgisSrid()}"
-
-                show_lyr = qgis.core.QgsVectorLayer(uri, layer_name, "virtual")
+                    show_lyr_sql = "SELECT"
+                    field_sql_lst = []
+
+                    # only the necessary attributes of Data-Layer are included, the other come via join, reuse the original field-names as aliases
+                    field_sql_lst.append(f" data_lyr.{self.ds.dataLyrIdField.name()} as \"{self.ds.dataLyrIdField.name()}\"")
+                    field_sql_lst.append(f" data_lyr.{self.ds.dataLyrReferenceField.name()} as \"{self.ds.dataLyrReferenceField.name()}\"")
+                    field_sql_lst.append(f" data_lyr.{self.ds.dataLyrMeasureFromField.name()} as \"{self.ds.dataLyrMeasureFromField.name()}\"")
+                    field_sql_lst.append(f" data_lyr.{self.ds.dataLyrMeasureToField.name()} as \"{self.ds.dataLyrMeasureToField.name()}\"")
+                    field_sql_lst.append(f" data_lyr.{self.ds.dataLyrOffsetField.name()} as \"{self.ds.dataLyrOffsetField.name()}\"")
+                    # no refLyr-fields in query, solved via Table-Join
+
+                    # Problem/Bug only under windows:
+                    # if dataLyr has no records ➜ show_lyr.renderer() == None
+                    # Workaround:
+                    # Geometry-Expression with "special comment" according https://docs.qgis.org/testing/en/docs/user_manual/managing_data_source/create_layers.html#creating-virtual-layers
+
+                    # Bug 2 (only in Windows!):
+                    # offset == 0 ➜ no result
+                    # therefore a more complex query:
+                    no_offset = f"data_lyr.\"{self.ds.dataLyrOffsetField.name()}\" is null or data_lyr.\"{self.ds.dataLyrOffsetField.name()}\" = 0"
+                    geom_without_offset = f"ST_Line_Substring(ref_lyr.geometry, min(data_lyr.\"{self.ds.dataLyrMeasureFromField.name()}\",data_lyr.\"{self.ds.dataLyrMeasureToField.name()}\")/st_length(ref_lyr.geometry),max(data_lyr.\"{self.ss.dataLyrMeasureFromFieldName}\",data_lyr.\"{self.ss.dataLyrMeasureToFieldName}\")/st_length(ref_lyr.geometry))"
+                    geom_with_offset = f"ST_OffsetCurve(ST_Line_Substring(ref_lyr.geometry, min(data_lyr.\"{self.ds.dataLyrMeasureFromField.name()}\",data_lyr.\"{self.ds.dataLyrMeasureToField.name()}\")/st_length(ref_lyr.geometry),max(data_lyr.\"{self.ds.dataLyrMeasureFromField.name()}\",data_lyr.\"{self.ds.dataLyrMeasureToField.name()}\")/st_length(ref_lyr.geometry)),data_lyr.\"{self.ds.dataLyrOffsetField.name()}\")"
+
+                    field_sql_lst.append(f" CASE WHEN {no_offset} THEN {geom_without_offset} ELSE {geom_with_offset} END as line_geom /*:linestring:{self.ds.refLyr.crs().postgisSrid()}*/")
+
+                    # field_sql_lst.append(f" {geom_with_offset} as line_geom /*:linestring:{self.ds.refLyr.crs().postgisSrid()}*/")
+
+                    show_lyr_sql += ',\n'.join(field_sql_lst)
+                    show_lyr_sql += f"\nFROM  \"{self.ds.dataLyr.id()}\" as data_lyr"
+                    show_lyr_sql += f"\n  INNER JOIN \"{self.ds.refLyr.id()}\" as ref_lyr"
+                    integer_field_types = [QtCore.QVariant.Int, QtCore.QVariant.UInt, QtCore.QVariant.LongLong, QtCore.QVariant.ULongLong]
+                    if self.ds.dataLyrReferenceField.type() in integer_field_types:
+                        show_lyr_sql += f" ON data_lyr.\"{self.ds.dataLyrReferenceField.name()}\" = ref_lyr.\"{self.ds.refLyrPkField.name()}\""
+                    else:
+                        # needed with non-integer join-fields,
+                        # makes the query/layer *very* slow, presumably because of missing indexes?
+                        # ➜ better avoid non-integer PKs
+                        show_lyr_sql += f" ON (data_lyr.\"{self.ds.dataLyrReferenceField.name()}\" = ref_lyr.\"{self.ds.refLyrPkField.name()}\") = True"
+
+                    # urllib.parse.quote? https://docs.python.org/3/library/urllib.parse.html
+                    # Perhaps not necessary, but "iface.activeLayer().dataProvider().uri().uri()"
+                    # show_lyr_sql_q = urllib.parse.quote(show_lyr_sql)
+
+                    uri = f"?query={show_lyr_sql}"
+
+                    # set uid-Field for virtual Layer via "&uid="
+                    # only for integer-PKs
+                    # advantage: no artificial fid used, feature.id() returns this value
+                    # if the Name of a string-PK would be used for that param
+                    # ➜ no error
+                    # ➜ the layer will show in canvas
+                    # ➜ but the associated table has only *one* record
+                    if self.ds.dataLyrIdField.type() in integer_field_types:
+                        uri += f"&uid={self.ds.dataLyrIdField.name()}"
+
+                    # &geometry=alias used in show_lyr_sql
+                    # :2: ➜ :linestring:
+                    # {epsg} ➜ same as Reference-Layer
+                    # anyway:
+                    # under windows:
+                    # the "Virtual Layer Dialog shows for "Geometry" allways "Autodetect" instead "Manually defined", so the whole
+                    # "&geometry=point_geom:linestring:25832"-part seems to be ignored
+                    uri += f"&geometry=line_geom:2:{self.ds.refLyr.crs().postgisSrid()}"
+
+                    show_lyr = qgis.core.QgsVectorLayer(uri, layer_name, "virtual")
 
                 if show_lyr and show_lyr.renderer():
                     qvl_join_data_lyr = qgis.core.QgsVectorLayerJoinInfo()
@@ -3191,7 +3948,18 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
 
                     did_it = True
 
-                    success_msg = QtCore.QCoreApplication.translate('LolEvt',"Virtual Show-Layer created and added...")
+                    if is_materialized:
+                        success_msg = QtCore.QCoreApplication.translate('LolEvt',"Materialized Show-Layer created and added...")
+                    elif is_linref:
+                        success_msg = QtCore.QCoreApplication.translate('LolEvt',"Calculated Show-Layer created and added...")
+                    elif is_db:
+                        success_msg = QtCore.QCoreApplication.translate('LolEvt',"Database Show-Layer created and added...")
+                    else:
+                        success_msg = QtCore.QCoreApplication.translate('LolEvt',"Virtual Show-Layer created and added...")
+                elif is_db and not db_msg:
+                    info_msg = QtCore.QCoreApplication.translate('LolEvt',"Canceled by user")
+                elif is_db:
+                    critical_msg = qt_format(QtCore.QCoreApplication.translate('LolEvt',"Error creating database Show-Layer:{br}{0}"), db_msg)
                 else:
                     critical_msg = QtCore.QCoreApplication.translate('LolEvt',"Error creating virtual Show-Layer...")
 
@@ -3265,7 +4033,7 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
 
     def s_delete_feature(self):
         """deletes the current selected data-feature after confirmation"""
-        # Rev. 2023-04-27
+        # Rev. 2023-09-09
         try_it = True
         did_it = True
         critical_msg = ''
@@ -3274,9 +4042,9 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         warning_msg = ''
 
         if self.cf.delete_enabled:
-            data_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.dataLyr, self.ds.dataLyrIdField, self.rs.edit_pk)
+            data_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.dataLyr, self.ds.dataLyrIdField, self.rs.edit_pk)
             if data_feature:
-                if self.ds.dataLyr.isEditable():
+                if self.ds.dataLyr.isEditable() and not self.edit_session.active:
                     if self.ds.dataLyr.isModified():
                         dialog_result = QtWidgets.QMessageBox.question(
                             None,
@@ -3298,7 +4066,7 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
                         self.ds.dataLyr.rollBack()
 
                 if try_it:
-                    self.ds.dataLyr.startEditing()
+                    self.start_data_edit("LinearReferencing: delete feature")
                     dialog_result = QtWidgets.QMessageBox.question(
                         None,
                         f"LinearReferencing ({gdp()})",
@@ -3310,12 +4078,12 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
                     if dialog_result == QtWidgets.QMessageBox.Yes:
                         try:
                             self.ds.dataLyr.deleteFeatures([self.rs.edit_pk])
-                            commit_result = self.ds.dataLyr.commitChanges()
+                            commit_result = self.commit_data_edit()
                             if commit_result:
                                 did_it = True
                                 success_msg = qt_format(QtCore.QCoreApplication.translate('LolEvt',"Feature with ID {apos}{0}{apos} successfully deleted in Data-Layer {apos}{1}{apos}..."),self.rs.edit_pk,self.ds.dataLyr.name())
                             else:
-                                self.ds.dataLyr.rollBack()
+                                self.rollback_data_edit()
                                 did_it = False
                                 critical_msg = str(self.ds.dataLyr.commitErrors())
 
@@ -3324,11 +4092,11 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
 
                             self.rs.edit_pk = None
                         except Exception as err:
-                            self.ds.dataLyr.rollBack()
+                            self.rollback_data_edit()
                             did_it = False
                             critical_msg = f"Exception {apos}{err.__class__.__name__}{apos} in {gdp()}: {err}"
                     else:
-                        self.ds.dataLyr.rollBack()
+                        self.rollback_data_edit()
                         did_it = False
                         info_msg = QtCore.QCoreApplication.translate('LolEvt',"Canceled by user...")
             else:
@@ -3346,11 +4114,8 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
             self.dlg_refresh_feature_selection_section()
             self.dlg_refresh_edit_section()
 
-            if self.cf.show_layer_complete:
-                if self.iface.mapCanvas().isCachingEnabled():
-                    self.ds.showLyr.triggerRepaint()
-                else:
-                    self.iface.mapCanvas().refresh()
+            if not self.edit_session.active:
+                self.refresh_show_layer(False)
 
             self.resume_measure()
 
@@ -3359,7 +4124,7 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
 
     def s_insert_feature(self):
         """opens insert from with some prefilled contents, from which a new can be inserted to Data-Layer"""
-        # Rev. 2023-04-28
+        # Rev. 2023-09-09
         try_it = True
         did_it = False
         success_msg = ''
@@ -3370,7 +4135,7 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         used_pk = None
 
         if self.cf.insert_enabled:
-            if self.ds.dataLyr.isEditable():
+            if self.ds.dataLyr.isEditable() and not self.edit_session.active:
                 if self.ds.dataLyr.isModified():
                     dialog_result = QtWidgets.QMessageBox.question(
                         None,
@@ -3425,23 +4190,19 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
                     if self.ds.dataLyrIdField.type() in integer_field_types:
                         # pre-fetch sequence-value for openFeatureForm for convenience
                         # normally integer-pk-Field declared as "INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL"
-                        current_pks = qgis.core.QgsVectorLayerUtils.getValues(self.ds.dataLyr, self.ds.dataLyrIdField.name(), selectedOnly=False)[0]
-                        if current_pks:
-                            new_pk = max(current_pks) + 1
-                        else:
-                            new_pk = 1
-                        data_feature[self.ds.dataLyrIdField.name()] = new_pk
+                        # provider-sequence or cached counter, see MyLayerCaches.PkAllocator
+                        data_feature[self.ds.dataLyrIdField.name()] = tools.MyLayerCaches.get_next_pk(self.ds.dataLyr, self.ds.dataLyrIdField)
                         # no convenience for string-PKs, but fortunately the FeatureForm checks the uniqueness
 
                     try:
-                        self.ds.dataLyr.startEditing()
+                        self.start_data_edit("LinearReferencing: insert feature")
                         self.ds.dataLyr.addFeature(data_feature)
                         dlg_result = self.iface.openFeatureForm(self.ds.dataLyr, data_feature)
                         if dlg_result:
                             insert_ref_pk = data_feature[self.ds.dataLyrReferenceField.name()]
                             insert_measure_from = data_feature[self.ds.dataLyrMeasureFromField.name()]
                             insert_measure_to = data_feature[self.ds.dataLyrMeasureToField.name()]
-                            ref_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.refLyr, self.ds.refLyrPkField, insert_ref_pk)
+                            ref_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.refLyr, self.ds.refLyrPkField, insert_ref_pk)
 
                             # User could have changed feature-data in dialog (PK, reference-id, measure)
                             # ➜ validity-check like "reference-id exists in refLyr?" "measure 0 ...referenced_line_length?"
@@ -3459,23 +4220,23 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
 
                                 # User could have changed feature-data in dialog (PK, reference-id, measure)
                                 # but despite that no client-side validity-check like "reference-id exists in refLyr?" "measure 0 ...referenced_line_length?"
-                                commit_result = self.ds.dataLyr.commitChanges()
+                                commit_result = self.commit_data_edit()
                                 if commit_result:
                                     used_pk = data_feature[self.ds.dataLyrIdField.name()]
                                     did_it = True
                                     success_msg = qt_format(QtCore.QCoreApplication.translate('LolEvt',"New feature with ID {apos}{0}{apos} successfully added to Data-Layer {apos}{1}{apos}..."),used_pk,self.ds.dataLyr.name())
                                 else:
-                                    self.ds.dataLyr.rollBack()
+                                    self.rollback_data_edit()
                                     critical_msg = str(self.ds.dataLyr.commitErrors())
                             else:
-                                self.ds.dataLyr.rollBack()
+                                self.rollback_data_edit()
                                 critical_msg = qt_format(QtCore.QCoreApplication.translate('LolEvt',"No valid feature with PK {apos}{0}{apos} in Reference-Layer {apos}{1}{apos}..."),insert_ref_pk,self.ds.refLyr.name())
                         else:
-                            self.ds.dataLyr.rollBack()
+                            self.rollback_data_edit()
                             info_msg = QtCore.QCoreApplication.translate('LolEvt',"Canceled by user...")
 
                     except Exception as err:
-                        self.ds.dataLyr.rollBack()
+                        self.rollback_data_edit()
                         critical_msg = str(err)
 
 
@@ -3483,12 +4244,8 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
             critical_msg = qt_format(QtCore.QCoreApplication.translate('LolEvt',"Add feature failed, missing privileges in Data-Layer {apos}{0}{apos}..."),self.ds.dataLyr.name())
 
         if did_it:
-            if self.cf.show_layer_complete:
-                self.ds.showLyr.updateExtents()
-                if self.iface.mapCanvas().isCachingEnabled():
-                    self.ds.showLyr.triggerRepaint()
-                else:
-                    self.iface.mapCanvas().refresh()
+            if not self.edit_session.active:
+                self.refresh_show_layer()
             self.set_edit_pk(used_pk, False)
 
         self.push_messages(success_msg, info_msg, warning_msg, critical_msg)
@@ -3708,6 +4465,10 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
                 self.ds.showLyrBackReferenceField is not None
         )
 
+        show_layer_materializer = self.get_show_layer_materializer()
+        if show_layer_materializer:
+            show_layer_materializer.ensure_materialized()
+
         if self.rs.snapped_ref_fid is not None:
             if self.cf.reference_layer_defined:
                 ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
@@ -3719,10 +4480,10 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         if self.cf.reference_layer_complete and self.cf.data_layer_complete:
             # double-check: data_feature and ref_feature
             if self.rs.edit_pk is not None:
-                data_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.dataLyr, self.ds.dataLyrIdField, self.rs.edit_pk)
+                data_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.dataLyr, self.ds.dataLyrIdField, self.rs.edit_pk)
                 if data_feature and data_feature.isValid():
                     ref_id = data_feature[self.ss.dataLyrReferenceFieldName]
-                    ref_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.refLyr, self.ds.refLyrPkField, ref_id)
+                    ref_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.refLyr, self.ds.refLyrPkField, ref_id)
                     if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
                         checked_edit_pk = self.rs.edit_pk
         self.rs.edit_pk = checked_edit_pk
@@ -3735,10 +4496,10 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
 
             # check self.rs.selected_pks: iterate through List of PKs and query features
             for pk in self.rs.selected_pks:
-                data_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.dataLyr, self.ds.dataLyrIdField, pk)
+                data_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.dataLyr, self.ds.dataLyrIdField, pk)
                 if data_feature and data_feature.isValid():
                     ref_id = data_feature[self.ss.dataLyrReferenceFieldName]
-                    ref_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.refLyr, self.ds.refLyrPkField, ref_id)
+                    ref_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.refLyr, self.ds.refLyrPkField, ref_id)
                     if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
                         checked_selected_pks.append(pk)
 
@@ -3754,7 +4515,7 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
             if not self.cf.reference_layer_defined:
                 tool_mode = 'disabled'
         elif tool_mode in ['select_features']:
-            if not (self.cf.reference_layer_complete and self.cf.data_layer_complete and self.cf.show_layer_complete):
+            if not (self.cf.reference_layer_complete and self.cf.data_layer_complete):
                 if self.cf.reference_layer_defined:
                     tool_mode = 'before_measure'
                 else:
@@ -3820,11 +4581,13 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
 
     def dlg_refresh_edit_section(self):
         """refreshes the edit-section in dialog"""
-        # Rev. 2023-05-10
+        # Rev. 2023-09-09
         if self.my_dialogue:
             self.my_dialogue.pbtn_insert_feature.setEnabled(self.cf.insert_enabled)
             self.my_dialogue.pbtn_update_feature.setEnabled(self.cf.update_enabled and self.rs.edit_pk is not None)
             self.my_dialogue.pbtn_delete_feature.setEnabled(self.cf.delete_enabled and self.rs.edit_pk is not None)
+            self.my_dialogue.cb_edit_session.setEnabled(self.cf.insert_enabled or self.cf.update_enabled or self.cf.delete_enabled)
+            self.dlg_refresh_pending_changes(self.edit_session.pending_count())
 
 
     def dlg_refresh_layer_settings_section(self):
@@ -4139,6 +4902,10 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
             self.my_dialogue.pb_call_show_disp_exp_dlg.setEnabled(self.cf.show_layer_defined)
             self.my_dialogue.pbtn_create_show_layer.setEnabled(self.cf.reference_layer_complete and self.cf.data_layer_complete)
             self.my_dialogue.pbtn_create_data_layer.setEnabled(self.cf.reference_layer_complete)
+            self.my_dialogue.pbtn_import_measure_table.setEnabled(self.cf.reference_layer_complete and self.cf.data_layer_complete)
+            self.my_dialogue.pbtn_check_integrity.setEnabled(self.cf.reference_layer_complete and self.cf.data_layer_complete)
+            self.my_dialogue.pbtn_check_integrity_changes.setEnabled(self.cf.reference_layer_complete and self.cf.data_layer_complete)
+            self.my_dialogue.pbtn_overlay.setEnabled(self.cf.reference_layer_complete and self.cf.data_layer_complete and self.rs.overlay_task is None)
 
     def dlg_refresh_style_settings_section(self):
         if self.my_dialogue:
@@ -4186,22 +4953,32 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
                 widget.blockSignals(False)
 
     def dlg_refresh_reference_layer_section(self):
-        """re-populates the QComboBoxN with the List of Reference-Layer-Features"""
-        # Rev. 2023-05-03
+        """re-populates the QComboBoxN with the List of Reference-Layer-Features
+        the rows are streamed by a background-task and appended in batches, see MyLayerCaches.ReferenceListTask"""
+        # Rev. 2023-08-26
         if self.my_dialogue and self.ds.refLyr:
-            self.my_dialogue.qcbn_snapped_ref_fid.blockSignals(True)
+            self.cancel_reference_list_task()
+
+            in_model = QtGui.QStandardItemModel(0, 3)
+            self.my_dialogue.qcbn_snapped_ref_fid.set_model(in_model)
 
-            in_model = QtGui.QStandardItemModel(0, 2)
-            context = qgis.core.QgsExpressionContext()
-            exp = qgis.core.QgsExpression(self.ds.refLyr.displayExpression())
-            for feature in self.ds.refLyr.getFeatures():
-                context.setFeature(feature)
-                disp_exp_evaluated = exp.evaluate(context)
+            task = tools.MyLayerCaches.ReferenceListTask(self.ds.refLyr)
+            task.rows_fetched.connect(functools.partial(self.s_append_reference_rows, in_model))
+            self.rs.reference_list_task = task
+            qgis.core.QgsApplication.taskManager().addTask(task)
 
+    def s_append_reference_rows(self, in_model: QtGui.QStandardItemModel, rows: dict):
+        """slot for ReferenceListTask.rows_fetched: appends a batch of rows to the List of Reference-Layer-Features
+        :param in_model: model the task was started for, rows of a previous task are ignored
+        :param rows: dict {fid: [evaluated displayExpression, length]}
+        """
+        # Rev. 2023-08-26
+        if self.my_dialogue and in_model is self.my_dialogue.qcbn_snapped_ref_fid.source_model():
+            for fid, (disp_exp_evaluated, length) in rows.items():
                 items = []
                 item = QtGui.QStandardItem()
-                item.setData(feature.id(), 0)
-                item.setData(feature.id(), 256)
+                item.setData(fid, 0)
+                item.setData(fid, 256)
                 items.append(item)
 
                 item = QtGui.QStandardItem()
@@ -4209,18 +4986,274 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
                 items.append(item)
 
                 item = QtGui.QStandardItem()
-                item.setData(feature.geometry().length(), 0)
+                item.setData(length, 0)
                 items.append(item)
 
                 in_model.appendRow(items)
 
+            if in_model.rowCount() == len(rows):
+                # first batch: column-widths and sort
+                self.my_dialogue.qcbn_snapped_ref_fid.apply_settings()
 
-            self.my_dialogue.qcbn_snapped_ref_fid.set_model(in_model)
-
-            if self.rs.snapped_ref_fid is not None:
+            if self.rs.snapped_ref_fid in rows and self.my_dialogue.qcbn_snapped_ref_fid.currentIndex() < 0:
                 self.my_dialogue.qcbn_snapped_ref_fid.select_by_value(0, 256, self.rs.snapped_ref_fid)
 
-            self.my_dialogue.qcbn_snapped_ref_fid.blockSignals(False)
+    def s_import_measure_table(self):
+        """imports a measure-table (CSV, XLSX, ODS, GPKG, DBF) into Data-Layer
+        all rows are validated against the Reference-line-lengths by MyBatchTools.MeasureTableImporter,
+        the accepted rows are inserted in one edit-command and one commit, in edit-session-mode only into the edit-buffer,
+        the rejected rows are shown in a temporary table"""
+        # Rev. 2023-09-12
+        if self.my_dialogue and self.cf.reference_layer_complete and self.cf.data_layer_complete:
+            if self.ds.dataLyr.isModified() and not self.edit_session.active:
+                # the import commits, uncommitted edits would be committed too
+                self.push_messages(warning_msg=qt_format(QtCore.QCoreApplication.translate('LolEvt', "Layer {apos}{0}{apos} has uncommitted edits, please save or discard..."), self.ds.dataLyr.name()))
+                return
+
+            dialog = QtWidgets.QFileDialog()
+            dialog.setFileMode(QtWidgets.QFileDialog.ExistingFile)
+            dialog.setViewMode(QtWidgets.QFileDialog.Detail)
+            dialog.setOption(QtWidgets.QFileDialog.DontUseNativeDialog, True)
+            dialog.setAcceptMode(QtWidgets.QFileDialog.AcceptOpen)
+            dialog.setNameFilter("Measure-Tables (*.csv *.txt *.xlsx *.xls *.ods *.gpkg *.dbf)")
+            dialog.setWindowTitle(QtCore.QCoreApplication.translate('LolEvt', "LinearReferencing: Import measure-table into Line-on-Line-Data-Layer"))
+            result = dialog.exec()
+            filenames = dialog.selectedFiles()
+            if not result or not filenames:
+                self.push_messages(info_msg=QtCore.QCoreApplication.translate('LolEvt', "Canceled by user"))
+                return
+
+            table_layer = tools.MyBatchTools.open_table(filenames[0])
+            if not table_layer.isValid():
+                self.push_messages(critical_msg=qt_format(QtCore.QCoreApplication.translate('LolEvt', "File {apos}{0}{apos} could not be opened as table"), filenames[0]))
+                return
+
+            importer = tools.MyBatchTools.MeasureTableImporter(
+                self.ds.refLyr,
+                self.ds.refLyrPkField,
+                self.ds.dataLyr,
+                self.ds.dataLyrIdField,
+                self.ds.dataLyrReferenceField,
+                [self.ds.dataLyrMeasureFromField, self.ds.dataLyrMeasureToField],
+                self.ds.dataLyrOffsetField
+            )
+            missing_columns = importer.missing_columns(table_layer)
+            if missing_columns:
+                self.push_messages(critical_msg=qt_format(QtCore.QCoreApplication.translate('LolEvt', "Table {apos}{0}{apos} misses the columns {1}"), table_layer.name(), ', '.join(missing_columns)))
+                return
+
+            QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
+            try:
+                accepted, rejected = importer.validate(table_layer)
+                commit_errors = []
+                if accepted:
+                    self.start_data_edit("LinearReferencing: import measure-table")
+                    if not importer.insert(accepted):
+                        self.rollback_data_edit()
+                        commit_errors = ["addFeatures failed"]
+                    elif not self.commit_data_edit():
+                        commit_errors = self.ds.dataLyr.commitErrors()
+                        self.rollback_data_edit()
+            except Exception as err:
+                self.rollback_data_edit()
+                self.push_messages(critical_msg=f"Exception '{err.__class__.__name__}' in {gdp()}: {err}")
+                return
+            finally:
+                QtWidgets.QApplication.restoreOverrideCursor()
+
+            if rejected:
+                rejects_layer = importer.create_rejects_layer(table_layer, rejected)
+                qgis.core.QgsProject.instance().addMapLayer(rejects_layer)
+
+            if commit_errors:
+                self.push_messages(critical_msg=qt_format(QtCore.QCoreApplication.translate('LolEvt', "Import into Data-Layer {apos}{0}{apos} failed, edits rolled back:{br}{1}"), self.ds.dataLyr.name(), '<br />'.join(commit_errors)))
+                return
+
+            tools.MyLayerCaches.invalidate_layer(self.ds.dataLyr.id())
+            if not self.edit_session.active:
+                self.refresh_show_layer()
+            if rejected:
+                self.push_messages(warning_msg=qt_format(QtCore.QCoreApplication.translate('LolEvt', "Import: {0} features inserted into Data-Layer {apos}{1}{apos}, {2} rows rejected, see table {apos}{3}{apos}"), len(accepted), self.ds.dataLyr.name(), len(rejected), rejects_layer.name()))
+            else:
+                self.push_messages(success_msg=qt_format(QtCore.QCoreApplication.translate('LolEvt', "Import: {0} features inserted into Data-Layer {apos}{1}{apos}"), len(accepted), self.ds.dataLyr.name()))
+
+    def s_check_integrity(self, incremental: bool = False):
+        """whole-table integrity-check of Data-Layer by MyIntegrity.IntegrityScanner, the issues are shown in a temporary table
+        :param incremental: True ➜ re-check only the features changed since the last check
+        """
+        # Rev. 2023-09-01
+        if self.my_dialogue and self.cf.reference_layer_complete and self.cf.data_layer_complete:
+            QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
+            try:
+                issues = self.integrity_scanner.scan(
+                    self.ds.refLyr,
+                    self.ds.refLyrPkField,
+                    self.ds.dataLyr,
+                    self.ds.dataLyrIdField,
+                    self.ds.dataLyrReferenceField,
+                    [self.ds.dataLyrMeasureFromField, self.ds.dataLyrMeasureToField],
+                    self.ds.showLyr if self.cf.show_layer_complete else None,
+                    self.ds.showLyrBackReferenceField if self.cf.show_layer_complete else None,
+                    incremental
+                )
+            finally:
+                QtWidgets.QApplication.restoreOverrideCursor()
+
+            # only one report per Map-Tool
+            if self.rs.integrity_report_layer_id and qgis.core.QgsProject.instance().mapLayer(self.rs.integrity_report_layer_id):
+                qgis.core.QgsProject.instance().removeMapLayer(self.rs.integrity_report_layer_id)
+            self.rs.integrity_report_layer_id = None
+
+            if issues:
+                report_layer = self.integrity_scanner.create_report_layer(self.ds.dataLyr, issues)
+                qgis.core.QgsProject.instance().addMapLayer(report_layer)
+                self.rs.integrity_report_layer_id = report_layer.id()
+                self.push_messages(warning_msg=qt_format(QtCore.QCoreApplication.translate('LolEvt', "Integrity-Check of Data-Layer {apos}{0}{apos}: {1} issues, see table {apos}{2}{apos}"), self.ds.dataLyr.name(), len(issues), report_layer.name()))
+            else:
+                self.push_messages(success_msg=qt_format(QtCore.QCoreApplication.translate('LolEvt', "Integrity-Check of Data-Layer {apos}{0}{apos}: no issues, {1} features read"), self.ds.dataLyr.name(), self.integrity_scanner.num_read))
+
+    def get_stored_configuration(self, setting_label: str) -> StoredSettings | None:
+        """reads a stored configuration from project-file without restoring it, see s_restore_configuration
+        :param setting_label: label of the configuration, client-side unique identifier
+        :returns StoredSettings or None if not found
+        """
+        # Rev. 2023-09-05
+        for setting_idx in range(self._num_storable_settings):
+            key = f"/LolEvtStoredSettings/setting_{setting_idx}/setting_label"
+            stored_label, type_conversion_ok = qgis.core.QgsProject.instance().readEntry('LinearReferencing', key)
+            if stored_label and type_conversion_ok and stored_label == setting_label:
+                stored_settings = self.StoredSettings()
+                property_list = [prop for prop in dir(self.StoredSettings) if prop.startswith('_') and not prop.startswith('__')]
+                for prop_name in property_list:
+                    key = f"/LolEvtStoredSettings/setting_{setting_idx}/{prop_name}"
+                    restored_value, type_conversion_ok = qgis.core.QgsProject.instance().readEntry('LinearReferencing', key)
+                    if restored_value and type_conversion_ok:
+                        # internal property, no "dirty"-Flag for the project
+                        setattr(stored_settings, prop_name, restored_value)
+                return stored_settings
+
+    def s_overlay_data_layers(self):
+        """overlays the current Data-Layer (A) with the Data-Layer of a stored configuration (B) on the same Reference-Layer
+        dynamic segmentation in background by MyOverlay.OverlayTask, the result is written to a new GeoPackage-table and added to the project"""
+        # Rev. 2023-09-05
+        if not (self.my_dialogue and self.cf.reference_layer_complete and self.cf.data_layer_complete) or self.rs.overlay_task is not None:
+            return
+
+        setting_label = self.my_dialogue.cb_overlay_configuration.currentData()
+        operation = self.my_dialogue.cb_overlay_operation.currentData()
+        overlay_settings = self.get_stored_configuration(setting_label) if setting_label else None
+        if overlay_settings is None:
+            self.push_messages(warning_msg=QtCore.QCoreApplication.translate('LolEvt', "No stored configuration selected for the overlay..."))
+            return
+
+        if overlay_settings.refLyrId != self.ds.refLyr.id():
+            self.push_messages(warning_msg=qt_format(QtCore.QCoreApplication.translate('LolEvt', "Configuration {apos}{0}{apos} uses another Reference-Layer, overlay not possible"), setting_label))
+            return
+
+        b_layer = qgis.core.QgsProject.instance().mapLayer(overlay_settings.dataLyrId) if overlay_settings.dataLyrId else None
+        b_field_names = [overlay_settings.dataLyrReferenceFieldName, overlay_settings.dataLyrMeasureFromFieldName, overlay_settings.dataLyrMeasureToFieldName]
+        if not b_layer or not b_layer.isValid() or any(not field_name or b_layer.fields().indexOf(field_name) < 0 for field_name in b_field_names):
+            self.push_messages(critical_msg=qt_format(QtCore.QCoreApplication.translate('LolEvt', "Data-Layer or fields of configuration {apos}{0}{apos} not found in project"), setting_label))
+            return
+
+        dialog = QtWidgets.QFileDialog()
+        dialog.setFileMode(QtWidgets.QFileDialog.AnyFile)
+        dialog.setViewMode(QtWidgets.QFileDialog.Detail)
+        dialog.setOption(QtWidgets.QFileDialog.DontUseNativeDialog, True)
+        dialog.setOption(QtWidgets.QFileDialog.DontConfirmOverwrite, True)
+        dialog.setAcceptMode(QtWidgets.QFileDialog.AcceptOpen)
+        dialog.setNameFilter("geoPackage (*.gpkg)")
+        dialog.setWindowTitle(QtCore.QCoreApplication.translate('LolEvt', "LinearReferencing: Select or create GeoPackage for the overlay-result"))
+        dialog.setDefaultSuffix("gpkg")
+        if not dialog.exec():
+            return
+        gpkg_path = dialog.selectedFiles()[0]
+
+        # already used names in project and existing GeoPackage
+        used_layer_names = [layer.name() for layer_id, layer in qgis.core.QgsProject.instance().mapLayers().items()]
+        overwrite = os.path.isfile(gpkg_path)
+        if overwrite:
+            used_layer_names += [lyr.GetName() for lyr in osgeo.ogr.Open(gpkg_path)]
+        table_name = tools.MyToolFunctions.get_unique_layer_name(used_layer_names, 'LineOnLine_Overlay_{curr_i}', '1')
+        table_name, ok = QtWidgets.QInputDialog.getText(None, f"LinearReferencing ({gdp()})", QtCore.QCoreApplication.translate('LolEvt', "Name for table in GeoPackage:"), QtWidgets.QLineEdit.Normal, table_name)
+        if not ok or not table_name:
+            self.push_messages(info_msg=QtCore.QCoreApplication.translate('LolEvt', "Canceled by user"))
+            return
+        if table_name in used_layer_names:
+            dialog_result = QtWidgets.QMessageBox.question(
+                None,
+                "LinearReferencing",
+                qt_format(QtCore.QCoreApplication.translate('LolEvt', "Replace existing table {apos}{0}{apos} in GeoPackage {apos}{1}{apos}?"), table_name, gpkg_path),
+                buttons=QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.Cancel,
+                defaultButton=QtWidgets.QMessageBox.Yes
+            )
+            if dialog_result != QtWidgets.QMessageBox.Yes:
+                self.push_messages(info_msg=QtCore.QCoreApplication.translate('LolEvt', "Canceled by user"))
+                return
+
+        task = tools.MyOverlay.OverlayTask(
+            self.ds.dataLyr,
+            [self.ds.dataLyrReferenceField.name(), self.ds.dataLyrMeasureFromField.name(), self.ds.dataLyrMeasureToField.name()],
+            b_layer,
+            b_field_names,
+            self.ds.refLyrPkField,
+            operation,
+            gpkg_path,
+            table_name,
+            overwrite
+        )
+        task.taskCompleted.connect(self.s_overlay_finished)
+        task.taskTerminated.connect(self.s_overlay_finished)
+        self.rs.overlay_task = task
+        qgis.core.QgsApplication.taskManager().addTask(task)
+        self.my_dialogue.pbtn_overlay.setEnabled(False)
+        self.push_messages(info_msg=qt_format(QtCore.QCoreApplication.translate('LolEvt', "Overlay {apos}{0}{apos} {1} {apos}{2}{apos} started, see task-manager..."), self.ds.dataLyr.name(), operation, b_layer.name()))
+
+    def s_overlay_finished(self):
+        """slot for taskCompleted/taskTerminated of OverlayTask: indexes the result-table and adds it to the project"""
+        # Rev. 2023-09-08
+        task = self.rs.overlay_task
+        self.rs.overlay_task = None
+        if task is not None:
+            if task.status() == qgis.core.QgsTask.Complete:
+                # bulk-load: index after all rows are written
+                tools.MyGeoPackage.execute_statements(task.gpkg_path, tools.MyGeoPackage.index_statements(task.table_name, 'line_ref_id', ['measure_from', 'measure_to']))
+                uri = task.gpkg_path + '|layername=' + task.table_name
+                result_lyr = self.iface.addVectorLayer(uri, task.table_name, "ogr")
+                if result_lyr and result_lyr.isValid():
+                    self.push_messages(success_msg=qt_format(QtCore.QCoreApplication.translate('LolEvt', "Overlay: {0} segments written to table {apos}{1}{apos}.{apos}{2}{apos}"), task.num_segments, task.gpkg_path, task.table_name))
+                else:
+                    self.push_messages(critical_msg=qt_format(QtCore.QCoreApplication.translate('LolEvt', "Overlay: created table {apos}{0}{apos}.{apos}{1}{apos} not valid"), task.gpkg_path, task.table_name))
+            elif task.error_msg:
+                self.push_messages(critical_msg=qt_format(QtCore.QCoreApplication.translate('LolEvt', "Overlay: error writing table {apos}{0}{apos}.{apos}{1}{apos}: {2}"), task.gpkg_path, task.table_name, task.error_msg))
+            else:
+                self.push_messages(warning_msg=QtCore.QCoreApplication.translate('LolEvt', "Overlay canceled"))
+
+        if self.my_dialogue:
+            self.my_dialogue.pbtn_overlay.setEnabled(self.cf.reference_layer_complete and self.cf.data_layer_complete)
+
+    def cancel_overlay_task(self):
+        """cancels a running OverlayTask, a partially written table remains in the GeoPackage"""
+        # Rev. 2023-09-05
+        if self.rs.overlay_task is not None:
+            try:
+                self.rs.overlay_task.cancel()
+            except RuntimeError:
+                # already finished and deleted by the QgsTaskManager
+                pass
+            self.rs.overlay_task = None
+
+    def cancel_reference_list_task(self):
+        """cancels a running ReferenceListTask"""
+        # Rev. 2023-08-26
+        if self.rs.reference_list_task is not None:
+            try:
+                self.rs.reference_list_task.cancel()
+            except RuntimeError:
+                # already finished and deleted by the QgsTaskManager
+                pass
+            self.rs.reference_list_task = None
+
 
 
     def dlg_refresh_measure_section(self):
@@ -4300,21 +5333,29 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
 
     def dlg_refresh_stored_settings_section(self):
         """re-populates the list with the stored Configurations within but independend from the dialog"""
-        # Rev. 2023-05-08
+        # Rev. 2023-09-05
         if self.my_dialogue:
             self.my_dialogue.lw_stored_settings.clear()
-            for setting_idx in range(self._num_storable_settings):
-                key = f"/LolEvtStoredSettings/setting_{setting_idx}/setting_label"
-                setting_label, type_conversion_ok = qgis.core.QgsProject.instance().readEntry('LinearReferencing', key)
-                if setting_label and type_conversion_ok:
-                    qlwi = QtWidgets.QListWidgetItem()
-                    qlwi.setText(setting_label)
-                    qlwi.setData(256, setting_label)
-                    self.my_dialogue.lw_stored_settings.addItem(qlwi)
+            # same list for the second Data-Layer of the overlay, see s_overlay_data_layers
+            prev_overlay_label = self.my_dialogue.cb_overlay_configuration.currentData()
+            with QtCore.QSignalBlocker(self.my_dialogue.cb_overlay_configuration):
+                self.my_dialogue.cb_overlay_configuration.clear()
+                for setting_idx in range(self._num_storable_settings):
+                    key = f"/LolEvtStoredSettings/setting_{setting_idx}/setting_label"
+                    setting_label, type_conversion_ok = qgis.core.QgsProject.instance().readEntry('LinearReferencing', key)
+                    if setting_label and type_conversion_ok:
+                        qlwi = QtWidgets.QListWidgetItem()
+                        qlwi.setText(setting_label)
+                        qlwi.setData(256, setting_label)
+                        self.my_dialogue.lw_stored_settings.addItem(qlwi)
+                        self.my_dialogue.cb_overlay_configuration.addItem(setting_label, setting_label)
+                prev_idx = self.my_dialogue.cb_overlay_configuration.findData(prev_overlay_label)
+                if prev_idx >= 0:
+                    self.my_dialogue.cb_overlay_configuration.setCurrentIndex(prev_idx)
 
     def dlg_refresh_feature_selection_section(self):
         """refreshes the Feature-Selection-List within but independend from the dialog"""
-        # Rev. 2023-05-03
+        # Rev. 2023-09-10
         # stored for the restore the sort-settings afterwards
         if self.my_dialogue:
             # stored for the restore the sort-settings afterwards
@@ -4324,38 +5365,30 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
             # make unique
             self.rs.selected_pks = list(dict.fromkeys(self.rs.selected_pks))
 
-            # clear all
-            self.my_dialogue.qtw_selected_pks.setRowCount(0)
-            self.my_dialogue.qtw_selected_pks.setColumnCount(0)
+            # clear all, the previous model is replaced
+            self.selection_model = None
+            self.my_dialogue.qtw_selected_pks.setModel(None)
             self.my_dialogue.qtw_selected_pks.horizontalHeader().setVisible(False)
 
-            # QTableWidget with selected edit-PKs, Show-Layer not necessary, but taken into account
-            # signal/slot see:
-            # self.my_dialogue.qtw_selected_pks.itemPressed.connect(self.qtw_item_pressed)
+            # QTableView with selected edit-PKs, Show-Layer not necessary, but taken into account
+            # rows, labels and cell-widgets are calculated lazy for the rows exposed by the model, see tools.MyQtWidgets.LazyTableModel
             if self.cf.reference_layer_complete and self.cf.data_layer_complete and len(self.rs.selected_pks) > 0:
 
                 edit_features = {}
-                # check self.rs.selected_pks: iterate through List of PKs and query features
+                # two bulk-queries instead of two queries per PK, Show-features are queried per fetched batch
+                data_features = tools.MyLayerCaches.get_features_by_pks(self.ds.dataLyr, self.ds.dataLyrIdField, self.rs.selected_pks, self.get_attribute_request(self.ds.dataLyr))
+                ref_ids = [data_feature[self.ss.dataLyrReferenceFieldName] for data_feature in data_features.values()]
+                ref_features = tools.MyLayerCaches.get_features_by_pks(self.ds.refLyr, self.ds.refLyrPkField, ref_ids, self.get_attribute_request(self.ds.refLyr, True))
+
+                # check self.rs.selected_pks: iterate through List of PKs and assign the queried features
                 for edit_pk in self.rs.selected_pks:
-                    data_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk)
+                    data_feature = data_features.get(edit_pk)
                     if data_feature and data_feature.isValid():
-                        ref_id = data_feature[self.ss.dataLyrReferenceFieldName]
-                        ref_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.refLyr, self.ds.refLyrPkField, ref_id)
+                        ref_feature = ref_features.get(data_feature[self.ss.dataLyrReferenceFieldName])
                         if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
-
-                            if self.cf.show_layer_complete:
-                                show_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.showLyr, self.ds.showLyrBackReferenceField, edit_pk)
-                                if show_feature and show_feature.isValid():
-                                    edit_features[edit_pk] = [data_feature, ref_feature, show_feature]
-                                else:
-                                    edit_features[edit_pk] = [data_feature, ref_feature, None]
-                            else:
-                                edit_features[edit_pk] = [data_feature, ref_feature, None]
+                            edit_features[edit_pk] = [data_feature, ref_feature]
                 self.rs.selected_pks = list(edit_features.keys())
 
-                self.my_dialogue.qtw_selected_pks.horizontalHeader().setVisible(True)
-                self.my_dialogue.qtw_selected_pks.setRowCount(len(self.rs.selected_pks))
-
                 # displayExpression() for single-field: "field_name"
                 # displayField() for same field: field_name (no quotes)
                 # complexer displayExpression()-sample: "fid" + "line_ref_id" (including all spaces, tabs, linebreaks...)
@@ -4374,230 +5407,104 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
                 if self.cf.show_layer_complete:
                     header_labels.append('Show-Layer')
 
-                self.my_dialogue.qtw_selected_pks.setColumnCount(len(header_labels))
-                self.my_dialogue.qtw_selected_pks.setHorizontalHeaderLabels(header_labels)
-
-                remove_icon = QtGui.QIcon(':icons/mIconClearTextHover.svg')
-                highlight_icon = QtGui.QIcon(':icons/mIconSelected.svg')
-                pan_icon = QtGui.QIcon(':icons/mActionPanToSelected.svg')
-                identify_icon = QtGui.QIcon(':icons/mActionIdentify.svg')
-
-                data_context = qgis.core.QgsExpressionContext()
                 # Features from Reference-Layer will show eith their PK and the evaluated displayExpression
-                data_display_exp = qgis.core.QgsExpression(self.ds.dataLyr.displayExpression())
-                data_display_exp.prepare(data_context)
-
-                ref_context = qgis.core.QgsExpressionContext()
-                ref_display_exp = qgis.core.QgsExpression(self.ds.refLyr.displayExpression())
-                ref_display_exp.prepare(ref_context)
+                # expressions are prepared once, evaluated values are cached, see MyLayerCaches.DisplayExpressionCache
+                data_display_exp = tools.MyLayerCaches.get_display_expression(self.ds.dataLyr)
+                ref_display_exp = tools.MyLayerCaches.get_display_expression(self.ds.refLyr)
                 if self.cf.show_layer_complete:
-                    show_context = qgis.core.QgsExpressionContext()
-                    show_display_exp = qgis.core.QgsExpression(self.ds.showLyr.displayExpression())
-                    show_display_exp.prepare(show_context)
+                    show_display_exp = tools.MyLayerCaches.get_display_expression(self.ds.showLyr)
 
-                rc = 0
                 integer_field_types = [QtCore.QVariant.Int, QtCore.QVariant.UInt, QtCore.QVariant.LongLong, QtCore.QVariant.ULongLong]
-                for edit_pk in edit_features:
-                    data_feature = edit_features[edit_pk][0]
-                    ref_feature = edit_features[edit_pk][1]
-                    show_feature = edit_features[edit_pk][2]
-
-                    data_pk = data_feature[self.ds.dataLyrIdField.name()]
-                    data_context.setFeature(data_feature)
-                    data_evaled_exp = data_display_exp.evaluate(data_context)
-                    data_label = data_label_plus = f"{apos}{data_evaled_exp}{apos}"
-                    # expression with dataLyrIdField as single field
-                    if data_display_exp.isField() and self.ds.dataLyrIdField.name() in data_display_exp.referencedColumns():
-                        if self.ds.dataLyrIdField.type() in integer_field_types:
-                            data_label = data_label_plus = f"# {data_evaled_exp}"
-                    else:
-                        if self.ds.dataLyrIdField.type() in integer_field_types:
-                            data_label_plus = f"# {data_pk} {data_label}"
-                        else:
-                            data_label_plus = f"{apos}{data_pk}{apos} {data_label}"
-
-                    data_measure_from = data_feature[self.ds.dataLyrMeasureFromField.name()]
-                    data_measure_to = data_feature[self.ds.dataLyrMeasureToField.name()]
-                    data_offset = data_feature[self.ds.dataLyrOffsetField.name()]
 
+                # the queried features contain only the configured fields, the displayExpressions are evaluated in bulk
+                ref_display_values = tools.MyLayerCaches.get_display_values(self.ds.refLyr, list(set(ref_feature.id() for data_feature, ref_feature in edit_features.values())))
+
+                # evaluated once per Reference-feature, used for display and sort
+                ref_labels = {}
+
+                def get_ref_label(ref_feature: qgis.core.QgsFeature) -> str:
+                    if ref_feature.id() not in ref_labels:
+                        ref_evaled_exp = ref_display_values.get(ref_feature.id())
+                        ref_label = f"'{ref_evaled_exp}'"
+                        # expression with refLyrPkField as single field
+                        if ref_display_exp.isField() and self.ds.refLyrPkField.name() in ref_display_exp.referencedColumns():
+                            if self.ds.refLyrPkField.type() in integer_field_types:
+                                ref_label = f"# {ref_evaled_exp}"
+                        ref_labels[ref_feature.id()] = ref_label
+                    return ref_labels[ref_feature.id()]
+
+                def fetch_rows(edit_pks: list) -> dict:
+                    """cell-data for a batch of rows, called by the model on first access"""
+                    show_features = {}
+                    show_display_values = {}
+                    if self.cf.show_layer_complete:
+                        show_features = tools.MyLayerCaches.get_features_by_pks(self.ds.showLyr, self.ds.showLyrBackReferenceField, edit_pks, self.get_attribute_request(self.ds.showLyr))
+                        show_display_values = tools.MyLayerCaches.get_display_values(self.ds.showLyr, [show_feature.id() for show_feature in show_features.values()])
+                    data_display_values = tools.MyLayerCaches.get_display_values(self.ds.dataLyr, [edit_features[edit_pk][0].id() for edit_pk in edit_pks])
 
+                    rows = {}
+                    for edit_pk in edit_pks:
+                        data_feature, ref_feature = edit_features[edit_pk]
 
-                    if self.ds.refLyr.crs().isGeographic():
-                        data_measure_from_rd = round(data_measure_from, 5)
-                        data_measure_to_rd = round(data_measure_to, 5)
-                        data_offset_rd = round(data_offset, 5)
-                    else:
-                        data_measure_from_rd = round(data_measure_from)
-                        data_measure_to_rd = round(data_measure_to)
-                        data_offset_rd = round(data_offset)
-
-                    ref_id = ref_feature[self.ds.refLyrPkField.name()]
-                    ref_context.setFeature(ref_feature)
-                    ref_evaled_exp = ref_display_exp.evaluate(ref_context)
-                    ref_label = ref_label_plus = f"{apos}{ref_evaled_exp}{apos}"
-
-                    # expression with dataLyrIdField as single field
-                    if ref_display_exp.isField() and self.ds.refLyrPkField.name() in ref_display_exp.referencedColumns():
-                        if self.ds.refLyrPkField.type() in integer_field_types:
-                            ref_label = ref_label_plus = f"# {ref_evaled_exp}"
-                    else:
-                        if self.ds.refLyrPkField.type() in integer_field_types:
-                            ref_label_plus = f"{ref_label} (# {ref_id})"
-                        else:
-                            ref_label_plus = f"{ref_label} ({apos}{ref_id}{apos})"
-
-                    show_back_ref_id = None
-                    show_label = None
-                    show_label_plus = None
-                    if show_feature:
-                        show_back_ref_id = show_feature[self.ds.showLyrBackReferenceField.name()]
-                        show_context.setFeature(show_feature)
-                        show_evaled_exp = show_display_exp.evaluate(show_context)
-                        show_label = show_label_plus = f"{apos}{show_evaled_exp}{apos}"
+                        data_evaled_exp = data_display_values.get(data_feature.id())
+                        data_label = f"'{data_evaled_exp}'"
                         # expression with dataLyrIdField as single field
-                        if show_display_exp.isField() and self.ds.showLyrBackReferenceField.name() in show_display_exp.referencedColumns():
-                            if self.ds.showLyrBackReferenceField.type() in integer_field_types:
-                                show_label = show_label_plus = f"# {show_evaled_exp}"
-                        else:
-                            if self.ds.showLyrBackReferenceField.type() in integer_field_types:
-                                show_label_plus = f"# {show_back_ref_id} {show_label}"
-                            else:
-                                show_label_plus = f"{apos}{show_back_ref_id}{apos} {show_label}"
-
-                    # col 0 (the initial sort-column): line_reference from ... to
-                    cc = 0
-
-                    item = tools.MyQtWidgets.QTableWidgetItemMultipleSort(256)
-                    item.setData(256, data_pk)
-                    item.setText(f"{data_label}")
-
-                    self.my_dialogue.qtw_selected_pks.setItem(rc, cc, item)
-
-                    c_wdg = QtWidgets.QWidget()
-                    c_wdg.setLayout(QtWidgets.QHBoxLayout())
-                    c_wdg.layout().setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
-                    c_wdg.layout().setContentsMargins(2, 0, 2, 0)
-                    c_wdg.layout().setSpacing(2)
-
-                    qtb = QtWidgets.QToolButton()
-                    qtb.setIcon(remove_icon)
-                    qtb.setCursor(QtCore.Qt.PointingHandCursor)
-                    qtb.setToolTip(QtCore.QCoreApplication.translate('LolEvt',"Remove feature from selection"))
-                    qtb.clicked.connect(self.s_remove_from_feature_selection)
-                    qtb.setProperty("edit_pk", edit_pk)
-                    qtb.setFixedSize(QtCore.QSize(20, 20))
-                    c_wdg.layout().addWidget(qtb)
-
-                    qtb = QtWidgets.QToolButton()
-                    qtb.setIcon(highlight_icon)
-                    qtb.setCursor(QtCore.Qt.PointingHandCursor)
-                    qtb.setToolTip(QtCore.QCoreApplication.translate('LolEvt',"Highlight feature and select for edit"))
-                    qtb.clicked.connect(self.s_highlight_edit_pk)
-                    qtb.setProperty("edit_pk", edit_pk)
-                    qtb.setFixedSize(QtCore.QSize(20, 20))
-                    c_wdg.layout().addWidget(qtb)
-
-                    qtb = QtWidgets.QToolButton()
-                    qtb.setIcon(pan_icon)
-                    qtb.setCursor(QtCore.Qt.PointingHandCursor)
-                    qtb.setToolTip(QtCore.QCoreApplication.translate('LolEvt',"Pan to feature and select for edit"))
-                    qtb.clicked.connect(self.s_pan_edit_pk)
-                    qtb.setProperty("edit_pk", edit_pk)
-                    qtb.setFixedSize(QtCore.QSize(20, 20))
-                    c_wdg.layout().addWidget(qtb)
-
-                    qtb = QtWidgets.QToolButton()
-                    qtb.setIcon(identify_icon)
-                    qtb.setCursor(QtCore.Qt.PointingHandCursor)
-                    qtb.setToolTip(QtCore.QCoreApplication.translate('LolEvt',"Show feature-form"))
-                    qtb.clicked.connect(self.s_open_data_form)
-                    qtb.setProperty("edit_pk", edit_pk)
-                    qtb.setFixedSize(QtCore.QSize(20, 20))
-                    c_wdg.layout().addWidget(qtb)
-
-                    self.my_dialogue.qtw_selected_pks.setCellWidget(rc, cc, c_wdg)
-
-                    cc += 1
-
-                    # Reference-Layer use expression and append ID, if not contained in expression
-                    item = tools.MyQtWidgets.QTableWidgetItemMultipleSort(256,257,258)
-                    item.setData(256, ref_label)
-                    item.setData(257, data_measure_from)
-                    item.setData(258, data_measure_to)
-
-                    item.setText(f"{ref_label} {data_measure_from_rd} ... {data_measure_to_rd}")
-                    self.my_dialogue.qtw_selected_pks.setItem(rc, cc, item)
-
-                    # Reference-Layer with highlight, zoom, identify, FID and Label-Expression
-                    c_wdg = QtWidgets.QWidget()
-                    c_wdg.setLayout(QtWidgets.QHBoxLayout())
-                    c_wdg.layout().setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
-                    c_wdg.layout().setContentsMargins(2, 0, 2, 0)
-                    c_wdg.layout().setSpacing(2)
-
-                    qtb = QtWidgets.QToolButton()
-                    qtb.setIcon(highlight_icon)
-                    qtb.setCursor(QtCore.Qt.PointingHandCursor)
-                    qtb.setToolTip(QtCore.QCoreApplication.translate('LolEvt',"Highlight Reference-Layer-feature"))
-                    qtb.clicked.connect(self.s_highlight_ref_feature_by_edit_pk)
-                    qtb.setProperty("edit_pk", edit_pk)
-                    qtb.setFixedSize(QtCore.QSize(20, 20))
-                    c_wdg.layout().addWidget(qtb)
-
-                    qtb = QtWidgets.QToolButton()
-                    qtb.setIcon(pan_icon)
-                    qtb.setCursor(QtCore.Qt.PointingHandCursor)
-                    qtb.setToolTip(QtCore.QCoreApplication.translate('LolEvt',"Zoom to Reference-Layer-feature"))
-                    qtb.clicked.connect(self.s_zoom_ref_feature_by_edit_pk)
-                    qtb.setProperty("edit_pk", edit_pk)
-                    qtb.setFixedSize(QtCore.QSize(20, 20))
-                    c_wdg.layout().addWidget(qtb)
-
-                    qtb = QtWidgets.QToolButton()
-                    qtb.setIcon(identify_icon)
-                    qtb.setCursor(QtCore.Qt.PointingHandCursor)
-                    qtb.setToolTip(QtCore.QCoreApplication.translate('LolEvt',"Show Reference-Layer attribute-form"))
-                    qtb.clicked.connect(self.s_open_ref_form_by_edit_pk)
-                    qtb.setProperty("edit_pk", edit_pk)
-                    qtb.setFixedSize(QtCore.QSize(20, 20))
-                    c_wdg.layout().addWidget(qtb)
-
-                    self.my_dialogue.qtw_selected_pks.setCellWidget(rc, cc, c_wdg)
-
-                    cc += 1
-                    # offset
-                    item = tools.MyQtWidgets.QTableWidgetItemCustomSort(256)
-                    item.setData(256, data_offset)
-                    item.setText(str(data_offset))
-                    self.my_dialogue.qtw_selected_pks.setItem(rc, cc, item)
-
-                    if self.cf.show_layer_complete:
-                        cc += 1
-                        item = tools.MyQtWidgets.QTableWidgetItemCustomSort(256)
-                        item.setData(256, show_back_ref_id)
-                        item.setData(257, edit_pk)
+                        if data_display_exp.isField() and self.ds.dataLyrIdField.name() in data_display_exp.referencedColumns():
+                            if self.ds.dataLyrIdField.type() in integer_field_types:
+                                data_label = f"# {data_evaled_exp}"
 
-                        item.setText(show_label_plus)
+                        data_measure_from = data_feature[self.ds.dataLyrMeasureFromField.name()]
+                        data_measure_to = data_feature[self.ds.dataLyrMeasureToField.name()]
+                        data_offset = data_feature[self.ds.dataLyrOffsetField.name()]
 
-                        self.my_dialogue.qtw_selected_pks.setItem(rc, cc, item)
-
-                        c_wdg = QtWidgets.QWidget()
-                        c_wdg.setLayout(QtWidgets.QHBoxLayout())
-                        c_wdg.layout().setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
-                        c_wdg.layout().setContentsMargins(2, 0, 2, 0)
-                        c_wdg.layout().setSpacing(2)
+                        if self.ds.refLyr.crs().isGeographic():
+                            data_measure_from_rd = round(data_measure_from, 5)
+                            data_measure_to_rd = round(data_measure_to, 5)
+                        else:
+                            data_measure_from_rd = round(data_measure_from)
+                            data_measure_to_rd = round(data_measure_to)
 
-                        qtb = QtWidgets.QToolButton()
-                        qtb.setIcon(identify_icon)
-                        qtb.setCursor(QtCore.Qt.PointingHandCursor)
-                        qtb.setToolTip(QtCore.QCoreApplication.translate('LolEvt',"Open Show-Layer attribute-form"))
-                        qtb.clicked.connect(self.s_open_show_form_by_edit_pk)
-                        qtb.setProperty("edit_pk", edit_pk)
-                        qtb.setFixedSize(QtCore.QSize(20, 20))
-                        c_wdg.layout().addWidget(qtb)
-                        self.my_dialogue.qtw_selected_pks.setCellWidget(rc, cc, c_wdg)
+                        rows[edit_pk] = [
+                            {QtCore.Qt.DisplayRole: data_label},
+                            {QtCore.Qt.DisplayRole: f"{get_ref_label(ref_feature)} {data_measure_from_rd} ... {data_measure_to_rd}"},
+                            {QtCore.Qt.DisplayRole: str(data_offset)}
+                        ]
 
-                    rc += 1
+                        if self.cf.show_layer_complete:
+                            show_label_plus = None
+                            show_feature = show_features.get(edit_pk)
+                            if show_feature and show_feature.isValid():
+                                show_back_ref_id = show_feature[self.ds.showLyrBackReferenceField.name()]
+                                show_evaled_exp = show_display_values.get(show_feature.id())
+                                show_label = show_label_plus = f"'{show_evaled_exp}'"
+                                # expression with showLyrBackReferenceField as single field
+                                if show_display_exp.isField() and self.ds.showLyrBackReferenceField.name() in show_display_exp.referencedColumns():
+                                    if self.ds.showLyrBackReferenceField.type() in integer_field_types:
+                                        show_label_plus = f"# {show_evaled_exp}"
+                                else:
+                                    if self.ds.showLyrBackReferenceField.type() in integer_field_types:
+                                        show_label_plus = f"# {show_back_ref_id} {show_label}"
+                                    else:
+                                        show_label_plus = f"'{show_back_ref_id}' {show_label}"
+
+                            rows[edit_pk].append({QtCore.Qt.DisplayRole: show_label_plus})
+
+                    return rows
+
+                def sort_values(edit_pk, column: int) -> list:
+                    """sort-values, same as the sort-roles of the former QTableWidgetItems, without evaluation of the Data- and Show-display-expressions"""
+                    data_feature, ref_feature = edit_features[edit_pk]
+                    if column == 1:
+                        return [get_ref_label(ref_feature), data_feature[self.ds.dataLyrMeasureFromField.name()], data_feature[self.ds.dataLyrMeasureToField.name()]]
+                    elif column == 2:
+                        return [data_feature[self.ds.dataLyrOffsetField.name()]]
+                    # col 0: Data-PK, col 3: Back-Reference in Show-Layer == Data-PK
+                    return [edit_pk]
+
+                self.selection_model = tools.MyQtWidgets.LazyTableModel(header_labels, self.rs.selected_pks, fetch_rows, sort_values)
+                self.selection_model.rows_fetched.connect(self.dlg_add_selection_cell_widgets)
+                self.my_dialogue.qtw_selected_pks.setModel(self.selection_model)
+                self.my_dialogue.qtw_selected_pks.horizontalHeader().setVisible(True)
 
                 self.dlg_0 = tools.MyQtWidgets.LambdaDelegate(lambda val: " " * 30 + str(val))
                 self.my_dialogue.qtw_selected_pks.setItemDelegateForColumn(0, self.dlg_0)
@@ -4607,18 +5514,17 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
                 if self.cf.show_layer_complete:
                     # only one icon => less padding
                     self.dlg_3 = tools.MyQtWidgets.LambdaDelegate(lambda val: " " * 10 + str(val))
-                    self.my_dialogue.qtw_selected_pks.setItemDelegateForColumn(4, self.dlg_3)
+                    self.my_dialogue.qtw_selected_pks.setItemDelegateForColumn(3, self.dlg_3)
+
+                # restore previous sort-settings
+                self.my_dialogue.qtw_selected_pks.sortByColumn(prev_sort_col_idx, prev_sort_order)
 
                 self.my_dialogue.qtw_selected_pks.resizeRowsToContents()
                 self.my_dialogue.qtw_selected_pks.resizeColumnsToContents()
 
-                # restore previous sort-settings
-                self.my_dialogue.qtw_selected_pks.sortItems(prev_sort_col_idx, prev_sort_order)
-
             self.my_dialogue.pbtn_select_features.setEnabled(
                 self.cf.reference_layer_complete and
-                self.cf.data_layer_complete and
-                self.cf.show_layer_complete
+                self.cf.data_layer_complete
             )
             self.my_dialogue.pbtn_clear_features.setEnabled(
                 self.cf.reference_layer_complete and
@@ -4643,12 +5549,72 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
                 self.cf.data_layer_complete and
                 self.cf.show_layer_complete
             )
+            # bulk-operations
+            self.my_dialogue.pbtn_bulk_shift.setEnabled(self.cf.update_enabled and len(self.rs.selected_pks) > 0)
+            self.my_dialogue.pbtn_bulk_offset.setEnabled(self.cf.update_enabled and self.ds.dataLyrOffsetField is not None and len(self.rs.selected_pks) > 0)
+            self.my_dialogue.pbtn_bulk_rereference.setEnabled(self.cf.update_enabled and len(self.rs.selected_pks) > 0)
+            self.my_dialogue.pbtn_bulk_delete.setEnabled(self.cf.delete_enabled and len(self.rs.selected_pks) > 0)
+
+    def dlg_add_selection_cell_widgets(self, first_row: int, last_row: int):
+        """slot for rows_fetched of the selection-model: cell-widgets with tool-buttons only for the rows exposed to the view
+        the edit_pk is stored as property in the tool-buttons
+        :param first_row:
+        :param last_row:
+        """
+        # Rev. 2023-08-23
+        if self.my_dialogue and self.selection_model:
+            remove_icon = QtGui.QIcon(':icons/mIconClearTextHover.svg')
+            highlight_icon = QtGui.QIcon(':icons/mIconSelected.svg')
+            pan_icon = QtGui.QIcon(':icons/mActionPanToSelected.svg')
+            identify_icon = QtGui.QIcon(':icons/mActionIdentify.svg')
+
+            # key: column value: list of tool-buttons (icon, tooltip, slot)
+            button_definitions = {
+                0: [
+                    (remove_icon, QtCore.QCoreApplication.translate('LolEvt',"Remove feature from selection"), self.s_remove_from_feature_selection),
+                    (highlight_icon, QtCore.QCoreApplication.translate('LolEvt',"Highlight feature and select for edit"), self.s_highlight_edit_pk),
+                    (pan_icon, QtCore.QCoreApplication.translate('LolEvt',"Pan to feature and select for edit"), self.s_pan_edit_pk),
+                    (identify_icon, QtCore.QCoreApplication.translate('LolEvt',"Show feature-form"), self.s_open_data_form),
+                ],
+                1: [
+                    (highlight_icon, QtCore.QCoreApplication.translate('LolEvt',"Highlight Reference-Layer-feature"), self.s_highlight_ref_feature_by_edit_pk),
+                    (pan_icon, QtCore.QCoreApplication.translate('LolEvt',"Zoom to Reference-Layer-feature"), self.s_zoom_ref_feature_by_edit_pk),
+                    (identify_icon, QtCore.QCoreApplication.translate('LolEvt',"Show Reference-Layer attribute-form"), self.s_open_ref_form_by_edit_pk),
+                ]
+            }
+            if self.cf.show_layer_complete:
+                button_definitions[3] = [
+                    (identify_icon, QtCore.QCoreApplication.translate('LolEvt',"Open Show-Layer attribute-form"), self.s_open_show_form_by_edit_pk),
+                ]
+
+            for rc in range(first_row, last_row + 1):
+                edit_pk = self.selection_model.row_key(rc)
+                for cc, buttons in button_definitions.items():
+                    index = self.selection_model.index(rc, cc)
+                    if self.my_dialogue.qtw_selected_pks.indexWidget(index) is None:
+                        c_wdg = QtWidgets.QWidget()
+                        c_wdg.setLayout(QtWidgets.QHBoxLayout())
+                        c_wdg.layout().setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
+                        c_wdg.layout().setContentsMargins(2, 0, 2, 0)
+                        c_wdg.layout().setSpacing(2)
+
+                        for icon, tool_tip, slot in buttons:
+                            qtb = QtWidgets.QToolButton()
+                            qtb.setIcon(icon)
+                            qtb.setCursor(QtCore.Qt.PointingHandCursor)
+                            qtb.setToolTip(tool_tip)
+                            qtb.clicked.connect(slot)
+                            qtb.setProperty("edit_pk", edit_pk)
+                            qtb.setFixedSize(QtCore.QSize(20, 20))
+                            c_wdg.layout().addWidget(qtb)
+
+                        self.my_dialogue.qtw_selected_pks.setIndexWidget(index, c_wdg)
 
     def s_open_data_form(self):
         """opens data-form for dataLyr from selection-list-cell-widget, edit_pk stored as property"""
         # Rev. 2023-05-03
         edit_pk = self.sender().property('edit_pk')
-        data_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk)
+        data_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk)
         if data_feature and data_feature.isValid():
             self.iface.openFeatureForm(self.ds.dataLyr, data_feature, True)
         else:
@@ -4683,9 +5649,9 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         """opens feature-form for showLyr from selection-list, edit_pk stored as property in cell-widget"""
         # Rev. 2023-05-03
         edit_pk = self.sender().property('edit_pk')
-        data_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk)
+        data_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk, self.get_attribute_request(self.ds.dataLyr))
         if data_feature and data_feature.isValid():
-            show_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.showLyr, self.ds.showLyrBackReferenceField, edit_pk)
+            show_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.showLyr, self.ds.showLyrBackReferenceField, edit_pk)
             if show_feature and show_feature.isValid():
                 self.iface.openFeatureForm(self.ds.showLyr, show_feature, True)
             else:
@@ -4695,9 +5661,9 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         """opens feature-form for refLyr from selection-list, edit_pk stored as property in cell-widget"""
         # Rev. 2023-05-03
         edit_pk = self.sender().property('edit_pk')
-        data_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk)
+        data_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk, self.get_attribute_request(self.ds.dataLyr))
         if data_feature and data_feature.isValid():
-            ref_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.refLyr, self.ds.refLyrPkField, data_feature[self.ds.dataLyrReferenceField.name()])
+            ref_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.refLyr, self.ds.refLyrPkField, data_feature[self.ds.dataLyrReferenceField.name()])
             if ref_feature and ref_feature.isValid():
                 self.iface.openFeatureForm(self.ds.refLyr, ref_feature, True)
             else:
@@ -4707,9 +5673,9 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         """highlights referenced line-feature from selection-list, edit_pk stored as property in cell-widget"""
         # Rev. 2023-05-03
         edit_pk = self.sender().property('edit_pk')
-        data_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk)
+        data_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk, self.get_attribute_request(self.ds.dataLyr))
         if data_feature and data_feature.isValid():
-            ref_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.refLyr, self.ds.refLyrPkField, data_feature[self.ds.dataLyrReferenceField.name()])
+            ref_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.refLyr, self.ds.refLyrPkField, data_feature[self.ds.dataLyrReferenceField.name()], self.get_attribute_request(self.ds.refLyr))
             if ref_feature and ref_feature.isValid():
                 if ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
                     self.rb_ref.setToGeometry(ref_feature.geometry(), self.ds.refLyr)
@@ -4723,15 +5689,15 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
         """highlight and zoom to referenced line-feature from selection-list, edit_pk stored as property in cell-widget"""
         # Rev. 2023-05-03
         edit_pk = self.sender().property('edit_pk')
-        data_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk)
+        data_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk, self.get_attribute_request(self.ds.dataLyr))
         if data_feature and data_feature.isValid():
-            ref_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.refLyr, self.ds.refLyrPkField, data_feature[self.ds.dataLyrReferenceField.name()])
+            ref_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.refLyr, self.ds.refLyrPkField, data_feature[self.ds.dataLyrReferenceField.name()], self.get_attribute_request(self.ds.refLyr, True))
             if ref_feature and ref_feature.isValid():
                 if ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
                     extent = ref_feature.geometry().boundingBox()
                     source_crs = self.ds.refLyr.crs()
                     target_crs = self.iface.mapCanvas().mapSettings().destinationCrs()
-                    tr = qgis.core.QgsCoordinateTransform(source_crs, target_crs, qgis.core.QgsProject.instance())
+                    tr = tools.MyTransforms.get_transform(source_crs, target_crs)
                     extent = tr.transformBoundingBox(extent)
                     self.iface.mapCanvas().setExtent(extent)
                     self.iface.mapCanvas().zoomByFactor(1.1)
@@ -4780,13 +5746,20 @@ class LolEvt(qgis.gui.QgsMapToolEmitPoint):
 
     def unload(self):
         """triggered by LinearReference => unload() and project.close()"""
-        # Rev. 2023-04-27
+        # Rev. 2023-09-09
 
         # check and write the settings back to project
         self.check_settings()
         self.store_settings()
 
         self.disconnect_all_layers()
+        # bulk-load-indexes not yet created
+        tools.MyGeoPackage.flush_deferred_indexes()
+        self.edit_session.stop()
+        self.cancel_reference_list_task()
+        self.cancel_overlay_task()
+        self.move_coalescer.discard()
+        self.ref_snapper.cancel()
         try:
 
             # remove canvas-graphics
@@ -22,7 +22,7 @@ the Free Software Foundation; either version 2 of the License, or
 ********************************************************************
 """
 from __future__ import annotations
-import os, qgis, osgeo, datetime, sys
+import os, qgis, osgeo, datetime, functools
 from PyQt5 import QtCore, QtGui, QtWidgets
 from LinearReferencing import tools, dialogs
 from LinearReferencing.icons import resources
@@ -356,6 +356,22 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         reference_layer_connections = []
         show_layer_connections = []
 
+        # MyLayerCaches.ReferenceListTask, streams the List of Reference-Layer-Features into the dialog
+        reference_list_task = None
+
+        # temporary report-layer of the last integrity-check, replaced by the next check
+        integrity_report_layer_id = None
+
+        # MyBatchTools.LocatePointsTask, see s_batch_locate
+        batch_locate_task = None
+
+        # next PK for the Data-features inserted by batch_locate_task, None ➜ no (more) inserts
+        # sequence-PKs: the default-value-clause, applied by the provider on insert, see MyLayerCaches.get_sequence_clause
+        batch_next_pk = None
+
+        # number of Data-features inserted by batch_locate_task
+        batch_num_inserted = 0
+
     class CheckFlags:
         """"template for self.cf, often needed group-flags, set to False/True in self.check_settings if settings/capabilities/interim results are sufficient"""
         # Rev. 2023-04-28
@@ -388,7 +404,7 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
             'before_move_point': QtCore.QCoreApplication.translate('PolEvt', "drag and drop measured point on selected line..."),
             'move_point': QtCore.QCoreApplication.translate('PolEvt', "drop the point at the desired position of the selected line..."),
             'disabled': QtCore.QCoreApplication.translate('PolEvt', "no Reference-Layer configured..."),
-            'select_features': QtCore.QCoreApplication.translate('PolEvt', "select features from Show-Layer with point or rect; [ctrl] remove from, [shift] add to, [ ] replace current feature-selection"),
+            'select_features': QtCore.QCoreApplication.translate('PolEvt', "select features with point or rect, hover to identify; [ctrl] remove from, [shift] add to, [ ] replace current feature-selection"),
         }
 
         # initialize the four settings-"containers" with blank "templates"
@@ -397,6 +413,20 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         self.cf = self.CheckFlags()
         self.rs = self.RuntimeSettings()
 
+        # latest-wins-coalescer for canvasMoveEvent
+        self.move_coalescer = tools.MyQtWidgets.LatestEventCoalescer(self.process_canvas_move, parent=self)
+
+        # own snapping-engine for the Reference-Layer, see connect_reference_layer
+        self.ref_snapper = tools.MySnapping.ReferenceSnapper()
+
+        # whole-table integrity-checks, changed features marked by the layer-signals, see connect_data_layer
+        self.integrity_scanner = tools.MyIntegrity.IntegrityScanner()
+
+        # optional edit-session on the Data-Layer, see s_toggle_edit_session
+        self.edit_session = tools.MyEditSession.EditSession(self)
+        self.edit_session.pending_changed.connect(self.dlg_refresh_pending_changes)
+        self.edit_session.committed.connect(self.s_edit_session_committed)
+
         self.restore_settings()
 
         # visualize selected point for edit
@@ -447,6 +477,13 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         self.my_dialogue.pbtn_update_feature.clicked.connect(self.s_update_feature)
         self.my_dialogue.pbtn_insert_feature.clicked.connect(self.s_insert_feature)
         self.my_dialogue.pbtn_delete_feature.clicked.connect(self.s_delete_feature)
+        # edit-session
+        self.my_dialogue.edit_session_grb.toggled.connect(self.s_toggle_edit_session_grb)
+        self.my_dialogue.cb_edit_session.toggled.connect(self.s_toggle_edit_session)
+        self.my_dialogue.qspb_auto_commit_count.valueChanged.connect(self.s_change_edit_session_thresholds)
+        self.my_dialogue.qspb_auto_commit_seconds.valueChanged.connect(self.s_change_edit_session_thresholds)
+        self.my_dialogue.pbtn_commit_edits.clicked.connect(self.s_commit_edits)
+        self.my_dialogue.pbtn_rollback_edits.clicked.connect(self.s_rollback_edits)
 
         # Section "Feature-Selection":
         self.my_dialogue.selection_grb.toggled.connect(self.s_toggle_selection_grb)
@@ -455,6 +492,9 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         self.my_dialogue.pbtn_insert_selected_data_features.clicked.connect(self.s_append_data_features)
         self.my_dialogue.pbtn_insert_selected_show_features.clicked.connect(self.s_append_show_features)
         self.my_dialogue.pbtn_zoom_to_feature_selection.clicked.connect(self.s_zoom_to_feature_selection)
+        self.my_dialogue.pbtn_bulk_shift.clicked.connect(self.s_bulk_shift)
+        self.my_dialogue.pbtn_bulk_rereference.clicked.connect(self.s_bulk_rereference)
+        self.my_dialogue.pbtn_bulk_delete.clicked.connect(self.s_bulk_delete)
         self.my_dialogue.pbtn_clear_features.clicked.connect(self.s_clear_feature_selection)
 
         # Section "Layers and Fields"
@@ -478,6 +518,20 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         self.my_dialogue.pbtn_create_show_layer.clicked.connect(self.s_create_show_layer)
         self.my_dialogue.qcbn_show_layer_back_reference_field.currentIndexChanged.connect(self.s_change_show_layer_back_reference_field)
 
+        # Section "Batch-Locate"
+        self.my_dialogue.batch_locate_grb.toggled.connect(self.s_toggle_batch_locate_grb)
+        self.my_dialogue.pbtn_batch_locate.clicked.connect(self.s_batch_locate)
+        self.my_dialogue.pbtn_batch_cancel.clicked.connect(self.cancel_batch_locate_task)
+
+        # Section "Bulk-Import"
+        self.my_dialogue.bulk_import_grb.toggled.connect(self.s_toggle_bulk_import_grb)
+        self.my_dialogue.pbtn_import_measure_table.clicked.connect(self.s_import_measure_table)
+
+        # Section "Integrity-Check"
+        self.my_dialogue.integrity_grb.toggled.connect(self.s_toggle_integrity_grb)
+        self.my_dialogue.pbtn_check_integrity.clicked.connect(functools.partial(self.s_check_integrity, False))
+        self.my_dialogue.pbtn_check_integrity_changes.clicked.connect(functools.partial(self.s_check_integrity, True))
+
         # Section "Styles"
         self.my_dialogue.style_grb.toggled.connect(self.s_toggle_style_gb)
         self.my_dialogue.qcb_pt_measure_icon_type.currentIndexChanged.connect(self.s_change_pt_measure_icon_type)
@@ -509,8 +563,8 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
     def s_move_start(self):
         """moves point to start of reference-line"""
         if self.cf.measure_completed:
-            ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
-            if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
+            ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, self.rs.snapped_ref_fid)
+            if ref_geom:
                 self.rs.current_measure = 0
                 self.draw_measured_point(self.rs.snapped_ref_fid, self.rs.current_measure)
                 self.dlg_show_measure(self.rs.snapped_ref_fid, self.rs.current_measure)
@@ -529,8 +583,8 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
             elif QtWidgets.QApplication.keyboardModifiers() == (QtCore.Qt.ShiftModifier | QtCore.Qt.ControlModifier):
                 delta *= 1000
 
-            ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
-            if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
+            ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, self.rs.snapped_ref_fid)
+            if ref_geom:
                 self.rs.current_measure = max(0, self.rs.current_measure - delta)
                 self.draw_measured_point(self.rs.snapped_ref_fid, self.rs.current_measure)
                 self.dlg_show_measure(self.rs.snapped_ref_fid, self.rs.current_measure)
@@ -549,18 +603,18 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
             elif QtWidgets.QApplication.keyboardModifiers() == (QtCore.Qt.ShiftModifier | QtCore.Qt.ControlModifier):
                 delta *= 1000
 
-            ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
-            if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
-                self.rs.current_measure = min(ref_feature.geometry().length(), self.rs.current_measure + delta)
+            ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, self.rs.snapped_ref_fid)
+            if ref_geom:
+                self.rs.current_measure = min(ref_geom.length, self.rs.current_measure + delta)
                 self.draw_measured_point(self.rs.snapped_ref_fid, self.rs.current_measure)
                 self.dlg_show_measure(self.rs.snapped_ref_fid, self.rs.current_measure)
 
     def s_move_end(self):
         """moves point to end of reference-line"""
         if self.cf.measure_completed:
-            ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
-            if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
-                self.rs.current_measure = ref_feature.geometry().length()
+            ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, self.rs.snapped_ref_fid)
+            if ref_geom:
+                self.rs.current_measure = ref_geom.length
                 self.draw_measured_point(self.rs.snapped_ref_fid, self.rs.current_measure)
                 self.dlg_show_measure(self.rs.snapped_ref_fid, self.rs.current_measure)
 
@@ -810,6 +864,36 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         else:
             self.my_dialogue.layers_and_fields_grb.setMaximumHeight(20)
 
+    def s_toggle_batch_locate_grb(self, status):
+        """Toggle Group-Box in Dialog
+        :param status: isChecked()-State
+        """
+        # Rev. 2023-08-30
+        if status:
+            self.my_dialogue.batch_locate_grb.setMaximumHeight(2147483647)
+        else:
+            self.my_dialogue.batch_locate_grb.setMaximumHeight(20)
+
+    def s_toggle_bulk_import_grb(self, status):
+        """Toggle Group-Box in Dialog
+        :param status: isChecked()-State
+        """
+        # Rev. 2023-08-31
+        if status:
+            self.my_dialogue.bulk_import_grb.setMaximumHeight(2147483647)
+        else:
+            self.my_dialogue.bulk_import_grb.setMaximumHeight(20)
+
+    def s_toggle_integrity_grb(self, status):
+        """Toggle Group-Box in Dialog
+        :param status: isChecked()-State
+        """
+        # Rev. 2023-09-01
+        if status:
+            self.my_dialogue.integrity_grb.setMaximumHeight(2147483647)
+        else:
+            self.my_dialogue.integrity_grb.setMaximumHeight(20)
+
     def s_toggle_selection_grb(self, status):
         """Toggle Group-Box in Dialog
         :param status: isChecked()-State
@@ -831,6 +915,16 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         else:
             self.my_dialogue.measure_grb.setMaximumHeight(20)
 
+    def s_toggle_edit_session_grb(self, status):
+        """Toggle Group-Box in Dialog
+        :param status: isChecked()-State
+        """
+        # Rev. 2023-09-09
+        if status:
+            self.my_dialogue.edit_session_grb.setMaximumHeight(2147483647)
+        else:
+            self.my_dialogue.edit_session_grb.setMaximumHeight(20)
+
     def s_edit_grb_toggle(self, status):
         """Toggle Group-Box in Dialog
         :param status: isChecked()-State
@@ -989,12 +1083,12 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         if self.ds.refLyr:
             ref_fid = self.my_dialogue.qcbn_snapped_ref_fid.currentData()
             if ref_fid is not None:
-                ref_feature = self.ds.refLyr.getFeature(ref_fid)
-                if ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
-                    extent = ref_feature.geometry().boundingBox()
+                ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, ref_fid)
+                if ref_geom:
+                    extent = ref_geom.geometry.boundingBox()
                     source_crs = self.ds.refLyr.crs()
                     target_crs = self.iface.mapCanvas().mapSettings().destinationCrs()
-                    tr = qgis.core.QgsCoordinateTransform(source_crs, target_crs, qgis.core.QgsProject.instance())
+                    tr = tools.MyTransforms.get_transform(source_crs, target_crs)
                     extent = tr.transformBoundingBox(extent)
                     self.iface.mapCanvas().setExtent(extent)
                     self.iface.mapCanvas().zoomByFactor(1.1)
@@ -1024,14 +1118,81 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
             self.pan_to_measure(self.rs.snapped_ref_fid, self.rs.current_measure)
 
 
-    def check_data_feature(self,check_pk):
-        """check Data-feature: detect Null-Values"""
+    def get_attribute_request(self, vlayer: qgis.core.QgsVectorLayer, with_geometry: bool = False) -> qgis.core.QgsFeatureRequest:
+        """request for read-only queries on Reference-, Data- or Show-Layer with only the fields configured in StoredSettings
+        not for features which are edited and updated, they would loose their unqueried attributes
+        :param vlayer: self.ds.refLyr, self.ds.dataLyr or self.ds.showLyr
+        :param with_geometry: True ➜ query the geometry too, f.e. Reference-features for validation
+        """
+        # Rev. 2023-08-25
+        field_names = []
+        if vlayer == self.ds.refLyr:
+            field_names = [self.ss.refLyrIdFieldName]
+        elif vlayer == self.ds.dataLyr:
+            field_names = [self.ss.dataLyrIdFieldName, self.ss.dataLyrReferenceFieldName, self.ss.dataLyrMeasureFieldName]
+        elif vlayer == self.ds.showLyr:
+            field_names = [self.ss.showLyrBackReferenceFieldName]
+        return tools.MyToolFunctions.get_attribute_request(vlayer, field_names, with_geometry)
+
+    def snap_to_reference(self, pos: QtCore.QPoint, ref_fid: int = None) -> tuple:
+        """snaps the canvas-position on the Reference-Layer, replacement for snappingUtils().snapToMap with OneLayerFilter/OneFeatureFilter
+        uses the own segment-index of self.ref_snapper, the QGis-snapping only as fallback while the index is built
+        :param pos: canvas-position from mouse-event
+        :param ref_fid: optional, snap only on this Reference-feature
+        :returns tuple (QgsPointLocator.Match with point in canvas-crs, measure) measure None if no match
+        """
+        # Rev. 2023-08-29
+        canvas_crs = self.iface.mapCanvas().mapSettings().destinationCrs()
+        map_point = self.iface.mapCanvas().getCoordinateTransform().toMapCoordinates(pos.x(), pos.y())
+        if self.ref_snapper.is_ready(self.ds.refLyr.id()):
+            # same tolerance as in the snapping-config, see connect_reference_layer
+            tolerance = qgis.core.QgsTolerance.toleranceInMapUnits(10, self.ds.refLyr, self.iface.mapCanvas().mapSettings(), qgis.core.QgsTolerance.UnitType.Pixels)
+            layer_point = tools.MyTransforms.get_transform(canvas_crs, self.ds.refLyr.crs()).transform(map_point)
+            snap_result = self.ref_snapper.snap(layer_point, tolerance, ref_fid)
+            if snap_result:
+                snapped_ref_fid, snapped_point_xy, measure, distance, side, segment_index = snap_result
+                snapped_point_xy = tools.MyTransforms.get_transform(self.ds.refLyr.crs(), canvas_crs).transform(snapped_point_xy)
+                m = qgis.core.QgsPointLocator.Match(qgis.core.QgsPointLocator.Edge, self.ds.refLyr, snapped_ref_fid, map_point.distance(snapped_point_xy), snapped_point_xy, segment_index - 1)
+                return m, measure
+            return qgis.core.QgsPointLocator.Match(), None
+
+        if ref_fid is None:
+            snap_filter = tools.MyToolFunctions.OneLayerFilter(self.ds.refLyr)
+        else:
+            snap_filter = tools.MyToolFunctions.OneFeatureFilter(self.ds.refLyr, ref_fid)
+        m = self.iface.mapCanvas().snappingUtils().snapToMap(pos, snap_filter)
+        if m.type():
+            ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, m.featureId())
+            if ref_geom:
+                layer_point = tools.MyTransforms.get_transform(canvas_crs, self.ds.refLyr.crs()).transform(m.point())
+                return m, ref_geom.locate_point(layer_point)[0]
+        return m, None
+
+    def get_canvas_ref_geometry(self, ref_fid: int):
+        """cached Reference-geometry with vertices pre-projected to canvas-crs, measures in Reference-Layer-units
+        for the draw-functions, which otherwise would transform each interpolated point on every mouse-move
+        :param ref_fid: FID of reference-line
+        :returns CanvasRefGeometry, the RefGeometry itself if canvas-crs == Reference-Layer-crs, None if not found
+        """
+        # Rev. 2023-08-28
+        ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, ref_fid)
+        if ref_geom:
+            return ref_geom.projected(tools.MyTransforms.get_transform(self.ds.refLyr.crs(), self.iface.mapCanvas().mapSettings().destinationCrs()))
+
+    def check_data_feature(self, check_pk, data_feature: qgis.core.QgsFeature = None, ref_feature: qgis.core.QgsFeature = None):
+        """check Data-feature: detect Null-Values
+        :param check_pk:
+        :param data_feature: optional, already queried Data-feature, f.e. from bulk-query in dlg_refresh_feature_selection_section
+        :param ref_feature: optional, already queried Reference-feature
+        """
         # TODO: apply filter on Data-Layer
         warning_msg=''
         if self.cf.data_layer_complete and self.cf.reference_layer_complete:
-            data_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.dataLyr, self.ds.dataLyrIdField, check_pk)
+            if data_feature is None:
+                data_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.dataLyr, self.ds.dataLyrIdField, check_pk, self.get_attribute_request(self.ds.dataLyr))
             if data_feature and data_feature.isValid():
-                ref_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.refLyr, self.ds.refLyrPkField, data_feature[self.ds.dataLyrReferenceField.name()])
+                if ref_feature is None:
+                    ref_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.refLyr, self.ds.refLyrPkField, data_feature[self.ds.dataLyrReferenceField.name()], self.get_attribute_request(self.ds.refLyr, True))
                 if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
                     measure = data_feature[self.ds.dataLyrMeasureField.name()]
 
@@ -1060,8 +1221,8 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         """
         # Rev. 2023-05-03
         if self.check_data_feature(edit_pk):
-            data_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk)
-            ref_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.refLyr, self.ds.refLyrPkField, data_feature[self.ds.dataLyrReferenceField.name()])
+            data_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk, self.get_attribute_request(self.ds.dataLyr))
+            ref_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.refLyr, self.ds.refLyrPkField, data_feature[self.ds.dataLyrReferenceField.name()], self.get_attribute_request(self.ds.refLyr))
 
 
             # no duplicates
@@ -1080,7 +1241,7 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
 
             # same in Show-Layer, if configured
             if self.cf.show_layer_complete:
-                show_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.showLyr, self.ds.showLyrBackReferenceField, edit_pk)
+                show_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.showLyr, self.ds.showLyrBackReferenceField, edit_pk, self.get_attribute_request(self.ds.showLyr))
                 if show_feature and show_feature.isValid():
                     self.ds.showLyr.removeSelection()
                     self.ds.showLyr.select(show_feature.id())
@@ -1105,10 +1266,10 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
 
 
     def s_select_features(self, checked: bool):
-        """Toggle tool_mode 'select_features' for selecting point-features from showLyr
+        """Toggle tool_mode 'select_features' for selecting point-features via the event-index, see get_event_index
         :param checked: status of checkable QPushButton self.my_dialogue.pbtn_select_features
         """
-        # Rev. 2023-05-03
+        # Rev. 2023-09-03
         self.vm_pt_edit.hide()
         self.rb_ref.hide()
 
@@ -1116,12 +1277,13 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         if self.rs.tool_mode == 'select_features':
             tool_mode = 'measuring'
         else:
-            if self.cf.reference_layer_complete and self.cf.data_layer_complete and self.cf.show_layer_complete:
-                self.ds.showLyr.removeSelection()
+            if self.cf.reference_layer_complete and self.cf.data_layer_complete:
+                if self.cf.show_layer_complete:
+                    self.ds.showLyr.removeSelection()
                 tool_mode = 'select_features'
             else:
                 tool_mode = 'measuring'
-                self.push_messages(warning_msg=QtCore.QCoreApplication.translate('PolEvt', "Missing requirements, Reference-, Data- and Show-Layer required..."))
+                self.push_messages(warning_msg=QtCore.QCoreApplication.translate('PolEvt', "Missing requirements, Reference- and Data-Layer required..."))
 
         self.check_settings(tool_mode)
         self.dlg_refresh_feature_selection_section()
@@ -1144,7 +1306,8 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         """Adds all Features to self.rs.selected_pks"""
         # Rev. 2023-05-03
         if self.cf.reference_layer_complete and self.cf.data_layer_complete:
-            self.rs.selected_pks = qgis.core.QgsVectorLayerUtils.getValues(self.ds.dataLyr, self.ds.dataLyrIdField.name(), selectedOnly=False)[0]
+            request = tools.MyToolFunctions.get_attribute_request(self.ds.dataLyr, [self.ss.dataLyrIdFieldName])
+            self.rs.selected_pks = [data_feature[self.ds.dataLyrIdField.name()] for data_feature in self.ds.dataLyr.getFeatures(request)]
             self.check_settings()
             self.dlg_refresh_feature_selection_section()
         else:
@@ -1154,7 +1317,8 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         """Adds current selected Features from dataLyr to self.rs.selected_pks"""
         # Rev. 2023-05-03
         if self.cf.reference_layer_complete and self.cf.data_layer_complete:
-            additional_features = qgis.core.QgsVectorLayerUtils.getValues(self.ds.dataLyr, self.ds.dataLyrIdField.name(), selectedOnly=True)[0]
+            request = tools.MyToolFunctions.get_attribute_request(self.ds.dataLyr, [self.ss.dataLyrIdFieldName])
+            additional_features = [data_feature[self.ds.dataLyrIdField.name()] for data_feature in self.ds.dataLyr.getSelectedFeatures(request)]
             if len(additional_features):
                 if QtWidgets.QApplication.keyboardModifiers() == QtCore.Qt.ShiftModifier:
                     self.rs.selected_pks += additional_features
@@ -1167,77 +1331,230 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         else:
             self.push_messages(warning_msg=QtCore.QCoreApplication.translate('PolEvt', "Missing requirements, Reference-, Data- and Show-Layer required..."))
 
+    def get_bulk_editor(self) -> tools.MyBatchTools.SelectionBulkEditor:
+        """SelectionBulkEditor for the current layers"""
+        # Rev. 2023-09-10
+        return tools.MyBatchTools.SelectionBulkEditor(
+            self.ds.refLyr,
+            self.ds.refLyrPkField,
+            self.ds.dataLyr,
+            self.ds.dataLyrIdField,
+            self.ds.dataLyrReferenceField,
+            [self.ds.dataLyrMeasureField]
+        )
+
+    def check_bulk_edit(self, enabled: bool) -> bool:
+        """pre-check for bulk-operations: Feature-Selection, privileges, no uncommitted edits outside an edit-session
+        :param enabled: privilege-flag, self.cf.update_enabled or self.cf.delete_enabled
+        """
+        # Rev. 2023-09-10
+        if not (self.my_dialogue and self.cf.reference_layer_complete and self.cf.data_layer_complete and self.rs.selected_pks):
+            return False
+        if not enabled:
+            self.push_messages(critical_msg=qt_format(QtCore.QCoreApplication.translate('PolEvt', "Bulk-operation failed, missing privileges in Data-Layer {apos}{0}{apos}..."), self.ds.dataLyr.name()))
+            return False
+        if self.ds.dataLyr.isModified() and not self.edit_session.active:
+            # the bulk-operation commits, uncommitted edits would be committed too
+            self.push_messages(warning_msg=qt_format(QtCore.QCoreApplication.translate('PolEvt', "Layer {apos}{0}{apos} has uncommitted edits, please save or discard..."), self.ds.dataLyr.name()))
+            return False
+        return True
+
+    def run_bulk_edit(self, text: str, calc_function):
+        """calculates and writes a bulk-operation on the Feature-Selection in one edit-command with one commit, see tools.MyBatchTools.SelectionBulkEditor
+        progress-dialog with cancel for selections with more than 1000 features
+        :param text: for undo-stack and messages
+        :param calc_function: function(bulk_editor, feedback) ➜ tuple (changes, skipped), f.e. lambda with bulk_editor.shift_changes
+        """
+        # Rev. 2023-09-10
+        critical_msg = ''
+        success_msg = ''
+        info_msg = ''
+        warning_msg = ''
+        bulk_editor = self.get_bulk_editor()
+        feedback = qgis.core.QgsFeedback()
+        progress_dialog = None
+        if len(self.rs.selected_pks) > 1000:
+            progress_dialog = QtWidgets.QProgressDialog(f"LinearReferencing: {text}", QtCore.QCoreApplication.translate('PolEvt', "Cancel"), 0, 100, self.iface.mainWindow())
+            progress_dialog.setWindowModality(QtCore.Qt.WindowModal)
+            progress_dialog.setMinimumDuration(0)
+            # modal QProgressDialog processes the events in setValue, so cancel is possible during the loops
+            feedback.progressChanged.connect(lambda progress: progress_dialog.setValue(int(progress)))
+            progress_dialog.canceled.connect(feedback.cancel)
+
+        QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
+        try:
+            changes, skipped = calc_function(bulk_editor, feedback)
+            if changes is None:
+                info_msg = QtCore.QCoreApplication.translate('PolEvt', "Canceled by user...")
+            elif changes:
+                self.start_data_edit(f"LinearReferencing: {text}")
+                if bulk_editor.apply_changes(changes, feedback):
+                    if self.commit_data_edit():
+                        success_msg = qt_format(QtCore.QCoreApplication.translate('PolEvt', "{0}: {1} features changed in Data-Layer {apos}{2}{apos}..."), text, len(changes), self.ds.dataLyr.name())
+                    else:
+                        self.rollback_data_edit()
+                        critical_msg = str(self.ds.dataLyr.commitErrors())
+                else:
+                    self.rollback_data_edit()
+                    if feedback.isCanceled():
+                        info_msg = QtCore.QCoreApplication.translate('PolEvt', "Canceled by user...")
+                    else:
+                        critical_msg = qt_format(QtCore.QCoreApplication.translate('PolEvt', "{0} failed in Data-Layer {apos}{1}{apos}, edits rolled back..."), text, self.ds.dataLyr.name())
+            if skipped:
+                warning_msg = qt_format(QtCore.QCoreApplication.translate('PolEvt', "{0}: {1} features skipped, missing Reference-line or measure..."), text, len(skipped))
+        except Exception as err:
+            self.rollback_data_edit()
+            critical_msg = f"Exception '{err.__class__.__name__}' in {gdp()}: {err}"
+        finally:
+            QtWidgets.QApplication.restoreOverrideCursor()
+            if progress_dialog:
+                progress_dialog.close()
+
+        if success_msg:
+            self.dlg_refresh_feature_selection_section()
+            if self.rs.edit_pk in self.rs.selected_pks:
+                self.set_edit_pk(self.rs.edit_pk, False)
+            if not self.edit_session.active:
+                self.refresh_show_layer()
+
+        self.push_messages(success_msg, info_msg, warning_msg, critical_msg)
+
+    def s_bulk_shift(self):
+        """shifts the measures of all selected features, truncated to the Reference-line-lengths"""
+        # Rev. 2023-09-10
+        if self.check_bulk_edit(self.cf.update_enabled):
+            delta, ok = QtWidgets.QInputDialog.getDouble(None, f"LinearReferencing ({gdp()})", qt_format(QtCore.QCoreApplication.translate('PolEvt', "Shift measures of {0} selected features by:"), len(self.rs.selected_pks)), 0, -1000000000, 1000000000, self.rs.num_digits)
+            if ok and delta:
+                self.run_bulk_edit("bulk shift", lambda bulk_editor, feedback: bulk_editor.shift_changes(self.rs.selected_pks, delta, feedback))
+            elif not ok:
+                self.push_messages(info_msg=QtCore.QCoreApplication.translate('PolEvt', "Canceled by user..."))
+
+    def s_bulk_rereference(self):
+        """assigns all selected features to another Reference-line, measures proportional to the line-lengths"""
+        # Rev. 2023-09-10
+        if self.check_bulk_edit(self.cf.update_enabled):
+            default_ref_id = ''
+            if self.rs.snapped_ref_fid is not None:
+                snapped_ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
+                if snapped_ref_feature.isValid():
+                    default_ref_id = str(snapped_ref_feature[self.ds.refLyrPkField.name()])
+            ref_id_text, ok = QtWidgets.QInputDialog.getText(None, f"LinearReferencing ({gdp()})", qt_format(QtCore.QCoreApplication.translate('PolEvt', "Assign {0} selected features to Reference-ID:"), len(self.rs.selected_pks)), QtWidgets.QLineEdit.Normal, default_ref_id)
+            if ok and ref_id_text:
+                try:
+                    new_ref_id = self.ds.refLyrPkField.convertCompatible(ref_id_text)
+                except ValueError:
+                    new_ref_id = None
+                if new_ref_id is None or not self.get_bulk_editor().get_reference_lengths([new_ref_id]):
+                    self.push_messages(warning_msg=qt_format(QtCore.QCoreApplication.translate('PolEvt', "No feature with ID {apos}{0}{apos} and valid geometry in Reference-Layer {apos}{1}{apos}..."), ref_id_text, self.ds.refLyr.name()))
+                else:
+                    self.run_bulk_edit("bulk re-reference", lambda bulk_editor, feedback: bulk_editor.rereference_changes(self.rs.selected_pks, new_ref_id, feedback))
+            else:
+                self.push_messages(info_msg=QtCore.QCoreApplication.translate('PolEvt', "Canceled by user..."))
+
+    def s_bulk_delete(self):
+        """deletes all selected features after confirmation, one deleteFeatures and one commit"""
+        # Rev. 2023-09-10
+        critical_msg = ''
+        success_msg = ''
+        info_msg = ''
+        warning_msg = ''
+        if self.check_bulk_edit(self.cf.delete_enabled):
+            dialog_result = QtWidgets.QMessageBox.question(
+                None,
+                f"LinearReferencing ({gdp()})",
+                qt_format(QtCore.QCoreApplication.translate('PolEvt', "Delete {0} selected features from Data-Layer {apos}{1}{apos}?"), len(self.rs.selected_pks), self.ds.dataLyr.name()),
+                buttons=QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.Cancel,
+                defaultButton=QtWidgets.QMessageBox.Cancel
+            )
+            if dialog_result == QtWidgets.QMessageBox.Yes:
+                QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
+                try:
+                    delete_fids = self.get_bulk_editor().get_fids(self.rs.selected_pks)
+                    self.start_data_edit("LinearReferencing: bulk delete")
+                    if self.ds.dataLyr.deleteFeatures(delete_fids) and self.commit_data_edit():
+                        success_msg = qt_format(QtCore.QCoreApplication.translate('PolEvt', "{0} features deleted in Data-Layer {apos}{1}{apos}..."), len(delete_fids), self.ds.dataLyr.name())
+                        if self.rs.edit_pk in self.rs.selected_pks:
+                            self.rs.edit_pk = None
+                        self.rs.selected_pks = []
+                    else:
+                        self.rollback_data_edit()
+                        critical_msg = str(self.ds.dataLyr.commitErrors())
+                except Exception as err:
+                    self.rollback_data_edit()
+                    critical_msg = f"Exception '{err.__class__.__name__}' in {gdp()}: {err}"
+                finally:
+                    QtWidgets.QApplication.restoreOverrideCursor()
+
+                if success_msg:
+                    self.dlg_refresh_feature_selection_section()
+                    self.dlg_refresh_edit_section()
+                    if not self.edit_session.active:
+                        self.refresh_show_layer(False)
+            else:
+                info_msg = QtCore.QCoreApplication.translate('PolEvt', "Canceled by user...")
+
+        self.push_messages(success_msg, info_msg, warning_msg, critical_msg)
+
     def s_zoom_to_feature_selection(self):
         """Zooms canvas to feature-selection
-        iterates through self.rs.selected_pks
-        checks validity,
-        calculates Point-Geometries and their extent,
+        extent of the calculated PoL-points from the event-index, see get_event_index,
         zooms/pans to this extent,
         selects features in dataLyr and (optional) showLyr (not required)
         """
-        # Rev. 2023-05-08
-        if self.cf.reference_layer_complete and self.cf.data_layer_complete and self.rs.selected_pks.__len__():
-            show_fids = []
-            data_fids = []
-
-            # calculate extent of the selected PoL-Features
-            top = -sys.float_info.max
-            right = -sys.float_info.max
-            left = sys.float_info.max
-            bottom = sys.float_info.max
-
-            for edit_pk in self.rs.selected_pks:
-                data_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk)
-                if data_feature and data_feature.isValid():
-                    ref_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.refLyr, self.ds.refLyrPkField, data_feature[self.ds.dataLyrReferenceField.name()])
-                    if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
-                        measure = data_feature[self.ds.dataLyrMeasureField.name()]
-                        ref_feature_geom = ref_feature.geometry()
-                        projected_point = ref_feature_geom.interpolate(measure)
-                        if self.iface.mapCanvas().mapSettings().destinationCrs() != self.ds.refLyr.crs():
-                            projected_point.transform(qgis.core.QgsCoordinateTransform(self.ds.refLyr.crs(), self.iface.mapCanvas().mapSettings().destinationCrs(), qgis.core.QgsProject.instance()))
-
-                        if projected_point:
-                            left = min(left, projected_point.asPoint().x())
-                            bottom = min(bottom, projected_point.asPoint().y())
-                            right = max(right, projected_point.asPoint().x())
-                            top = max(top, projected_point.asPoint().y())
-
-                            # projected_point ➜ QgsGeometry
-                            data_fids.append(data_feature.id())
-
-                            if self.cf.show_layer_complete:
-                                show_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.showLyr, self.ds.showLyrBackReferenceField, edit_pk)
-                                if show_feature and show_feature.isValid():
-                                    show_fids.append(show_feature.id())
-
+        # Rev. 2023-09-03
+        event_index = self.get_event_index()
+        if event_index and self.rs.selected_pks.__len__():
+            entries = event_index.get_entries_by_pks(self.rs.selected_pks)
             self.ds.dataLyr.removeSelection()
-            self.ds.dataLyr.selectByIds(data_fids)
+            self.ds.dataLyr.selectByIds(list(entries.keys()))
 
             if self.cf.show_layer_complete:
+                show_features = tools.MyLayerCaches.get_features_by_pks(self.ds.showLyr, self.ds.showLyrBackReferenceField, self.rs.selected_pks, self.get_attribute_request(self.ds.showLyr))
                 self.ds.showLyr.removeSelection()
-                self.ds.showLyr.selectByIds(show_fids)
-
-            # zoomToSelected without layer:
-            if left < right or bottom < top:
-                # valuable extent ➜ zoom
-                extent = qgis.core.QgsRectangle(left, bottom, right, top)
-                self.iface.mapCanvas().setExtent(extent)
-                self.iface.mapCanvas().zoomByFactor(1.1)
-            elif left == right and bottom == top:
-                # single feature or all features with same calculated point ➜ pan
-                center_point = qgis.core.QgsPointXY(left, bottom)
-                self.iface.mapCanvas().setCenter(center_point)
-            else:
-                # no feature or no point calculable, left/top/right/bottom as initialized with +- sys.float_info.max
+                self.ds.showLyr.selectByIds([show_feature.id() for show_feature in show_features.values() if show_feature.isValid()])
+
+            extent = event_index.extent(self.rs.selected_pks)
+            if extent is None:
                 self.push_messages(warning_msg=QtCore.QCoreApplication.translate('PolEvt', "no extent calculable for these features"))
+            else:
+                # zoomToSelected without layer:
+                extent = tools.MyTransforms.get_transform(self.ds.refLyr.crs(), self.iface.mapCanvas().mapSettings().destinationCrs()).transformBoundingBox(extent)
+                if extent.width() > 0 or extent.height() > 0:
+                    # valuable extent ➜ zoom
+                    self.iface.mapCanvas().setExtent(extent)
+                    self.iface.mapCanvas().zoomByFactor(1.1)
+                else:
+                    # single feature or all features with same calculated point ➜ pan
+                    self.iface.mapCanvas().setCenter(extent.center())
+
+    def identify_event(self, pos: QtCore.QPoint):
+        """hover-identify in tool_mode 'select_features': tooltip with the display-value of the nearest PoL-feature, queried from the event-index
+        :param pos: canvas-pixel-position
+        """
+        # Rev. 2023-09-03
+        event_index = self.get_event_index()
+        if event_index:
+            point_xy = self.iface.mapCanvas().getCoordinateTransform().toMapCoordinates(pos.x(), pos.y())
+            point_xy = tools.MyTransforms.get_transform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.refLyr.crs()).transform(point_xy)
+            tolerance = qgis.core.QgsTolerance.toleranceInMapUnits(10, self.ds.refLyr, self.iface.mapCanvas().mapSettings(), qgis.core.QgsTolerance.Pixels)
+            nearest = event_index.nearest(point_xy, tolerance)
+            if nearest:
+                data_fid, data_pk, distance = nearest
+                display_value = tools.MyLayerCaches.get_display_values(self.ds.dataLyr, [data_fid]).get(data_fid)
+                tool_tip = f"{self.ds.dataLyrIdField.name()}: {data_pk}"
+                if display_value is not None and str(display_value) != str(data_pk):
+                    tool_tip += f"\n{display_value}"
+                QtWidgets.QToolTip.showText(self.iface.mapCanvas().mapToGlobal(pos), tool_tip, self.iface.mapCanvas())
+            else:
+                QtWidgets.QToolTip.hideText()
 
     def s_append_show_features(self):
         """Adds current selected Features from showLyr to self.rs.selected_pks"""
         # Rev. 2023-05-03
         if self.cf.reference_layer_complete and self.cf.data_layer_complete and self.cf.show_layer_complete:
 
-            additional_features = qgis.core.QgsVectorLayerUtils.getValues(self.ds.showLyr, self.ds.showLyrBackReferenceField.name(), selectedOnly=True)[0]
+            request = tools.MyToolFunctions.get_attribute_request(self.ds.showLyr, [self.ss.showLyrBackReferenceFieldName])
+            additional_features = [show_feature[self.ds.showLyrBackReferenceField.name()] for show_feature in self.ds.showLyr.getSelectedFeatures(request)]
             if len(additional_features):
                 if QtWidgets.QApplication.keyboardModifiers() == QtCore.Qt.ShiftModifier:
                     self.rs.selected_pks += additional_features
@@ -1251,9 +1568,126 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         else:
             self.push_messages(warning_msg=QtCore.QCoreApplication.translate('PolEvt', "Missing requirements, Reference-, Data- and Show-Layer required..."))
 
+    def start_data_edit(self, text: str):
+        """sets the Data-Layer editable for one edit, in edit-session-mode as edit-command, see tools.MyEditSession
+        :param text: text for the undo-stack
+        """
+        # Rev. 2023-09-09
+        self.ds.dataLyr.startEditing()
+        self.edit_session.begin_edit(text)
+
+    def commit_data_edit(self) -> bool:
+        """commits the edit, in edit-session-mode only the edit-command is closed and the commit deferred
+        :returns commit-result, always True in edit-session-mode, errors of auto-commits see s_edit_session_committed
+        """
+        # Rev. 2023-09-09
+        if self.edit_session.active:
+            self.edit_session.end_edit()
+            return True
+        return self.ds.dataLyr.commitChanges()
+
+    def rollback_data_edit(self):
+        """discards the edit, in edit-session-mode only this edit, the other pending changes remain"""
+        # Rev. 2023-09-09
+        if self.edit_session.active:
+            self.edit_session.discard_edit()
+        else:
+            self.ds.dataLyr.rollBack()
+
+    def s_toggle_edit_session(self, checked: bool):
+        """starts or ends the edit-session on the Data-Layer
+        :param checked: checked-status of cb_edit_session
+        """
+        # Rev. 2023-09-09
+        critical_msg = ''
+        success_msg = ''
+        info_msg = ''
+        warning_msg = ''
+        if checked:
+            if self.cf.data_layer_complete and self.edit_session.start(self.ds.dataLyr, self.my_dialogue.qspb_auto_commit_count.value(), self.my_dialogue.qspb_auto_commit_seconds.value()):
+                info_msg = qt_format(QtCore.QCoreApplication.translate('PolEvt', "Edit-session on {apos}{0}{apos} started, edits are collected until Save..."), self.ds.dataLyr.name())
+            else:
+                critical_msg = QtCore.QCoreApplication.translate('PolEvt', "Edit-session not started, Data-Layer missing or not editable...")
+        elif self.edit_session.active:
+            data_lyr = self.edit_session.layer
+            save_changes = True
+            if self.edit_session.pending_count():
+                dialog_result = QtWidgets.QMessageBox.question(
+                    None,
+                    f"LinearReferencing ({gdp()})",
+                    qt_format(QtCore.QCoreApplication.translate('PolEvt', "End edit-session: save {0} pending changes in {apos}{1}{apos}?"), self.edit_session.pending_count(), data_lyr.name()),
+                    buttons=QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
+                    defaultButton=QtWidgets.QMessageBox.Yes
+                )
+                save_changes = dialog_result == QtWidgets.QMessageBox.Yes
+            self.edit_session.stop()
+            if save_changes:
+                if data_lyr.commitChanges():
+                    success_msg = QtCore.QCoreApplication.translate('PolEvt', "Edit-session ended, changes saved...")
+                else:
+                    critical_msg = str(data_lyr.commitErrors())
+            else:
+                data_lyr.rollBack()
+                info_msg = QtCore.QCoreApplication.translate('PolEvt', "Edit-session ended, changes discarded...")
+            self.refresh_show_layer()
+
+        self.dlg_refresh_pending_changes(self.edit_session.pending_count())
+        self.push_messages(success_msg, info_msg, warning_msg, critical_msg)
+
+    def s_change_edit_session_thresholds(self, *args):
+        """applies the auto-commit-thresholds from dialog"""
+        # Rev. 2023-09-09
+        self.edit_session.set_thresholds(self.my_dialogue.qspb_auto_commit_count.value(), self.my_dialogue.qspb_auto_commit_seconds.value())
+
+    def s_commit_edits(self):
+        """explicit commit of the edit-session, result see s_edit_session_committed"""
+        # Rev. 2023-09-09
+        self.edit_session.commit()
+
+    def s_rollback_edits(self):
+        """discards all pending changes of the edit-session after confirmation"""
+        # Rev. 2023-09-09
+        if self.edit_session.active and self.edit_session.pending_count():
+            dialog_result = QtWidgets.QMessageBox.question(
+                None,
+                f"LinearReferencing ({gdp()})",
+                qt_format(QtCore.QCoreApplication.translate('PolEvt', "Discard {0} pending changes in {apos}{1}{apos}?"), self.edit_session.pending_count(), self.edit_session.layer.name()),
+                buttons=QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.Cancel,
+                defaultButton=QtWidgets.QMessageBox.Cancel
+            )
+            if dialog_result == QtWidgets.QMessageBox.Yes:
+                self.edit_session.rollback()
+                self.dlg_refresh_edit_section()
+                self.refresh_show_layer()
+                self.push_messages(info_msg=QtCore.QCoreApplication.translate('PolEvt', "Pending changes discarded..."))
+
+    def s_edit_session_committed(self, errors: list):
+        """slot for EditSession.committed, explicit or auto-commit
+        :param errors: commit-errors, empty on success
+        """
+        # Rev. 2023-09-09
+        if errors:
+            self.push_messages(critical_msg=qt_format(QtCore.QCoreApplication.translate('PolEvt', "Commit failed, changes kept in edit-buffer:{br}{0}"), '{br}'.join(errors)))
+        else:
+            self.refresh_show_layer()
+            self.push_messages(success_msg=QtCore.QCoreApplication.translate('PolEvt', "Pending changes saved..."))
+
+    def dlg_refresh_pending_changes(self, pending_count: int):
+        """refreshes the edit-session-widgets in dialog, slot for EditSession.pending_changed
+        :param pending_count:
+        """
+        # Rev. 2023-09-09
+        if self.my_dialogue:
+            self.my_dialogue.cb_edit_session.blockSignals(True)
+            self.my_dialogue.cb_edit_session.setChecked(self.edit_session.active)
+            self.my_dialogue.cb_edit_session.blockSignals(False)
+            self.my_dialogue.le_pending_changes.setText(str(pending_count) if self.edit_session.active else '')
+            self.my_dialogue.pbtn_commit_edits.setEnabled(self.edit_session.active and pending_count > 0)
+            self.my_dialogue.pbtn_rollback_edits.setEnabled(self.edit_session.active and pending_count > 0)
+
     def s_update_feature(self):
         """Show feature-form for edit and save segment to Data-Layer"""
-        # Rev. 2023-04-27
+        # Rev. 2023-09-09
         try_it = True
         did_it = False
         critical_msg = ''
@@ -1263,10 +1697,10 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         if self.cf.update_enabled and self.rs.edit_pk is not None:
             if self.check_data_feature(self.rs.edit_pk):
                 # get current edit-values from runtime-settings, not from dialogue-widgets
-                data_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.dataLyr, self.ds.dataLyrIdField, self.rs.edit_pk)
+                data_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.dataLyr, self.ds.dataLyrIdField, self.rs.edit_pk)
                 ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
 
-                if self.ds.dataLyr.isEditable():
+                if self.ds.dataLyr.isEditable() and not self.edit_session.active:
                     if self.ds.dataLyr.isModified():
                         dialog_result = QtWidgets.QMessageBox.question(
                             None,
@@ -1297,12 +1731,12 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
                     data_feature[self.ds.dataLyrMeasureField.name()] = measure
 
                     try:
-                        self.ds.dataLyr.startEditing()
+                        self.start_data_edit("LinearReferencing: update feature")
                         dlg_result = self.iface.openFeatureForm(self.ds.dataLyr, data_feature)
                         if dlg_result:
                             update_ref_pk = data_feature[self.ds.dataLyrReferenceField.name()]
                             update_measure = data_feature[self.ds.dataLyrMeasureField.name()]
-                            update_ref_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.refLyr, self.ds.refLyrPkField, update_ref_pk)
+                            update_ref_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.refLyr, self.ds.refLyrPkField, update_ref_pk)
                             # user could have changed feature-data in dialog (PK, Reference-id, measure)
                             # ➜ validity-check like "Reference-id exists in refLyr?" "measure 0 ...referenced_line_length?"
                             if update_ref_feature and update_ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
@@ -1315,22 +1749,22 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
                                     data_feature[self.ds.dataLyrMeasureField.name()] = max(0, min(update_ref_feature.geometry().length(), update_measure))
 
                                 self.ds.dataLyr.updateFeature(data_feature)
-                                commit_result = self.ds.dataLyr.commitChanges()
+                                commit_result = self.commit_data_edit()
                                 if commit_result:
                                     did_it = True
                                     success_msg = qt_format(QtCore.QCoreApplication.translate('PolEvt', "Feature with ID {apos}{0}{apos} successfully updated in Data-Layer {apos}{1}{apos}..."),self.rs.edit_pk, self.ds.dataLyr.name())
                                 else:
-                                    self.ds.dataLyr.rollBack()
+                                    self.rollback_data_edit()
                                     critical_msg = str(self.ds.dataLyr.commitErrors())
                             else:
-                                self.ds.dataLyr.rollBack()
+                                self.rollback_data_edit()
                                 critical_msg = qt_format(QtCore.QCoreApplication.translate('PolEvt', "Update feature failed, no Reference-feature with PK {apos}{0}{apos} in Data-Layer {apos}{1}{apos} ..."),update_ref_pk, self.ds.refLyr.name())
                         else:
-                            self.ds.dataLyr.rollBack()
+                            self.rollback_data_edit()
                             info_msg = QtCore.QCoreApplication.translate('PolEvt', "Canceled by user...")
 
                     except Exception as err:
-                        self.ds.dataLyr.rollBack()
+                        self.rollback_data_edit()
                         critical_msg = f"Exception '{err.__class__.__name__}' in {gdp()}: {err}"
         else:
             critical_msg = qt_format(QtCore.QCoreApplication.translate('PolEvt', "Update feature failed, missing privileges in Data-Layer {apos}{0}{apos}..."),self.ds.dataLyr.name())
@@ -1338,12 +1772,8 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         if did_it:
             self.vm_pt_edit.hide()
             self.vm_pt_measure.hide()
-            if self.cf.show_layer_complete:
-                self.ds.showLyr.updateExtents()
-                if self.iface.mapCanvas().isCachingEnabled():
-                    self.ds.showLyr.triggerRepaint()
-                else:
-                    self.iface.mapCanvas().refresh()
+            if not self.edit_session.active:
+                self.refresh_show_layer()
 
             self.set_edit_pk(self.rs.edit_pk, False)
 
@@ -1459,12 +1889,11 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
             self.my_dialogue.dspbx_measure.setSingleStep(1)
 
         if self.cf.reference_layer_defined and self.cf.measure_completed:
-            ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
-            if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
-                ref_feature_geom = ref_feature.geometry()
+            ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, self.rs.snapped_ref_fid)
+            if ref_geom:
                 # Spinbox-Value > length of the geometry ?
                 # Should never happen, because the range is set to line-length
-                self.rs.current_measure = max(0, min(measure, ref_feature_geom.length()))
+                self.rs.current_measure = max(0, min(measure, ref_geom.length))
                 self.draw_measured_point(self.rs.snapped_ref_fid, self.rs.current_measure)
                 self.draw_reference_geom(self.rs.snapped_ref_fid)
                 self.dlg_show_measure(self.rs.snapped_ref_fid, self.rs.current_measure)
@@ -1475,11 +1904,10 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         """
         # Rev. 2023-05-03
         if self.cf.measure_completed:
-            ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
-            if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
+            ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, self.rs.snapped_ref_fid)
+            if ref_geom:
                 measure_fract = max(0, min(measure_fract, 1))
-                ref_feature_geom = ref_feature.geometry()
-                self.rs.current_measure = measure_fract * ref_feature_geom.length()
+                self.rs.current_measure = measure_fract * ref_geom.length
                 self.draw_measured_point(self.rs.snapped_ref_fid, self.rs.current_measure)
                 self.draw_reference_geom(self.rs.snapped_ref_fid)
                 self.dlg_show_measure(self.rs.snapped_ref_fid, self.rs.current_measure)
@@ -1490,12 +1918,9 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         :param measure: measure along reference-line
         """
         if self.cf.reference_layer_defined:
-            ref_feature = self.ds.refLyr.getFeature(ref_fid)
-            if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
-                ref_feature_geom = ref_feature.geometry()
-                projected_point = ref_feature_geom.interpolate(measure)
-                if self.iface.mapCanvas().mapSettings().destinationCrs() != self.ds.refLyr.crs():
-                    projected_point.transform(qgis.core.QgsCoordinateTransform(self.ds.refLyr.crs(), self.iface.mapCanvas().mapSettings().destinationCrs(), qgis.core.QgsProject.instance()))
+            canvas_ref_geom = self.get_canvas_ref_geometry(ref_fid)
+            if canvas_ref_geom:
+                projected_point = canvas_ref_geom.interpolate(measure)
 
                 if projected_point:
                     self.iface.mapCanvas().setCenter(projected_point.asPoint())
@@ -1505,14 +1930,11 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         """draw vm_pt_edit
         :param ref_fid: FID of selected reference-line
         :param measure: measure along reference-line"""
-        # Rev. 2023-06-03
+        # Rev. 2023-08-28
         if self.cf.reference_layer_defined:
-            ref_feature = self.ds.refLyr.getFeature(ref_fid)
-            if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
-                ref_feature_geom = ref_feature.geometry()
-                projected_point = ref_feature_geom.interpolate(measure)
-                if self.iface.mapCanvas().mapSettings().destinationCrs() != self.ds.refLyr.crs():
-                    projected_point.transform(qgis.core.QgsCoordinateTransform(self.ds.refLyr.crs(), self.iface.mapCanvas().mapSettings().destinationCrs(), qgis.core.QgsProject.instance()))
+            canvas_ref_geom = self.get_canvas_ref_geometry(ref_fid)
+            if canvas_ref_geom:
+                projected_point = canvas_ref_geom.interpolate(measure)
                 if projected_point:
                     self.vm_pt_edit.setCenter(projected_point.asPoint())
                     self.vm_pt_edit.show()
@@ -1523,14 +1945,11 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         :param ref_fid: FID of selected reference-line
         :param measure: measure along reference-line
         """
-        # Rev. 2023-05-03
+        # Rev. 2023-08-28
         if self.cf.reference_layer_defined:
-            ref_feature = self.ds.refLyr.getFeature(ref_fid)
-            if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
-                ref_feature_geom = ref_feature.geometry()
-                projected_point = ref_feature_geom.interpolate(measure)
-                if self.iface.mapCanvas().mapSettings().destinationCrs() != self.ds.refLyr.crs():
-                    projected_point.transform(qgis.core.QgsCoordinateTransform(self.ds.refLyr.crs(), self.iface.mapCanvas().mapSettings().destinationCrs(), qgis.core.QgsProject.instance()))
+            canvas_ref_geom = self.get_canvas_ref_geometry(ref_fid)
+            if canvas_ref_geom:
+                projected_point = canvas_ref_geom.interpolate(measure)
 
                 if projected_point:
                     self.vm_pt_measure.setCenter(projected_point.asPoint())
@@ -1541,9 +1960,9 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         :param ref_fid: FID of selected reference-line
         """
         if self.cf.reference_layer_defined:
-            ref_feature = self.ds.refLyr.getFeature(ref_fid)
-            if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
-                self.rb_ref.setToGeometry(ref_feature.geometry(), self.ds.refLyr)
+            ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, ref_fid)
+            if ref_geom:
+                self.rb_ref.setToGeometry(ref_geom.geometry, self.ds.refLyr)
                 self.rb_ref.show()
             else:
                 self.push_messages(warning_msg=qt_format(QtCore.QCoreApplication.translate('PolEvt', "Feature with fid {apos}{0}{apos} not found, not valid or without geometry"),ref_fid))
@@ -1554,22 +1973,22 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         :param measure: measure along reference-line"""
         # Rev. 2023-06-03
         if self.my_dialogue and self.cf.reference_layer_defined:
-            ref_feature = self.ds.refLyr.getFeature(ref_fid)
-            if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
-                self.my_dialogue.qcbn_snapped_ref_fid.select_by_value(0, 256, ref_feature.id())
+            ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, ref_fid)
+            if ref_geom:
+                self.my_dialogue.qcbn_snapped_ref_fid.select_by_value(0, 256, ref_geom.fid)
 
-                projected_point = ref_feature.geometry().interpolate(measure)
+                projected_point = ref_geom.interpolate(measure)
 
                 if not projected_point.isNull():
                     if self.iface.mapCanvas().mapSettings().destinationCrs() != self.ds.refLyr.crs():
-                        projected_point.transform(qgis.core.QgsCoordinateTransform(self.ds.refLyr.crs(), self.iface.mapCanvas().mapSettings().destinationCrs(), qgis.core.QgsProject.instance()))
+                        projected_point.transform(tools.MyTransforms.get_transform(self.ds.refLyr.crs(), self.iface.mapCanvas().mapSettings().destinationCrs()))
 
-                    self.my_dialogue.dspbx_measure.setRange(0, ref_feature.geometry().length())
+                    self.my_dialogue.dspbx_measure.setRange(0, ref_geom.length)
                     self.show_measure_in_dialogue(measure)
 
-                    if ref_feature.geometry().length() > 0:
+                    if ref_geom.length > 0:
                         # prevent "ZeroDivisionError: float division by zero"
-                        self.show_measure_fract_in_dialogue(measure / ref_feature.geometry().length())
+                        self.show_measure_fract_in_dialogue(measure / ref_geom.length)
 
                     # map and snap-coords are the same
                     self.show_snap_coords_in_dialogue(projected_point)
@@ -1662,11 +2081,13 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
 
     def dlg_refresh_edit_section(self):
         """refreshes the edit-section in dialog"""
-        # Rev. 2023-05-10
+        # Rev. 2023-09-09
         if self.my_dialogue:
             self.my_dialogue.pbtn_insert_feature.setEnabled(self.cf.insert_enabled)
             self.my_dialogue.pbtn_update_feature.setEnabled(self.cf.update_enabled and self.rs.edit_pk is not None)
             self.my_dialogue.pbtn_delete_feature.setEnabled(self.cf.delete_enabled and self.rs.edit_pk is not None)
+            self.my_dialogue.cb_edit_session.setEnabled(self.cf.insert_enabled or self.cf.update_enabled or self.cf.delete_enabled)
+            self.dlg_refresh_pending_changes(self.edit_session.pending_count())
             if self.rs.edit_pk is not None:
                 if not self.check_data_feature(self.rs.edit_pk):
                     self.rs.edit_pk = None
@@ -1678,16 +2099,19 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         connects signals
         configures canvas-snap-settings
         """
-        # Rev. 2023-05-03
+        # Rev. 2023-09-11
 
         # disconnect all previously connected Reference-Layer
         self.disconnect_reference_layers()
+        self.ref_snapper.cancel()
 
         prev_refLyrId = self.ss.refLyrId
 
         self.ss.refLyrId = None
         if reference_layer:
             self.ss.refLyrId = reference_layer.id()
+            # own snapping-engine, the segment-index is built in background, until then the QGis-snapping configured below is used
+            self.ref_snapper.build(reference_layer)
             # snapping settings ar stored in canvas, not in layer
             my_snap_config = self.iface.mapCanvas().snappingUtils().config()
             # clear all previous settings
@@ -1706,6 +2130,46 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
             # displayExpressionChanged not triggered with configChanged
             # afterCommitChanges ➜ refresh too, if the Reference-Layer was edited
 
+            # PK-index must be invalidated before the refresh-slots below are called
+            for signal in [reference_layer.afterCommitChanges, reference_layer.subsetStringChanged]:
+                self.rs.reference_layer_connections.append(signal.connect(functools.partial(tools.MyLayerCaches.invalidate_layer, reference_layer.id())))
+            # single feature for edits in the edit-buffer
+            self.rs.reference_layer_connections.append(reference_layer.featureAdded.connect(functools.partial(tools.MyLayerCaches.add_pk_index_feature, reference_layer)))
+            self.rs.reference_layer_connections.append(reference_layer.featureDeleted.connect(functools.partial(tools.MyLayerCaches.remove_pk_index_feature, reference_layer.id())))
+            for signal in [reference_layer.featureAdded, reference_layer.featureDeleted]:
+                self.rs.reference_layer_connections.append(signal.connect(functools.partial(tools.MyLayerCaches.invalidate_display_value, reference_layer.id())))
+            # cached Reference-geometries: single feature on geometry-edits, complete layer after rollBack
+            for signal in [reference_layer.geometryChanged, reference_layer.featureDeleted]:
+                self.rs.reference_layer_connections.append(signal.connect(functools.partial(tools.MyLayerCaches.invalidate_feature, reference_layer.id())))
+            self.rs.reference_layer_connections.append(reference_layer.afterRollBack.connect(functools.partial(tools.MyLayerCaches.invalidate_layer, reference_layer.id())))
+            # cached displayExpression-values: single feature on attribute-edits, complete layer if the expression changes
+            self.rs.reference_layer_connections.append(reference_layer.attributeValueChanged.connect(functools.partial(tools.MyLayerCaches.invalidate_display_value, reference_layer.id())))
+            # PK-index: changed ID-values in the edit-buffer
+            self.rs.reference_layer_connections.append(reference_layer.attributeValueChanged.connect(functools.partial(tools.MyLayerCaches.update_pk_index, reference_layer)))
+            self.rs.reference_layer_connections.append(reference_layer.displayExpressionChanged.connect(functools.partial(tools.MyLayerCaches.invalidate_display_values, reference_layer.id())))
+            # cached coordinate-transforms and pre-projected Reference-geometries
+            self.rs.reference_layer_connections.append(reference_layer.crsChanged.connect(tools.MyTransforms.invalidate_transforms))
+            # snapping-index: incremental updates on geometry-edits, rebuild after rollBack and filter-changes
+            self.rs.reference_layer_connections.append(reference_layer.geometryChanged.connect(functools.partial(self.ref_snapper.update_feature, reference_layer)))
+            self.rs.reference_layer_connections.append(reference_layer.featureAdded.connect(functools.partial(self.ref_snapper.update_feature, reference_layer)))
+            self.rs.reference_layer_connections.append(reference_layer.featureDeleted.connect(self.ref_snapper.remove_feature))
+            for signal in [reference_layer.afterRollBack, reference_layer.subsetStringChanged]:
+                self.rs.reference_layer_connections.append(signal.connect(functools.partial(self.ref_snapper.build, reference_layer)))
+            # event-index: re-calculate the PoL-points on the changed Reference-lines
+            for signal in [reference_layer.geometryChanged, reference_layer.attributeValueChanged, reference_layer.featureAdded, reference_layer.featureDeleted]:
+                self.rs.reference_layer_connections.append(signal.connect(functools.partial(tools.MyEventIndex.mark_reference_dirty, reference_layer.id())))
+            for signal in [reference_layer.afterRollBack, reference_layer.subsetStringChanged]:
+                self.rs.reference_layer_connections.append(signal.connect(functools.partial(tools.MyEventIndex.invalidate_events, reference_layer.id())))
+            # integrity-scanner: mark changed Reference-features for the incremental check
+            for signal in [reference_layer.geometryChanged, reference_layer.attributeValueChanged, reference_layer.featureAdded, reference_layer.featureDeleted]:
+                self.rs.reference_layer_connections.append(signal.connect(functools.partial(self.integrity_scanner.mark_dirty, 'ref')))
+            self.rs.reference_layer_connections.append(reference_layer.committedFeaturesAdded.connect(functools.partial(self.integrity_scanner.mark_committed, 'ref')))
+            for signal in [reference_layer.afterRollBack, reference_layer.subsetStringChanged]:
+                self.rs.reference_layer_connections.append(signal.connect(self.integrity_scanner.invalidate))
+            # materialized Show-Layer: re-calculate the rows on the committed Reference-lines
+            self.rs.reference_layer_connections.append(reference_layer.committedGeometriesChanges.connect(self.s_materialize_changed_references))
+            self.rs.reference_layer_connections.append(reference_layer.committedAttributeValuesChanges.connect(self.s_materialize_changed_reference_ids))
+            self.rs.reference_layer_connections.append(reference_layer.committedFeaturesRemoved.connect(self.s_materialize_removed_references))
             self.rs.reference_layer_connections.append(reference_layer.configChanged.connect(self.refresh_gui))
             self.rs.reference_layer_connections.append(reference_layer.displayExpressionChanged.connect(self.refresh_gui))
             self.rs.reference_layer_connections.append(reference_layer.afterCommitChanges.connect(self.dlg_refresh_feature_selection_section))
@@ -1751,6 +2215,133 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         self.dlg_refresh_edit_section()
         self.dlg_refresh_feature_selection_section()
 
+    def s_invalidate_data_caches(self, *args):
+        """slot for Data-Layer-signals afterCommitChanges/afterRollBack/subsetStringChanged:
+        invalidates the cached PK-indices of Data-Layer and Show-Layer, because the Show-Layer depends on the Data-Layer
+        :param args: signal-arguments, unused
+        """
+        # Rev. 2023-09-12
+        if self.ss.dataLyrId:
+            tools.MyLayerCaches.invalidate_layer(self.ss.dataLyrId)
+        if self.ss.showLyrId:
+            tools.MyLayerCaches.invalidate_layer(self.ss.showLyrId)
+
+    def get_show_layer_materializer(self) -> tools.MyShowLayers.ShowLayerMaterializer | None:
+        """returns the materializer, if the current Show-Layer is a materialized one and the settings are complete"""
+        # Rev. 2023-08-21
+        if self.cf.reference_layer_complete and self.cf.data_layer_complete and self.cf.show_layer_complete and tools.MyShowLayers.is_materialized(self.ds.showLyr):
+            return tools.MyShowLayers.get_materializer(
+                self.ds.showLyr,
+                self.ds.refLyr,
+                self.ds.refLyrPkField,
+                self.ds.dataLyr,
+                self.ds.dataLyrIdField,
+                self.ds.dataLyrReferenceField,
+                [self.ds.dataLyrIdField, self.ds.dataLyrReferenceField, self.ds.dataLyrMeasureField],
+                self.calc_show_geometry
+            )
+
+    def get_event_index(self) -> tools.MyEventIndex.EventIndex | None:
+        """returns the spatial index of the calculated PoL-points, if Reference- and Data-Layer are complete, no Show-Layer required"""
+        # Rev. 2023-09-03
+        if self.cf.reference_layer_complete and self.cf.data_layer_complete:
+            return tools.MyEventIndex.get_event_index(
+                self.ds.refLyr,
+                self.ds.refLyrPkField,
+                self.ds.dataLyr,
+                self.ds.dataLyrIdField,
+                self.ds.dataLyrReferenceField,
+                [self.ds.dataLyrIdField, self.ds.dataLyrReferenceField, self.ds.dataLyrMeasureField],
+                self.calc_show_geometry
+            )
+
+    def calc_show_geometry(self, ref_geom: tools.MyLayerCaches.RefGeometry, data_feature: qgis.core.QgsFeature) -> qgis.core.QgsGeometry | None:
+        """callback for the materialized Show-Layer: point-geometry for a Data-feature
+        :param ref_geom: Reference-geometry
+        :param data_feature: Data-feature
+        """
+        # Rev. 2023-08-21
+        measure = data_feature[self.ds.dataLyrMeasureField.name()]
+        if measure is not None and measure != qgis.core.NULL:
+            return tools.MyToolFunctions.get_point_geom(ref_geom, measure)
+
+    def s_materialize_added_features(self, layer_id: str, added_features: list):
+        """slot for committedFeaturesAdded on Data-Layer: calculates these rows in materialized Show-Layer
+        :param layer_id:
+        :param added_features: committed features with their new fids
+        """
+        # Rev. 2023-08-21
+        show_layer_materializer = self.get_show_layer_materializer()
+        if show_layer_materializer:
+            show_layer_materializer.update_features([feature.id() for feature in added_features])
+
+    def s_materialize_changed_features(self, layer_id: str, changed_attribute_values: dict):
+        """slot for committedAttributeValuesChanges on Data-Layer: re-calculates these rows in materialized Show-Layer
+        :param layer_id:
+        :param changed_attribute_values: key: fid value: dict field-index ➜ value
+        """
+        # Rev. 2023-08-21
+        show_layer_materializer = self.get_show_layer_materializer()
+        if show_layer_materializer:
+            show_layer_materializer.update_features(list(changed_attribute_values.keys()))
+
+    def s_materialize_removed_features(self, layer_id: str, deleted_fids: list):
+        """slot for committedFeaturesRemoved on Data-Layer: removes these rows from materialized Show-Layer
+        :param layer_id:
+        :param deleted_fids:
+        """
+        # Rev. 2023-08-21
+        show_layer_materializer = self.get_show_layer_materializer()
+        if show_layer_materializer:
+            show_layer_materializer.remove_features(deleted_fids)
+
+    def s_materialize_changed_references(self, layer_id: str, changed_geometries: dict):
+        """slot for committedGeometriesChanges on Reference-Layer: re-calculates the referencing rows in materialized Show-Layer
+        :param layer_id:
+        :param changed_geometries: key: fid value: new geometry
+        """
+        # Rev. 2023-08-22
+        show_layer_materializer = self.get_show_layer_materializer()
+        if show_layer_materializer:
+            show_layer_materializer.update_references(list(changed_geometries.keys()))
+
+    def s_materialize_changed_reference_ids(self, layer_id: str, changed_attribute_values: dict):
+        """slot for committedAttributeValuesChanges on Reference-Layer: changed PKs affect the join ➜ re-calculate materialized Show-Layer
+        :param layer_id:
+        :param changed_attribute_values: key: fid value: dict field-index ➜ value
+        """
+        # Rev. 2023-08-22
+        show_layer_materializer = self.get_show_layer_materializer()
+        if show_layer_materializer:
+            pk_field_idx = self.ds.refLyr.fields().indexOf(self.ds.refLyrPkField.name())
+            if any(pk_field_idx in changed_values for changed_values in changed_attribute_values.values()):
+                show_layer_materializer.materialize()
+
+    def s_materialize_removed_references(self, layer_id: str, deleted_fids: list):
+        """slot for committedFeaturesRemoved on Reference-Layer: the PKs of the removed features are unknown ➜ re-calculate materialized Show-Layer
+        :param layer_id:
+        :param deleted_fids:
+        """
+        # Rev. 2023-08-22
+        show_layer_materializer = self.get_show_layer_materializer()
+        if show_layer_materializer:
+            show_layer_materializer.materialize()
+
+    def refresh_show_layer(self, update_extents: bool = True):
+        """refreshes Show-Layer after edits in Data-Layer
+        materialized Show-Layer: already patched row by row via the committed...-signals, see s_materialize_added_features...
+        virtual layer or database-view: the whole layer must be re-queried
+        :param update_extents: False after delete, removed features don't expand the extent
+        """
+        # Rev. 2023-08-22
+        if self.cf.show_layer_complete and not tools.MyShowLayers.is_materialized(self.ds.showLyr):
+            if update_extents:
+                self.ds.showLyr.updateExtents()
+            if self.iface.mapCanvas().isCachingEnabled():
+                self.ds.showLyr.triggerRepaint()
+            else:
+                self.iface.mapCanvas().refresh()
+
     def s_change_reference_layer_id_field(self) -> None:
         """change Reference-Layer-join-field in QComboBox"""
         # Rev. 2023-05-03
@@ -1972,6 +2563,9 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
 
     def disconnect_data_layer(self):
         """disconnects currently registered Data-Layer"""
+        # Rev. 2023-09-09
+        # edit-session ends, pending changes remain in the edit-buffer of the previous Data-Layer
+        self.edit_session.stop()
         if self.ds.dataLyr:
             action_list = [action for action in self.ds.dataLyr.actions().actions() if action.id() in [self._lyr_act_id_1, self._lyr_act_id_2]]
             for action in action_list:
@@ -1998,7 +2592,7 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         connects signals
         disconnects previous dataLyr
         """
-        # Rev. 2023-05-08
+        # Rev. 2023-09-11
         critical_msg = ''
         success_msg = ''
         info_msg = ''
@@ -2012,7 +2606,48 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         if data_layer:
 
             # https://doc.qt.io/qt-5/qmetaobject-connection.html
+            # PK-indices must be invalidated/updated before dlg_refresh_data_sections is called
+            # complete: after commit (fids of added features are remapped) and if the features change outside the edit-buffer
+            for signal in [data_layer.afterCommitChanges, data_layer.afterRollBack, data_layer.subsetStringChanged]:
+                self.rs.data_layer_connections.append(signal.connect(self.s_invalidate_data_caches))
+            # single feature for edits in the edit-buffer
+            self.rs.data_layer_connections.append(data_layer.featureAdded.connect(functools.partial(tools.MyLayerCaches.add_pk_index_feature, data_layer)))
+            self.rs.data_layer_connections.append(data_layer.featureDeleted.connect(functools.partial(tools.MyLayerCaches.remove_pk_index_feature, data_layer.id())))
+            for signal in [data_layer.featureAdded, data_layer.featureDeleted]:
+                self.rs.data_layer_connections.append(signal.connect(functools.partial(tools.MyLayerCaches.invalidate_display_value, data_layer.id())))
+            # cached displayExpression-values: single feature on attribute-edits, complete layer if the expression changes or after rollBack
+            self.rs.data_layer_connections.append(data_layer.attributeValueChanged.connect(functools.partial(tools.MyLayerCaches.invalidate_display_value, data_layer.id())))
+            # PK-index: changed PK-values in the edit-buffer
+            self.rs.data_layer_connections.append(data_layer.attributeValueChanged.connect(functools.partial(tools.MyLayerCaches.update_pk_index, data_layer)))
+            for signal in [data_layer.displayExpressionChanged, data_layer.afterRollBack]:
+                self.rs.data_layer_connections.append(signal.connect(functools.partial(tools.MyLayerCaches.invalidate_display_values, data_layer.id())))
+            # materialized Show-Layer: only the committed rows are re-calculated
+            self.rs.data_layer_connections.append(data_layer.committedFeaturesAdded.connect(self.s_materialize_added_features))
+            self.rs.data_layer_connections.append(data_layer.committedAttributeValuesChanges.connect(self.s_materialize_changed_features))
+            self.rs.data_layer_connections.append(data_layer.committedFeaturesRemoved.connect(self.s_materialize_removed_features))
+            # PK-allocator for inserts: counter re-queried once per connect and per commit, in between kept current by the edit-buffer-signals
+            tools.MyLayerCaches.invalidate_pks(data_layer.id())
+            self.rs.data_layer_connections.append(data_layer.featureAdded.connect(functools.partial(tools.MyLayerCaches.register_pk_feature, data_layer)))
+            self.rs.data_layer_connections.append(data_layer.attributeValueChanged.connect(functools.partial(tools.MyLayerCaches.register_pk_value, data_layer)))
+            self.rs.data_layer_connections.append(data_layer.committedFeaturesAdded.connect(tools.MyLayerCaches.register_committed_pks))
+            # beforeCommitChanges: re-query also if the commit fails, inserts of other users are found after each commit
+            for signal in [data_layer.beforeCommitChanges, data_layer.afterCommitChanges, data_layer.afterRollBack, data_layer.subsetStringChanged]:
+                self.rs.data_layer_connections.append(signal.connect(functools.partial(tools.MyLayerCaches.invalidate_pks, data_layer.id())))
+            # event-index: re-calculate the changed Data-features
+            for signal in [data_layer.attributeValueChanged, data_layer.featureAdded, data_layer.featureDeleted]:
+                self.rs.data_layer_connections.append(signal.connect(functools.partial(tools.MyEventIndex.mark_data_dirty, data_layer.id())))
+            self.rs.data_layer_connections.append(data_layer.committedFeaturesAdded.connect(tools.MyEventIndex.mark_data_committed))
+            for signal in [data_layer.afterRollBack, data_layer.subsetStringChanged]:
+                self.rs.data_layer_connections.append(signal.connect(functools.partial(tools.MyEventIndex.invalidate_events, data_layer.id())))
+            # integrity-scanner: mark changed Data-features for the incremental check
+            for signal in [data_layer.attributeValueChanged, data_layer.featureAdded, data_layer.featureDeleted]:
+                self.rs.data_layer_connections.append(signal.connect(functools.partial(self.integrity_scanner.mark_dirty, 'data')))
+            self.rs.data_layer_connections.append(data_layer.committedFeaturesAdded.connect(functools.partial(self.integrity_scanner.mark_committed, 'data')))
+            for signal in [data_layer.afterRollBack, data_layer.subsetStringChanged]:
+                self.rs.data_layer_connections.append(signal.connect(self.integrity_scanner.invalidate))
             self.rs.data_layer_connections.append(data_layer.configChanged.connect(self.refresh_gui))
+            # bulk-load: deferred GeoPackage-indexes
+            self.rs.data_layer_connections.append(data_layer.afterCommitChanges.connect(functools.partial(tools.MyGeoPackage.create_deferred_indexes, data_layer.id())))
             self.rs.data_layer_connections.append(data_layer.afterCommitChanges.connect(self.dlg_refresh_data_sections))
             self.rs.data_layer_connections.append(data_layer.displayExpressionChanged.connect(self.refresh_gui))
 
@@ -2064,6 +2699,12 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         self.ss.showLyrId = None
         if show_layer:
             self.ss.showLyrId = show_layer.id()
+            for signal in [show_layer.afterCommitChanges, show_layer.featureAdded, show_layer.featureDeleted]:
+                self.rs.show_layer_connections.append(signal.connect(functools.partial(tools.MyLayerCaches.invalidate_layer, show_layer.id())))
+            self.rs.show_layer_connections.append(show_layer.attributeValueChanged.connect(functools.partial(tools.MyLayerCaches.invalidate_display_value, show_layer.id())))
+            self.rs.show_layer_connections.append(show_layer.crsChanged.connect(tools.MyTransforms.invalidate_transforms))
+            for signal in [show_layer.displayExpressionChanged, show_layer.afterRollBack]:
+                self.rs.show_layer_connections.append(signal.connect(functools.partial(tools.MyLayerCaches.invalidate_display_values, show_layer.id())))
             self.rs.show_layer_connections.append(show_layer.configChanged.connect(self.refresh_gui))
             self.rs.show_layer_connections.append(show_layer.displayExpressionChanged.connect(self.refresh_gui))
             self.ds.showLyr = show_layer
@@ -2161,89 +2802,102 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
             self.my_dialogue.dspbx_measure_fract.setValue(measure_fract)
 
     def canvasMoveEvent(self, event: qgis.gui.QgsMapMouseEvent) -> None:
-        """MouseMove on canvas
-        further action depending on rs.tool_mode
+        """reimplemented: MouseMove on canvas
+        coalesced, only the latest position is processed once per frame, see process_canvas_move
         :param event:
         """
-        # Rev. 2023-05-03
-        point_xy = self.iface.mapCanvas().getCoordinateTransform().toMapCoordinates(event.x(), event.y())
+        # Rev. 2023-08-27
+        # copy, the event is deleted after return
+        self.move_coalescer.push(QtCore.QPoint(event.pos()))
+
+    def process_canvas_move(self, pos: QtCore.QPoint) -> None:
+        """coalesced MouseMove on canvas, called by self.move_coalescer
+        further action depending on rs.tool_mode
+        :param pos: canvas-pixel-position of the latest mouse-move-event
+        """
+        # Rev. 2023-08-27
+        point_xy = self.iface.mapCanvas().getCoordinateTransform().toMapCoordinates(pos.x(), pos.y())
         self.show_map_coords_in_dialogue(point_xy)
 
         if self.rs.tool_mode == 'move_point':
             if self.rs.snapped_ref_fid is not None:
-                ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
-
-                ref_projected_point_geom = qgis.core.QgsGeometry.fromPointXY(point_xy)
-                ref_projected_point_geom.transform(qgis.core.QgsCoordinateTransform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.refLyr.crs(), qgis.core.QgsProject.instance()))
-
-                # see https://qgis.org/pyqgis/master/core/QgsGeometry.html#qgis.core.QgsGeometry.closestSegmentWithContext
-                # returns tuple: (sqrDist, minDistPoint, nextVertexIndex, leftOrRightOfSegment)
-                point_on_line = ref_feature.geometry().closestSegmentWithContext(ref_projected_point_geom.asPoint())
-                # sqr_dist = point_on_line[0]
-                # <0 left, >0 right, ==0 on the line
-                # side = point_on_line[3]
-                # abs_dist = math.sqrt(sqr_dist)
-                # offset = abs_dist * side * -1
-                current_measure = ref_feature.geometry().lineLocatePoint(qgis.core.QgsGeometry.fromPointXY(point_on_line[1]))
-                delta = current_measure - self.rs.last_measure
-                measure = self.rs.current_measure + delta
-                self.rs.current_measure = self.rs.last_measure = max(0, min(measure, ref_feature.geometry().length()))
-                self.show_measure_in_dialogue(self.rs.current_measure)
-                self.show_measure_fract_in_dialogue(self.rs.current_measure / ref_feature.geometry().length())
-                self.draw_measured_point(self.rs.snapped_ref_fid, self.rs.current_measure)
+                ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, self.rs.snapped_ref_fid)
+                if ref_geom:
+                    ref_projected_point_geom = qgis.core.QgsGeometry.fromPointXY(point_xy)
+                    ref_projected_point_geom.transform(tools.MyTransforms.get_transform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.refLyr.crs()))
+
+                    # measure, squared distance and side (<0 left, >0 right, ==0 on the line) in one query,
+                    # only the segments near the last measure are checked, see MyLayerCaches.RefGeometry.locate_point
+                    current_measure, sqr_dist, side = ref_geom.locate_point(ref_projected_point_geom.asPoint(), self.rs.last_measure)
+                    # abs_dist = math.sqrt(sqr_dist)
+                    # offset = abs_dist * side * -1
+                    delta = current_measure - self.rs.last_measure
+                    measure = self.rs.current_measure + delta
+                    self.rs.current_measure = self.rs.last_measure = max(0, min(measure, ref_geom.length))
+                    self.show_measure_in_dialogue(self.rs.current_measure)
+                    self.show_measure_fract_in_dialogue(self.rs.current_measure / ref_geom.length)
+                    self.draw_measured_point(self.rs.snapped_ref_fid, self.rs.current_measure)
 
         elif self.rs.tool_mode == 'select_features':
 
             if self.rs.mouse_down_point:
                 # draw selection-rectangle
-                mouse_move_point = self.iface.mapCanvas().getCoordinateTransform().toMapCoordinates(event.x(), event.y())
+                mouse_move_point = self.iface.mapCanvas().getCoordinateTransform().toMapCoordinates(pos.x(), pos.y())
                 geom = qgis.core.QgsGeometry.fromRect(qgis.core.QgsRectangle(self.rs.mouse_down_point, mouse_move_point))
                 self.rb_selection_rect.setToGeometry(geom, None)
                 self.rb_selection_rect.show()
+            else:
+                self.identify_event(pos)
 
         elif self.rs.tool_mode == 'measuring':
             # running measurement, stop with mouseReleaseEvent()
             if self.cf.reference_layer_defined:
-                snap_filter = tools.MyToolFunctions.OneLayerFilter(self.ds.refLyr)
-
-                m = self.iface.mapCanvas().snappingUtils().snapToMap(event.pos(), snap_filter)
+                m, snapped_measure = self.snap_to_reference(pos)
                 self.snap_indicator.setMatch(m)
                 # qgis.core.QgsPointXY
 
                 if self.snap_indicator.match().type():
                     snapped_ref_fid = m.featureId()
-                    ref_feature = self.ds.refLyr.getFeature(snapped_ref_fid)
-                    # always, because otherwise no snapping...
-                    snapped_point_xy = self.snap_indicator.match().point()
-                    self.show_snap_coords_in_dialogue(snapped_point_xy)
-                    self.draw_reference_geom(snapped_ref_fid)
-                    self.my_dialogue.qcbn_snapped_ref_fid.select_by_value(0, 256, snapped_ref_fid)
-
-                    snapped_point_geom = qgis.core.QgsGeometry.fromPointXY(snapped_point_xy)
-                    if self.iface.mapCanvas().mapSettings().destinationCrs() != self.ds.refLyr.crs():
-                        snapped_point_geom.transform(qgis.core.QgsCoordinateTransform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.refLyr.crs(), qgis.core.QgsProject.instance()))
-                    measure = ref_feature.geometry().lineLocatePoint(snapped_point_geom)
+                    ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, snapped_ref_fid)
+                    if ref_geom:
+                        # always, because otherwise no snapping...
+                        snapped_point_xy = self.snap_indicator.match().point()
+                        self.show_snap_coords_in_dialogue(snapped_point_xy)
+                        self.draw_reference_geom(snapped_ref_fid)
+                        self.my_dialogue.qcbn_snapped_ref_fid.select_by_value(0, 256, snapped_ref_fid)
 
-                    self.show_measure_in_dialogue(measure)
-                    self.show_measure_fract_in_dialogue(measure / ref_feature.geometry().length())
+                        measure = snapped_measure
+
+                        self.show_measure_in_dialogue(measure)
+                        self.show_measure_fract_in_dialogue(measure / ref_geom.length)
 
     def dlg_refresh_reference_layer_section(self):
-        """re-populates the QComboBoxN with the List of Reference-Layer-Features"""
-        # Rev. 2023-05-03
+        """re-populates the QComboBoxN with the List of Reference-Layer-Features
+        the rows are streamed by a background-task and appended in batches, see MyLayerCaches.ReferenceListTask"""
+        # Rev. 2023-08-26
         if self.my_dialogue and self.ds.refLyr:
-            self.my_dialogue.qcbn_snapped_ref_fid.blockSignals(True)
+            self.cancel_reference_list_task()
 
-            in_model = QtGui.QStandardItemModel(0, 2)
-            context = qgis.core.QgsExpressionContext()
-            exp = qgis.core.QgsExpression(self.ds.refLyr.displayExpression())
-            for feature in self.ds.refLyr.getFeatures():
-                context.setFeature(feature)
-                disp_exp_evaluated = exp.evaluate(context)
+            in_model = QtGui.QStandardItemModel(0, 3)
+            self.my_dialogue.qcbn_snapped_ref_fid.set_model(in_model)
+
+            task = tools.MyLayerCaches.ReferenceListTask(self.ds.refLyr)
+            task.rows_fetched.connect(functools.partial(self.s_append_reference_rows, in_model))
+            self.rs.reference_list_task = task
+            qgis.core.QgsApplication.taskManager().addTask(task)
 
+    def s_append_reference_rows(self, in_model: QtGui.QStandardItemModel, rows: dict):
+        """slot for ReferenceListTask.rows_fetched: appends a batch of rows to the List of Reference-Layer-Features
+        :param in_model: model the task was started for, rows of a previous task are ignored
+        :param rows: dict {fid: [evaluated displayExpression, length]}
+        """
+        # Rev. 2023-08-26
+        if self.my_dialogue and in_model is self.my_dialogue.qcbn_snapped_ref_fid.source_model():
+            for fid, (disp_exp_evaluated, length) in rows.items():
                 items = []
                 item = QtGui.QStandardItem()
-                item.setData(feature.id(), 0)
-                item.setData(feature.id(), 256)
+                item.setData(fid, 0)
+                item.setData(fid, 256)
                 items.append(item)
 
                 item = QtGui.QStandardItem()
@@ -2251,17 +2905,323 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
                 items.append(item)
 
                 item = QtGui.QStandardItem()
-                item.setData(feature.geometry().length(), 0)
+                item.setData(length, 0)
                 items.append(item)
 
                 in_model.appendRow(items)
 
-            self.my_dialogue.qcbn_snapped_ref_fid.set_model(in_model)
+            if in_model.rowCount() == len(rows):
+                # first batch: column-widths and sort
+                self.my_dialogue.qcbn_snapped_ref_fid.apply_settings()
 
-            if self.rs.snapped_ref_fid is not None:
+            if self.rs.snapped_ref_fid in rows and self.my_dialogue.qcbn_snapped_ref_fid.currentIndex() < 0:
                 self.my_dialogue.qcbn_snapped_ref_fid.select_by_value(0, 256, self.rs.snapped_ref_fid)
 
-            self.my_dialogue.qcbn_snapped_ref_fid.blockSignals(False)
+    def dlg_refresh_batch_locate_section(self):
+        """refreshes the Batch-Locate-part in dialog: Point-Layers and the optional Side-/Distance-/Point-ID-Fields of the Data-Layer"""
+        # Rev. 2023-09-11
+        if self.my_dialogue:
+            prev_point_layer = self.my_dialogue.qcbn_batch_point_layer.currentData()
+            prev_side_field = self.my_dialogue.qcbn_batch_side_field.currentData()
+            prev_distance_field = self.my_dialogue.qcbn_batch_distance_field.currentData()
+            prev_point_fid_field = self.my_dialogue.qcbn_batch_point_fid_field.currentData()
+
+            point_layers = tools.MyToolFunctions.get_point_layers()
+            integer_field_types = [QtCore.QVariant.Int, QtCore.QVariant.UInt, QtCore.QVariant.LongLong, QtCore.QVariant.ULongLong]
+            numeric_field_types = integer_field_types + [QtCore.QVariant.Double]
+
+            model = QtGui.QStandardItemModel(0, 3)
+            for cltrl in qgis.core.QgsProject.instance().layerTreeRoot().findLayers():
+                if cltrl.layer() and cltrl.layer().id() in point_layers:
+                    cl = cltrl.layer()
+                    name_item = QtGui.QStandardItem(cl.name())
+                    name_item.setData(cl, 256)
+                    geometry_item = QtGui.QStandardItem(qgis.core.QgsWkbTypes.displayString(cl.dataProvider().wkbType()))
+                    if cl.dataProvider().name() != 'virtual':
+                        provider_item = QtGui.QStandardItem(f"{cl.dataProvider().name()} ({cl.dataProvider().storageType()})")
+                    else:
+                        provider_item = QtGui.QStandardItem(cl.dataProvider().name())
+                    model.appendRow([name_item, geometry_item, provider_item])
+            self.my_dialogue.qcbn_batch_point_layer.set_model(model)
+            if prev_point_layer in point_layers.values():
+                self.my_dialogue.qcbn_batch_point_layer.select_by_value(0, 256, prev_point_layer)
+
+            for qcbn, prev_field, field_types in [
+                (self.my_dialogue.qcbn_batch_side_field, prev_side_field, numeric_field_types),
+                (self.my_dialogue.qcbn_batch_distance_field, prev_distance_field, numeric_field_types),
+                (self.my_dialogue.qcbn_batch_point_fid_field, prev_point_fid_field, integer_field_types)
+            ]:
+                model = QtGui.QStandardItemModel(0, 3)
+                if self.cf.data_layer_complete:
+                    idx = 0
+                    for field in self.ds.dataLyr.dataProvider().fields():
+                        name_item = QtGui.QStandardItem(field.name())
+                        name_item.setData(field, 256)
+                        # numeric (Point-ID-Field: integer) and none of the fields registered in the settings
+                        name_item.setEnabled(
+                            field.type() in field_types and
+                            field.name() not in [self.ds.dataLyrIdField.name(), self.ds.dataLyrReferenceField.name(), self.ds.dataLyrMeasureField.name()] and
+                            idx not in self.ds.dataLyr.dataProvider().pkAttributeIndexes()
+                        )
+                        is_pk_item = QtGui.QStandardItem()
+                        type_item = QtGui.QStandardItem(field.friendlyTypeString())
+                        model.appendRow([name_item, type_item, is_pk_item])
+                        idx += 1
+                qcbn.set_model(model)
+                if prev_field and self.cf.data_layer_complete and self.ds.dataLyr.fields().indexOf(prev_field.name()) >= 0:
+                    qcbn.select_by_value(0, 0, prev_field.name())
+
+            self.my_dialogue.pbtn_batch_locate.setEnabled(self.cf.reference_layer_complete and self.cf.data_layer_complete and self.rs.batch_locate_task is None)
+            self.my_dialogue.pbtn_batch_cancel.setEnabled(self.rs.batch_locate_task is not None)
+            self.my_dialogue.pbtn_import_measure_table.setEnabled(self.cf.reference_layer_complete and self.cf.data_layer_complete)
+            self.my_dialogue.pbtn_check_integrity.setEnabled(self.cf.reference_layer_complete and self.cf.data_layer_complete)
+            self.my_dialogue.pbtn_check_integrity_changes.setEnabled(self.cf.reference_layer_complete and self.cf.data_layer_complete)
+
+    def s_batch_locate(self):
+        """locates all or the selected features of the chosen Point-Layer on the nearest Reference-line and inserts the results into Data-Layer
+        calculation in background by MyBatchTools.LocatePointsTask, the rows are inserted chunk-wise by s_write_located_rows"""
+        # Rev. 2023-09-11
+        if self.my_dialogue and self.cf.reference_layer_complete and self.cf.data_layer_complete and self.rs.batch_locate_task is None:
+            point_layer = self.my_dialogue.qcbn_batch_point_layer.currentData()
+            integer_field_types = [QtCore.QVariant.Int, QtCore.QVariant.UInt, QtCore.QVariant.LongLong, QtCore.QVariant.ULongLong]
+            if not point_layer:
+                self.push_messages(warning_msg=QtCore.QCoreApplication.translate('PolEvt', "No Point-Layer selected..."))
+            elif self.ds.dataLyr.isEditable():
+                # the rows are written directly to the provider, an open edit-session would be inconsistent
+                self.push_messages(warning_msg=qt_format(QtCore.QCoreApplication.translate('PolEvt', "Layer {apos}{0}{apos} is editable, please end edit session..."), self.ds.dataLyr.name()))
+            elif self.ds.dataLyrIdField.type() not in integer_field_types:
+                self.push_messages(critical_msg=qt_format(QtCore.QCoreApplication.translate('PolEvt', "Batch-Locate requires an integer ID-field in Data-Layer, field {apos}{0}{apos} has type {apos}{1}{apos}"), self.ds.dataLyrIdField.name(), self.ds.dataLyrIdField.friendlyTypeString()))
+            else:
+                self.rs.batch_next_pk = tools.MyLayerCaches.get_sequence_clause(self.ds.dataLyr, self.ds.dataLyrIdField) or tools.MyLayerCaches.get_next_pk(self.ds.dataLyr, self.ds.dataLyrIdField)
+                self.rs.batch_num_inserted = 0
+
+                side_field = self.my_dialogue.qcbn_batch_side_field.currentData()
+                distance_field = self.my_dialogue.qcbn_batch_distance_field.currentData()
+                point_fid_field = self.my_dialogue.qcbn_batch_point_fid_field.currentData()
+                task = tools.MyBatchTools.LocatePointsTask(
+                    self.ds.refLyr,
+                    self.ds.refLyrPkField.name(),
+                    point_layer,
+                    self.my_dialogue.cb_batch_selected_only.isChecked(),
+                    self.my_dialogue.dspbx_batch_max_distance.value()
+                )
+                task.rows_located.connect(functools.partial(
+                    self.s_write_located_rows,
+                    side_field.name() if side_field else None,
+                    distance_field.name() if distance_field else None,
+                    point_fid_field.name() if point_fid_field else None
+                ))
+                task.taskCompleted.connect(self.s_batch_locate_finished)
+                task.taskTerminated.connect(self.s_batch_locate_finished)
+                self.rs.batch_locate_task = task
+                qgis.core.QgsApplication.taskManager().addTask(task)
+
+                self.my_dialogue.pbtn_batch_locate.setEnabled(False)
+                self.my_dialogue.pbtn_batch_cancel.setEnabled(True)
+                self.push_messages(info_msg=qt_format(QtCore.QCoreApplication.translate('PolEvt', "Batch-Locate of Point-Layer {apos}{0}{apos} started, see task-manager..."), point_layer.name()))
+
+    def s_write_located_rows(self, side_field_name: str | None, distance_field_name: str | None, point_fid_field_name: str | None, rows: list):
+        """slot for LocatePointsTask.rows_located: inserts one chunk of located points into Data-Layer
+        written directly to the provider, one provider-transaction per chunk
+        :param side_field_name: optional Data-Layer-field for the side
+        :param distance_field_name: optional Data-Layer-field for the distance
+        :param point_fid_field_name: optional Data-Layer-field for the fid of the located point
+        :param rows: list of [point-fid, Reference-Layer-ID-value, measure, side, distance]
+        """
+        # Rev. 2023-09-11
+        if self.rs.batch_next_pk is None or not self.cf.data_layer_complete:
+            return
+
+        data_features = []
+        for point_fid, ref_id, measure, side, distance in rows:
+            data_feature = qgis.core.QgsFeature(self.ds.dataLyr.dataProvider().fields())
+            data_feature[self.ds.dataLyrIdField.name()] = self.rs.batch_next_pk
+            data_feature[self.ds.dataLyrReferenceField.name()] = ref_id
+            data_feature[self.ds.dataLyrMeasureField.name()] = measure
+            if side_field_name:
+                data_feature[side_field_name] = side
+            if distance_field_name:
+                data_feature[distance_field_name] = distance
+            if point_fid_field_name:
+                data_feature[point_fid_field_name] = point_fid
+            data_features.append(data_feature)
+            if not isinstance(self.rs.batch_next_pk, str):
+                # allocated one by one, the cached counter stays current for parallel inserts
+                self.rs.batch_next_pk = tools.MyLayerCaches.get_next_pk(self.ds.dataLyr, self.ds.dataLyrIdField)
+
+        success, added_features = self.ds.dataLyr.dataProvider().addFeatures(data_features)
+        if success:
+            self.rs.batch_num_inserted += len(added_features)
+            show_layer_materializer = self.get_show_layer_materializer()
+            if show_layer_materializer:
+                show_layer_materializer.update_features([feature.id() for feature in added_features])
+        else:
+            # no further inserts, the already inserted chunks remain
+            self.rs.batch_next_pk = None
+            self.cancel_batch_locate_task()
+            self.push_messages(critical_msg=qt_format(QtCore.QCoreApplication.translate('PolEvt', "Batch-Locate: insert into Data-Layer {apos}{0}{apos} failed: {1}"), self.ds.dataLyr.name(), self.ds.dataLyr.dataProvider().lastError()))
+
+    def s_batch_locate_finished(self):
+        """slot for taskCompleted/taskTerminated of LocatePointsTask: refreshes caches, layers and dialog"""
+        # Rev. 2023-09-11
+        task = self.rs.batch_locate_task
+        self.rs.batch_locate_task = None
+        self.rs.batch_next_pk = None
+        # the rows were written to the provider without layer-signals
+        self.integrity_scanner.invalidate()
+        if self.cf.data_layer_complete:
+            tools.MyLayerCaches.invalidate_pks(self.ds.dataLyr.id())
+            tools.MyEventIndex.invalidate_events(self.ds.dataLyr.id())
+            tools.MyLayerCaches.invalidate_layer(self.ds.dataLyr.id())
+            # bulk-load-GeoPackage: written via dataProvider, afterCommitChanges is not emitted
+            tools.MyGeoPackage.create_deferred_indexes(self.ds.dataLyr.id())
+            self.ds.dataLyr.reload()
+            self.refresh_show_layer()
+
+        if task is not None:
+            if task.status() == qgis.core.QgsTask.Complete:
+                self.push_messages(success_msg=qt_format(QtCore.QCoreApplication.translate('PolEvt', "Batch-Locate: {0} features inserted into Data-Layer {apos}{1}{apos}, {2} points not located"), self.rs.batch_num_inserted, self.ds.dataLyr.name(), task.num_not_located))
+            else:
+                self.push_messages(warning_msg=qt_format(QtCore.QCoreApplication.translate('PolEvt', "Batch-Locate canceled, {0} features already inserted into Data-Layer {apos}{1}{apos}"), self.rs.batch_num_inserted, self.ds.dataLyr.name()))
+
+        if self.my_dialogue:
+            self.my_dialogue.pbtn_batch_locate.setEnabled(self.cf.reference_layer_complete and self.cf.data_layer_complete)
+            self.my_dialogue.pbtn_batch_cancel.setEnabled(False)
+
+    def cancel_batch_locate_task(self):
+        """cancels a running LocatePointsTask, the already inserted chunks remain in Data-Layer"""
+        # Rev. 2023-08-30
+        if self.rs.batch_locate_task is not None:
+            try:
+                self.rs.batch_locate_task.cancel()
+            except RuntimeError:
+                # already finished and deleted by the QgsTaskManager
+                self.rs.batch_locate_task = None
+
+    def s_import_measure_table(self):
+        """imports a measure-table (CSV, XLSX, ODS, GPKG, DBF) into Data-Layer
+        all rows are validated against the Reference-line-lengths by MyBatchTools.MeasureTableImporter,
+        the accepted rows are inserted in one edit-command and one commit, in edit-session-mode only into the edit-buffer,
+        the rejected rows are shown in a temporary table"""
+        # Rev. 2023-09-12
+        if self.my_dialogue and self.cf.reference_layer_complete and self.cf.data_layer_complete:
+            if self.ds.dataLyr.isModified() and not self.edit_session.active:
+                # the import commits, uncommitted edits would be committed too
+                self.push_messages(warning_msg=qt_format(QtCore.QCoreApplication.translate('PolEvt', "Layer {apos}{0}{apos} has uncommitted edits, please save or discard..."), self.ds.dataLyr.name()))
+                return
+
+            dialog = QtWidgets.QFileDialog()
+            dialog.setFileMode(QtWidgets.QFileDialog.ExistingFile)
+            dialog.setViewMode(QtWidgets.QFileDialog.Detail)
+            dialog.setOption(QtWidgets.QFileDialog.DontUseNativeDialog, True)
+            dialog.setAcceptMode(QtWidgets.QFileDialog.AcceptOpen)
+            dialog.setNameFilter("Measure-Tables (*.csv *.txt *.xlsx *.xls *.ods *.gpkg *.dbf)")
+            dialog.setWindowTitle(QtCore.QCoreApplication.translate('PolEvt', "LinearReferencing: Import measure-table into Point-on-Line-Data-Layer"))
+            result = dialog.exec()
+            filenames = dialog.selectedFiles()
+            if not result or not filenames:
+                self.push_messages(info_msg=QtCore.QCoreApplication.translate('PolEvt', "Canceled by user"))
+                return
+
+            table_layer = tools.MyBatchTools.open_table(filenames[0])
+            if not table_layer.isValid():
+                self.push_messages(critical_msg=qt_format(QtCore.QCoreApplication.translate('PolEvt', "File {apos}{0}{apos} could not be opened as table"), filenames[0]))
+                return
+
+            importer = tools.MyBatchTools.MeasureTableImporter(
+                self.ds.refLyr,
+                self.ds.refLyrPkField,
+                self.ds.dataLyr,
+                self.ds.dataLyrIdField,
+                self.ds.dataLyrReferenceField,
+                [self.ds.dataLyrMeasureField]
+            )
+            missing_columns = importer.missing_columns(table_layer)
+            if missing_columns:
+                self.push_messages(critical_msg=qt_format(QtCore.QCoreApplication.translate('PolEvt', "Table {apos}{0}{apos} misses the columns {1}"), table_layer.name(), ', '.join(missing_columns)))
+                return
+
+            QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
+            try:
+                accepted, rejected = importer.validate(table_layer)
+                commit_errors = []
+                if accepted:
+                    self.start_data_edit("LinearReferencing: import measure-table")
+                    if not importer.insert(accepted):
+                        self.rollback_data_edit()
+                        commit_errors = ["addFeatures failed"]
+                    elif not self.commit_data_edit():
+                        commit_errors = self.ds.dataLyr.commitErrors()
+                        self.rollback_data_edit()
+            except Exception as err:
+                self.rollback_data_edit()
+                self.push_messages(critical_msg=f"Exception '{err.__class__.__name__}' in {gdp()}: {err}")
+                return
+            finally:
+                QtWidgets.QApplication.restoreOverrideCursor()
+
+            if rejected:
+                rejects_layer = importer.create_rejects_layer(table_layer, rejected)
+                qgis.core.QgsProject.instance().addMapLayer(rejects_layer)
+
+            if commit_errors:
+                self.push_messages(critical_msg=qt_format(QtCore.QCoreApplication.translate('PolEvt', "Import into Data-Layer {apos}{0}{apos} failed, edits rolled back:{br}{1}"), self.ds.dataLyr.name(), '<br />'.join(commit_errors)))
+                return
+
+            tools.MyLayerCaches.invalidate_layer(self.ds.dataLyr.id())
+            if not self.edit_session.active:
+                self.refresh_show_layer()
+            if rejected:
+                self.push_messages(warning_msg=qt_format(QtCore.QCoreApplication.translate('PolEvt', "Import: {0} features inserted into Data-Layer {apos}{1}{apos}, {2} rows rejected, see table {apos}{3}{apos}"), len(accepted), self.ds.dataLyr.name(), len(rejected), rejects_layer.name()))
+            else:
+                self.push_messages(success_msg=qt_format(QtCore.QCoreApplication.translate('PolEvt', "Import: {0} features inserted into Data-Layer {apos}{1}{apos}"), len(accepted), self.ds.dataLyr.name()))
+
+    def s_check_integrity(self, incremental: bool = False):
+        """whole-table integrity-check of Data-Layer by MyIntegrity.IntegrityScanner, the issues are shown in a temporary table
+        :param incremental: True ➜ re-check only the features changed since the last check
+        """
+        # Rev. 2023-09-01
+        if self.my_dialogue and self.cf.reference_layer_complete and self.cf.data_layer_complete:
+            QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
+            try:
+                issues = self.integrity_scanner.scan(
+                    self.ds.refLyr,
+                    self.ds.refLyrPkField,
+                    self.ds.dataLyr,
+                    self.ds.dataLyrIdField,
+                    self.ds.dataLyrReferenceField,
+                    [self.ds.dataLyrMeasureField],
+                    self.ds.showLyr if self.cf.show_layer_complete else None,
+                    self.ds.showLyrBackReferenceField if self.cf.show_layer_complete else None,
+                    incremental
+                )
+            finally:
+                QtWidgets.QApplication.restoreOverrideCursor()
+
+            # only one report per Map-Tool
+            if self.rs.integrity_report_layer_id and qgis.core.QgsProject.instance().mapLayer(self.rs.integrity_report_layer_id):
+                qgis.core.QgsProject.instance().removeMapLayer(self.rs.integrity_report_layer_id)
+            self.rs.integrity_report_layer_id = None
+
+            if issues:
+                report_layer = self.integrity_scanner.create_report_layer(self.ds.dataLyr, issues)
+                qgis.core.QgsProject.instance().addMapLayer(report_layer)
+                self.rs.integrity_report_layer_id = report_layer.id()
+                self.push_messages(warning_msg=qt_format(QtCore.QCoreApplication.translate('PolEvt', "Integrity-Check of Data-Layer {apos}{0}{apos}: {1} issues, see table {apos}{2}{apos}"), self.ds.dataLyr.name(), len(issues), report_layer.name()))
+            else:
+                self.push_messages(success_msg=qt_format(QtCore.QCoreApplication.translate('PolEvt', "Integrity-Check of Data-Layer {apos}{0}{apos}: no issues, {1} features read"), self.ds.dataLyr.name(), self.integrity_scanner.num_read))
+
+    def cancel_reference_list_task(self):
+        """cancels a running ReferenceListTask"""
+        # Rev. 2023-08-26
+        if self.rs.reference_list_task is not None:
+            try:
+                self.rs.reference_list_task.cancel()
+            except RuntimeError:
+                # already finished and deleted by the QgsTaskManager
+                pass
+            self.rs.reference_list_task = None
+
 
     def canvasReleaseEvent(self, event: qgis.gui.QgsMapMouseEvent) -> None:
         """mouseUp on canvas
@@ -2269,41 +3229,39 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
            :param event:
            """
         # Rev. 2023-05-03
+        # pending mouse-move first
+        self.move_coalescer.flush()
         point_xy = self.iface.mapCanvas().getCoordinateTransform().toMapCoordinates(event.x(), event.y())
         self.show_map_coords_in_dialogue(point_xy)
 
         if self.rs.tool_mode == 'move_point':
             self.vm_pt_edit.hide()
             if self.cf.measure_completed:
-                ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
-
-                ref_projected_point_geom = qgis.core.QgsGeometry.fromPointXY(point_xy)
-                ref_projected_point_geom.transform(qgis.core.QgsCoordinateTransform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.refLyr.crs(), qgis.core.QgsProject.instance()))
+                ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, self.rs.snapped_ref_fid)
+                if ref_geom:
+                    ref_projected_point_geom = qgis.core.QgsGeometry.fromPointXY(point_xy)
+                    ref_projected_point_geom.transform(tools.MyTransforms.get_transform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.refLyr.crs()))
 
-                # see https://qgis.org/pyqgis/master/core/QgsGeometry.html#qgis.core.QgsGeometry.closestSegmentWithContext
-                # returns tuple: (sqrDist, minDistPoint, nextVertexIndex, leftOrRightOfSegment)
-                point_on_line = ref_feature.geometry().closestSegmentWithContext(ref_projected_point_geom.asPoint())
-                # sqr_dist = point_on_line[0]
-                # <0 left, >0 right, ==0 on the line
-                # side = point_on_line[3]
-                # abs_dist = math.sqrt(sqr_dist)
+                    # measure, squared distance and side (<0 left, >0 right, ==0 on the line) in one query,
+                    # only the segments near the last measure are checked, see MyLayerCaches.RefGeometry.locate_point
+                    current_measure, sqr_dist, side = ref_geom.locate_point(ref_projected_point_geom.asPoint(), self.rs.last_measure)
+                    # abs_dist = math.sqrt(sqr_dist)
 
-                # offset = abs_dist * side * -1
+                    # offset = abs_dist * side * -1
 
-                current_measure = ref_feature.geometry().lineLocatePoint(qgis.core.QgsGeometry.fromPointXY(point_on_line[1]))
 
-                delta = current_measure - self.rs.last_measure
-                #
-                next_measure = self.rs.current_measure + delta
+                    delta = current_measure - self.rs.last_measure
+                    #
+                    next_measure = self.rs.current_measure + delta
 
-                self.rs.current_measure = max(0, min(next_measure, ref_feature.geometry().length()))
-                self.show_measure_in_dialogue(self.rs.current_measure)
-                self.show_measure_fract_in_dialogue(self.rs.current_measure / ref_feature.geometry().length())
-                self.draw_measured_point(self.rs.snapped_ref_fid, self.rs.current_measure)
+                    self.rs.current_measure = max(0, min(next_measure, ref_geom.length))
+                    self.show_measure_in_dialogue(self.rs.current_measure)
+                    self.show_measure_fract_in_dialogue(self.rs.current_measure / ref_geom.length)
+                    self.draw_measured_point(self.rs.snapped_ref_fid, self.rs.current_measure)
 
-                self.rs.last_measure = None
+                    self.rs.last_measure = None
 
-                self.check_settings('before_move_point')
+                    self.check_settings('before_move_point')
 
         elif self.rs.tool_mode == 'after_measure':
             # convenience
@@ -2313,7 +3271,8 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
             self.vm_pt_edit.hide()
             self.vm_pt_measure.hide()
 
-            if self.cf.show_layer_complete:
+            event_index = self.get_event_index()
+            if event_index:
                 if self.rs.mouse_down_point:
                     self.rs.mouse_up_point = point_xy
                     # mouse-down == mouse-up ➜ simple click, no rect
@@ -2325,16 +3284,11 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
                     else:
                         rect = qgis.core.QgsRectangle(self.rs.mouse_down_point.x(), self.rs.mouse_down_point.y(), self.rs.mouse_up_point.x(), self.rs.mouse_up_point.y())
 
-                    tr = qgis.core.QgsCoordinateTransform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.showLyr.crs(), qgis.core.QgsProject.instance())
+                    tr = tools.MyTransforms.get_transform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.refLyr.crs())
                     projected_rect = tr.transformBoundingBox(rect)
 
-                    request = qgis.core.QgsFeatureRequest()
-                    request.setFilterRect(projected_rect)
-                    request.setFlags(qgis.core.QgsFeatureRequest.ExactIntersect)
-
-                    new_selected_pks = []
-                    for feature in self.ds.showLyr.getFeatures(request):
-                        new_selected_pks.append(feature[self.ds.showLyrBackReferenceField.name()])
+                    # calculated PoL-points in the event-index instead of ExactIntersect on the Show-Layer
+                    new_selected_pks = list(event_index.query_rect(projected_rect).values())
 
                     if len(new_selected_pks) > 0:
 
@@ -2356,39 +3310,29 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
                         self.rs.selected_pks = list(dict.fromkeys(self.rs.selected_pks))
 
                         # validate self.rs.selected_pks and select features:
-                        data_fids = []
-                        show_fids = []
-                        for edit_pk in self.rs.selected_pks:
-                            data_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk)
-                            if data_feature:
-                                data_fids.append(data_feature.id())
-
-                            show_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.showLyr, self.ds.showLyrBackReferenceField, edit_pk)
-                            if show_feature and show_feature.isValid():
-                                show_fids.append(show_feature.id())
-                        self.ds.showLyr.removeSelection()
-                        self.ds.showLyr.select(show_fids)
+                        # Data-fids from the event-index, one bulk-query for the optional Show-Layer
+                        data_fids = list(event_index.get_entries_by_pks(self.rs.selected_pks).keys())
                         self.ds.dataLyr.removeSelection()
                         self.ds.dataLyr.select(data_fids)
+                        if self.cf.show_layer_complete:
+                            show_features = tools.MyLayerCaches.get_features_by_pks(self.ds.showLyr, self.ds.showLyrBackReferenceField, self.rs.selected_pks, self.get_attribute_request(self.ds.showLyr))
+                            show_fids = [show_feature.id() for show_feature in show_features.values() if show_feature.isValid()]
+                            self.ds.showLyr.removeSelection()
+                            self.ds.showLyr.select(show_fids)
             else:
-                self.push_messages(warning_msg=QtCore.QCoreApplication.translate('PolEvt', "Missing requirements: No Show-Layer configured..."))
+                self.push_messages(warning_msg=QtCore.QCoreApplication.translate('PolEvt', "Missing requirements, Reference- and Data-Layer required..."))
             self.rb_selection_rect.hide()
             self.rs.mouse_down_point = None
             self.rs.mouse_up_point = None
             self.dlg_refresh_feature_selection_section()
         elif self.rs.tool_mode == 'measuring':
-            snap_filter = tools.MyToolFunctions.OneLayerFilter(self.ds.refLyr)
-            m = self.iface.mapCanvas().snappingUtils().snapToMap(event.pos(), snap_filter)
-            if self.snap_indicator.match().type():
-                snapped_point_xy = self.snap_indicator.match().point()
-                snapped_point_geom = qgis.core.QgsGeometry.fromPointXY(snapped_point_xy)
+            m, snapped_measure = self.snap_to_reference(event.pos())
+            if m.type():
                 snapped_ref_fid = m.featureId()
-                if self.iface.mapCanvas().mapSettings().destinationCrs() != self.ds.refLyr.crs():
-                    snapped_point_geom.transform(qgis.core.QgsCoordinateTransform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.refLyr.crs(), qgis.core.QgsProject.instance()))
-                if snapped_point_geom and snapped_point_geom.asPoint():
+                ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, snapped_ref_fid)
+                if ref_geom and snapped_measure is not None:
                     self.rs.snapped_ref_fid = snapped_ref_fid
-                    snapped_ref_geom = self.ds.refLyr.getFeature(m.featureId()).geometry()
-                    self.rs.current_measure = snapped_ref_geom.lineLocatePoint(snapped_point_geom)
+                    self.rs.current_measure = snapped_measure
                     self.snap_indicator.setVisible(False)
                     self.draw_measured_point(self.rs.snapped_ref_fid, self.rs.current_measure)
                     self.draw_reference_geom(self.rs.snapped_ref_fid)
@@ -2408,26 +3352,28 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         :param event:
         """
         # Rev. 2023-05-03
+        # pending mouse-move first
+        self.move_coalescer.flush()
         point_xy = self.iface.mapCanvas().getCoordinateTransform().toMapCoordinates(event.x(), event.y())
 
         if self.rs.tool_mode == 'before_move_point':
             if self.cf.measure_completed:
                 self.draw_edit_point(self.rs.snapped_ref_fid, self.rs.current_measure)
-                ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
-                ref_projected_point_geom = qgis.core.QgsGeometry.fromPointXY(point_xy)
-                ref_projected_point_geom.transform(qgis.core.QgsCoordinateTransform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.refLyr.crs(), qgis.core.QgsProject.instance()))
-
-                # see https://qgis.org/pyqgis/master/core/QgsGeometry.html#qgis.core.QgsGeometry.closestSegmentWithContext
-                # returns tuple: (sqrDist, minDistPoint, nextVertexIndex, leftOrRightOfSegment)
-                point_on_line = ref_feature.geometry().closestSegmentWithContext(ref_projected_point_geom.asPoint())
-                current_measure = ref_feature.geometry().lineLocatePoint(qgis.core.QgsGeometry.fromPointXY(point_on_line[1]))
-                self.rs.current_measure = self.rs.last_measure = current_measure
-
-                self.show_measure_in_dialogue(self.rs.current_measure)
-                self.show_measure_fract_in_dialogue(self.rs.current_measure / ref_feature.geometry().length())
-                self.draw_measured_point(self.rs.snapped_ref_fid, self.rs.current_measure)
+                ref_geom = tools.MyLayerCaches.get_ref_geometry(self.ds.refLyr, self.rs.snapped_ref_fid)
+                if ref_geom:
+                    ref_projected_point_geom = qgis.core.QgsGeometry.fromPointXY(point_xy)
+                    ref_projected_point_geom.transform(tools.MyTransforms.get_transform(self.iface.mapCanvas().mapSettings().destinationCrs(), self.ds.refLyr.crs()))
+
+                    # measure, squared distance and side (<0 left, >0 right, ==0 on the line) in one query,
+                    # see MyLayerCaches.RefGeometry.locate_point
+                    current_measure, sqr_dist, side = ref_geom.locate_point(ref_projected_point_geom.asPoint())
+                    self.rs.current_measure = self.rs.last_measure = current_measure
+
+                    self.show_measure_in_dialogue(self.rs.current_measure)
+                    self.show_measure_fract_in_dialogue(self.rs.current_measure / ref_geom.length)
+                    self.draw_measured_point(self.rs.snapped_ref_fid, self.rs.current_measure)
 
-                self.check_settings('move_point')
+                    self.check_settings('move_point')
 
         elif self.rs.tool_mode == 'select_features':
             # store self.rs.mouse_down_point as start-point for the feature-selection-rect
@@ -2437,7 +3383,7 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
 
     def s_create_data_layer(self):
         """create a GeoPackage-"layer" (geometry-less) for storing the linear-references"""
-        # Rev. 2023-05-03
+        # Rev. 2023-09-08
         try_it = True
         did_it = False
         critical_msg = ''
@@ -2506,6 +3452,15 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
                         try_it = False
 
                 if try_it:
+                    # indexes and storage-options, see tools.MyGeoPackage
+                    storage_options = [QtCore.QCoreApplication.translate('PolEvt', "Indexed"), QtCore.QCoreApplication.translate('PolEvt', "Indexed, WAL-journal, page-size 8192 (new GeoPackage)"), QtCore.QCoreApplication.translate('PolEvt', "Bulk load: index after first commit, WAL-journal, page-size 8192 (new GeoPackage)")]
+                    storage_option, ok = QtWidgets.QInputDialog.getItem(None, f"LinearReferencing ({gdp()})", QtCore.QCoreApplication.translate('PolEvt', "GeoPackage-options:"), storage_options, 0, False)
+                    if not ok:
+                        info_msg = QtCore.QCoreApplication.translate('PolEvt', "Canceled by user")
+                        try_it = False
+
+                if try_it:
+                    is_new = not os.path.isfile(gpkg_path)
                     options.layerName = table_name
                     # geometry-less table needs anyway three Dummy-Attributes for geometrie-type, projection and transformation
                     writer = qgis.core.QgsVectorFileWriter.create(
@@ -2526,10 +3481,18 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
                         # perhaps layer is physically created after "del writer"?
                         del writer
 
+                        # page-size and journal-mode before the layer is opened
+                        tune_msg = tools.MyGeoPackage.tune(gpkg_path, 8192 if storage_option != storage_options[0] else 0, storage_option != storage_options[0], is_new)
+
                         uri = gpkg_path + '|layername=' + table_name
                         data_lyr = self.iface.addVectorLayer(uri, table_name, "ogr")
 
                         if data_lyr and data_lyr.isValid():
+                            # bulk-load: index created after the first commit, f.e. the import of a measure-table
+                            index_msg = tools.MyGeoPackage.create_indexes(data_lyr.id(), gpkg_path, table_name, data_lyr_reference_field.name(), [data_lyr_measure_field.name()], storage_option == storage_options[2])
+                            if tune_msg or index_msg:
+                                warning_msg = qt_format(QtCore.QCoreApplication.translate('PolEvt', "GeoPackage-options not applied: {0}"), tune_msg or index_msg)
+
                             data_lyr.setFieldConstraint(0, qgis.core.QgsFieldConstraints.Constraint.ConstraintUnique)
                             data_lyr.setFieldConstraint(0, qgis.core.QgsFieldConstraints.Constraint.ConstraintNotNull)
                             data_lyr.setFieldConstraint(1, qgis.core.QgsFieldConstraints.Constraint.ConstraintNotNull)
@@ -2560,9 +3523,50 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
 
         self.push_messages(success_msg, info_msg, warning_msg, critical_msg)
 
+    def create_db_show_layer(self, layer_name: str) -> tuple:
+        """creates a PostGIS-view or a trigger-maintained table in PostGIS/SpatiaLite, see tools.MyDbViews
+        the SQL is shown for confirmation before execution
+        :param layer_name: name of the layer, database-object-name derived from it
+        :returns tuple (show_lyr, error_msg), show_lyr None if canceled or failed, error_msg empty if canceled
+        """
+        # Rev. 2023-09-07
+        modes = [QtCore.QCoreApplication.translate('PolEvt', "View (PostGIS)"), QtCore.QCoreApplication.translate('PolEvt', "Trigger-maintained table (PostGIS/SpatiaLite)")]
+        mode, ok = QtWidgets.QInputDialog.getItem(None, f"LinearReferencing ({gdp()})", QtCore.QCoreApplication.translate('PolEvt', "Type of database-object:"), modes, 0, False)
+        if not ok:
+            return None, ''
+
+        generator = tools.MyDbViews.ShowObjectGenerator(
+            'PolEvt',
+            self.ds.refLyr,
+            self.ds.refLyrPkField.name(),
+            self.ds.dataLyr,
+            self.ds.dataLyrIdField.name(),
+            self.ds.dataLyrReferenceField.name(),
+            [self.ds.dataLyrMeasureField.name()],
+            tools.MyDbViews.get_object_name(layer_name),
+            'view' if mode == modes[0] else 'table'
+        )
+        error_msg = generator.check()
+        if error_msg:
+            return None, error_msg
+
+        msg_box = QtWidgets.QMessageBox(QtWidgets.QMessageBox.Question, f"LinearReferencing ({gdp()})", qt_format(QtCore.QCoreApplication.translate('PolEvt', "Create {apos}{0}{apos} in the database of the Data-Layer?{br}SQL see details..."), generator.object_qualified_name), QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.Cancel)
+        msg_box.setDetailedText(generator.sql_script())
+        if msg_box.exec_() != QtWidgets.QMessageBox.Yes:
+            return None, ''
+
+        error_msg = generator.execute()
+        if error_msg:
+            return None, error_msg
+
+        show_lyr = generator.load_layer(layer_name)
+        if not show_lyr.isValid():
+            return None, qt_format(QtCore.QCoreApplication.translate('PolEvt', "{apos}{0}{apos} created, but not loadable as layer"), generator.object_qualified_name)
+        return show_lyr, ''
+
     def s_create_show_layer(self):
         """create a virtual layer gcombining the Data-Layer and the Reference-Layer"""
-        # Rev. 2023-05-03
+        # Rev. 2023-09-07
         try_it = True
         did_it = False
         critical_msg = ''
@@ -2577,58 +3581,88 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
             # unique name for the  virtual layer within project
             layer_name, ok = QtWidgets.QInputDialog.getText(None, f"LinearReferencing ({gdp()})", QtCore.QCoreApplication.translate('PolEvt', "Name for virtual Show-Layer:"), QtWidgets.QLineEdit.Normal, layer_name)
             if ok and layer_name:
-                show_lyr_sql = "SELECT"
-                field_sql_lst = []
-
-                # only the necessary attributes of Data-Layer are included, the other come via join
-                field_sql_lst.append(f" data_lyr.{self.ds.dataLyrIdField.name()} as \"{self.ds.dataLyrIdField.name()}\"")
-                field_sql_lst.append(f" data_lyr.{self.ds.dataLyrReferenceField.name()} as \"{self.ds.dataLyrReferenceField.name()}\"")
-                field_sql_lst.append(f" data_lyr.{self.ds.dataLyrMeasureField.name()} as \"{self.ds.dataLyrMeasureField.name()}\"")
-
-                # Problem/Bug only under windows:
-                # if dataLyr has no records ➜ show_lyr.renderer() == None
-                # Workaround:
-                # Geometry-Expression with "special comment" according https://docs.qgis.org/testing/en/docs/user_manual/managing_data_source/create_layers.html#creating-virtual-layers
-                # Bug?
-                field_sql_lst.append(f" ST_Line_Interpolate_Point(ref_lyr.geometry, data_lyr.\"{self.ds.dataLyrMeasureField.name()}\"/st_length(ref_lyr.geometry)) as point_geom /*:point:{self.ds.refLyr.crs().postgisSrid()}*/")
-                show_lyr_sql += ',\n'.join(field_sql_lst)
-                show_lyr_sql += f"\nFROM  \"{self.ds.dataLyr.id()}\" as data_lyr"
-                show_lyr_sql += f"\n  INNER JOIN \"{self.ds.refLyr.id()}\" as ref_lyr"
-                integer_field_types = [QtCore.QVariant.Int, QtCore.QVariant.UInt, QtCore.QVariant.LongLong, QtCore.QVariant.ULongLong]
-                if self.ds.dataLyrReferenceField.type() in integer_field_types:
-                    show_lyr_sql += f" ON data_lyr.\"{self.ss.dataLyrReferenceFieldName}\" = ref_lyr.\"{self.ds.refLyrPkField.name()}\""
+                # virtual layer, materialized memory-layer, see tools.MyShowLayers, or layer with the plugin-provider, see tools.MyShowProvider
+                layer_types = [QtCore.QCoreApplication.translate('PolEvt', "Virtual layer"), QtCore.QCoreApplication.translate('PolEvt', "Materialized memory-layer"), QtCore.QCoreApplication.translate('PolEvt', "Calculated layer (provider linref)"), QtCore.QCoreApplication.translate('PolEvt', "Database view/table (PostGIS/SpatiaLite)")]
+                layer_type, ok = QtWidgets.QInputDialog.getItem(None, f"LinearReferencing ({gdp()})", QtCore.QCoreApplication.translate('PolEvt', "Type of Show-Layer:"), layer_types, 0, False)
+
+            if ok and layer_name:
+                is_materialized = layer_type == layer_types[1]
+                is_linref = layer_type == layer_types[2]
+                is_db = layer_type == layer_types[3]
+                db_msg = ''
+                if is_materialized:
+                    # the geometries are calculated by the plugin and updated on Data-Layer-commits
+                    show_lyr = tools.MyShowLayers.create_memory_layer(layer_name, 'point', self.ds.refLyr.crs(), [self.ds.dataLyrIdField, self.ds.dataLyrReferenceField, self.ds.dataLyrMeasureField], 'PolEvt')
+                elif is_db:
+                    # the geometries are calculated by the database, view or trigger-maintained table, see tools.MyDbViews
+                    show_lyr, db_msg = self.create_db_show_layer(layer_name)
+                elif is_linref:
+                    # the geometries are calculated by the provider on request, only for the features in the filter-rect
+                    uri = tools.MyShowProvider.build_uri(
+                        'PolEvt',
+                        self.ds.refLyr.crs(),
+                        self.ds.refLyr.id(),
+                        self.ds.refLyrPkField.name(),
+                        self.ds.dataLyr.id(),
+                        [self.ds.dataLyrIdField, self.ds.dataLyrReferenceField, self.ds.dataLyrMeasureField],
+                        self.ds.dataLyrIdField.name(),
+                        self.ds.dataLyrReferenceField.name(),
+                        [self.ds.dataLyrMeasureField.name()]
+                    )
+                    show_lyr = qgis.core.QgsVectorLayer(uri, layer_name, tools.MyShowProvider.provider_key)
                 else:
-                    # needed with non-integer join-fields,
-                    # makes the query/layer *very* slow, presumably because of missing indexes?
-                    # ➜ better avoid non-integer PKs
-                    show_lyr_sql += f" ON (data_lyr.\"{self.ss.dataLyrReferenceFieldName}\" = ref_lyr.\"{self.ds.refLyrPkField.name()}\") = True"
-
-                # urllib.parse.quote
-                # https://docs.python.org/3/library/urllib.parse.html
-                # not necessary
-                # show_lyr_sql_q = urllib.parse.quote(show_lyr_sql)
-
-                uri = f"?query={show_lyr_sql}"
-
-                # set uid-Field for virtual Layer via "&uid="
-                # only for integer-PKs
-                # advantage: no artificial fid used, feature.id() returns this value
-                # if the Name of a string-PK would be used for that param
-                # ➜ no error
-                # ➜ the layer will show in canvas
-                # ➜ but the associated table has only *one* record
-                if self.ds.dataLyrIdField.type() in integer_field_types:
-                    uri += f"&uid={self.ds.dataLyrIdField.name()}"
-
-                # &geometry=alias used in show_lyr_sql
-                # :1: ➜ point
-                # {epsg} ➜ same as Reference-Layer
-                # anyway under windows:
-                # the "Virtual Layer Dialog shows for "Geometry" allways "Autodetect" instead "Manually defined", so the whole
-                # "&geometry=point_geom:Point:25832"-part seems to be ignored
-                uri += f"&geometry=point_geom:point:{self.ds.refLyr.crs().postgisSrid()}"
-
-                show_lyr = qgis.core.QgsVectorLayer(uri, layer_name, "virtual")
+                    show_lyr_sql = "SELECT"
+                    field_sql_lst = []
+
+                    # only the necessary attributes of Data-Layer are included, the other come via join
+                    field_sql_lst.append(f" data_lyr.{self.ds.dataLyrIdField.name()} as \"{self.ds.dataLyrIdField.name()}\"")
+                    field_sql_lst.append(f" data_lyr.{self.ds.dataLyrReferenceField.name()} as \"{self.ds.dataLyrReferenceField.name()}\"")
+                    field_sql_lst.append(f" data_lyr.{self.ds.dataLyrMeasureField.name()} as \"{self.ds.dataLyrMeasureField.name()}\"")
+
+                    # Problem/Bug only under windows:
+                    # if dataLyr has no records ➜ show_lyr.renderer() == None
+                    # Workaround:
+                    # Geometry-Expression with "special comment" according https://docs.qgis.org/testing/en/docs/user_manual/managing_data_source/create_layers.html#creating-virtual-layers
+                    # Bug?
+                    field_sql_lst.append(f" ST_Line_Interpolate_Point(ref_lyr.geometry, data_lyr.\"{self.ds.dataLyrMeasureField.name()}\"/st_length(ref_lyr.geometry)) as point_geom /*:point:{self.ds.refLyr.crs().postgisSrid()}*/")
+                    show_lyr_sql += ',\n'.join(field_sql_lst)
+                    show_lyr_sql += f"\nFROM  \"{self.ds.dataLyr.id()}\" as data_lyr"
+                    show_lyr_sql += f"\n  INNER JOIN \"{self.ds.refLyr.id()}\" as ref_lyr"
+                    integer_field_types = [QtCore.QVariant.Int, QtCore.QVariant.UInt, QtCore.QVariant.LongLong, QtCore.QVariant.ULongLong]
+                    if self.ds.dataLyrReferenceField.type() in integer_field_types:
+                        show_lyr_sql += f" ON data_lyr.\"{self.ss.dataLyrReferenceFieldName}\" = ref_lyr.\"{self.ds.refLyrPkField.name()}\""
+                    else:
+                        # needed with non-integer join-fields,
+                        # makes the query/layer *very* slow, presumably because of missing indexes?
+                        # ➜ better avoid non-integer PKs
+                        show_lyr_sql += f" ON (data_lyr.\"{self.ss.dataLyrReferenceFieldName}\" = ref_lyr.\"{self.ds.refLyrPkField.name()}\") = True"
+
+                    # urllib.parse.quote
+                    # https://docs.python.org/3/library/urllib.parse.html
+                    # not necessary
+                    # show_lyr_sql_q = urllib.parse.quote(show_lyr_sql)
+
+                    uri = f"?query={show_lyr_sql}"
+
+                    # set uid-Field for virtual Layer via "&uid="
+                    # only for integer-PKs
+                    # advantage: no artificial fid used, feature.id() returns this value
+                    # if the Name of a string-PK would be used for that param
+                    # ➜ no error
+                    # ➜ the layer will show in canvas
+                    # ➜ but the associated table has only *one* record
+                    if self.ds.dataLyrIdField.type() in integer_field_types:
+                        uri += f"&uid={self.ds.dataLyrIdField.name()}"
+
+                    # &geometry=alias used in show_lyr_sql
+                    # :1: ➜ point
+                    # {epsg} ➜ same as Reference-Layer
+                    # anyway under windows:
+                    # the "Virtual Layer Dialog shows for "Geometry" allways "Autodetect" instead "Manually defined", so the whole
+                    # "&geometry=point_geom:Point:25832"-part seems to be ignored
+                    uri += f"&geometry=point_geom:point:{self.ds.refLyr.crs().postgisSrid()}"
+
+                    show_lyr = qgis.core.QgsVectorLayer(uri, layer_name, "virtual")
 
                 if show_lyr and show_lyr.renderer():
                     qvl_join_data_lyr = qgis.core.QgsVectorLayerJoinInfo()
@@ -2679,8 +3713,19 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
                     self.resume_measure()
 
                     did_it = True
-                    success_msg = QtCore.QCoreApplication.translate('PolEvt', "Virtual layer created and added...")
+                    if is_materialized:
+                        success_msg = QtCore.QCoreApplication.translate('PolEvt', "Materialized layer created and added...")
+                    elif is_linref:
+                        success_msg = QtCore.QCoreApplication.translate('PolEvt', "Calculated layer created and added...")
+                    elif is_db:
+                        success_msg = QtCore.QCoreApplication.translate('PolEvt', "Database layer created and added...")
+                    else:
+                        success_msg = QtCore.QCoreApplication.translate('PolEvt', "Virtual layer created and added...")
 
+                elif is_db and not db_msg:
+                    info_msg = QtCore.QCoreApplication.translate('PolEvt', "Canceled by user")
+                elif is_db:
+                    critical_msg = qt_format(QtCore.QCoreApplication.translate('PolEvt', "Error creating database layer:{br}{0}"), db_msg)
                 else:
                     critical_msg = QtCore.QCoreApplication.translate('PolEvt', "Error creating virtual layer...")
             else:
@@ -2717,7 +3762,7 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
     def s_insert_feature(self):
         """opens insert from with some prefilled contents, from which a new can be inserted to Data-Layer
         data from any currently selected self.rs.edit_pk is cloned"""
-        # Rev. 2023-04-28
+        # Rev. 2023-09-09
         try_it = True
         did_it = False
 
@@ -2729,7 +3774,7 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         used_pk = None
 
         if self.cf.insert_enabled:
-            if self.ds.dataLyr.isEditable():
+            if self.ds.dataLyr.isEditable() and not self.edit_session.active:
                 if self.ds.dataLyr.isModified():
                     dialog_result = QtWidgets.QMessageBox.question(
                         None,
@@ -2774,7 +3819,7 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
 
                     if self.rs.edit_pk is not None:
                         # clone data from current selected self.rs.edit_pk
-                        data_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.dataLyr, self.ds.dataLyrIdField, self.rs.edit_pk)
+                        data_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.dataLyr, self.ds.dataLyrIdField, self.rs.edit_pk)
                         for field in data_feature.fields():
                             data_feature[field.name()] = data_feature[field.name()]
 
@@ -2795,22 +3840,18 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
                     if self.ds.dataLyrIdField.type() in integer_field_types:
                         # pre-fetch sequence-value for openFeatureForm for convenience
                         # normally integer-pk-Field declared as "INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL"
-                        current_pks = qgis.core.QgsVectorLayerUtils.getValues(self.ds.dataLyr, self.ds.dataLyrIdField.name(), selectedOnly=False)[0]
-                        if current_pks:
-                            new_pk = max(current_pks) + 1
-                        else:
-                            new_pk = 1
-                        data_feature[self.ds.dataLyrIdField.name()] = new_pk
+                        # provider-sequence or cached counter, see MyLayerCaches.PkAllocator
+                        data_feature[self.ds.dataLyrIdField.name()] = tools.MyLayerCaches.get_next_pk(self.ds.dataLyr, self.ds.dataLyrIdField)
                         # no convenience for string-PKs, but fortunately the FeatureForm checks the uniqueness
                     try:
-                        self.ds.dataLyr.startEditing()
+                        self.start_data_edit("LinearReferencing: insert feature")
                         self.ds.dataLyr.addFeature(data_feature)
                         # dialog is modal by default
                         dlg_result = self.iface.openFeatureForm(self.ds.dataLyr, data_feature)
                         if dlg_result:
                             insert_ref_pk = data_feature[self.ds.dataLyrReferenceField.name()]
                             insert_measure = data_feature[self.ds.dataLyrMeasureField.name()]
-                            ref_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.refLyr, self.ds.refLyrPkField, insert_ref_pk)
+                            ref_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.refLyr, self.ds.refLyrPkField, insert_ref_pk)
                             # user could have changed feature-data in dialog (PK, Reference-id, measure)
                             # ➜ validity-check like "Reference-id exists in refLyr?" "measure 0 ...referenced_line_length?"
                             if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
@@ -2823,36 +3864,32 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
                                     data_feature[self.ds.dataLyrMeasureField.name()] = max(0, min(ref_feature.geometry().length(), insert_measure))
                                     self.ds.dataLyr.updateFeature(data_feature)
 
-                                commit_result = self.ds.dataLyr.commitChanges()
+                                commit_result = self.commit_data_edit()
                                 if commit_result:
                                     used_pk = data_feature[self.ds.dataLyrIdField.name()]
 
                                     did_it = True
                                     success_msg = qt_format(QtCore.QCoreApplication.translate('PolEvt', "New feature with ID {apos}{0}{apos} successfully added to {apos}{1}{apos}..."),used_pk, self.ds.dataLyr.name())
                                 else:
-                                    self.ds.dataLyr.rollBack()
+                                    self.rollback_data_edit()
                                     critical_msg = str(self.ds.dataLyr.commitErrors())
                             else:
-                                self.ds.dataLyr.rollBack()
+                                self.rollback_data_edit()
                                 critical_msg = qt_format(QtCore.QCoreApplication.translate('PolEvt', "No Reference-Layer-feature with PK {apos}{0}{apos}..."),insert_ref_pk)
                         else:
-                            self.ds.dataLyr.rollBack()
+                            self.rollback_data_edit()
                             success_msg = QtCore.QCoreApplication.translate('PolEvt', "Canceled by user...")
 
                     except Exception as err:
-                        self.ds.dataLyr.rollBack()
+                        self.rollback_data_edit()
                         critical_msg = str(err)
 
         else:
             critical_msg = qt_format(QtCore.QCoreApplication.translate('PolEvt', "Add feature failed, missing privileges in Data-Layer {apos}{0}{apos}..."),self.ds.dataLyr.name())
 
         if did_it:
-            if self.cf.show_layer_complete:
-                self.ds.showLyr.updateExtents()
-                if self.iface.mapCanvas().isCachingEnabled():
-                    self.ds.showLyr.triggerRepaint()
-                else:
-                    self.iface.mapCanvas().refresh()
+            if not self.edit_session.active:
+                self.refresh_show_layer()
 
             self.set_edit_pk(used_pk, False)
 
@@ -2860,7 +3897,7 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
 
     def s_delete_feature(self):
         """deletes the current selected Data-feature """
-        # Rev. 2023-04-27
+        # Rev. 2023-09-09
         try_delete = True
         did_it = True
         critical_msg = ''
@@ -2871,8 +3908,8 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         if self.rs.edit_pk is not None:
             if self.cf.delete_enabled:
                 if self.check_data_feature(self.rs.edit_pk):
-                    data_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.dataLyr, self.ds.dataLyrIdField, self.rs.edit_pk)
-                    if self.ds.dataLyr.isEditable():
+                    data_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.dataLyr, self.ds.dataLyrIdField, self.rs.edit_pk)
+                    if self.ds.dataLyr.isEditable() and not self.edit_session.active:
                         if self.ds.dataLyr.isModified():
                             dialog_result = QtWidgets.QMessageBox.question(
                                 None,
@@ -2894,7 +3931,7 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
                             self.ds.dataLyr.rollBack()
 
                     if try_delete:
-                        self.ds.dataLyr.startEditing()
+                        self.start_data_edit("LinearReferencing: delete feature")
                         dialog_result = QtWidgets.QMessageBox.question(
                             None,
                             f"LinearReferencing ({gdp()})",
@@ -2906,21 +3943,21 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
                         if dialog_result == QtWidgets.QMessageBox.Yes:
                             try:
                                 self.ds.dataLyr.deleteFeatures([self.rs.edit_pk])
-                                commit_result = self.ds.dataLyr.commitChanges()
+                                commit_result = self.commit_data_edit()
                                 if commit_result:
                                     did_it = True
                                     success_msg = qt_format(QtCore.QCoreApplication.translate('PolEvt', "Feature with ID {apos}{0}{apos} successfully deleted in Data-Layer {apos}{1}{apos}..."),self.rs.edit_pk, self.ds.dataLyr.name())
                                 else:
-                                    self.ds.dataLyr.rollBack()
+                                    self.rollback_data_edit()
                                     did_it = False
                                     critical_msg = str(self.ds.dataLyr.commitErrors())
 
                             except Exception as err:
-                                self.ds.dataLyr.rollBack()
+                                self.rollback_data_edit()
                                 did_it = False
                                 critical_msg = f"Exception '{err.__class__.__name__}' in {gdp()}: {err}"
                         else:
-                            self.ds.dataLyr.rollBack()
+                            self.rollback_data_edit()
                             did_it = False
                             info_msg = QtCore.QCoreApplication.translate('PolEvt', "Canceled by user...")
             else:
@@ -2937,11 +3974,8 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
             self.rs.edit_pk = None
             self.dlg_refresh_feature_selection_section()
             self.dlg_refresh_edit_section()
-            if self.cf.show_layer_complete:
-                if self.iface.mapCanvas().isCachingEnabled():
-                    self.ds.showLyr.triggerRepaint()
-                else:
-                    self.iface.mapCanvas().refresh()
+            if not self.edit_session.active:
+                self.refresh_show_layer(False)
             self.resume_measure()
 
         self.push_messages(success_msg, info_msg, warning_msg, critical_msg)
@@ -3107,6 +4141,10 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
                 self.ds.showLyrBackReferenceField is not None
         )
 
+        show_layer_materializer = self.get_show_layer_materializer()
+        if show_layer_materializer:
+            show_layer_materializer.ensure_materialized()
+
         if self.rs.snapped_ref_fid is not None:
             if self.cf.reference_layer_defined:
                 ref_feature = self.ds.refLyr.getFeature(self.rs.snapped_ref_fid)
@@ -3120,10 +4158,10 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
             # double-check: data_feature and ref_feature
             if self.rs.edit_pk is not None:
 
-                data_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.dataLyr, self.ds.dataLyrIdField, self.rs.edit_pk)
+                data_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.dataLyr, self.ds.dataLyrIdField, self.rs.edit_pk)
                 if data_feature and data_feature.isValid():
                     ref_id = data_feature[self.ss.dataLyrReferenceFieldName]
-                    ref_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.refLyr, self.ds.refLyrPkField, ref_id)
+                    ref_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.refLyr, self.ds.refLyrPkField, ref_id)
                     if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
                         checked_edit_pk = self.rs.edit_pk
 
@@ -3137,10 +4175,10 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
 
             # check self.rs.selected_pks: iterate through List of PKs and query features
             for pk in self.rs.selected_pks:
-                data_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.dataLyr, self.ds.dataLyrIdField, pk)
+                data_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.dataLyr, self.ds.dataLyrIdField, pk)
                 if data_feature and data_feature.isValid():
                     ref_id = data_feature[self.ss.dataLyrReferenceFieldName]
-                    ref_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.refLyr, self.ds.refLyrPkField, ref_id)
+                    ref_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.refLyr, self.ds.refLyrPkField, ref_id)
                     if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
                         checked_selected_pks.append(pk)
 
@@ -3489,6 +4527,8 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
             for widget in block_widgets:
                 widget.blockSignals(False)
 
+            self.dlg_refresh_batch_locate_section()
+
             self.my_dialogue.pb_open_ref_tbl.setEnabled(self.cf.reference_layer_defined)
             self.my_dialogue.pb_call_ref_disp_exp_dlg.setEnabled(self.cf.reference_layer_defined)
             self.my_dialogue.pb_open_data_tbl.setEnabled(self.cf.data_layer_defined)
@@ -3575,7 +4615,7 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
 
     def dlg_refresh_feature_selection_section(self):
         """refreshes the Feature-Selection-List and buttons in dialog"""
-        # Rev. 2023-05-03
+        # Rev. 2023-09-10
         if self.my_dialogue:
             # stored for the restore the sort-settings afterwards
             prev_sort_col_idx = self.my_dialogue.qtw_selected_pks.horizontalHeader().sortIndicatorSection()
@@ -3584,38 +4624,31 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
             # make unique
             self.rs.selected_pks = list(dict.fromkeys(self.rs.selected_pks))
 
-            self.my_dialogue.qtw_selected_pks.setRowCount(0)
-            self.my_dialogue.qtw_selected_pks.setColumnCount(0)
+            # clear all, the previous model is replaced
+            self.selection_model = None
+            self.my_dialogue.qtw_selected_pks.setModel(None)
             self.my_dialogue.qtw_selected_pks.horizontalHeader().setVisible(False)
 
-            # QTableWidget with selected edit-PKs, Show-Layer not necessary, but taken into account
-            # signal/slot see:
-            # self.my_dialogue.qtw_selected_pks.itemPressed.connect(self.qtw_item_pressed)
+            # QTableView with selected edit-PKs, Show-Layer not necessary, but taken into account
+            # rows, labels and cell-widgets are calculated lazy for the rows exposed by the model, see tools.MyQtWidgets.LazyTableModel
             if self.cf.reference_layer_complete and self.cf.data_layer_complete and len(self.rs.selected_pks) > 0:
 
                 edit_features = {}
-                # check self.rs.selected_pks: iterate through List of PKs and query features
+                # two bulk-queries instead of two queries per PK, Show-features are queried per fetched batch
+                data_features = tools.MyLayerCaches.get_features_by_pks(self.ds.dataLyr, self.ds.dataLyrIdField, self.rs.selected_pks, self.get_attribute_request(self.ds.dataLyr))
+                ref_ids = [data_feature[self.ss.dataLyrReferenceFieldName] for data_feature in data_features.values()]
+                ref_features = tools.MyLayerCaches.get_features_by_pks(self.ds.refLyr, self.ds.refLyrPkField, ref_ids, self.get_attribute_request(self.ds.refLyr, True))
+
+                # check self.rs.selected_pks: iterate through List of PKs and assign the queried features
                 for edit_pk in self.rs.selected_pks:
-                    if self.check_data_feature(edit_pk):
-                        data_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk)
+                    data_feature = data_features.get(edit_pk)
+                    ref_feature = ref_features.get(data_feature[self.ss.dataLyrReferenceFieldName]) if data_feature else None
+                    if self.check_data_feature(edit_pk, data_feature, ref_feature):
                         if data_feature and data_feature.isValid():
-                            ref_id = data_feature[self.ss.dataLyrReferenceFieldName]
-                            ref_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.refLyr, self.ds.refLyrPkField, ref_id)
                             if ref_feature and ref_feature.isValid() and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
-
-                                if self.cf.show_layer_complete:
-                                    show_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.showLyr, self.ds.showLyrBackReferenceField, edit_pk)
-                                    if show_feature and show_feature.isValid():
-                                        edit_features[edit_pk] = [data_feature, ref_feature, show_feature]
-                                    else:
-                                        edit_features[edit_pk] = [data_feature, ref_feature, None]
-                                else:
-                                    edit_features[edit_pk] = [data_feature, ref_feature, None]
+                                edit_features[edit_pk] = [data_feature, ref_feature]
                 self.rs.selected_pks = list(edit_features.keys())
 
-                self.my_dialogue.qtw_selected_pks.horizontalHeader().setVisible(True)
-                self.my_dialogue.qtw_selected_pks.setRowCount(len(self.rs.selected_pks))
-
                 # displayExpression() for single-field: "field_name"
                 # displayField() for same field: field_name (no quotes)
                 # complexer displayExpression()-sample: "fid" + "line_ref_id" (including all spaces, tabs, linebreaks...)
@@ -3633,213 +4666,97 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
                 if self.cf.show_layer_complete:
                     header_labels.append('Show-Layer')
 
-                self.my_dialogue.qtw_selected_pks.setColumnCount(len(header_labels))
-                self.my_dialogue.qtw_selected_pks.setHorizontalHeaderLabels(header_labels)
-
-                remove_icon = QtGui.QIcon(':icons/mIconClearTextHover.svg')
-                highlight_icon = QtGui.QIcon(':icons/mIconSelected.svg')
-                pan_icon = QtGui.QIcon(':icons/mActionPanToSelected.svg')
-                identify_icon = QtGui.QIcon(':icons/mActionIdentify.svg')
-
-                data_context = qgis.core.QgsExpressionContext()
                 # Features from Reference-Layer will show eith their PK and the evaluated displayExpression
-                data_display_exp = qgis.core.QgsExpression(self.ds.dataLyr.displayExpression())
-                data_display_exp.prepare(data_context)
-
-                ref_context = qgis.core.QgsExpressionContext()
-                ref_display_exp = qgis.core.QgsExpression(self.ds.refLyr.displayExpression())
-                ref_display_exp.prepare(ref_context)
+                # expressions are prepared once, evaluated values are cached, see MyLayerCaches.DisplayExpressionCache
+                data_display_exp = tools.MyLayerCaches.get_display_expression(self.ds.dataLyr)
+                ref_display_exp = tools.MyLayerCaches.get_display_expression(self.ds.refLyr)
                 if self.cf.show_layer_complete:
-                    show_context = qgis.core.QgsExpressionContext()
-                    show_display_exp = qgis.core.QgsExpression(self.ds.showLyr.displayExpression())
-                    show_display_exp.prepare(show_context)
+                    show_display_exp = tools.MyLayerCaches.get_display_expression(self.ds.showLyr)
 
-                rc = 0
                 integer_field_types = [QtCore.QVariant.Int, QtCore.QVariant.UInt, QtCore.QVariant.LongLong, QtCore.QVariant.ULongLong]
-                for edit_pk in edit_features:
-                    data_feature = edit_features[edit_pk][0]
-                    ref_feature = edit_features[edit_pk][1]
-                    show_feature = edit_features[edit_pk][2]
-
-                    data_pk = data_feature[self.ds.dataLyrIdField.name()]
-                    data_context.setFeature(data_feature)
-                    data_evaled_exp = data_display_exp.evaluate(data_context)
-                    data_label = data_label_plus = f"'{data_evaled_exp}'"
-                    # expression with dataLyrIdField as single field
-                    if data_display_exp.isField() and self.ds.dataLyrIdField.name() in data_display_exp.referencedColumns():
-                        if self.ds.dataLyrIdField.type() in integer_field_types:
-                            data_label = data_label_plus = f"# {data_evaled_exp}"
-                    else:
-                        if self.ds.dataLyrIdField.type() in integer_field_types:
-                            data_label_plus = f"# {data_pk} {data_label}"
-                        else:
-                            data_label_plus = f"'{data_pk}' {data_label}"
 
-                    data_measure = data_feature[self.ds.dataLyrMeasureField.name()]
-
-                    if self.ds.refLyr.crs().isGeographic():
-                        data_measure_rd = round(data_measure, 5)
-                    else:
-                        data_measure_rd = round(data_measure)
+                # the queried features contain only the configured fields, the displayExpressions are evaluated in bulk
+                ref_display_values = tools.MyLayerCaches.get_display_values(self.ds.refLyr, list(set(ref_feature.id() for data_feature, ref_feature in edit_features.values())))
+
+                # evaluated once per Reference-feature, used for display and sort
+                ref_labels = {}
+
+                def get_ref_label(ref_feature: qgis.core.QgsFeature) -> str:
+                    if ref_feature.id() not in ref_labels:
+                        ref_evaled_exp = ref_display_values.get(ref_feature.id())
+                        ref_label = f"'{ref_evaled_exp}'"
+                        # expression with refLyrPkField as single field
+                        if ref_display_exp.isField() and self.ds.refLyrPkField.name() in ref_display_exp.referencedColumns():
+                            if self.ds.refLyrPkField.type() in integer_field_types:
+                                ref_label = f"# {ref_evaled_exp}"
+                        ref_labels[ref_feature.id()] = ref_label
+                    return ref_labels[ref_feature.id()]
+
+                def fetch_rows(edit_pks: list) -> dict:
+                    """cell-data for a batch of rows, called by the model on first access"""
+                    show_features = {}
+                    show_display_values = {}
+                    if self.cf.show_layer_complete:
+                        show_features = tools.MyLayerCaches.get_features_by_pks(self.ds.showLyr, self.ds.showLyrBackReferenceField, edit_pks, self.get_attribute_request(self.ds.showLyr))
+                        show_display_values = tools.MyLayerCaches.get_display_values(self.ds.showLyr, [show_feature.id() for show_feature in show_features.values()])
+                    data_display_values = tools.MyLayerCaches.get_display_values(self.ds.dataLyr, [edit_features[edit_pk][0].id() for edit_pk in edit_pks])
 
-                    ref_id = ref_feature[self.ds.refLyrPkField.name()]
-                    ref_context.setFeature(ref_feature)
-                    ref_evaled_exp = ref_display_exp.evaluate(ref_context)
-                    ref_label = ref_label_plus = f"'{ref_evaled_exp}'"
+                    rows = {}
+                    for edit_pk in edit_pks:
+                        data_feature, ref_feature = edit_features[edit_pk]
 
-                    # expression with dataLyrIdField as single field
-                    if ref_display_exp.isField() and self.ds.refLyrPkField.name() in ref_display_exp.referencedColumns():
-                        if self.ds.refLyrPkField.type() in integer_field_types:
-                            ref_label = ref_label_plus = f"# {ref_evaled_exp}"
-                    else:
-                        if self.ds.refLyrPkField.type() in integer_field_types:
-                            ref_label_plus = f"{ref_label} (# {ref_id})"
-                        else:
-                            ref_label_plus = f"{ref_label} ('{ref_id}')"
+                        data_evaled_exp = data_display_values.get(data_feature.id())
+                        data_label = f"'{data_evaled_exp}'"
+                        # expression with dataLyrIdField as single field
+                        if data_display_exp.isField() and self.ds.dataLyrIdField.name() in data_display_exp.referencedColumns():
+                            if self.ds.dataLyrIdField.type() in integer_field_types:
+                                data_label = f"# {data_evaled_exp}"
 
-                    show_back_ref_id = None
-                    show_label = None
-                    show_label_plus = None
+                        data_measure = data_feature[self.ds.dataLyrMeasureField.name()]
 
-                    if show_feature:
-                        show_back_ref_id = show_feature[self.ds.showLyrBackReferenceField.name()]
-                        show_context.setFeature(show_feature)
-                        show_evaled_exp = show_display_exp.evaluate(show_context)
-                        show_label = show_label_plus = f"'{show_evaled_exp}'"
-                        # expression with dataLyrIdField as single field
-                        if show_display_exp.isField() and self.ds.showLyrBackReferenceField.name() in show_display_exp.referencedColumns():
-                            if self.ds.showLyrBackReferenceField.type() in integer_field_types:
-                                show_label = show_label_plus = f"# {show_evaled_exp}"
+                        if self.ds.refLyr.crs().isGeographic():
+                            data_measure_rd = round(data_measure, 5)
                         else:
-                            if self.ds.showLyrBackReferenceField.type() in integer_field_types:
-                                show_label_plus = f"# {show_back_ref_id} {show_label}"
-                            else:
-                                show_label_plus = f"'{show_back_ref_id}' {show_label}"
-
-                    # col 0 (the initial sort-column): line_reference from ... to
-                    cc = 0
-
-                    item = tools.MyQtWidgets.QTableWidgetItemCustomSort(256)
-                    item.setData(256, data_pk)
-
-                    item.setText(f"{data_label}")
-                    self.my_dialogue.qtw_selected_pks.setItem(rc, cc, item)
-
-                    c_wdg = QtWidgets.QWidget()
-                    c_wdg.setLayout(QtWidgets.QHBoxLayout())
-                    c_wdg.layout().setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
-                    c_wdg.layout().setContentsMargins(2, 0, 2, 0)
-                    c_wdg.layout().setSpacing(2)
-
-                    qtb = QtWidgets.QToolButton()
-                    qtb.setIcon(remove_icon)
-                    qtb.setCursor(QtCore.Qt.PointingHandCursor)
-                    qtb.setToolTip(QtCore.QCoreApplication.translate('PolEvt', "Remove feature from selection"))
-                    qtb.clicked.connect(self.s_remove_from_feature_selection)
-                    qtb.setProperty("edit_pk", edit_pk)
-                    qtb.setFixedSize(QtCore.QSize(20, 20))
-                    c_wdg.layout().addWidget(qtb)
-
-                    qtb = QtWidgets.QToolButton()
-                    qtb.setIcon(highlight_icon)
-                    qtb.setCursor(QtCore.Qt.PointingHandCursor)
-                    qtb.setToolTip(QtCore.QCoreApplication.translate('PolEvt', "Highlight feature and select for edit"))
-                    qtb.clicked.connect(self.s_highlight_edit_pk)
-                    qtb.setProperty("edit_pk", edit_pk)
-                    qtb.setFixedSize(QtCore.QSize(20, 20))
-                    c_wdg.layout().addWidget(qtb)
-
-                    qtb = QtWidgets.QToolButton()
-                    qtb.setIcon(pan_icon)
-                    qtb.setCursor(QtCore.Qt.PointingHandCursor)
-                    qtb.setToolTip(QtCore.QCoreApplication.translate('PolEvt', "Pan to feature and select for edit"))
-                    qtb.clicked.connect(self.s_pan_edit_pk)
-                    qtb.setProperty("edit_pk", edit_pk)
-                    qtb.setFixedSize(QtCore.QSize(20, 20))
-                    c_wdg.layout().addWidget(qtb)
-
-                    qtb = QtWidgets.QToolButton()
-                    qtb.setIcon(identify_icon)
-                    qtb.setCursor(QtCore.Qt.PointingHandCursor)
-                    qtb.setToolTip(QtCore.QCoreApplication.translate('PolEvt', "Show feature-form"))
-                    qtb.clicked.connect(self.s_open_data_form)
-                    qtb.setProperty("edit_pk", edit_pk)
-                    qtb.setFixedSize(QtCore.QSize(20, 20))
-                    c_wdg.layout().addWidget(qtb)
-
-                    self.my_dialogue.qtw_selected_pks.setCellWidget(rc, cc, c_wdg)
-
-                    cc += 1
-
-                    # Reference-Layer use expression and append ID, if not contained in expression
-                    item = tools.MyQtWidgets.QTableWidgetItemMultipleSort(256, 257)
-                    item.setData(256, ref_label)
-                    item.setData(257, data_measure)
-                    item.setText(f"{ref_label} {data_measure_rd}")
-                    self.my_dialogue.qtw_selected_pks.setItem(rc, cc, item)
-
-                    # Reference-Layer with highlight, zoom, identify, FID and Label-Expression
-                    c_wdg = QtWidgets.QWidget()
-                    c_wdg.setLayout(QtWidgets.QHBoxLayout())
-                    c_wdg.layout().setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
-                    c_wdg.layout().setContentsMargins(2, 0, 2, 0)
-                    c_wdg.layout().setSpacing(2)
-
-                    qtb = QtWidgets.QToolButton()
-                    qtb.setIcon(highlight_icon)
-                    qtb.setCursor(QtCore.Qt.PointingHandCursor)
-                    qtb.setToolTip(QtCore.QCoreApplication.translate('PolEvt', "Highlight reference-feature"))
-                    qtb.clicked.connect(self.s_highlight_ref_feature_by_edit_pk)
-                    qtb.setProperty("edit_pk", edit_pk)
-                    qtb.setFixedSize(QtCore.QSize(20, 20))
-                    c_wdg.layout().addWidget(qtb)
-
-                    qtb = QtWidgets.QToolButton()
-                    qtb.setIcon(pan_icon)
-                    qtb.setCursor(QtCore.Qt.PointingHandCursor)
-                    qtb.setToolTip(QtCore.QCoreApplication.translate('PolEvt', "Zoom to reference-feature"))
-                    qtb.clicked.connect(self.s_zoom_ref_feature_by_edit_pk)
-                    qtb.setProperty("edit_pk", edit_pk)
-                    qtb.setFixedSize(QtCore.QSize(20, 20))
-                    c_wdg.layout().addWidget(qtb)
-
-                    qtb = QtWidgets.QToolButton()
-                    qtb.setIcon(identify_icon)
-                    qtb.setCursor(QtCore.Qt.PointingHandCursor)
-                    qtb.setToolTip(QtCore.QCoreApplication.translate('PolEvt', "Show reference-feature-attribute-form"))
-                    qtb.clicked.connect(self.s_open_ref_form_by_edit_pk)
-                    qtb.setProperty("edit_pk", edit_pk)
-                    qtb.setFixedSize(QtCore.QSize(20, 20))
-                    c_wdg.layout().addWidget(qtb)
-
-                    self.my_dialogue.qtw_selected_pks.setCellWidget(rc, cc, c_wdg)
+                            data_measure_rd = round(data_measure)
 
-                    if self.cf.show_layer_complete:
-                        cc += 1
-                        item = tools.MyQtWidgets.QTableWidgetItemCustomSort(256)
-                        item.setData(256, show_back_ref_id)
-                        item.setData(257, edit_pk)
-                        item.setText(show_label_plus)
+                        rows[edit_pk] = [
+                            {QtCore.Qt.DisplayRole: data_label},
+                            {QtCore.Qt.DisplayRole: f"{get_ref_label(ref_feature)} {data_measure_rd}"}
+                        ]
+
+                        if self.cf.show_layer_complete:
+                            show_label_plus = None
+                            show_feature = show_features.get(edit_pk)
+                            if show_feature and show_feature.isValid():
+                                show_back_ref_id = show_feature[self.ds.showLyrBackReferenceField.name()]
+                                show_evaled_exp = show_display_values.get(show_feature.id())
+                                show_label = show_label_plus = f"'{show_evaled_exp}'"
+                                # expression with showLyrBackReferenceField as single field
+                                if show_display_exp.isField() and self.ds.showLyrBackReferenceField.name() in show_display_exp.referencedColumns():
+                                    if self.ds.showLyrBackReferenceField.type() in integer_field_types:
+                                        show_label_plus = f"# {show_evaled_exp}"
+                                else:
+                                    if self.ds.showLyrBackReferenceField.type() in integer_field_types:
+                                        show_label_plus = f"# {show_back_ref_id} {show_label}"
+                                    else:
+                                        show_label_plus = f"'{show_back_ref_id}' {show_label}"
 
-                        self.my_dialogue.qtw_selected_pks.setItem(rc, cc, item)
+                            rows[edit_pk].append({QtCore.Qt.DisplayRole: show_label_plus})
 
-                        c_wdg = QtWidgets.QWidget()
-                        c_wdg.setLayout(QtWidgets.QHBoxLayout())
-                        c_wdg.layout().setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
-                        c_wdg.layout().setContentsMargins(2, 0, 2, 0)
-                        c_wdg.layout().setSpacing(2)
+                    return rows
 
-                        qtb = QtWidgets.QToolButton()
-                        qtb.setIcon(identify_icon)
-                        qtb.setCursor(QtCore.Qt.PointingHandCursor)
-                        qtb.setToolTip(QtCore.QCoreApplication.translate('PolEvt', "Open attribute-form for Show-Layer"))
-                        qtb.clicked.connect(self.s_open_show_form_by_edit_pk)
-                        qtb.setProperty("edit_pk", edit_pk)
-                        qtb.setFixedSize(QtCore.QSize(20, 20))
-                        c_wdg.layout().addWidget(qtb)
-                        self.my_dialogue.qtw_selected_pks.setCellWidget(rc, cc, c_wdg)
+                def sort_values(edit_pk, column: int) -> list:
+                    """sort-values, same as the sort-roles of the former QTableWidgetItems, without evaluation of the Data- and Show-display-expressions"""
+                    data_feature, ref_feature = edit_features[edit_pk]
+                    if column == 1:
+                        return [get_ref_label(ref_feature), data_feature[self.ds.dataLyrMeasureField.name()]]
+                    # col 0: Data-PK, col 2: Back-Reference in Show-Layer == Data-PK
+                    return [edit_pk]
 
-                    rc += 1
+                self.selection_model = tools.MyQtWidgets.LazyTableModel(header_labels, self.rs.selected_pks, fetch_rows, sort_values)
+                self.selection_model.rows_fetched.connect(self.dlg_add_selection_cell_widgets)
+                self.my_dialogue.qtw_selected_pks.setModel(self.selection_model)
+                self.my_dialogue.qtw_selected_pks.horizontalHeader().setVisible(True)
 
                 self.dlg_0 = tools.MyQtWidgets.LambdaDelegate(lambda val: " " * 30 + str(val))
                 self.my_dialogue.qtw_selected_pks.setItemDelegateForColumn(0, self.dlg_0)
@@ -3851,16 +4768,15 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
                     self.dlg_2 = tools.MyQtWidgets.LambdaDelegate(lambda val: " " * 10 + str(val))
                     self.my_dialogue.qtw_selected_pks.setItemDelegateForColumn(2, self.dlg_2)
 
+                # restore previous sort-settings
+                self.my_dialogue.qtw_selected_pks.sortByColumn(prev_sort_col_idx, prev_sort_order)
+
                 self.my_dialogue.qtw_selected_pks.resizeRowsToContents()
                 self.my_dialogue.qtw_selected_pks.resizeColumnsToContents()
 
-                # restore previous sort-settings
-                self.my_dialogue.qtw_selected_pks.sortItems(prev_sort_col_idx, prev_sort_order)
-
             self.my_dialogue.pbtn_select_features.setEnabled(
                 self.cf.reference_layer_complete and
-                self.cf.data_layer_complete and
-                self.cf.show_layer_complete
+                self.cf.data_layer_complete
             )
             self.my_dialogue.pbtn_clear_features.setEnabled(
                 self.cf.reference_layer_complete and
@@ -3885,6 +4801,10 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
                 self.cf.data_layer_complete and
                 self.cf.show_layer_complete
             )
+            # bulk-operations
+            self.my_dialogue.pbtn_bulk_shift.setEnabled(self.cf.update_enabled and len(self.rs.selected_pks) > 0)
+            self.my_dialogue.pbtn_bulk_rereference.setEnabled(self.cf.update_enabled and len(self.rs.selected_pks) > 0)
+            self.my_dialogue.pbtn_bulk_delete.setEnabled(self.cf.delete_enabled and len(self.rs.selected_pks) > 0)
             # checkable Pushbutton
             with QtCore.QSignalBlocker(self.my_dialogue.pbtn_select_features):
                 self.my_dialogue.pbtn_select_features.setChecked(
@@ -3894,11 +4814,66 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
                     self.rs.tool_mode == 'select_features'
                 )
 
+    def dlg_add_selection_cell_widgets(self, first_row: int, last_row: int):
+        """slot for rows_fetched of the selection-model: cell-widgets with tool-buttons only for the rows exposed to the view
+        the edit_pk is stored as property in the tool-buttons
+        :param first_row:
+        :param last_row:
+        """
+        # Rev. 2023-08-23
+        if self.my_dialogue and self.selection_model:
+            remove_icon = QtGui.QIcon(':icons/mIconClearTextHover.svg')
+            highlight_icon = QtGui.QIcon(':icons/mIconSelected.svg')
+            pan_icon = QtGui.QIcon(':icons/mActionPanToSelected.svg')
+            identify_icon = QtGui.QIcon(':icons/mActionIdentify.svg')
+
+            # key: column value: list of tool-buttons (icon, tooltip, slot)
+            button_definitions = {
+                0: [
+                    (remove_icon, QtCore.QCoreApplication.translate('PolEvt', "Remove feature from selection"), self.s_remove_from_feature_selection),
+                    (highlight_icon, QtCore.QCoreApplication.translate('PolEvt', "Highlight feature and select for edit"), self.s_highlight_edit_pk),
+                    (pan_icon, QtCore.QCoreApplication.translate('PolEvt', "Pan to feature and select for edit"), self.s_pan_edit_pk),
+                    (identify_icon, QtCore.QCoreApplication.translate('PolEvt', "Show feature-form"), self.s_open_data_form),
+                ],
+                1: [
+                    (highlight_icon, QtCore.QCoreApplication.translate('PolEvt', "Highlight reference-feature"), self.s_highlight_ref_feature_by_edit_pk),
+                    (pan_icon, QtCore.QCoreApplication.translate('PolEvt', "Zoom to reference-feature"), self.s_zoom_ref_feature_by_edit_pk),
+                    (identify_icon, QtCore.QCoreApplication.translate('PolEvt', "Show reference-feature-attribute-form"), self.s_open_ref_form_by_edit_pk),
+                ]
+            }
+            if self.cf.show_layer_complete:
+                button_definitions[2] = [
+                    (identify_icon, QtCore.QCoreApplication.translate('PolEvt', "Open attribute-form for Show-Layer"), self.s_open_show_form_by_edit_pk),
+                ]
+
+            for rc in range(first_row, last_row + 1):
+                edit_pk = self.selection_model.row_key(rc)
+                for cc, buttons in button_definitions.items():
+                    index = self.selection_model.index(rc, cc)
+                    if self.my_dialogue.qtw_selected_pks.indexWidget(index) is None:
+                        c_wdg = QtWidgets.QWidget()
+                        c_wdg.setLayout(QtWidgets.QHBoxLayout())
+                        c_wdg.layout().setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
+                        c_wdg.layout().setContentsMargins(2, 0, 2, 0)
+                        c_wdg.layout().setSpacing(2)
+
+                        for icon, tool_tip, slot in buttons:
+                            qtb = QtWidgets.QToolButton()
+                            qtb.setIcon(icon)
+                            qtb.setCursor(QtCore.Qt.PointingHandCursor)
+                            qtb.setToolTip(tool_tip)
+                            qtb.clicked.connect(slot)
+                            qtb.setProperty("edit_pk", edit_pk)
+                            qtb.setFixedSize(QtCore.QSize(20, 20))
+                            c_wdg.layout().addWidget(qtb)
+
+                        self.my_dialogue.qtw_selected_pks.setIndexWidget(index, c_wdg)
+
     def s_open_data_form(self):
         """opens Data-form for dataLyr from selection-list-cell-widget, edit_pk stored as property"""
         # Rev. 2023-05-03
         edit_pk = self.sender().property('edit_pk')
-        data_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk)
+        data_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk)
         if data_feature and data_feature.isValid():
             self.iface.openFeatureForm(self.ds.dataLyr, data_feature, True)
         else:
@@ -3933,9 +4908,9 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         """opens feature-form for showLyr from selection-list, edit_pk stored as property in cell-widget"""
         # Rev. 2023-05-03
         edit_pk = self.sender().property('edit_pk')
-        data_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk)
+        data_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk, self.get_attribute_request(self.ds.dataLyr))
         if data_feature and data_feature.isValid():
-            show_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.showLyr, self.ds.showLyrBackReferenceField, edit_pk)
+            show_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.showLyr, self.ds.showLyrBackReferenceField, edit_pk)
             if show_feature and show_feature.isValid():
                 self.iface.openFeatureForm(self.ds.showLyr, show_feature, True)
             else:
@@ -3945,9 +4920,9 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         """opens feature-form for refLyr from selection-list, edit_pk stored as property in cell-widget"""
         # Rev. 2023-05-03
         edit_pk = self.sender().property('edit_pk')
-        data_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk)
+        data_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk, self.get_attribute_request(self.ds.dataLyr))
         if data_feature and data_feature.isValid():
-            ref_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.refLyr, self.ds.refLyrPkField, data_feature[self.ds.dataLyrReferenceField.name()])
+            ref_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.refLyr, self.ds.refLyrPkField, data_feature[self.ds.dataLyrReferenceField.name()])
             if ref_feature and ref_feature.isValid():
                 self.iface.openFeatureForm(self.ds.refLyr, ref_feature, True)
             else:
@@ -3957,9 +4932,9 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         """highlights referenced line-feature from selection-list, edit_pk stored as property in cell-widget"""
         # Rev. 2023-05-03
         edit_pk = self.sender().property('edit_pk')
-        data_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk)
+        data_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk, self.get_attribute_request(self.ds.dataLyr))
         if data_feature and data_feature.isValid():
-            ref_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.refLyr, self.ds.refLyrPkField, data_feature[self.ds.dataLyrReferenceField.name()])
+            ref_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.refLyr, self.ds.refLyrPkField, data_feature[self.ds.dataLyrReferenceField.name()], self.get_attribute_request(self.ds.refLyr))
             if ref_feature and ref_feature.isValid():
                 self.draw_reference_geom(ref_feature.id())
             else:
@@ -3969,15 +4944,15 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         """highlight and zoom to referenced line-feature from selection-list, edit_pk stored as property in cell-widget"""
         # Rev. 2023-05-03
         edit_pk = self.sender().property('edit_pk')
-        data_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk)
+        data_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.dataLyr, self.ds.dataLyrIdField, edit_pk, self.get_attribute_request(self.ds.dataLyr))
         if data_feature and data_feature.isValid():
-            ref_feature = tools.MyToolFunctions.get_feature_by_value(self.ds.refLyr, self.ds.refLyrPkField, data_feature[self.ds.dataLyrReferenceField.name()])
+            ref_feature = tools.MyLayerCaches.get_feature_by_pk(self.ds.refLyr, self.ds.refLyrPkField, data_feature[self.ds.dataLyrReferenceField.name()], self.get_attribute_request(self.ds.refLyr, True))
             if ref_feature and ref_feature.isValid():
                 if ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
                     extent = ref_feature.geometry().boundingBox()
                     source_crs = self.ds.refLyr.crs()
                     target_crs = self.iface.mapCanvas().mapSettings().destinationCrs()
-                    tr = qgis.core.QgsCoordinateTransform(source_crs, target_crs, qgis.core.QgsProject.instance())
+                    tr = tools.MyTransforms.get_transform(source_crs, target_crs)
                     extent = tr.transformBoundingBox(extent)
                     self.iface.mapCanvas().setExtent(extent)
                     self.iface.mapCanvas().zoomByFactor(1.1)
@@ -4011,13 +4986,22 @@ class PolEvt(qgis.gui.QgsMapToolEmitPoint):
         for project.close only necessary for the layer-actions, which are stored in project-file
         all other Qt-Objects (signals/slots...) are destroyed with their owner (QApplication) and not saved to project-file
         """
-        # Rev. 2023-04-27
+        # Rev. 2023-09-09
 
         # check and write the settings back to project
         self.check_settings()
         self.store_settings()
 
         self.disconnect_all_layers()
+        # bulk-load-indexes not yet created
+        tools.MyGeoPackage.flush_deferred_indexes()
+        self.edit_session.stop()
+        self.cancel_reference_list_task()
+        # no more inserts from the chunks still queued
+        self.rs.batch_next_pk = None
+        self.cancel_batch_locate_task()
+        self.move_coalescer.discard()
+        self.ref_snapper.cancel()
 
         try:
             # remove canvas-graphics
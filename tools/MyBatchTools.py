@@ -0,0 +1,517 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+********************************************************************
+
+* Part of the QGis-Plugin LinearReferencing:
+* background-tasks for bulk-operations on Data-Layers
+
+.. note::
+    * import to console from Path (LinearReferencing-plugin-folder in current QGis-Profile-Folder)
+    * or use: import LinearReferencing.tools.MyBatchTools
+    * or use f.e.: from LinearReferencing.tools.MyBatchTools import LocatePointsTask, MeasureTableImporter, SelectionBulkEditor
+    * the tasks only calculate in the worker-thread, the results are emitted in chunks
+      and written by the Map-Tools in the main-thread
+    * MeasureTableImporter runs in the main-thread, all rows in one edit-command, the commit is done by the Map-Tools
+    * SelectionBulkEditor runs in the main-thread, all changes of one bulk-operation in one edit-command
+
+********************************************************************
+
+* Date                 : 2023-08-30
+* Copyright            : (C) 2023 by Ludwig Kniprath
+* Email                : ludwig at kni minus online dot de
+
+********************************************************************
+
+this program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+********************************************************************
+"""
+from __future__ import annotations
+import os
+import qgis
+from qgis import core
+from PyQt5 import QtCore
+from LinearReferencing.tools import MySnapping
+from LinearReferencing.tools import MyLayerCaches
+
+
+class LocatePointsTask(qgis.core.QgsTask):
+    """background-task: locates the features of a point-layer on the nearest Reference-line
+    nearest-segment-search via MySnapping.SegmentIndex, measures from the cumulative vertex-distances,
+    the results are emitted in chunks via rows_located and stored by the receiver, f.e. PolEvt.s_write_located_rows
+    """
+    # list of [point-fid, Reference-Layer-ID-value, measure, side, distance], emitted per chunk, received in the main-thread
+    rows_located = QtCore.pyqtSignal(list)
+
+    def __init__(self, ref_layer: qgis.core.QgsVectorLayer, ref_id_field_name: str, point_layer: qgis.core.QgsVectorLayer, selected_only: bool = False, max_distance: float = 0, chunk_size: int = 1000):
+        """constructor, must be called in the main-thread
+        :param ref_layer: Reference-Layer
+        :param ref_id_field_name: ID-Field in Reference-Layer, value stored in the Data-Layer-Reference-Field
+        :param point_layer: layer with the points to locate
+        :param selected_only: True ➜ only the selected features of point_layer
+        :param max_distance: search-radius in Reference-Layer-units, 0 ➜ unlimited
+        :param chunk_size: number of rows per rows_located-signal
+        """
+        # Rev. 2023-08-30
+        super().__init__(f"LinearReferencing: locate {point_layer.name()} on {ref_layer.name()}", qgis.core.QgsTask.CanCancel)
+        self.max_distance = max_distance
+        self.chunk_size = chunk_size
+        self.num_located = 0
+        self.num_not_located = 0
+
+        self.ref_source = qgis.core.QgsVectorLayerFeatureSource(ref_layer)
+        self.ref_request = qgis.core.QgsFeatureRequest().setSubsetOfAttributes([ref_id_field_name], ref_layer.fields())
+        self.ref_id_field_name = ref_id_field_name
+        self.num_ref_features = max(ref_layer.featureCount(), 1)
+
+        self.point_source = qgis.core.QgsVectorLayerFeatureSource(point_layer)
+        self.point_request = qgis.core.QgsFeatureRequest().setNoAttributes()
+        if selected_only:
+            self.point_request.setFilterFids(point_layer.selectedFeatureIds())
+            self.num_points = max(point_layer.selectedFeatureCount(), 1)
+        else:
+            self.num_points = max(point_layer.featureCount(), 1)
+
+        # own transform-object for the worker-thread, not the shared MyTransforms-cache
+        self.transform = qgis.core.QgsCoordinateTransform(point_layer.crs(), ref_layer.crs(), qgis.core.QgsProject.instance().transformContext())
+
+    def run(self) -> bool:
+        """worker-thread, no access to layers or widgets
+        progress: 0...50 index, 50...100 locate
+        """
+        # Rev. 2023-08-30
+        segment_index = MySnapping.SegmentIndex()
+        # key: fid value: ID-value
+        ref_ids = {}
+        for feature_no, ref_feature in enumerate(self.ref_source.getFeatures(self.ref_request)):
+            if self.isCanceled():
+                return False
+            ref_id = ref_feature[self.ref_id_field_name]
+            # features without ID can't be referenced
+            if ref_feature.hasGeometry() and ref_id != '' and ref_id is not None and repr(ref_id) != 'NULL':
+                if segment_index.add_line(ref_feature.id(), ref_feature.geometry()):
+                    ref_ids[ref_feature.id()] = ref_id
+            if feature_no % 1000 == 0:
+                self.setProgress(50 * feature_no / self.num_ref_features)
+
+        chunk = []
+        for feature_no, point_feature in enumerate(self.point_source.getFeatures(self.point_request)):
+            if self.isCanceled():
+                return False
+            result = None
+            if point_feature.hasGeometry() and not point_feature.geometry().isEmpty():
+                point_geom = qgis.core.QgsGeometry(point_feature.geometry())
+                if not self.transform.isShortCircuited():
+                    point_geom.transform(self.transform)
+                result = segment_index.nearest(point_geom.asPoint(), self.max_distance)
+
+            if result:
+                ref_fid, snapped_point_xy, measure, distance, side, segment_index_no = result
+                chunk.append([point_feature.id(), ref_ids[ref_fid], measure, side, distance])
+                self.num_located += 1
+            else:
+                self.num_not_located += 1
+
+            if len(chunk) >= self.chunk_size:
+                self.rows_located.emit(chunk)
+                self.setProgress(50 + 50 * feature_no / self.num_points)
+                chunk = []
+        if chunk:
+            self.rows_located.emit(chunk)
+        return True
+
+
+def open_table(path: str) -> qgis.core.QgsVectorLayer:
+    """opens a measure-table as geometry-less layer, not added to the project
+    CSV/TXT via delimitedtext-provider with type-detection, comma or semicolon as delimiter,
+    all other formats (XLSX, ODS, GeoPackage, DBF...) via ogr
+    sample:
+    table_layer = open_table('/home/user/measures.csv')
+    :param path:
+    :returns layer, check isValid()
+    """
+    # Rev. 2023-08-31
+    layer_name = os.path.splitext(os.path.basename(path))[0]
+    if os.path.splitext(path)[1].lower() in ['.csv', '.txt']:
+        uri = f"{QtCore.QUrl.fromLocalFile(path).toString()}?type=csv&delimiter=,;&detectTypes=yes&geomType=none"
+        return qgis.core.QgsVectorLayer(uri, layer_name, 'delimitedtext')
+    return qgis.core.QgsVectorLayer(path, layer_name, 'ogr')
+
+
+class MeasureTableImporter:
+    """bulk-import of measure-tables into the Data-Layer, shared by PolEvt and LolEvt
+    the columns of the table are assigned by name to the fields of the Data-Layer:
+    the table needs at least the Reference-field and the measure-field(s) with the same names as in the Data-Layer,
+    further columns with names of Data-Layer-fields are copied
+    all rows are validated in one pass against a pre-queried table of Reference-line-lengths,
+    the accepted rows are inserted with one addFeatures in one edit-command, see insert
+    """
+
+    integer_field_types = [QtCore.QVariant.Int, QtCore.QVariant.UInt, QtCore.QVariant.LongLong, QtCore.QVariant.ULongLong]
+
+    def __init__(self, ref_layer: qgis.core.QgsVectorLayer, ref_pk_field: qgis.core.QgsField, data_layer: qgis.core.QgsVectorLayer, data_id_field: qgis.core.QgsField, data_reference_field: qgis.core.QgsField, measure_fields: list, offset_field: qgis.core.QgsField = None):
+        """constructor
+        :param ref_layer: Reference-Layer
+        :param ref_pk_field: ID-Field in Reference-Layer
+        :param data_layer: Data-Layer
+        :param data_id_field: PK-Field in Data-Layer, integer-PKs are generated, other types must be in the table
+        :param data_reference_field: Reference-Field in Data-Layer
+        :param measure_fields: list of QgsField, [measure] for PoL, [measure_from, measure_to] for LoL
+        :param offset_field: optional Offset-Field for LoL, empty values ➜ 0
+        """
+        # Rev. 2023-08-31
+        self.ref_layer = ref_layer
+        self.ref_pk_field = ref_pk_field
+        self.data_layer = data_layer
+        self.data_id_field = data_id_field
+        self.data_reference_field = data_reference_field
+        self.measure_fields = measure_fields
+        self.offset_field = offset_field
+        self.generate_pks = data_id_field.type() in self.integer_field_types
+
+    def missing_columns(self, table_layer: qgis.core.QgsVectorLayer) -> list:
+        """names of the necessary columns missing in table_layer
+        :param table_layer: f.e. from open_table
+        """
+        # Rev. 2023-08-31
+        necessary_fields = [self.data_reference_field] + self.measure_fields
+        if not self.generate_pks:
+            necessary_fields.append(self.data_id_field)
+        return [field.name() for field in necessary_fields if table_layer.fields().indexOf(field.name()) < 0]
+
+    def _ref_key(self, value):
+        """normalized Reference-ID, f.e. integers read as strings from CSV
+        :param value:
+        :returns None for empty values
+        """
+        # Rev. 2023-08-31
+        if value is None or value == '' or repr(value) == 'NULL':
+            return None
+        try:
+            return int(value) if self.ref_pk_field.type() in self.integer_field_types else str(value)
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _to_float(value) -> float | None:
+        """numeric value or None, f.e. strings with decimal-comma from CSV
+        :param value:
+        """
+        # Rev. 2023-08-31
+        if value is None or value == '' or repr(value) == 'NULL':
+            return None
+        try:
+            return float(str(value).replace(',', '.')) if isinstance(value, str) else float(value)
+        except (TypeError, ValueError):
+            return None
+
+    def get_reference_lengths(self) -> dict:
+        """lengths of all Reference-lines, one query with only the ID-Field
+        :returns dict key: normalized ID value: tuple (ID, length)
+        """
+        # Rev. 2023-08-31
+        request = qgis.core.QgsFeatureRequest().setSubsetOfAttributes([self.ref_pk_field.name()], self.ref_layer.fields())
+        ref_lengths = {}
+        for ref_feature in self.ref_layer.getFeatures(request):
+            ref_key = self._ref_key(ref_feature[self.ref_pk_field.name()])
+            if ref_key is not None and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
+                ref_lengths[ref_key] = (ref_feature[self.ref_pk_field.name()], ref_feature.geometry().length())
+        return ref_lengths
+
+    def validate(self, table_layer: qgis.core.QgsVectorLayer) -> tuple:
+        """validates all rows of table_layer and converts the accepted into Data-features
+        :param table_layer: f.e. from open_table, see missing_columns
+        :returns tuple (list of accepted QgsFeatures for Data-Layer, list of rejected tuples (row-number, attributes, reason))
+        """
+        # Rev. 2023-09-11
+        ref_lengths = self.get_reference_lengths()
+        data_fields = self.data_layer.fields()
+        table_fields = table_layer.fields()
+        # all other columns with names of Data-Layer-fields
+        special_field_names = [self.data_id_field.name(), self.data_reference_field.name()] + [field.name() for field in self.measure_fields]
+        if self.offset_field:
+            special_field_names.append(self.offset_field.name())
+        copy_field_names = [field.name() for field in table_fields if data_fields.indexOf(field.name()) >= 0 and field.name() not in special_field_names]
+        with_offset = self.offset_field is not None and table_fields.indexOf(self.offset_field.name()) >= 0
+
+        next_pk = None
+        pk_clause = ''
+        if self.generate_pks:
+            # sequence ➜ applied by the provider on insert, no round-trip per row
+            pk_clause = MyLayerCaches.get_sequence_clause(self.data_layer, self.data_id_field)
+            next_pk = pk_clause or MyLayerCaches.get_next_pk(self.data_layer, self.data_id_field)
+
+        accepted = []
+        rejected = []
+        request = qgis.core.QgsFeatureRequest().setFlags(qgis.core.QgsFeatureRequest.NoGeometry)
+        for row_no, table_feature in enumerate(table_layer.getFeatures(request), 1):
+            reason = None
+            measures = []
+            offset = 0
+            ref_id = table_feature[self.data_reference_field.name()]
+            ref_key = self._ref_key(ref_id)
+            ref_entry = ref_lengths.get(ref_key)
+            if ref_key is None:
+                reason = f"no valid value in {self.data_reference_field.name()}"
+            elif ref_entry is None:
+                reason = f"Reference-ID {ref_id} not found or without geometry"
+            else:
+                for field in self.measure_fields:
+                    measure = self._to_float(table_feature[field.name()])
+                    if measure is None:
+                        reason = f"no numeric value in {field.name()}"
+                        break
+                    if not 0 <= measure <= ref_entry[1]:
+                        reason = f"{field.name()} {measure} outside 0 ... {ref_entry[1]}"
+                        break
+                    measures.append(measure)
+
+            if reason is None and with_offset:
+                offset_value = table_feature[self.offset_field.name()]
+                offset = self._to_float(offset_value)
+                if offset is None:
+                    if offset_value is None or offset_value == '' or repr(offset_value) == 'NULL':
+                        offset = 0
+                    else:
+                        reason = f"no numeric value in {self.offset_field.name()}"
+
+            pk = next_pk
+            if reason is None and not self.generate_pks:
+                pk = table_feature[self.data_id_field.name()]
+                if pk is None or pk == '' or repr(pk) == 'NULL':
+                    reason = f"no value in {self.data_id_field.name()}"
+
+            if reason is not None:
+                rejected.append((row_no, table_feature.attributes(), reason))
+                continue
+
+            data_feature = qgis.core.QgsFeature(data_fields)
+            for field_name in copy_field_names:
+                data_feature[field_name] = table_feature[field_name]
+            data_feature[self.data_id_field.name()] = pk
+            data_feature[self.data_reference_field.name()] = ref_entry[0]
+            for field, measure in zip(self.measure_fields, measures):
+                data_feature[field.name()] = measure
+            if self.offset_field:
+                data_feature[self.offset_field.name()] = offset
+            accepted.append(data_feature)
+            if self.generate_pks and not pk_clause:
+                # allocated one by one from the cached counter
+                next_pk = MyLayerCaches.get_next_pk(self.data_layer, self.data_id_field)
+
+        return accepted, rejected
+
+    def insert(self, data_features: list) -> bool:
+        """writes the accepted features into the edit-buffer, the Data-Layer must be editable,
+        edit-command and commit by the Map-Tool, so an active edit-session (see MyEditSession) is kept
+        :param data_features: from validate
+        :returns False if addFeatures failed, the Map-Tool must roll back
+        """
+        # Rev. 2023-09-11
+        return self.data_layer.addFeatures(data_features)
+
+    def create_rejects_layer(self, table_layer: qgis.core.QgsVectorLayer, rejected: list) -> qgis.core.QgsVectorLayer:
+        """geometry-less memory-layer with the rejected rows, their row-numbers and the reasons
+        :param table_layer: source of the rows
+        :param rejected: from validate
+        """
+        # Rev. 2023-08-31
+        rejects_layer = qgis.core.QgsVectorLayer("None", f"{table_layer.name()} rejects", "memory")
+        rejects_fields = [qgis.core.QgsField("row_no", QtCore.QVariant.Int), qgis.core.QgsField("reject_reason", QtCore.QVariant.String)]
+        rejects_fields += [qgis.core.QgsField(field) for field in table_layer.fields()]
+        rejects_layer.dataProvider().addAttributes(rejects_fields)
+        rejects_layer.updateFields()
+        rejects_features = []
+        for row_no, attributes, reason in rejected:
+            rejects_feature = qgis.core.QgsFeature(rejects_layer.fields())
+            rejects_feature.setAttributes([row_no, reason] + attributes)
+            rejects_features.append(rejects_feature)
+        rejects_layer.dataProvider().addFeatures(rejects_features)
+        return rejects_layer
+
+
+class SelectionBulkEditor:
+    """bulk-operations on the Feature-Selection of the Map-Tools (rs.selected_pks), shared by PolEvt and LolEvt
+    the new values of all selected features are calculated in one pass against the pre-queried lengths of their Reference-lines
+    and written into the edit-buffer by the Map-Tool inside one edit-command, see apply_changes,
+    so the commit sends one changeAttributeValues- or deleteFeatures-batch to the provider in one transaction
+    optional QgsFeedback for progress and cancel: 0...50 calculate, 50...100 write
+    sample:
+    bulk_editor = SelectionBulkEditor(ref_layer, ref_pk_field, data_layer, data_id_field, data_reference_field, [measure_field])
+    changes, skipped = bulk_editor.shift_changes([1, 2, 3], 10)
+    """
+
+    def __init__(self, ref_layer: qgis.core.QgsVectorLayer, ref_pk_field: qgis.core.QgsField, data_layer: qgis.core.QgsVectorLayer, data_id_field: qgis.core.QgsField, data_reference_field: qgis.core.QgsField, measure_fields: list, offset_field: qgis.core.QgsField = None):
+        """constructor
+        :param ref_layer: Reference-Layer
+        :param ref_pk_field: ID-Field in Reference-Layer
+        :param data_layer: Data-Layer
+        :param data_id_field: PK-Field in Data-Layer
+        :param data_reference_field: Reference-Field in Data-Layer
+        :param measure_fields: list of QgsField, [measure] for PoL, [measure_from, measure_to] for LoL
+        :param offset_field: optional Offset-Field for LoL, necessary for offset_changes
+        """
+        # Rev. 2023-09-10
+        self.ref_layer = ref_layer
+        self.ref_pk_field = ref_pk_field
+        self.data_layer = data_layer
+        self.data_id_field = data_id_field
+        self.data_reference_field = data_reference_field
+        self.measure_fields = measure_fields
+        self.offset_field = offset_field
+        self.measure_field_idxs = [data_layer.fields().indexOf(field.name()) for field in measure_fields]
+
+    def get_data_features(self, pks: list) -> dict:
+        """selected Data-features, only the necessary attributes, no geometry
+        :param pks: f.e. rs.selected_pks
+        :returns dict key: PK value: feature, PKs without feature are missing
+        """
+        # Rev. 2023-09-10
+        field_names = [self.data_id_field.name(), self.data_reference_field.name()] + [field.name() for field in self.measure_fields]
+        if self.offset_field:
+            field_names.append(self.offset_field.name())
+        request = qgis.core.QgsFeatureRequest().setSubsetOfAttributes(field_names, self.data_layer.fields()).setFlags(qgis.core.QgsFeatureRequest.NoGeometry)
+        return MyLayerCaches.get_features_by_pks(self.data_layer, self.data_id_field, pks, request)
+
+    def get_reference_lengths(self, ref_ids: list) -> dict:
+        """lengths of the Reference-lines, one query for all IDs, only the ID-Field
+        :param ref_ids: Reference-IDs of the selected features
+        :returns dict key: Reference-ID value: length, IDs without feature or geometry are missing
+        """
+        # Rev. 2023-09-10
+        request = qgis.core.QgsFeatureRequest().setSubsetOfAttributes([self.ref_pk_field.name()], self.ref_layer.fields())
+        ref_features = MyLayerCaches.get_features_by_pks(self.ref_layer, self.ref_pk_field, list(dict.fromkeys(ref_ids)), request)
+        return {ref_id: ref_feature.geometry().length() for ref_id, ref_feature in ref_features.items() if ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty()}
+
+    @staticmethod
+    def _is_empty(value) -> bool:
+        """None, empty string or NULL-QVariant
+        :param value:
+        """
+        # Rev. 2023-09-10
+        return value is None or value == '' or repr(value) == 'NULL'
+
+    def _calculate(self, pks: list, calc_function, feedback: qgis.core.QgsFeedback = None) -> tuple:
+        """common loop of the bulk-operations
+        :param pks: f.e. rs.selected_pks
+        :param calc_function: function(data_feature, ref_lengths) ➜ dict key: field-index value: new value or None ➜ skipped
+        :param feedback: optional, progress 0...50
+        :returns tuple (dict key: fid value: dict key: field-index value: new value, list of skipped PKs), (None, None) if canceled
+        """
+        # Rev. 2023-09-10
+        data_features = self.get_data_features(pks)
+        ref_lengths = self.get_reference_lengths([data_feature[self.data_reference_field.name()] for data_feature in data_features.values()])
+        changes = {}
+        skipped = [pk for pk in pks if pk not in data_features]
+        num_features = max(len(data_features), 1)
+        for feature_no, (pk, data_feature) in enumerate(data_features.items()):
+            if feedback:
+                if feedback.isCanceled():
+                    return None, None
+                if feature_no % 1000 == 0:
+                    feedback.setProgress(50 * feature_no / num_features)
+            attribute_changes = calc_function(data_feature, ref_lengths)
+            if attribute_changes is None:
+                skipped.append(pk)
+            elif attribute_changes:
+                changes[data_feature.id()] = attribute_changes
+        return changes, skipped
+
+    def _get_measures(self, data_feature: qgis.core.QgsFeature) -> list | None:
+        """current measures of a Data-feature
+        :param data_feature:
+        :returns list of floats, None if one measure is empty
+        """
+        # Rev. 2023-09-10
+        measures = [data_feature[field.name()] for field in self.measure_fields]
+        if any(self._is_empty(measure) for measure in measures):
+            return None
+        return [float(measure) for measure in measures]
+
+    def shift_changes(self, pks: list, delta: float, feedback: qgis.core.QgsFeedback = None) -> tuple:
+        """shifts all measures by delta, clamped to 0 ... Reference-line-length
+        :param pks: f.e. rs.selected_pks
+        :param delta: positive or negative
+        :param feedback: optional
+        :returns see _calculate
+        """
+        # Rev. 2023-09-10
+
+        def calc_function(data_feature, ref_lengths):
+            ref_length = ref_lengths.get(data_feature[self.data_reference_field.name()])
+            measures = self._get_measures(data_feature)
+            if ref_length is None or measures is None:
+                return None
+            return {field_idx: max(0, min(ref_length, measure + delta)) for field_idx, measure in zip(self.measure_field_idxs, measures)}
+
+        return self._calculate(pks, calc_function, feedback)
+
+    def offset_changes(self, pks: list, value: float, scale: bool = False, feedback: qgis.core.QgsFeedback = None) -> tuple:
+        """sets or scales the offsets, only with offset_field
+        :param pks: f.e. rs.selected_pks
+        :param value: new offset or factor
+        :param scale: False ➜ offset = value, True ➜ offset *= value, empty offsets are treated as 0
+        :param feedback: optional
+        :returns see _calculate
+        """
+        # Rev. 2023-09-10
+        offset_field_idx = self.data_layer.fields().indexOf(self.offset_field.name())
+
+        def calc_function(data_feature, ref_lengths):
+            if scale:
+                offset = data_feature[self.offset_field.name()]
+                return {offset_field_idx: (0 if self._is_empty(offset) else float(offset)) * value}
+            return {offset_field_idx: value}
+
+        return self._calculate(pks, calc_function, feedback)
+
+    def rereference_changes(self, pks: list, new_ref_id, feedback: qgis.core.QgsFeedback = None) -> tuple:
+        """assigns the features to another Reference-line, the measures are re-measured proportional to the line-lengths
+        :param pks: f.e. rs.selected_pks
+        :param new_ref_id: value of ref_pk_field
+        :param feedback: optional
+        :returns see _calculate, all PKs skipped if new_ref_id has no valid geometry
+        """
+        # Rev. 2023-09-10
+        new_ref_length = self.get_reference_lengths([new_ref_id]).get(new_ref_id)
+        reference_field_idx = self.data_layer.fields().indexOf(self.data_reference_field.name())
+
+        def calc_function(data_feature, ref_lengths):
+            ref_length = ref_lengths.get(data_feature[self.data_reference_field.name()])
+            measures = self._get_measures(data_feature)
+            if new_ref_length is None or not ref_length or measures is None:
+                return None
+            attribute_changes = {field_idx: max(0, min(new_ref_length, measure * new_ref_length / ref_length)) for field_idx, measure in zip(self.measure_field_idxs, measures)}
+            attribute_changes[reference_field_idx] = new_ref_id
+            return attribute_changes
+
+        return self._calculate(pks, calc_function, feedback)
+
+    def get_fids(self, pks: list) -> list:
+        """feature-ids of the selected features, f.e. for deleteFeatures
+        :param pks: f.e. rs.selected_pks
+        """
+        # Rev. 2023-09-10
+        return [data_feature.id() for data_feature in self.get_data_features(pks).values()]
+
+    def apply_changes(self, changes: dict, feedback: qgis.core.QgsFeedback = None) -> bool:
+        """writes the changes into the edit-buffer, the Data-Layer must be editable, the commit is done by the Map-Tool
+        :param changes: from shift_changes, offset_changes or rereference_changes
+        :param feedback: optional, progress 50...100
+        :returns False if canceled or a change failed, the Map-Tool must roll back
+        """
+        # Rev. 2023-09-10
+        num_changes = max(len(changes), 1)
+        for change_no, (fid, attribute_changes) in enumerate(changes.items()):
+            if feedback:
+                if feedback.isCanceled():
+                    return False
+                if change_no % 1000 == 0:
+                    feedback.setProgress(50 + 50 * change_no / num_changes)
+            if not self.data_layer.changeAttributeValues(fid, attribute_changes):
+                return False
+        return True
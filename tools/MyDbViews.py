@@ -0,0 +1,407 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+********************************************************************
+
+* Part of the QGis-Plugin LinearReferencing:
+* server-side Show-Layers: PostGIS-views and trigger-maintained tables in PostGIS or SpatiaLite
+
+.. note::
+    * import to console from Path (LinearReferencing-plugin-folder in current QGis-Profile-Folder)
+    * or use: import LinearReferencing.tools.MyDbViews
+    * Data- and Reference-Layer must be tables in the same database, provider 'postgres' or 'spatialite'
+    * modes:
+        view ➜ PostGIS only, CREATE OR REPLACE VIEW, geometries calculated by the database on every query
+        table ➜ materialized table with primary-key, btree- and spatial index, kept current by triggers on Data- and Reference-table
+      SpatiaLite only table: a calculated geometry can't be registered in views_geometry_columns
+    * btree-indexes on the join-columns of Data- and Reference-table, if not already primary-key,
+      GiST-index on the Reference-geometry (PostGIS)
+    * LoL-geometries as MultiLineString, ST_OffsetCurve can return multi-part results
+    * the SQL is built by ShowObjectGenerator.statements without database-access and can be shown/copied before execution,
+      ShowObjectGenerator.execute queries the database for existing objects with the same name first, see foreign_object_check
+    * existing tables are dropped without CASCADE, dependent objects (f.e. user-defined views) let the execution fail
+
+sample:
+    generator = LinearReferencing.tools.MyDbViews.ShowObjectGenerator('LolEvt', ref_layer, 'fid', data_layer, 'fid', 'line_ref_id', ['measure_from', 'measure_to', 'offset'], 'lol_show', 'table')
+    print(generator.sql_script())
+
+********************************************************************
+
+* Date                 : 2023-09-07
+* Copyright            : (C) 2023 by Ludwig Kniprath
+* Email                : ludwig at kni minus online dot de
+
+********************************************************************
+
+this program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+********************************************************************
+"""
+from __future__ import annotations
+import re
+import qgis
+from qgis import core
+from PyQt5 import QtCore
+from LinearReferencing.tools.MyToolFunctions import qt_format
+
+supported_providers = ['postgres', 'spatialite']
+
+# PostGIS: max. length of identifiers
+max_identifier_length = 63
+
+
+def quote_identifier(name: str) -> str:
+    """double-quoted SQL-identifier, same for PostGIS and SpatiaLite
+    :param name:
+    """
+    # Rev. 2023-09-07
+    return '"' + name.replace('"', '""') + '"'
+
+
+def quote_literal(value: str) -> str:
+    """single-quoted SQL-string-literal, same for PostGIS and SpatiaLite
+    :param value:
+    """
+    # Rev. 2023-09-11
+    return "'" + value.replace("'", "''") + "'"
+
+
+def get_object_name(layer_name: str) -> str:
+    """database-compatible name from a layer-name: lower case, only a-z, 0-9 and _
+    :param layer_name:
+    """
+    # Rev. 2023-09-07
+    object_name = re.sub('[^a-z0-9_]', '_', layer_name.lower())
+    if not object_name or object_name[0].isdigit():
+        object_name = 'show_' + object_name
+    return object_name[:max_identifier_length - 10]
+
+
+class DbTable:
+    """database-table of a layer, parsed from the layer-source"""
+
+    def __init__(self, vlayer: qgis.core.QgsVectorLayer):
+        """constructor
+        :param vlayer:
+        """
+        # Rev. 2023-09-07
+        self.provider = vlayer.dataProvider().name()
+        self.uri = qgis.core.QgsDataSourceUri(vlayer.source())
+        self.schema = self.uri.schema()
+        self.table = self.uri.table()
+        self.geometry_column = self.uri.geometryColumn()
+        self.fields = vlayer.fields()
+        # names of the primary-key-columns, these are already indexed
+        self.pk_names = [self.fields.at(field_idx).name() for field_idx in vlayer.dataProvider().pkAttributeIndexes()]
+        if self.provider == 'postgres':
+            self.connection_key = self.uri.connectionInfo(False)
+        else:
+            self.connection_key = self.uri.database()
+
+    @property
+    def is_supported(self) -> bool:
+        """table, not query-layer, in a supported database"""
+        return self.provider in supported_providers and bool(self.table) and not self.table.startswith('(')
+
+    def qualified_name(self, name: str = None) -> str:
+        """quoted, schema-qualified name of this table or of another object in the same schema
+        :param name: None ➜ this table
+        """
+        # Rev. 2023-09-07
+        name = self.table if name is None else name
+        if self.provider == 'postgres' and self.schema:
+            return f"{quote_identifier(self.schema)}.{quote_identifier(name)}"
+        return quote_identifier(name)
+
+
+class ShowObjectGenerator:
+    """SQL-generator for server-side Show-Layers, see module-note"""
+
+    def __init__(self, tool_name: str, ref_layer: qgis.core.QgsVectorLayer, ref_pk_field_name: str, data_layer: qgis.core.QgsVectorLayer, data_id_field_name: str, data_reference_field_name: str, measure_field_names: list, object_name: str, mode: str):
+        """constructor
+        :param tool_name: 'PolEvt' or 'LolEvt'
+        :param ref_layer:
+        :param ref_pk_field_name:
+        :param data_layer:
+        :param data_id_field_name:
+        :param data_reference_field_name:
+        :param measure_field_names: PolEvt: [measure], LolEvt: [measure_from, measure_to, offset]
+        :param object_name: name of view/table, created in the schema of the Data-table
+        :param mode: 'view' or 'table'
+        """
+        # Rev. 2023-09-07
+        self.tool_name = tool_name
+        self.ref_table = DbTable(ref_layer)
+        self.ref_pk_field_name = ref_pk_field_name
+        self.data_table = DbTable(data_layer)
+        self.data_id_field_name = data_id_field_name
+        self.data_reference_field_name = data_reference_field_name
+        self.measure_field_names = measure_field_names
+        self.object_name = object_name
+        self.mode = mode
+        self.provider = self.data_table.provider
+        self.srid = ref_layer.crs().postgisSrid()
+        self.geometry_column = 'geom'
+        if tool_name == 'PolEvt':
+            self.wkb_type = qgis.core.QgsWkbTypes.Point
+        else:
+            self.wkb_type = qgis.core.QgsWkbTypes.MultiLineString
+
+    def check(self) -> str:
+        """checks the requirements
+        :returns error-message, empty string if OK
+        """
+        # Rev. 2023-09-11
+        if not self.data_table.is_supported or not self.ref_table.is_supported:
+            return QtCore.QCoreApplication.translate('MyDbViews', "Data- and Reference-Layer must be tables in PostGIS or SpatiaLite")
+        if self.data_table.provider != self.ref_table.provider or self.data_table.connection_key != self.ref_table.connection_key:
+            return QtCore.QCoreApplication.translate('MyDbViews', "Data- and Reference-Layer must be tables in the same database")
+        if not self.ref_table.geometry_column:
+            return QtCore.QCoreApplication.translate('MyDbViews', "Reference-Layer without geometry-column")
+        if self.mode not in ['view', 'table']:
+            return qt_format(QtCore.QCoreApplication.translate('MyDbViews', "unknown mode {apos}{0}{apos}"), self.mode)
+        if self.mode == 'view' and self.provider != 'postgres':
+            return qt_format(QtCore.QCoreApplication.translate('MyDbViews', "views only with PostGIS, SpatiaLite needs mode {apos}table{apos}"))
+        # the existing object is dropped and replaced, never the Data- or Reference-table
+        if self.object_name.lower() in [self.data_table.table.lower(), self.ref_table.table.lower()]:
+            return qt_format(QtCore.QCoreApplication.translate('MyDbViews', "Name {apos}{0}{apos} is the name of the Data- or Reference-table"), self.object_name)
+        return ''
+
+    def foreign_object_check(self, connection: qgis.core.QgsAbstractDatabaseProviderConnection) -> str:
+        """checks, if an existing object with object_name was created by this generator, only these are dropped/replaced
+        marker: the sync-trigger on this Data-table, see _postgres_trigger_statements and _spatialite_trigger_statements,
+        views (PostGIS, mode 'view') have no triggers, their definition must contain the aliases of select_sql
+        :param connection:
+        :returns error-message, empty string if no object or created by this generator
+        """
+        # Rev. 2023-09-12
+        if self.provider == 'postgres':
+            schema = quote_literal(self.data_table.schema or 'public')
+            object_rows = connection.executeSql(f"SELECT c.relkind FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace WHERE n.nspname = {schema} AND c.relname = {quote_literal(self.object_name)}")
+            if not object_rows:
+                return ''
+            if object_rows[0][0] == 'v':
+                marker_rows = connection.executeSql(f"SELECT 1 FROM pg_views WHERE schemaname = {schema} AND viewname = {quote_literal(self.object_name)} AND definition LIKE {quote_literal('%data_lyr%ref_lyr%')}")
+            else:
+                marker_rows = connection.executeSql(f"SELECT 1 FROM pg_trigger WHERE tgname = {quote_literal(f'{self.object_name}_sync_data')} AND tgrelid = {quote_literal(self.data_table.qualified_name())}::regclass")
+        else:
+            object_rows = connection.executeSql(f"SELECT type FROM sqlite_master WHERE type IN ('table', 'view') AND lower(name) = lower({quote_literal(self.object_name)})")
+            if not object_rows:
+                return ''
+            marker_rows = connection.executeSql(f"SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND lower(name) = lower({quote_literal(f'{self.object_name}_data_insert')}) AND lower(tbl_name) = lower({quote_literal(self.data_table.table)})")
+        if marker_rows:
+            return ''
+        return qt_format(QtCore.QCoreApplication.translate('MyDbViews', "Object {apos}{0}{apos} already exists and was not created by LinearReferencing, please choose another name"), self.object_name)
+
+    @property
+    def object_qualified_name(self) -> str:
+        """quoted name of the created view/table"""
+        return self.data_table.qualified_name(self.object_name)
+
+    def _index_name(self, table: str, column: str, suffix: str = 'idx') -> str:
+        """quoted index-name, unique per table and column
+        :param table:
+        :param column:
+        :param suffix:
+        """
+        # Rev. 2023-09-07
+        name = get_object_name(f"{table}_{column}")[:max_identifier_length - len(suffix) - 1]
+        return quote_identifier(f"{name}_{suffix}")
+
+    def _geometry_expression(self) -> str:
+        """SQL-expression for the PoL-point or LoL-segment, fractions clamped to 0...1, zero-length lines ➜ NULL"""
+        # Rev. 2023-09-11
+        ref_geom = f"ref_lyr.{quote_identifier(self.ref_table.geometry_column)}"
+        # first part of multi-geometries, same as the plugin, SpatiaLite-Line_Interpolate_Point/Line_Substring return NULL for MultiLineStrings
+        if self.provider == 'postgres':
+            line = f"ST_GeometryN({ref_geom}, 1)"
+            least, greatest = 'LEAST', 'GREATEST'
+        else:
+            line = f"GeometryN({ref_geom}, 1)"
+            least, greatest = 'MIN', 'MAX'
+        length = f"NULLIF(ST_Length({line}), 0)"
+
+        def fraction(measure: str) -> str:
+            return f"{least}({greatest}({measure} / {length}, 0), 1)"
+
+        measures = [f"data_lyr.{quote_identifier(field_name)}" for field_name in self.measure_field_names]
+        if self.tool_name == 'PolEvt':
+            if self.provider == 'postgres':
+                return f"ST_LineInterpolatePoint({line}, {fraction(measures[0])})::geometry(Point, {self.srid})"
+            return f"Line_Interpolate_Point({line}, {fraction(measures[0])})"
+
+        measure_from, measure_to, offset = measures
+        if self.provider == 'postgres':
+            substring = f"ST_LineSubstring({line}, {fraction(f'LEAST({measure_from}, {measure_to})')}, {fraction(f'GREATEST({measure_from}, {measure_to})')})"
+            segment = f"CASE WHEN COALESCE({offset}, 0) = 0 THEN {substring} ELSE ST_OffsetCurve({substring}, {offset}) END"
+            return f"ST_Multi({segment})::geometry(MultiLineString, {self.srid})"
+        substring = f"Line_Substring({line}, {fraction(f'MIN({measure_from}, {measure_to})')}, {fraction(f'MAX({measure_from}, {measure_to})')})"
+        segment = f"CASE WHEN COALESCE({offset}, 0) = 0 THEN {substring} ELSE ST_OffsetCurve({substring}, {offset}) END"
+        return f"CastToMultiLineString({segment})"
+
+    @property
+    def column_names(self) -> list:
+        """Data-columns of the view/table, without geometry"""
+        return [self.data_id_field_name, self.data_reference_field_name] + self.measure_field_names
+
+    def select_sql(self, where: str = '') -> str:
+        """SELECT of the Show-features, INNER JOIN as the virtual Show-Layer
+        :param where: optional condition, f.e. in triggers
+        """
+        # Rev. 2023-09-07
+        columns = [f"data_lyr.{quote_identifier(column_name)} AS {quote_identifier(column_name)}" for column_name in self.column_names]
+        columns.append(f"{self._geometry_expression()} AS {quote_identifier(self.geometry_column)}")
+        sql = "SELECT " + ",\n  ".join(columns)
+        sql += f"\nFROM {self.data_table.qualified_name()} AS data_lyr"
+        sql += f"\n  INNER JOIN {self.ref_table.qualified_name()} AS ref_lyr ON data_lyr.{quote_identifier(self.data_reference_field_name)} = ref_lyr.{quote_identifier(self.ref_pk_field_name)}"
+        if where:
+            sql += f"\nWHERE {where}"
+        return sql
+
+    def _base_index_statements(self) -> list:
+        """btree-indexes on the join-columns, GiST on the Reference-geometry, primary-keys are skipped"""
+        # Rev. 2023-09-07
+        statements = []
+        for db_table, column_name in [(self.data_table, self.data_reference_field_name), (self.data_table, self.data_id_field_name), (self.ref_table, self.ref_pk_field_name)]:
+            if column_name not in db_table.pk_names:
+                statements.append(f"CREATE INDEX IF NOT EXISTS {self._index_name(db_table.table, column_name)} ON {db_table.qualified_name()} ({quote_identifier(column_name)})")
+        if self.provider == 'postgres':
+            statements.append(f"CREATE INDEX IF NOT EXISTS {self._index_name(self.ref_table.table, self.ref_table.geometry_column, 'gist')} ON {self.ref_table.qualified_name()} USING GIST ({quote_identifier(self.ref_table.geometry_column)})")
+        return statements
+
+    def _postgres_trigger_statements(self) -> list:
+        """PL/pgSQL-trigger-functions and triggers on Data- and Reference-table, row-wise re-calculation"""
+        # Rev. 2023-09-07
+        data_id = quote_identifier(self.data_id_field_name)
+        data_ref = quote_identifier(self.data_reference_field_name)
+        ref_pk = quote_identifier(self.ref_pk_field_name)
+        statements = []
+        for role, table, delete_where, insert_where in [
+            ('data', self.data_table, f"{data_id} = OLD.{data_id}", f"data_lyr.{data_id} = NEW.{data_id}"),
+            ('ref', self.ref_table, f"{data_ref} = OLD.{ref_pk}", f"ref_lyr.{ref_pk} = NEW.{ref_pk}")
+        ]:
+            function_name = self.data_table.qualified_name(f"{self.object_name}_sync_{role}")
+            trigger_name = quote_identifier(f"{self.object_name}_sync_{role}")
+            statements.append(
+                f"CREATE OR REPLACE FUNCTION {function_name}() RETURNS trigger AS $$\n"
+                f"BEGIN\n"
+                f"  IF TG_OP IN ('UPDATE', 'DELETE') THEN\n"
+                f"    DELETE FROM {self.object_qualified_name} WHERE {delete_where};\n"
+                f"  END IF;\n"
+                f"  IF TG_OP IN ('INSERT', 'UPDATE') THEN\n"
+                f"    INSERT INTO {self.object_qualified_name}\n{self.select_sql(insert_where)};\n"
+                f"  END IF;\n"
+                f"  RETURN NULL;\n"
+                f"END;\n"
+                f"$$ LANGUAGE plpgsql"
+            )
+            statements.append(f"DROP TRIGGER IF EXISTS {trigger_name} ON {table.qualified_name()}")
+            statements.append(f"CREATE TRIGGER {trigger_name} AFTER INSERT OR UPDATE OR DELETE ON {table.qualified_name()} FOR EACH ROW EXECUTE PROCEDURE {function_name}()")
+        return statements
+
+    def _spatialite_column_type(self, field_name: str) -> str:
+        """SQLite-column-type for a Data-column
+        :param field_name:
+        """
+        # Rev. 2023-09-07
+        field_type = self.data_table.fields.field(field_name).type()
+        if field_type in [QtCore.QVariant.Int, QtCore.QVariant.UInt, QtCore.QVariant.LongLong, QtCore.QVariant.ULongLong]:
+            return 'INTEGER'
+        if field_type == QtCore.QVariant.Double:
+            return 'REAL'
+        return 'TEXT'
+
+    def _spatialite_trigger_statements(self) -> list:
+        """SQLite-triggers on Data- and Reference-table, row-wise re-calculation"""
+        # Rev. 2023-09-07
+        data_id = quote_identifier(self.data_id_field_name)
+        data_ref = quote_identifier(self.data_reference_field_name)
+        ref_pk = quote_identifier(self.ref_pk_field_name)
+        statements = []
+        for role, table, delete_where, insert_where in [
+            ('data', self.data_table, f"{data_id} = OLD.{data_id}", f"data_lyr.{data_id} = NEW.{data_id}"),
+            ('ref', self.ref_table, f"{data_ref} = OLD.{ref_pk}", f"ref_lyr.{ref_pk} = NEW.{ref_pk}")
+        ]:
+            insert_sql = f"INSERT INTO {self.object_qualified_name} ({', '.join(quote_identifier(column_name) for column_name in self.column_names + [self.geometry_column])})\n{self.select_sql(insert_where)};"
+            delete_sql = f"DELETE FROM {self.object_qualified_name} WHERE {delete_where};"
+            for event, body in [('insert', insert_sql), ('update', delete_sql + "\n" + insert_sql), ('delete', delete_sql)]:
+                trigger_name = quote_identifier(f"{self.object_name}_{role}_{event}")
+                statements.append(f"DROP TRIGGER IF EXISTS {trigger_name}")
+                statements.append(f"CREATE TRIGGER {trigger_name} AFTER {event.upper()} ON {table.qualified_name()}\nBEGIN\n{body}\nEND")
+        return statements
+
+    def statements(self) -> list:
+        """all SQL-statements in execution-order"""
+        # Rev. 2023-09-12
+        statements = self._base_index_statements()
+        object_name = self.object_qualified_name
+        object_id = quote_identifier(self.data_id_field_name)
+        object_ref = quote_identifier(self.data_reference_field_name)
+        object_geom = quote_identifier(self.geometry_column)
+        if self.provider == 'postgres':
+            if self.mode == 'view':
+                statements.append(f"CREATE OR REPLACE VIEW {object_name} AS\n{self.select_sql()}")
+            else:
+                statements.append(f"DROP TABLE IF EXISTS {object_name}")
+                statements.append(f"CREATE TABLE {object_name} AS\n{self.select_sql()}")
+                statements.append(f"ALTER TABLE {object_name} ADD PRIMARY KEY ({object_id})")
+                statements.append(f"CREATE INDEX {self._index_name(self.object_name, self.data_reference_field_name)} ON {object_name} ({object_ref})")
+                statements.append(f"CREATE INDEX {self._index_name(self.object_name, self.geometry_column, 'gist')} ON {object_name} USING GIST ({object_geom})")
+                statements += self._postgres_trigger_statements()
+        else:
+            geometry_type = 'POINT' if self.tool_name == 'PolEvt' else 'MULTILINESTRING'
+            column_defs = [f"{object_id} {self._spatialite_column_type(self.data_id_field_name)} PRIMARY KEY"]
+            column_defs += [f"{quote_identifier(column_name)} {self._spatialite_column_type(column_name)}" for column_name in self.column_names[1:]]
+            # previous table with its geometry-registration and R*Tree
+            statements.append(f"SELECT DisableSpatialIndex('{self.object_name}', '{self.geometry_column}')")
+            statements.append(f"DROP TABLE IF EXISTS {quote_identifier(f'idx_{self.object_name}_{self.geometry_column}')}")
+            statements.append(f"SELECT DiscardGeometryColumn('{self.object_name}', '{self.geometry_column}')")
+            statements.append(f"DROP TABLE IF EXISTS {object_name}")
+            statements.append(f"CREATE TABLE {object_name} ({', '.join(column_defs)})")
+            statements.append(f"SELECT AddGeometryColumn('{self.object_name}', '{self.geometry_column}', {self.srid}, '{geometry_type}', 'XY')")
+            statements.append(f"INSERT INTO {object_name} ({', '.join(quote_identifier(column_name) for column_name in self.column_names + [self.geometry_column])})\n{self.select_sql()}")
+            statements.append(f"SELECT CreateSpatialIndex('{self.object_name}', '{self.geometry_column}')")
+            statements.append(f"CREATE INDEX IF NOT EXISTS {self._index_name(self.object_name, self.data_reference_field_name)} ON {object_name} ({object_ref})")
+            statements += self._spatialite_trigger_statements()
+        return statements
+
+    def sql_script(self) -> str:
+        """all statements as script, f.e. for display or manual execution"""
+        # Rev. 2023-09-07
+        return ';\n\n'.join(self.statements()) + ';\n'
+
+    def execute(self) -> str:
+        """executes the statements via QgsAbstractDatabaseProviderConnection
+        PostGIS: one script in one transaction, SpatiaLite: statement by statement, executeSql runs only the first statement of a script
+        existing objects with object_name are only replaced if created by this generator, see foreign_object_check
+        :returns error-message, empty string if OK
+        """
+        # Rev. 2023-09-11
+        try:
+            metadata = qgis.core.QgsProviderRegistry.instance().providerMetadata(self.provider)
+            connection = metadata.createConnection(self.data_table.uri.uri(False), {})
+            error_msg = self.foreign_object_check(connection)
+            if error_msg:
+                return error_msg
+            if self.provider == 'postgres':
+                connection.executeSql(f"BEGIN;\n{self.sql_script()}COMMIT;")
+            else:
+                for statement in self.statements():
+                    connection.executeSql(statement)
+        except qgis.core.QgsProviderConnectionException as e:
+            return str(e)
+        return ''
+
+    def load_layer(self, layer_name: str) -> qgis.core.QgsVectorLayer:
+        """layer for the created view/table, not added to the project
+        :param layer_name:
+        """
+        # Rev. 2023-09-07
+        uri = qgis.core.QgsDataSourceUri(self.data_table.uri)
+        uri.setDataSource(self.data_table.schema if self.provider == 'postgres' else '', self.object_name, self.geometry_column, '', self.data_id_field_name)
+        uri.setSrid(str(self.srid))
+        uri.setWkbType(self.wkb_type)
+        return qgis.core.QgsVectorLayer(uri.uri(False), layer_name, self.provider)
@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+********************************************************************
+
+* Part of the QGis-Plugin LinearReferencing:
+* edit-session for Data-Layers: edits collected in the edit-buffer, saved with one commit
+
+.. note::
+    * import to console from Path (LinearReferencing-plugin-folder in current QGis-Profile-Folder)
+    * or use: import LinearReferencing.tools.MyEditSession
+    * without edit-session every insert/update/delete of the Map-Tools is committed immediately,
+      with PostGIS one transaction and one Show-Layer-reload per edit
+    * each edit of the Map-Tool is wrapped in an edit-command (beginEditCommand/endEditCommand),
+      a canceled feature-form only undoes this edit (destroyEditCommand), the other pending edits remain
+    * pending changes: added + deleted + attribute-changed features in the edit-buffer,
+      edits via attribute-table or feature-form of the same layer are counted too
+    * auto-commit: after max_edits pending changes and/or max_seconds after the first uncommitted edit, 0 ➜ off
+    * after each commit the layer is set editable again (commitChanges(False) not available in QGis < 3.16)
+    * failed commits keep the edit-buffer, the errors are emitted via committed
+
+sample:
+    edit_session = LinearReferencing.tools.MyEditSession.EditSession()
+    edit_session.start(data_layer, 100, 60)
+    edit_session.begin_edit('update')
+    data_layer.changeAttributeValue(fid, field_idx, value)
+    edit_session.end_edit()
+    edit_session.commit()
+
+********************************************************************
+
+* Date                 : 2023-09-09
+* Copyright            : (C) 2023 by Ludwig Kniprath
+* Email                : ludwig at kni minus online dot de
+
+********************************************************************
+
+this program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+********************************************************************
+"""
+from __future__ import annotations
+import qgis
+from qgis import core
+from PyQt5 import QtCore
+
+
+class EditSession(QtCore.QObject):
+    """edit-session on one Data-Layer, see module-note"""
+
+    # number of pending changes, emitted on every change of the edit-buffer and on start/stop
+    pending_changed = QtCore.pyqtSignal(int)
+
+    # list of commit-errors, empty on success, emitted after every commit, auto or explicit
+    committed = QtCore.pyqtSignal(list)
+
+    def __init__(self, parent: QtCore.QObject = None):
+        """constructor
+        :param parent:
+        """
+        # Rev. 2023-09-09
+        super().__init__(parent)
+        self.layer = None
+        self.max_edits = 0
+        self.max_seconds = 0
+        self._edit_active = False
+        # commit/rollback in progress, editingStopped must not end the edit-session
+        self._committing = False
+        self._connections = []
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.commit)
+
+    @property
+    def active(self) -> bool:
+        """edit-session started and the layer still editable"""
+        return self.layer is not None
+
+    def start(self, layer: qgis.core.QgsVectorLayer, max_edits: int = 0, max_seconds: int = 0) -> bool:
+        """starts the edit-session, the layer is set editable
+        :param layer: Data-Layer
+        :param max_edits: auto-commit after this number of pending changes, 0 ➜ off
+        :param max_seconds: auto-commit this number of seconds after the first uncommitted edit, 0 ➜ off
+        :returns False, if the layer can't be set editable
+        """
+        # Rev. 2023-09-09
+        self.stop()
+        if not layer.isEditable() and not layer.startEditing():
+            return False
+        self.layer = layer
+        self.set_thresholds(max_edits, max_seconds)
+        self._connections.append(layer.layerModified.connect(self._s_layer_modified))
+        self._connections.append(layer.editingStopped.connect(self._s_editing_stopped))
+        self._connections.append(layer.willBeDeleted.connect(self.stop))
+        self.pending_changed.emit(self.pending_count())
+        return True
+
+    def stop(self):
+        """ends the edit-session, the pending edits remain in the edit-buffer, see commit and rollback"""
+        # Rev. 2023-09-09
+        self._timer.stop()
+        if self.layer is not None:
+            for connection in self._connections:
+                try:
+                    self.layer.disconnect(connection)
+                except (TypeError, RuntimeError):
+                    # already disconnected or layer deleted
+                    pass
+        self._connections = []
+        self.layer = None
+        self._edit_active = False
+        self.pending_changed.emit(0)
+
+    def set_thresholds(self, max_edits: int = 0, max_seconds: int = 0):
+        """auto-commit-thresholds, see start
+        :param max_edits:
+        :param max_seconds:
+        """
+        # Rev. 2023-09-09
+        self.max_edits = max_edits
+        self.max_seconds = max_seconds
+        if not max_seconds:
+            self._timer.stop()
+
+    def pending_count(self) -> int:
+        """number of changed features in the edit-buffer"""
+        # Rev. 2023-09-09
+        if self.layer is not None and self.layer.editBuffer():
+            edit_buffer = self.layer.editBuffer()
+            return len(edit_buffer.addedFeatures()) + len(edit_buffer.deletedFeatureIds()) + len(edit_buffer.changedAttributeValues())
+        return 0
+
+    def begin_edit(self, text: str):
+        """starts an edit-command for one edit of the Map-Tool
+        :param text: text for the undo-stack
+        """
+        # Rev. 2023-09-09
+        if self.layer is not None:
+            self.layer.beginEditCommand(text)
+            self._edit_active = True
+
+    def end_edit(self) -> list:
+        """ends the edit-command, auto-commit if the thresholds are reached
+        :returns list of commit-errors, empty if OK or not committed
+        """
+        # Rev. 2023-09-09
+        if self.layer is not None and self._edit_active:
+            self.layer.endEditCommand()
+            self._edit_active = False
+            pending_count = self.pending_count()
+            if self.max_edits and pending_count >= self.max_edits:
+                return self.commit()
+            if self.max_seconds and pending_count and not self._timer.isActive():
+                self._timer.start(self.max_seconds * 1000)
+        return []
+
+    def discard_edit(self):
+        """undoes the changes since begin_edit, f.e. canceled feature-form"""
+        # Rev. 2023-09-09
+        if self.layer is not None and self._edit_active:
+            self.layer.destroyEditCommand()
+            self._edit_active = False
+
+    def commit(self) -> list:
+        """commits all pending changes, the layer stays editable
+        :returns list of commit-errors, empty on success
+        """
+        # Rev. 2023-09-09
+        self._timer.stop()
+        errors = []
+        # not during an edit-command, f.e. timeout while the feature-form is open, the timer restarts with end_edit
+        if self.layer is not None and not self._edit_active:
+            layer = self.layer
+            self._committing = True
+            if layer.commitChanges():
+                layer.startEditing()
+            else:
+                errors = layer.commitErrors()
+            self._committing = False
+            self.pending_changed.emit(self.pending_count())
+            self.committed.emit(errors)
+        return errors
+
+    def rollback(self):
+        """discards all pending changes, the layer stays editable"""
+        # Rev. 2023-09-09
+        self._timer.stop()
+        if self.layer is not None and not self._edit_active:
+            self._committing = True
+            self.layer.rollBack()
+            self.layer.startEditing()
+            self._committing = False
+            self.pending_changed.emit(self.pending_count())
+
+    def _s_layer_modified(self):
+        """slot for layerModified"""
+        # Rev. 2023-09-09
+        self.pending_changed.emit(self.pending_count())
+
+    def _s_editing_stopped(self):
+        """slot for editingStopped: the layer was committed or rolled back outside, f.e. with the QGis-toolbar"""
+        # Rev. 2023-09-09
+        if not self._committing:
+            self.stop()
@@ -0,0 +1,363 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+********************************************************************
+
+* Part of the QGis-Plugin LinearReferencing:
+* spatial index over the calculated PoL/LoL-geometries
+
+.. note::
+    * import to console from Path (LinearReferencing-plugin-folder in current QGis-Profile-Folder)
+    * or use: import LinearReferencing.tools.MyEventIndex
+    * replaces the ExactIntersect-queries on the Show-Layer for selection, hover and zoom,
+      virtual Show-Layers would re-evaluate the complete join for every query
+    * works without Show-Layer, the geometries are calculated with the same callback as the materialized Show-Layer
+    * changed features are marked by the layer-signals connected in the Map-Tools and re-calculated lazily on the next query
+
+********************************************************************
+
+* Date                 : 2023-09-03
+* Copyright            : (C) 2023 by Ludwig Kniprath
+* Email                : ludwig at kni minus online dot de
+
+********************************************************************
+
+this program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+********************************************************************
+"""
+from __future__ import annotations
+import typing
+import qgis
+from qgis import core
+from LinearReferencing.tools import MyLayerCaches
+from LinearReferencing.tools import MyToolFunctions
+
+
+class EventIndex:
+    """in-memory QgsSpatialIndex of the PoL-points or LoL-segments of all Data-features, coords in Reference-Layer-CRS
+    the geometries are kept for the exact test of the index-candidates
+    all Data-features with the same Reference-id are calculated with the same RefGeometry, see MyShowLayers.ShowLayerMaterializer
+    """
+
+    def __init__(self, ref_layer: qgis.core.QgsVectorLayer, ref_pk_field: qgis.core.QgsField, data_layer: qgis.core.QgsVectorLayer, data_id_field: qgis.core.QgsField, data_reference_field: qgis.core.QgsField, data_fields: list, calc_geometry: typing.Callable):
+        """constructor
+        :param ref_layer:
+        :param ref_pk_field:
+        :param data_layer:
+        :param data_id_field:
+        :param data_reference_field:
+        :param data_fields: list of QgsField, the Data-Layer-fields needed by calc_geometry, including data_id_field and data_reference_field
+        :param calc_geometry: function(ref_geom: MyLayerCaches.RefGeometry, data_feature: QgsFeature) -> QgsGeometry|None
+        """
+        # Rev. 2023-09-03
+        self.ref_layer = ref_layer
+        self.ref_pk_field = ref_pk_field
+        self.data_layer = data_layer
+        self.data_id_field = data_id_field
+        self.data_reference_field = data_reference_field
+        self.data_fields = data_fields
+        self.calc_geometry = calc_geometry
+        # layer-ids for the module-slots, valid also after the removal of the layers
+        self.ref_layer_id = ref_layer.id()
+        self.data_layer_id = data_layer.id()
+        self.index = None
+        # key: Data-fid value: tuple (PK, Reference-fid, QgsGeometry, list of data_fields-values)
+        self.entries = {}
+        # combined bounding-box of all entries, None if no entries, re-calculated on next full_extent if not _extent_valid
+        self._extent = None
+        self._extent_valid = False
+        # key: Reference-fid value: set of Data-fids
+        self.data_fids_by_ref_fid = {}
+        # key: str(PK) value: set of Data-fids, see get_entries_by_pks
+        self.data_fids_by_pk = {}
+        self.dirty_data_fids = set()
+        self.dirty_ref_fids = set()
+        self.rebuild_needed = True
+
+    @property
+    def key(self) -> tuple:
+        """identifies the configuration, a changed configuration needs a new index"""
+        return (
+            self.ref_layer.id(),
+            self.ref_pk_field.name(),
+            self.data_layer.id(),
+            tuple(field.name() for field in self.data_fields)
+        )
+
+    def _calc_entries(self, data_fids: list = None) -> dict:
+        """queries the Data-features, groups them by Reference-id and calculates the geometries
+        :param data_fids: fids in Data-Layer, None ➜ all Data-features
+        :returns dict key: Data-fid value: tuple (PK, Reference-fid, QgsGeometry, list of data_fields-values), Data-features without valid Reference-feature or geometry are skipped
+        """
+        # Rev. 2023-09-06
+        request = qgis.core.QgsFeatureRequest()
+        request.setFlags(qgis.core.QgsFeatureRequest.NoGeometry)
+        request.setSubsetOfAttributes([field.name() for field in self.data_fields], self.data_layer.fields())
+        if data_fids is not None:
+            request.setFilterFids(data_fids)
+
+        data_features_by_ref_id = {}
+        for data_feature in self.data_layer.getFeatures(request):
+            data_features_by_ref_id.setdefault(data_feature[self.data_reference_field.name()], []).append(data_feature)
+
+        ref_features = MyLayerCaches.get_features_by_pks(self.ref_layer, self.ref_pk_field, list(data_features_by_ref_id.keys()))
+
+        entries = {}
+        for ref_id, data_features in data_features_by_ref_id.items():
+            ref_feature = ref_features.get(ref_id)
+            if ref_feature and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
+                ref_geom = MyLayerCaches.RefGeometry(ref_feature)
+                for data_feature in data_features:
+                    event_geom = self.calc_geometry(ref_geom, data_feature)
+                    if event_geom and not event_geom.isEmpty():
+                        entries[data_feature.id()] = (data_feature[self.data_id_field.name()], ref_feature.id(), event_geom, [data_feature[field.name()] for field in self.data_fields])
+        return entries
+
+    def _add_entries(self, entries: dict):
+        """adds calculated entries to index and lookups
+        :param entries: from _calc_entries
+        """
+        # Rev. 2023-09-12
+        for data_fid, entry in entries.items():
+            self.entries[data_fid] = entry
+            self.data_fids_by_ref_fid.setdefault(entry[1], set()).add(data_fid)
+            self.data_fids_by_pk.setdefault(str(entry[0]), set()).add(data_fid)
+            self.index.addFeature(data_fid, entry[2].boundingBox())
+            if self._extent_valid:
+                if self._extent is None:
+                    self._extent = qgis.core.QgsRectangle(entry[2].boundingBox())
+                else:
+                    self._extent.combineExtentWith(entry[2].boundingBox())
+
+    def _remove_entry(self, data_fid: int):
+        """removes a Data-feature from index and lookups
+        :param data_fid:
+        """
+        # Rev. 2023-09-12
+        entry = self.entries.pop(data_fid, None)
+        if entry is not None:
+            # removed features could shrink the extent
+            self._extent_valid = False
+            self.data_fids_by_ref_fid.get(entry[1], set()).discard(data_fid)
+            pk_fids = self.data_fids_by_pk.get(str(entry[0]))
+            if pk_fids is not None:
+                pk_fids.discard(data_fid)
+                if not pk_fids:
+                    del self.data_fids_by_pk[str(entry[0])]
+            # QgsSpatialIndex.deleteFeature needs the former geometry for the bounding-box
+            feature = qgis.core.QgsFeature(data_fid)
+            feature.setGeometry(entry[2])
+            self.index.deleteFeature(feature)
+
+    def build(self):
+        """(re-)calculates all Data-features"""
+        # Rev. 2023-09-12
+        self.index = qgis.core.QgsSpatialIndex()
+        self.entries = {}
+        self._extent = None
+        self._extent_valid = True
+        self.data_fids_by_ref_fid = {}
+        self.data_fids_by_pk = {}
+        self._add_entries(self._calc_entries())
+        self.dirty_data_fids = set()
+        self.dirty_ref_fids = set()
+        self.rebuild_needed = False
+
+    def ensure_current(self):
+        """full build or re-calculation of the marked Data- and Reference-features"""
+        # Rev. 2023-09-12
+        if self.rebuild_needed or self.index is None:
+            self.build()
+            return
+
+        data_fids = set(self.dirty_data_fids)
+        if self.dirty_ref_fids:
+            ref_fids = list(self.dirty_ref_fids)
+            # previously referencing Data-features...
+            for ref_fid in ref_fids:
+                data_fids.update(self.data_fids_by_ref_fid.pop(ref_fid, set()))
+            # ...and the currently referencing, f.e. after changed Reference-id
+            request = qgis.core.QgsFeatureRequest()
+            request.setFlags(qgis.core.QgsFeatureRequest.NoGeometry)
+            request.setSubsetOfAttributes([self.ref_pk_field.name()], self.ref_layer.fields())
+            request.setFilterFids(ref_fids)
+            ref_ids = [ref_feature[self.ref_pk_field.name()] for ref_feature in self.ref_layer.getFeatures(request)]
+            data_fids.update(MyToolFunctions.get_fids_by_values(self.data_layer, self.data_reference_field, ref_ids))
+
+        if data_fids:
+            for data_fid in data_fids:
+                self._remove_entry(data_fid)
+            # removed fids are not returned
+            self._add_entries(self._calc_entries(list(data_fids)))
+
+        self.dirty_data_fids = set()
+        self.dirty_ref_fids = set()
+
+    def mark_data_dirty(self, data_fid: int):
+        """Data-feature added, changed or deleted
+        :param data_fid:
+        """
+        # Rev. 2023-09-03
+        self.dirty_data_fids.add(data_fid)
+
+    def mark_data_committed(self, features: list):
+        """committed Data-features get new fids, the temporary (negative) fids of the edit-buffer are obsolete
+        :param features: committed features with their new fids
+        """
+        # Rev. 2023-09-03
+        self.dirty_data_fids.update(feature.id() for feature in features)
+        self.dirty_data_fids.update(data_fid for data_fid in self.entries if data_fid < 0)
+
+    def mark_ref_dirty(self, ref_fid: int):
+        """Reference-feature added, changed or deleted
+        :param ref_fid:
+        """
+        # Rev. 2023-09-03
+        self.dirty_ref_fids.add(ref_fid)
+
+    def query_rect(self, rect: qgis.core.QgsRectangle) -> dict:
+        """Data-features intersecting rect, replacement for the ExactIntersect-request on the Show-Layer
+        :param rect: in Reference-Layer-CRS
+        :returns dict key: Data-fid value: PK
+        """
+        # Rev. 2023-09-03
+        self.ensure_current()
+        rect_geom = qgis.core.QgsGeometry.fromRect(rect)
+        hits = {}
+        for data_fid in self.index.intersects(rect):
+            entry = self.entries.get(data_fid)
+            if entry is not None and entry[2].intersects(rect_geom):
+                hits[data_fid] = entry[0]
+        return hits
+
+    def nearest(self, point_xy: qgis.core.QgsPointXY, max_distance: float) -> tuple | None:
+        """nearest Data-feature within max_distance, f.e. for hover-identify
+        :param point_xy: in Reference-Layer-CRS
+        :param max_distance: in Reference-Layer-units
+        :returns tuple (Data-fid, PK, distance) or None
+        """
+        # Rev. 2023-09-03
+        self.ensure_current()
+        point_geom = qgis.core.QgsGeometry.fromPointXY(point_xy)
+        nearest = None
+        # bounding-box-distance ≤ exact distance, the exact nearest is among the candidates within max_distance
+        for data_fid in self.index.intersects(qgis.core.QgsRectangle(point_xy.x() - max_distance, point_xy.y() - max_distance, point_xy.x() + max_distance, point_xy.y() + max_distance)):
+            entry = self.entries.get(data_fid)
+            if entry is not None:
+                distance = entry[2].distance(point_geom)
+                if distance <= max_distance and (nearest is None or distance < nearest[2]):
+                    nearest = (data_fid, entry[0], distance)
+        return nearest
+
+    def get_entries_by_pks(self, pks: list) -> dict:
+        """indexed Data-features by PK
+        :param pks:
+        :returns dict key: Data-fid value: tuple (PK, Reference-fid, QgsGeometry, list of data_fields-values), PKs without calculable geometry are missing
+        """
+        # Rev. 2023-09-12
+        self.ensure_current()
+        found_entries = {}
+        for pk in pks:
+            for data_fid in self.data_fids_by_pk.get(str(pk), set()):
+                found_entries[data_fid] = self.entries[data_fid]
+        return found_entries
+
+    def extent(self, pks: list) -> qgis.core.QgsRectangle | None:
+        """combined bounding-box of these Data-features, f.e. for zoom-to-selection, via the PK-lookup of get_entries_by_pks
+        :param pks:
+        :returns QgsRectangle in Reference-Layer-CRS or None
+        """
+        # Rev. 2023-09-12
+        extent = None
+        for entry in self.get_entries_by_pks(pks).values():
+            if extent is None:
+                extent = qgis.core.QgsRectangle(entry[2].boundingBox())
+            else:
+                extent.combineExtentWith(entry[2].boundingBox())
+        return extent
+
+    def full_extent(self) -> qgis.core.QgsRectangle:
+        """combined bounding-box of all Data-features, updated incrementally on added features, re-calculated after removals
+        :returns QgsRectangle in Reference-Layer-CRS, empty if no entries
+        """
+        # Rev. 2023-09-06
+        self.ensure_current()
+        if not self._extent_valid:
+            self._extent = None
+            for entry in self.entries.values():
+                if self._extent is None:
+                    self._extent = qgis.core.QgsRectangle(entry[2].boundingBox())
+                else:
+                    self._extent.combineExtentWith(entry[2].boundingBox())
+            self._extent_valid = True
+        if self._extent is None:
+            return qgis.core.QgsRectangle()
+        return qgis.core.QgsRectangle(self._extent)
+
+
+# module-wide registry, key: Data-Layer-id, value: EventIndex
+_event_indices = {}
+
+
+def get_event_index(ref_layer: qgis.core.QgsVectorLayer, ref_pk_field: qgis.core.QgsField, data_layer: qgis.core.QgsVectorLayer, data_id_field: qgis.core.QgsField, data_reference_field: qgis.core.QgsField, data_fields: list, calc_geometry: typing.Callable) -> EventIndex:
+    """returns the registered index for data_layer, creates a new one if not registered or the configuration has changed
+    parameters see EventIndex
+    """
+    # Rev. 2023-09-03
+    event_index = EventIndex(ref_layer, ref_pk_field, data_layer, data_id_field, data_reference_field, data_fields, calc_geometry)
+    registered = _event_indices.get(data_layer.id())
+    if registered is not None and registered.key == event_index.key:
+        registered.calc_geometry = calc_geometry
+        return registered
+    _event_indices[data_layer.id()] = event_index
+    return event_index
+
+
+def mark_data_dirty(layer_id: str, fid: int, *args):
+    """slot for Data-Layer-signals featureAdded, featureDeleted and attributeValueChanged
+    :param layer_id:
+    :param fid:
+    :param args: signal-arguments, unused
+    """
+    # Rev. 2023-09-03
+    event_index = _event_indices.get(layer_id)
+    if event_index is not None:
+        event_index.mark_data_dirty(fid)
+
+
+def mark_data_committed(layer_id: str, features: list):
+    """slot for Data-Layer-signal committedFeaturesAdded
+    :param layer_id:
+    :param features:
+    """
+    # Rev. 2023-09-03
+    event_index = _event_indices.get(layer_id)
+    if event_index is not None:
+        event_index.mark_data_committed(features)
+
+
+def mark_reference_dirty(layer_id: str, fid: int, *args):
+    """slot for Reference-Layer-signals featureAdded, featureDeleted, geometryChanged and attributeValueChanged
+    :param layer_id:
+    :param fid:
+    :param args: signal-arguments, unused
+    """
+    # Rev. 2023-09-03
+    for event_index in _event_indices.values():
+        if event_index.ref_layer_id == layer_id:
+            event_index.mark_ref_dirty(fid)
+
+
+def invalidate_events(layer_id: str = None, *args):
+    """slot for afterRollBack and subsetStringChanged of Reference- and Data-Layer, after provider-level inserts
+    :param layer_id: None ➜ all indices
+    :param args: signal-arguments, unused
+    """
+    # Rev. 2023-09-03
+    for event_index in _event_indices.values():
+        if layer_id is None or layer_id in [event_index.ref_layer_id, event_index.data_layer_id]:
+            event_index.rebuild_needed = True
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+********************************************************************
+
+* Part of the QGis-Plugin LinearReferencing:
+* indexes and storage-options for GeoPackage-Data-Layers
+
+.. note::
+    * import to console from Path (LinearReferencing-plugin-folder in current QGis-Profile-Folder)
+    * or use: import LinearReferencing.tools.MyGeoPackage
+    * one composite btree-index per Data-table: (Reference-field, measure) for PoL, (Reference-field, From, To) for LoL
+      the Reference-field is the leading column, so the index serves the joins and per-route-queries on the Reference-field alone too
+    * page-size only for new GeoPackages: PRAGMA page_size + VACUUM rewrites the whole file and is not possible in WAL-mode
+    * journal_mode=WAL is persistent in the file, readers (f.e. Show-Layers) don't block the writer
+    * bulk-load: the index-statements are registered per Data-Layer-ID and executed after the first commit of this layer,
+      f.e. the import of a measure-table, see create_deferred_indexes, or on unload of the Map-Tool, see flush_deferred_indexes
+    * execution via QgsGeoPackageProviderConnection, same GDAL-connection-pool as the ogr-layers in the project
+
+sample:
+    LinearReferencing.tools.MyGeoPackage.tune('/home/user/lol.gpkg', 8192, True, True)
+    LinearReferencing.tools.MyGeoPackage.index_statements('LineOnLine_Data_Layer_1', 'line_ref_id', ['measure_from', 'measure_to'])
+    ➜ ['CREATE INDEX IF NOT EXISTS "LineOnLine_Data_Layer_1_line_ref_id_idx" ON "LineOnLine_Data_Layer_1" ("line_ref_id", "measure_from", "measure_to")']
+
+********************************************************************
+
+* Date                 : 2023-09-08
+* Copyright            : (C) 2023 by Ludwig Kniprath
+* Email                : ludwig at kni minus online dot de
+
+********************************************************************
+
+this program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+********************************************************************
+"""
+from __future__ import annotations
+import qgis
+from qgis import core
+
+# SQLite: power of two between 512 and 65536
+page_sizes = [4096, 8192, 16384, 32768, 65536]
+
+# key: Data-Layer-ID value: tuple (gpkg_path, list of CREATE INDEX-statements), see bulk-load
+_deferred_indexes = {}
+
+
+def quote_identifier(name: str) -> str:
+    """double-quoted SQLite-identifier
+    :param name:
+    """
+    # Rev. 2023-09-08
+    return '"' + name.replace('"', '""') + '"'
+
+
+def index_statements(table_name: str, reference_field_name: str, measure_field_names: list) -> list:
+    """CREATE INDEX-statements for a Data-table
+    :param table_name:
+    :param reference_field_name:
+    :param measure_field_names: PoL: [measure], LoL: [measure_from, measure_to]
+    """
+    # Rev. 2023-09-08
+    columns = ', '.join(quote_identifier(field_name) for field_name in [reference_field_name] + measure_field_names)
+    index_name = quote_identifier(f"{table_name}_{reference_field_name}_idx")
+    return [f"CREATE INDEX IF NOT EXISTS {index_name} ON {quote_identifier(table_name)} ({columns})"]
+
+
+def execute_statements(gpkg_path: str, statements: list) -> str:
+    """executes the statements one by one
+    :param gpkg_path:
+    :param statements:
+    :returns error-message, empty string if OK
+    """
+    # Rev. 2023-09-08
+    try:
+        connection = qgis.core.QgsProviderRegistry.instance().providerMetadata('ogr').createConnection(gpkg_path, {})
+        for statement in statements:
+            connection.executeSql(statement)
+    except qgis.core.QgsProviderConnectionException as e:
+        return str(e)
+    return ''
+
+
+def tune(gpkg_path: str, page_size: int = 0, wal: bool = False, is_new: bool = False) -> str:
+    """storage-options for the GeoPackage
+    :param gpkg_path:
+    :param page_size: 0 ➜ unchanged, see page_sizes, only if is_new
+    :param wal: True ➜ journal_mode=WAL
+    :param is_new: GeoPackage just created, the VACUUM for the page-size is cheap
+    :returns error-message, empty string if OK
+    """
+    # Rev. 2023-09-08
+    statements = []
+    if page_size and is_new:
+        # page-size must be set before WAL
+        statements += [f"PRAGMA page_size = {int(page_size)}", "VACUUM"]
+    if wal:
+        statements.append("PRAGMA journal_mode = WAL")
+    return execute_statements(gpkg_path, statements)
+
+
+def create_indexes(layer_id: str, gpkg_path: str, table_name: str, reference_field_name: str, measure_field_names: list, deferred: bool = False) -> str:
+    """creates the indexes for a Data-table or registers them for bulk-load
+    :param layer_id: ID of the Data-Layer, key for the deferred indexes
+    :param gpkg_path:
+    :param table_name:
+    :param reference_field_name:
+    :param measure_field_names: see index_statements
+    :param deferred: True ➜ bulk-load, created after the first commit, see create_deferred_indexes
+    :returns error-message, empty string if OK
+    """
+    # Rev. 2023-09-08
+    statements = index_statements(table_name, reference_field_name, measure_field_names)
+    if deferred:
+        _deferred_indexes[layer_id] = (gpkg_path, statements)
+        return ''
+    return execute_statements(gpkg_path, statements)
+
+
+def has_deferred_indexes(layer_id: str) -> bool:
+    """True ➜ bulk-load-mode, indexes not yet created
+    :param layer_id:
+    """
+    # Rev. 2023-09-08
+    return layer_id in _deferred_indexes
+
+
+def create_deferred_indexes(layer_id: str, *args) -> str:
+    """creates the registered indexes of a Data-Layer, slot for afterCommitChanges
+    :param layer_id:
+    :param args: signal-arguments, unused
+    :returns error-message, empty string if OK or nothing registered
+    """
+    # Rev. 2023-09-08
+    if layer_id in _deferred_indexes:
+        gpkg_path, statements = _deferred_indexes.pop(layer_id)
+        return execute_statements(gpkg_path, statements)
+    return ''
+
+
+def flush_deferred_indexes():
+    """creates all registered indexes, f.e. on unload"""
+    # Rev. 2023-09-08
+    for layer_id in list(_deferred_indexes.keys()):
+        create_deferred_indexes(layer_id)
@@ -0,0 +1,288 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+********************************************************************
+
+* Part of the QGis-Plugin LinearReferencing:
+* whole-table integrity-checks for Data-Layers
+
+.. note::
+    * import to console from Path (LinearReferencing-plugin-folder in current QGis-Profile-Folder)
+    * or use: import LinearReferencing.tools.MyIntegrity
+    * or use f.e.: from LinearReferencing.tools.MyIntegrity import IntegrityScanner
+    * the key-columns of Reference-, Data- and Show-Layer are read once into dictionaries,
+      the checks are set-operations on these dictionaries,
+      the incremental scan re-reads only the features marked by the layer-signals since the last scan
+
+********************************************************************
+
+* Date                 : 2023-09-01
+* Copyright            : (C) 2023 by Ludwig Kniprath
+* Email                : ludwig at kni minus online dot de
+
+********************************************************************
+
+this program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+********************************************************************
+"""
+from __future__ import annotations
+import collections
+import qgis
+from qgis import core
+from PyQt5 import QtCore
+
+# issue-codes with their descriptions in the report-layer
+issue_descriptions = {
+    'null_pk': "Null-Value in ID-Field",
+    'duplicate_pk': "ID not unique",
+    'null_reference': "Null-Value in Reference-Field",
+    'missing_reference': "no Reference-feature with this ID",
+    'reference_without_geometry': "Reference-feature without geometry",
+    'multipart_reference': "Reference-feature with multipart-geometry, only the first part is used",
+    'null_measure': "Null-Value in measure-field",
+    'measure_out_of_range': "measure outside 0 ... length of Reference-line",
+    'missing_show_feature': "no Show-feature with this Back-Reference",
+    'orphaned_show_feature': "Show-feature without Data-feature",
+}
+
+
+def is_null(value) -> bool:
+    """True for None, empty strings and QVariant-NULL
+    :param value:
+    """
+    # Rev. 2023-09-01
+    return value is None or value == '' or repr(value) == 'NULL'
+
+
+class IntegrityScanner:
+    """whole-table integrity-scanner for Data-Layers, one instance per Map-Tool
+    the last read key-columns are kept, the layer-signals mark changed features via mark_dirty/mark_committed,
+    scan(incremental=True) re-reads only these features, a changed configuration of layers or fields forces a full scan
+    """
+
+    def __init__(self):
+        # key: configuration of layers and fields of the last scan, see config_key
+        self.config_key = None
+        # key: Reference-fid value: Reference-ID
+        self.ref_ids = {}
+        # key: Reference-ID value: tuple (length, is multipart) or None for features without geometry
+        self.ref_infos = {}
+        # key: Data-fid value: tuple (PK, Reference-ID, tuple measures)
+        self.data_rows = {}
+        # key: Show-fid value: Back-Reference
+        self.show_back_refs = {}
+        # key: layer-role 'ref'/'data' value: set of fids changed since the last scan
+        self.dirty_fids = {'ref': set(), 'data': set()}
+        self.full_scan_needed = True
+        # number of features read in the last scan
+        self.num_read = 0
+
+    def mark_dirty(self, layer_role: str, fid: int, *args):
+        """slot for featureAdded/featureDeleted/attributeValueChanged/geometryChanged
+        :param layer_role: 'ref' or 'data'
+        :param fid:
+        :param args: further signal-arguments, unused
+        """
+        # Rev. 2023-09-01
+        self.dirty_fids[layer_role].add(fid)
+
+    def mark_committed(self, layer_role: str, layer_id: str, features: list):
+        """slot for committedFeaturesAdded: the committed features get new fids
+        :param layer_role: 'ref' or 'data'
+        :param layer_id: unused
+        :param features: list of QgsFeature with the new fids
+        """
+        # Rev. 2023-09-01
+        self.dirty_fids[layer_role].update(feature.id() for feature in features)
+
+    def invalidate(self, *args):
+        """slot for afterRollBack/subsetStringChanged/dataChanged: next scan reads all features
+        :param args: signal-arguments, unused
+        """
+        # Rev. 2023-09-01
+        self.full_scan_needed = True
+
+    @staticmethod
+    def _read_features(vlayer: qgis.core.QgsVectorLayer, field_names: list, fids: set | None, with_geometry: bool = False):
+        """generator for the features of vlayer with a subset of attributes
+        :param vlayer:
+        :param field_names:
+        :param fids: None ➜ all features
+        :param with_geometry:
+        """
+        # Rev. 2023-09-01
+        request = qgis.core.QgsFeatureRequest().setSubsetOfAttributes(field_names, vlayer.fields())
+        if not with_geometry:
+            request.setFlags(qgis.core.QgsFeatureRequest.NoGeometry)
+        if fids is not None:
+            request.setFilterFids(list(fids))
+        for feature in vlayer.getFeatures(request):
+            yield feature
+
+    def _read_reference_layer(self, ref_layer: qgis.core.QgsVectorLayer, ref_pk_field: qgis.core.QgsField, fids: set | None):
+        """(re-)reads IDs, lengths and multipart-flags of the Reference-features
+        :param fids: None ➜ all features
+        """
+        # Rev. 2023-09-01
+        if fids is not None:
+            for fid in fids:
+                ref_id = self.ref_ids.pop(fid, None)
+                self.ref_infos.pop(ref_id, None)
+        for ref_feature in self._read_features(ref_layer, [ref_pk_field.name()], fids, True):
+            self.num_read += 1
+            ref_id = ref_feature[ref_pk_field.name()]
+            if is_null(ref_id):
+                continue
+            self.ref_ids[ref_feature.id()] = ref_id
+            if ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
+                ref_geom = ref_feature.geometry()
+                self.ref_infos[ref_id] = (ref_geom.length(), ref_geom.isMultipart() and ref_geom.constGet().numGeometries() > 1)
+            else:
+                self.ref_infos[ref_id] = None
+
+    def _read_data_layer(self, data_layer: qgis.core.QgsVectorLayer, data_id_field: qgis.core.QgsField, data_reference_field: qgis.core.QgsField, measure_fields: list, fids: set | None):
+        """(re-)reads PKs, Reference-IDs and measures of the Data-features, deleted fids are removed
+        :param fids: None ➜ all features
+        """
+        # Rev. 2023-09-01
+        if fids is not None:
+            for fid in fids:
+                self.data_rows.pop(fid, None)
+        field_names = [data_id_field.name(), data_reference_field.name()] + [field.name() for field in measure_fields]
+        for data_feature in self._read_features(data_layer, field_names, fids):
+            self.num_read += 1
+            self.data_rows[data_feature.id()] = (
+                data_feature[data_id_field.name()],
+                data_feature[data_reference_field.name()],
+                tuple(data_feature[field.name()] for field in measure_fields)
+            )
+
+    def _read_show_layer(self, show_layer: qgis.core.QgsVectorLayer, show_back_reference_field: qgis.core.QgsField):
+        """reads the Back-References of all Show-features"""
+        # Rev. 2023-09-01
+        self.show_back_refs = {}
+        for show_feature in self._read_features(show_layer, [show_back_reference_field.name()], None):
+            self.num_read += 1
+            self.show_back_refs[show_feature.id()] = show_feature[show_back_reference_field.name()]
+
+    def scan(self, ref_layer: qgis.core.QgsVectorLayer, ref_pk_field: qgis.core.QgsField, data_layer: qgis.core.QgsVectorLayer, data_id_field: qgis.core.QgsField, data_reference_field: qgis.core.QgsField, measure_fields: list, show_layer: qgis.core.QgsVectorLayer = None, show_back_reference_field: qgis.core.QgsField = None, incremental: bool = False) -> list:
+        """runs all checks on Data-Layer
+        Show-Layers are often virtual layers without own edit-signals, their Back-References are therefore re-read with every scan
+        :param ref_layer: Reference-Layer
+        :param ref_pk_field: ID-Field in Reference-Layer
+        :param data_layer: Data-Layer
+        :param data_id_field: ID-Field in Data-Layer
+        :param data_reference_field: Reference-Field in Data-Layer
+        :param measure_fields: list of QgsField, [measure] for PoL, [measure_from, measure_to] for LoL
+        :param show_layer: optional Show-Layer
+        :param show_back_reference_field: Back-Reference-Field in Show-Layer
+        :param incremental: True ➜ re-read only the features changed since the last scan
+        :returns list of issues, tuples (layer-role, fid, PK, Reference-ID, issue-code)
+        """
+        # Rev. 2023-09-01
+        config_key = (
+            ref_layer.id(), ref_pk_field.name(),
+            data_layer.id(), data_id_field.name(), data_reference_field.name(), tuple(field.name() for field in measure_fields),
+            show_layer.id() if show_layer else None, show_back_reference_field.name() if show_back_reference_field else None
+        )
+        self.num_read = 0
+        if not incremental or self.full_scan_needed or config_key != self.config_key:
+            self.ref_ids = {}
+            self.ref_infos = {}
+            self.data_rows = {}
+            self._read_reference_layer(ref_layer, ref_pk_field, None)
+            self._read_data_layer(data_layer, data_id_field, data_reference_field, measure_fields, None)
+        else:
+            if self.dirty_fids['ref']:
+                self._read_reference_layer(ref_layer, ref_pk_field, self.dirty_fids['ref'])
+            if self.dirty_fids['data']:
+                self._read_data_layer(data_layer, data_id_field, data_reference_field, measure_fields, self.dirty_fids['data'])
+
+        if show_layer and show_back_reference_field:
+            self._read_show_layer(show_layer, show_back_reference_field)
+
+        self.config_key = config_key
+        self.full_scan_needed = False
+        self.dirty_fids = {'ref': set(), 'data': set()}
+        return self.get_issues(show_layer is not None and show_back_reference_field is not None)
+
+    def get_issues(self, with_show_layer: bool = False) -> list:
+        """the checks on the already read key-columns
+        :param with_show_layer: False ➜ no checks for Show-Layer
+        :returns list of issues, tuples (layer-role, fid, PK, Reference-ID, issue-code)
+        """
+        # Rev. 2023-09-01
+        issues = []
+        pk_counts = collections.Counter(pk for pk, ref_id, measures in self.data_rows.values() if not is_null(pk))
+        duplicate_pks = {pk for pk, count in pk_counts.items() if count > 1}
+        show_back_refs = set(self.show_back_refs.values())
+
+        for fid, (pk, ref_id, measures) in self.data_rows.items():
+            if is_null(pk):
+                issues.append(('data', fid, pk, ref_id, 'null_pk'))
+            elif pk in duplicate_pks:
+                issues.append(('data', fid, pk, ref_id, 'duplicate_pk'))
+            elif with_show_layer and pk not in show_back_refs:
+                issues.append(('data', fid, pk, ref_id, 'missing_show_feature'))
+
+            if is_null(ref_id):
+                issues.append(('data', fid, pk, ref_id, 'null_reference'))
+                continue
+            if ref_id not in self.ref_infos:
+                issues.append(('data', fid, pk, ref_id, 'missing_reference'))
+                continue
+            ref_info = self.ref_infos[ref_id]
+            if ref_info is None:
+                issues.append(('data', fid, pk, ref_id, 'reference_without_geometry'))
+                continue
+            ref_length, is_multipart = ref_info
+            if is_multipart:
+                issues.append(('data', fid, pk, ref_id, 'multipart_reference'))
+            if any(is_null(measure) for measure in measures):
+                issues.append(('data', fid, pk, ref_id, 'null_measure'))
+            elif any(not 0 <= measure <= ref_length for measure in measures):
+                issues.append(('data', fid, pk, ref_id, 'measure_out_of_range'))
+
+        if with_show_layer:
+            orphaned_back_refs = show_back_refs - set(pk_counts)
+            for fid, back_ref in self.show_back_refs.items():
+                if back_ref in orphaned_back_refs:
+                    issues.append(('show', fid, back_ref, None, 'orphaned_show_feature'))
+
+        return issues
+
+    @staticmethod
+    def create_report_layer(data_layer: qgis.core.QgsVectorLayer, issues: list) -> qgis.core.QgsVectorLayer:
+        """geometry-less memory-layer with one row per issue
+        :param data_layer: for the name of the report
+        :param issues: from scan
+        """
+        # Rev. 2023-09-01
+        report_layer = qgis.core.QgsVectorLayer("None", f"{data_layer.name()} integrity report", "memory")
+        report_layer.dataProvider().addAttributes([
+            qgis.core.QgsField("layer", QtCore.QVariant.String),
+            qgis.core.QgsField("fid", QtCore.QVariant.LongLong),
+            qgis.core.QgsField("pk", QtCore.QVariant.String),
+            qgis.core.QgsField("reference_id", QtCore.QVariant.String),
+            qgis.core.QgsField("issue", QtCore.QVariant.String),
+            qgis.core.QgsField("description", QtCore.QVariant.String)
+        ])
+        report_layer.updateFields()
+        report_features = []
+        for layer_role, fid, pk, ref_id, issue in issues:
+            report_feature = qgis.core.QgsFeature(report_layer.fields())
+            report_feature.setAttributes([
+                layer_role,
+                fid,
+                None if is_null(pk) else str(pk),
+                None if is_null(ref_id) else str(ref_id),
+                issue,
+                issue_descriptions[issue]
+            ])
+            report_features.append(report_feature)
+        report_layer.dataProvider().addFeatures(report_features)
+        return report_layer
@@ -0,0 +1,1192 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+********************************************************************
+
+* Part of the QGis-Plugin LinearReferencing:
+* some Caches for Layer-Queries
+
+.. note::
+    * import to console from Path (LinearReferencing-plugin-folder in current QGis-Profile-Folder)
+    * or use: import LinearReferencing.tools.MyLayerCaches
+    * or use f.e.: from LinearReferencing.tools.MyLayerCaches import get_feature_by_pk
+    * caches are module-wide, shared by PolEvt and LolEvt, invalidation via layer-signals connected in the Map-Tools
+    * PkAllocator: next integer PK without reading all PK-values, see get_next_pk
+      bulk-inserts into layers with sequence use get_sequence_clause instead: one provider-round-trip per row otherwise
+
+********************************************************************
+
+* Date                 : 2023-08-14
+* Copyright            : (C) 2023 by Ludwig Kniprath
+* Email                : ludwig at kni minus online dot de
+
+********************************************************************
+
+this program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+********************************************************************
+"""
+from __future__ import annotations
+import math, array, bisect, collections
+import qgis
+from qgis import core
+from PyQt5 import QtCore
+from LinearReferencing.tools import MyToolFunctions
+from LinearReferencing.tools import MyTransforms
+
+
+class PkFidIndex:
+    """index PK-value ➜ fid for each queried layer/field
+    built once with a single geometry-less request on the PK-field,
+    replaces the per-call filter-expression in get_feature_by_value
+    keys are stringified values, equivalent to the type-independent expression "field" = 'value'
+    PK-values changed in the edit-buffer are registered via update_value (attributeValueChanged),
+    added/deleted features via add_feature/remove_feature (featureAdded/featureDeleted),
+    a miss on a modified layer rebuilds once, if the index was built before the edits
+    """
+
+    def __init__(self):
+        # key: (layer_id, field_name) value: dict {str(pk_value): fid}
+        self._indices = {}
+        # reverse index, key: (layer_id, field_name) value: dict {fid: str(pk_value)}
+        self._fid_values = {}
+        # key: (layer_id, field_name) value: True ➜ built while the layer was modified, edit-buffer included
+        self._built_modified = {}
+
+    def _build(self, vlayer: qgis.core.QgsVectorLayer, field_name: str) -> dict:
+        """query all features of vlayer (without geometry, only field_name) and build the index
+        :param vlayer:
+        :param field_name:
+        """
+        # Rev. 2023-09-12
+        index = {}
+        fid_values = {}
+        field_idx = vlayer.fields().indexOf(field_name)
+        if field_idx >= 0:
+            request = qgis.core.QgsFeatureRequest()
+            request.setFlags(qgis.core.QgsFeatureRequest.NoGeometry)
+            request.setSubsetOfAttributes([field_idx])
+            for feature in vlayer.getFeatures(request):
+                value = feature[field_idx]
+                if value is not None and value != qgis.core.NULL:
+                    # first feature wins, same as the former "return the first feature"
+                    index.setdefault(str(value), feature.id())
+                    fid_values[feature.id()] = str(value)
+        self._indices[(vlayer.id(), field_name)] = index
+        self._fid_values[(vlayer.id(), field_name)] = fid_values
+        self._built_modified[(vlayer.id(), field_name)] = vlayer.isModified()
+        return index
+
+    def _rebuild_on_miss(self, vlayer: qgis.core.QgsVectorLayer, field_name: str) -> bool:
+        """rebuilds the index once, if vlayer has edits made before the index was built
+        :param vlayer:
+        :param field_name:
+        :returns True if rebuilt
+        """
+        # Rev. 2023-09-11
+        if vlayer.isModified() and not self._built_modified.get((vlayer.id(), field_name)):
+            self._build(vlayer, field_name)
+            return True
+        return False
+
+    def get_fid(self, vlayer: qgis.core.QgsVectorLayer, field: qgis.core.QgsField, value: str | int) -> int | None:
+        """returns the fid of the feature with field == value or None
+        :param vlayer:
+        :param field:
+        :param value:
+        """
+        # Rev. 2023-09-11
+        index = self._indices.get((vlayer.id(), field.name()))
+        if index is None:
+            index = self._build(vlayer, field.name())
+        fid = index.get(str(value))
+        if fid is None and self._rebuild_on_miss(vlayer, field.name()):
+            fid = self._indices[(vlayer.id(), field.name())].get(str(value))
+        return fid
+
+    def get_feature(self, vlayer: qgis.core.QgsVectorLayer, field: qgis.core.QgsField, value: str | int, request: qgis.core.QgsFeatureRequest = None) -> qgis.core.QgsFeature | None:
+        """Returns feature from layer by its PK-value, replacement for MyToolFunctions.get_feature_by_value
+        :param vlayer:
+        :param field:
+        :param value:
+        :param request: optional, f.e. from MyToolFunctions.get_attribute_request, must include field
+        """
+        # Rev. 2023-08-25
+        fid = self.get_fid(vlayer, field, value)
+        if fid is not None:
+            feature = MyToolFunctions.get_feature_by_fid(vlayer, fid, request)
+            if feature.isValid() and str(feature[field.name()]) == str(value):
+                return feature
+            # stale index, f.e. PK changed in edit-buffer ➜ rebuild once
+            fid = self._build(vlayer, field.name()).get(str(value))
+            if fid is not None:
+                return MyToolFunctions.get_feature_by_fid(vlayer, fid, request)
+
+    def get_features(self, vlayer: qgis.core.QgsVectorLayer, field: qgis.core.QgsField, values: list, request: qgis.core.QgsFeatureRequest = None) -> dict:
+        """bulk-query features from layer by a list of PK-values with one setFilterFids-request
+        :param vlayer:
+        :param field:
+        :param values:
+        :param request: optional, f.e. from MyToolFunctions.get_attribute_request, must include field
+        :returns dict key: value value: feature, values without feature are missing
+        """
+        # Rev. 2023-09-11
+        found_features = {}
+        values_by_fid = {}
+        index = self._indices.get((vlayer.id(), field.name()))
+        if index is None:
+            index = self._build(vlayer, field.name())
+        missing_values = []
+        for value in values:
+            fid = index.get(str(value))
+            if fid is not None:
+                values_by_fid.setdefault(fid, value)
+            else:
+                missing_values.append(value)
+        # PK-values changed in the edit-buffer before the index was built ➜ rebuild once for all misses
+        if missing_values and self._rebuild_on_miss(vlayer, field.name()):
+            index = self._indices[(vlayer.id(), field.name())]
+            for value in missing_values:
+                fid = index.get(str(value))
+                if fid is not None:
+                    values_by_fid.setdefault(fid, value)
+
+        stale_values = []
+        if values_by_fid:
+            fids_request = qgis.core.QgsFeatureRequest(request) if request else qgis.core.QgsFeatureRequest()
+            fids_request.setFilterFids(list(values_by_fid.keys()))
+            for feature in vlayer.getFeatures(fids_request):
+                value = values_by_fid.pop(feature.id(), None)
+                if value is None:
+                    continue
+                if str(feature[field.name()]) == str(value):
+                    found_features[value] = feature
+                else:
+                    stale_values.append(value)
+            # indexed fids without feature
+            stale_values += list(values_by_fid.values())
+
+        if stale_values:
+            # stale index, f.e. PK changed in edit-buffer ➜ rebuild once and query the rest by value
+            self._build(vlayer, field.name())
+            found_features.update(MyToolFunctions.get_features_by_values(vlayer, field, stale_values, request=request))
+
+        return found_features
+
+    def _set_value(self, key: tuple, fid: int, value):
+        """registers value ➜ fid and removes the previous value of fid
+        :param key: (layer_id, field_name)
+        :param fid:
+        :param value:
+        """
+        # Rev. 2023-09-12
+        index = self._indices[key]
+        fid_values = self._fid_values[key]
+        prev_value = fid_values.pop(fid, None)
+        if prev_value is not None and index.get(prev_value) == fid:
+            del index[prev_value]
+        if value is not None and value != qgis.core.NULL:
+            index[str(value)] = fid
+            fid_values[fid] = str(value)
+
+    def update_value(self, vlayer: qgis.core.QgsVectorLayer, fid: int, field_idx: int, value):
+        """registers a value changed in the edit-buffer
+        :param vlayer:
+        :param fid:
+        :param field_idx: layer-field-index
+        :param value:
+        """
+        # Rev. 2023-09-12
+        if 0 <= field_idx < vlayer.fields().count():
+            key = (vlayer.id(), vlayer.fields().at(field_idx).name())
+            if key in self._indices:
+                self._set_value(key, fid, value)
+
+    def add_feature(self, vlayer: qgis.core.QgsVectorLayer, fid: int):
+        """registers the PK-values of a feature added to the edit-buffer, one query only if vlayer is indexed
+        :param vlayer:
+        :param fid:
+        """
+        # Rev. 2023-09-12
+        keys = [key for key in self._indices if key[0] == vlayer.id()]
+        if keys:
+            feature = vlayer.getFeature(fid)
+            if feature.isValid():
+                for key in keys:
+                    if feature.fields().indexOf(key[1]) >= 0:
+                        self._set_value(key, fid, feature[key[1]])
+
+    def remove_feature(self, layer_id: str, fid: int):
+        """removes the PK-values of a deleted feature
+        :param layer_id:
+        :param fid:
+        """
+        # Rev. 2023-09-12
+        for key in [key for key in self._indices if key[0] == layer_id]:
+            self._set_value(key, fid, None)
+
+    def invalidate(self, layer_id: str = None):
+        """removes all indices for layer_id, all indices if layer_id is None
+        :param layer_id:
+        """
+        # Rev. 2023-09-12
+        if layer_id is None:
+            self._indices = {}
+            self._fid_values = {}
+            self._built_modified = {}
+        else:
+            for key in [key for key in self._indices if key[0] == layer_id]:
+                del self._indices[key]
+                self._fid_values.pop(key, None)
+                self._built_modified.pop(key, None)
+
+
+class PkAllocator:
+    """next integer PK for inserts, replaces max(QgsVectorLayerUtils.getValues(...)) + 1
+    providers with a sequence as default-value-clause (PostgreSQL nextval(...)) allocate the value themselves,
+    else a counter per layer/field is initialized with QgsVectorLayer.maximumValue (provider-side MAX, edit-buffer included)
+    and kept current by the layer-signals featureAdded, attributeValueChanged and committedFeaturesAdded,
+    re-queried after each commit-attempt (before-/afterCommitChanges, failed commits included), rollBack and subsetStringChanged
+    allocated values are reserved, canceled inserts leave gaps like sequences
+    multi-user-databases without sequence: inserts of other users between two commits are not seen, a duplicate PK fails on commit
+    """
+
+    def __init__(self):
+        # key: (layer_id, field_name) value: last allocated or highest known PK
+        self._counters = {}
+
+    def get_next_pk(self, vlayer: qgis.core.QgsVectorLayer, field: qgis.core.QgsField) -> int:
+        """allocates the next PK
+        :param vlayer:
+        :param field: integer PK-field
+        """
+        # Rev. 2023-09-11
+        field_idx = vlayer.fields().indexOf(field.name())
+        if self.get_sequence_clause(vlayer, field):
+            # native sequence, evaluated by the provider, one round-trip per call
+            sequence_value = vlayer.dataProvider().defaultValue(vlayer.fields().fieldOriginIndex(field_idx))
+            if sequence_value is not None and repr(sequence_value) != 'NULL':
+                return int(sequence_value)
+
+        key = (vlayer.id(), field.name())
+        counter = self._counters.get(key)
+        if counter is None:
+            max_value = vlayer.maximumValue(field_idx)
+            counter = int(max_value) if max_value is not None and repr(max_value) != 'NULL' else 0
+        self._counters[key] = counter + 1
+        return counter + 1
+
+    @staticmethod
+    def get_sequence_clause(vlayer: qgis.core.QgsVectorLayer, field: qgis.core.QgsField) -> str:
+        """default-value-clause of a sequence-PK, f.e. nextval('table_id_seq'::regclass)
+        used as attribute-value for inserts, the provider applies the sequence in the INSERT-statement
+        :param vlayer:
+        :param field:
+        :returns empty string if the field has no sequence
+        """
+        # Rev. 2023-09-11
+        field_idx = vlayer.fields().indexOf(field.name())
+        if field_idx >= 0 and vlayer.fields().fieldOrigin(field_idx) == qgis.core.QgsFields.OriginProvider:
+            default_value_clause = vlayer.dataProvider().defaultValueClause(vlayer.fields().fieldOriginIndex(field_idx))
+            if default_value_clause.startswith('nextval('):
+                return default_value_clause
+        return ''
+
+    def _register_value(self, key: tuple, value):
+        """raises the counter if value is larger
+        :param key: (layer_id, field_name)
+        :param value: PK-value
+        """
+        # Rev. 2023-09-02
+        if key in self._counters and value is not None and repr(value) != 'NULL':
+            try:
+                self._counters[key] = max(self._counters[key], int(value))
+            except (TypeError, ValueError):
+                pass
+
+    def register_feature(self, vlayer: qgis.core.QgsVectorLayer, fid: int):
+        """registers the PKs of a feature added to the edit-buffer
+        :param vlayer:
+        :param fid:
+        """
+        # Rev. 2023-09-02
+        keys = [key for key in self._counters if key[0] == vlayer.id()]
+        if keys:
+            feature = vlayer.getFeature(fid)
+            if feature.isValid():
+                for key in keys:
+                    if feature.fields().indexOf(key[1]) >= 0:
+                        self._register_value(key, feature[key[1]])
+
+    def register_attribute_value(self, vlayer: qgis.core.QgsVectorLayer, field_idx: int, value):
+        """registers a changed PK-value
+        :param vlayer:
+        :param field_idx: layer-field-index
+        :param value:
+        """
+        # Rev. 2023-09-02
+        if 0 <= field_idx < vlayer.fields().count():
+            self._register_value((vlayer.id(), vlayer.fields().at(field_idx).name()), value)
+
+    def register_features(self, layer_id: str, features: list):
+        """registers the PKs of committed features, f.e. provider-generated autoincrement-values
+        :param layer_id:
+        :param features: list of QgsFeature
+        """
+        # Rev. 2023-09-02
+        for key in [key for key in self._counters if key[0] == layer_id]:
+            for feature in features:
+                if feature.fields().indexOf(key[1]) >= 0:
+                    self._register_value(key, feature[key[1]])
+
+    def invalidate(self, layer_id: str = None):
+        """removes the counters for layer_id, all counters if layer_id is None
+        :param layer_id:
+        """
+        # Rev. 2023-09-02
+        if layer_id is None:
+            self._counters = {}
+        else:
+            for key in [key for key in self._counters if key[0] == layer_id]:
+                del self._counters[key]
+
+
+class RefGeometry:
+    """cached Reference-geometry with precomputed length and (lazy) cumulative vertex-distances
+    replaces the repeated refLyr.getFeature(fid).geometry().length() in the mouse-move/measure/draw-paths
+    and works as linear-referencing-engine:
+    measure ➜ point, point ➜ measure and measure-range ➜ substring are located via bisect on the cumulative distances in O(log n)
+    instead of the linear QgsGeometry.interpolate/lineLocatePoint/curveSubstring
+    only for single-part linestrings, multi-part and curved geometries use the QgsGeometry-functions
+    """
+
+    def __init__(self, feature: qgis.core.QgsFeature):
+        """constructor
+        :param feature: valid Reference-feature with non-empty geometry
+        """
+        # Rev. 2023-08-17
+        self.fid = feature.id()
+        self.feature = feature
+        self.geometry = feature.geometry()
+        self.length = self.geometry.length()
+        self.is_indexed = qgis.core.QgsWkbTypes.isSingleType(self.geometry.wkbType()) and isinstance(self.geometry.constGet(), qgis.core.QgsLineString)
+        self._xs = None
+        self._ys = None
+        self._zs = None
+        self._ms = None
+        self._cum_dists = None
+        # tuple (transform, CanvasRefGeometry), see projected
+        self._projected = None
+
+    def _calc_vertices(self):
+        """coords and cumulative distances of the vertices, calculated once on first usage
+        multi-geometries: only first part, same as in MyToolFunctions.get_segment_geom
+        """
+        # Rev. 2023-08-17
+        if qgis.core.QgsWkbTypes.isSingleType(self.geometry.wkbType()):
+            curve = self.geometry.constGet()
+        else:
+            curve = self.geometry.constGet().geometryN(0)
+
+        if not isinstance(curve, qgis.core.QgsLineString):
+            # curved geometries
+            curve = curve.curveToLine()
+
+        self._xs = array.array('d', curve.xVector())
+        self._ys = array.array('d', curve.yVector())
+        # empty if no z/m
+        self._zs = array.array('d', curve.zVector())
+        self._ms = array.array('d', curve.mVector())
+        self._cum_dists = array.array('d', [0.0] * len(self._xs))
+        for i in range(1, len(self._xs)):
+            self._cum_dists[i] = self._cum_dists[i - 1] + math.hypot(self._xs[i] - self._xs[i - 1], self._ys[i] - self._ys[i - 1])
+
+        if len(self._xs) < 2:
+            self.is_indexed = False
+
+    @property
+    def xs(self) -> array.array:
+        if self._xs is None:
+            self._calc_vertices()
+        return self._xs
+
+    @property
+    def ys(self) -> array.array:
+        if self._ys is None:
+            self._calc_vertices()
+        return self._ys
+
+    @property
+    def cum_dists(self) -> array.array:
+        """cumulative 2D-distances from start-point to each vertex, cum_dists[-1] == length of the (first) part"""
+        if self._cum_dists is None:
+            self._calc_vertices()
+        return self._cum_dists
+
+    def _use_index(self) -> bool:
+        """True, if the vertex-arrays can be used, calculates them on first usage"""
+        if self.is_indexed and self._cum_dists is None:
+            self._calc_vertices()
+        return self.is_indexed
+
+    def _locate_measure(self, measure: float) -> tuple:
+        """bisect for the segment containing measure
+        :param measure: will be clamped to 0...length
+        :returns tuple (i, measure): segment from vertex i - 1 to vertex i with cum_dists[i - 1] <= measure <= cum_dists[i], clamped measure
+        """
+        # Rev. 2023-08-17
+        cum_dists = self.cum_dists
+        measure = max(0.0, min(measure, cum_dists[-1]))
+        i = bisect.bisect_left(cum_dists, measure)
+        i = max(1, min(i, len(cum_dists) - 1))
+        return i, measure
+
+    def _point_at(self, i: int, measure: float) -> qgis.core.QgsPoint:
+        """linear interpolated point on segment vertex i - 1 ➜ vertex i, including z/m
+        :param i: segment-index from _locate_measure
+        :param measure:
+        """
+        # Rev. 2023-08-17
+        seg_len = self._cum_dists[i] - self._cum_dists[i - 1]
+        fract = (measure - self._cum_dists[i - 1]) / seg_len if seg_len > 0 else 0
+        x = self._xs[i - 1] + (self._xs[i] - self._xs[i - 1]) * fract
+        y = self._ys[i - 1] + (self._ys[i] - self._ys[i - 1]) * fract
+        z = self._zs[i - 1] + (self._zs[i] - self._zs[i - 1]) * fract if self._zs else None
+        m = self._ms[i - 1] + (self._ms[i] - self._ms[i - 1]) * fract if self._ms else None
+        return qgis.core.QgsPoint(x, y, z, m)
+
+    def interpolate(self, measure: float) -> qgis.core.QgsGeometry:
+        """replacement for QgsGeometry.interpolate
+        :param measure: distance from start-point
+        """
+        # Rev. 2023-08-17
+        if self._use_index():
+            i, measure = self._locate_measure(measure)
+            return qgis.core.QgsGeometry(self._point_at(i, measure))
+        return self.geometry.interpolate(measure)
+
+    def substring(self, measure_from: float, measure_to: float) -> qgis.core.QgsGeometry:
+        """replacement for curveSubstring, used in MyToolFunctions.get_segment_geom
+        :param measure_from:
+        :param measure_to:
+        """
+        # Rev. 2023-08-17
+        if self._use_index():
+            m_from = min(measure_from, measure_to)
+            m_to = max(measure_from, measure_to)
+            i_from, measure_from = self._locate_measure(m_from)
+            i_to, measure_to = self._locate_measure(m_to)
+            points = [self._point_at(i_from, measure_from)]
+            # vertices between the two interpolated points
+            for i in range(i_from, i_to):
+                if measure_from < self._cum_dists[i] < measure_to:
+                    points.append(qgis.core.QgsPoint(self._xs[i], self._ys[i], self._zs[i] if self._zs else None, self._ms[i] if self._ms else None))
+            points.append(self._point_at(i_to, measure_to))
+            return qgis.core.QgsGeometry(qgis.core.QgsLineString(points))
+
+        if qgis.core.QgsWkbTypes.isSingleType(self.geometry.wkbType()):
+            curve = self.geometry.constGet()
+        else:
+            curve = self.geometry.constGet().geometryN(0)
+        return qgis.core.QgsGeometry(curve.curveSubstring(min(measure_from, measure_to), max(measure_from, measure_to)))
+
+    def locate_point(self, point_xy: qgis.core.QgsPointXY, near_measure: float = None, vertex_window: int = 50) -> tuple:
+        """replacement for closestSegmentWithContext + lineLocatePoint
+        :param point_xy: point in Reference-Layer-crs
+        :param near_measure: optional previous measure, f.e. during drag, then only the segments within vertex_window around this measure are checked
+        :param vertex_window: number of segments before and after near_measure
+        :returns tuple (measure, sqr_dist, side), side <0 left, >0 right, ==0 on the line, same as in closestSegmentWithContext
+        """
+        # Rev. 2023-08-17
+        if self._use_index():
+            num_vertices = len(self._cum_dists)
+            if near_measure is not None:
+                i, near_measure = self._locate_measure(near_measure)
+                i_start = max(1, i - vertex_window)
+                i_end = min(num_vertices - 1, i + vertex_window)
+            else:
+                i_start = 1
+                i_end = num_vertices - 1
+
+            result = self._closest_segment(point_xy.x(), point_xy.y(), i_start, i_end)
+            if result is not None:
+                best_i = result[3]
+                # hit on the border of the window ➜ perhaps better hit outside, check complete line
+                if (best_i > i_start or i_start == 1) and (best_i < i_end or i_end == num_vertices - 1):
+                    return result[0:3]
+                if i_start > 1 or i_end < num_vertices - 1:
+                    return self._closest_segment(point_xy.x(), point_xy.y(), 1, num_vertices - 1)[0:3]
+
+        sqr_dist, min_dist_point, next_vertex_index, side = self.geometry.closestSegmentWithContext(point_xy)
+        measure = self.geometry.lineLocatePoint(qgis.core.QgsGeometry.fromPointXY(min_dist_point))
+        return measure, sqr_dist, side
+
+    def _closest_segment(self, px: float, py: float, i_start: int, i_end: int) -> tuple | None:
+        """check segments i_start...i_end for the nearest point
+        :returns tuple (measure, sqr_dist, side, segment-index)
+        """
+        # Rev. 2023-08-17
+        xs = self._xs
+        ys = self._ys
+        best = None
+        for i in range(i_start, i_end + 1):
+            x1 = xs[i - 1]
+            y1 = ys[i - 1]
+            dx = xs[i] - x1
+            dy = ys[i] - y1
+            seg_sqr_len = dx * dx + dy * dy
+            t = ((px - x1) * dx + (py - y1) * dy) / seg_sqr_len if seg_sqr_len > 0 else 0
+            t = max(0.0, min(1.0, t))
+            nx = x1 + t * dx
+            ny = y1 + t * dy
+            sqr_dist = (px - nx) ** 2 + (py - ny) ** 2
+            if best is None or sqr_dist < best[1]:
+                cross = dx * (py - y1) - dy * (px - x1)
+                # same convention as QgsGeometryUtils::leftOfLine: <0 left, >0 right
+                side = -1 if cross > 0 else (1 if cross < 0 else 0)
+                best = (self._cum_dists[i - 1] + t * math.sqrt(seg_sqr_len), sqr_dist, side, i)
+        return best
+
+    def projected(self, transform: qgis.core.QgsCoordinateTransform) -> RefGeometry:
+        """copy with vertices transformed once into the destination-crs of transform, f.e. canvas-crs for the rubber-bands
+        cached as long as the same transform-object is used, see MyTransforms.get_transform
+        :param transform: Reference-Layer-crs ➜ canvas-crs
+        :returns self, if no transformation is necessary
+        """
+        # Rev. 2023-08-28
+        if transform.isShortCircuited():
+            return self
+        if self._projected is None or self._projected[0] is not transform:
+            self._projected = (transform, CanvasRefGeometry(self, transform))
+        return self._projected[1]
+
+
+class CanvasRefGeometry(RefGeometry):
+    """RefGeometry with vertex-coords pre-projected to another crs, created via RefGeometry.projected
+    measures stay in the units of the Reference-Layer, only the returned geometries are in the destination-crs,
+    so the draw-functions of the Map-Tools don't need to transform the reference-geometry on every mouse-move
+    z/m are not projected and dropped
+    """
+
+    def __init__(self, source: RefGeometry, transform: qgis.core.QgsCoordinateTransform):
+        """constructor
+        :param source: RefGeometry in Reference-Layer-crs
+        :param transform: Reference-Layer-crs ➜ destination-crs
+        """
+        # Rev. 2023-08-28
+        self.source = source
+        self.transform = transform
+        self.fid = source.fid
+        self.feature = source.feature
+        self.geometry = qgis.core.QgsGeometry(source.geometry)
+        self.geometry.transform(transform)
+        self.length = source.length
+        self.is_indexed = source._use_index()
+        self._xs = None
+        self._ys = None
+        self._zs = array.array('d')
+        self._ms = array.array('d')
+        self._cum_dists = None
+        self._projected = None
+        if self.is_indexed:
+            line = qgis.core.QgsLineString(list(source.xs), list(source.ys))
+            line.transform(transform)
+            self._xs = array.array('d', line.xVector())
+            self._ys = array.array('d', line.yVector())
+            # measures along the source-geometry
+            self._cum_dists = source.cum_dists
+
+    def _calc_vertices(self):
+        """vertices are calculated in the constructor, not indexed geometries use the fallbacks below"""
+        # Rev. 2023-08-28
+        self.is_indexed = False
+
+    def interpolate(self, measure: float) -> qgis.core.QgsGeometry:
+        """point in destination-crs
+        :param measure: distance from start-point in Reference-Layer-units
+        """
+        # Rev. 2023-08-28
+        if self.is_indexed:
+            return super().interpolate(measure)
+        point_geom = self.source.interpolate(measure)
+        point_geom.transform(self.transform)
+        return point_geom
+
+    def substring(self, measure_from: float, measure_to: float) -> qgis.core.QgsGeometry:
+        """segment in destination-crs
+        :param measure_from: Reference-Layer-units
+        :param measure_to: Reference-Layer-units
+        """
+        # Rev. 2023-08-28
+        if self.is_indexed:
+            return super().substring(measure_from, measure_to)
+        segment_geom = self.source.substring(measure_from, measure_to)
+        segment_geom.transform(self.transform)
+        return segment_geom
+
+    def locate_point(self, point_xy: qgis.core.QgsPointXY, near_measure: float = None, vertex_window: int = 50) -> tuple:
+        """point in destination-crs, located on the source-geometry
+        :returns tuple (measure, sqr_dist, side), sqr_dist in Reference-Layer-units
+        """
+        # Rev. 2023-08-28
+        reverse_tr = MyTransforms.get_transform(self.transform.destinationCrs(), self.transform.sourceCrs())
+        return self.source.locate_point(reverse_tr.transform(point_xy), near_measure, vertex_window)
+
+    def projected(self, transform: qgis.core.QgsCoordinateTransform) -> RefGeometry:
+        """projections always from the source-geometry"""
+        # Rev. 2023-08-28
+        return self.source.projected(transform)
+
+
+class RefGeometryCache:
+    """LRU-cache for Reference-geometries, key: (layer_id, fid), value: RefGeometry"""
+
+    def __init__(self, max_size: int = 32):
+        """constructor
+        :param max_size: max. number of cached geometries, least recently used are removed
+        """
+        # Rev. 2023-08-16
+        self.max_size = max_size
+        self._entries = collections.OrderedDict()
+
+    def get(self, vlayer: qgis.core.QgsVectorLayer, fid: int) -> RefGeometry | None:
+        """returns cached RefGeometry, queries and caches the feature if not already cached
+        :param vlayer: Reference-Layer
+        :param fid:
+        :returns None if feature not found, not valid, without or with empty geometry
+        """
+        # Rev. 2023-08-16
+        if fid is None:
+            return None
+        key = (vlayer.id(), fid)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        feature = vlayer.getFeature(fid)
+        if feature and feature.isValid() and feature.hasGeometry() and not feature.geometry().isEmpty():
+            ref_geom = RefGeometry(feature)
+            self._entries[key] = ref_geom
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+            return ref_geom
+
+    def invalidate_feature(self, layer_id: str, fid: int):
+        """removes a single cached geometry
+        :param layer_id:
+        :param fid:
+        """
+        # Rev. 2023-08-16
+        self._entries.pop((layer_id, fid), None)
+
+    def invalidate(self, layer_id: str = None):
+        """removes all cached geometries for layer_id, all geometries if layer_id is None
+        :param layer_id:
+        """
+        # Rev. 2023-08-16
+        if layer_id is None:
+            self._entries.clear()
+        else:
+            for key in [key for key in self._entries if key[0] == layer_id]:
+                del self._entries[key]
+
+
+class DisplayExpressionCache:
+    """cache for evaluated displayExpressions, key: (layer_id, expression) ➜ {fid: value}
+    each expression is prepared once with the layer-scoped context,
+    features are queried without geometry and only with the referencedColumns of the expression
+    """
+
+    def __init__(self):
+        # key: (layer_id, expression) value: [prepared QgsExpression, QgsExpressionContext]
+        self._expressions = {}
+        # key: (layer_id, expression) value: dict {fid: evaluated value}
+        self._values = {}
+        # (layer_id, expression) for which all features are cached
+        self._complete = set()
+        # key: (layer_id, expression) value: set of fids invalidated since the cache was completed
+        self._stale = {}
+
+    def get_expression(self, vlayer: qgis.core.QgsVectorLayer) -> qgis.core.QgsExpression:
+        """returns the prepared displayExpression of vlayer
+        :param vlayer:
+        """
+        # Rev. 2023-08-24
+        return self._prepare(vlayer)[0]
+
+    def _prepare(self, vlayer: qgis.core.QgsVectorLayer) -> list:
+        """prepares the current displayExpression of vlayer, once per expression
+        :param vlayer:
+        :returns [QgsExpression, QgsExpressionContext]
+        """
+        # Rev. 2023-08-24
+        key = (vlayer.id(), vlayer.displayExpression())
+        if key not in self._expressions:
+            context = qgis.core.QgsExpressionContext(qgis.core.QgsExpressionContextUtils.globalProjectLayerScopes(vlayer))
+            exp = qgis.core.QgsExpression(key[1])
+            exp.prepare(context)
+            self._expressions[key] = [exp, context]
+        return self._expressions[key]
+
+    def _request(self, vlayer: qgis.core.QgsVectorLayer, exp: qgis.core.QgsExpression) -> qgis.core.QgsFeatureRequest:
+        """feature-request with only the attributes and geometry needed by exp
+        :param vlayer:
+        :param exp:
+        """
+        # Rev. 2023-08-24
+        request = qgis.core.QgsFeatureRequest()
+        if not exp.needsGeometry():
+            request.setFlags(qgis.core.QgsFeatureRequest.NoGeometry)
+        referenced_columns = exp.referencedColumns()
+        if qgis.core.QgsFeatureRequest.ALL_ATTRIBUTES not in referenced_columns:
+            request.setSubsetOfAttributes(referenced_columns, vlayer.fields())
+        return request
+
+    def get_value(self, vlayer: qgis.core.QgsVectorLayer, feature: qgis.core.QgsFeature):
+        """returns the cached value for an already queried feature, evaluated and cached if not already cached
+        :param vlayer:
+        :param feature: must contain the referencedColumns of the displayExpression
+        """
+        # Rev. 2023-08-24
+        exp, context = self._prepare(vlayer)
+        values = self._values.setdefault((vlayer.id(), exp.expression()), {})
+        if feature.id() not in values:
+            context.setFeature(feature)
+            values[feature.id()] = exp.evaluate(context)
+        return values[feature.id()]
+
+    def get_values(self, vlayer: qgis.core.QgsVectorLayer, fids: list = None) -> dict:
+        """returns the cached values, the uncached features are queried with one request
+        :param vlayer:
+        :param fids: list of fids, None ➜ all features
+        :returns dict key: fid value: evaluated displayExpression, fids without feature are missing
+        """
+        # Rev. 2023-08-24
+        exp, context = self._prepare(vlayer)
+        key = (vlayer.id(), exp.expression())
+        values = self._values.setdefault(key, {})
+
+        request = None
+        if fids is None:
+            if key in self._complete:
+                stale_fids = self._stale.pop(key, set())
+                if stale_fids:
+                    request = self._request(vlayer, exp)
+                    request.setFilterFids(list(stale_fids))
+            else:
+                request = self._request(vlayer, exp)
+        else:
+            missing_fids = [fid for fid in fids if fid not in values]
+            if missing_fids:
+                request = self._request(vlayer, exp)
+                request.setFilterFids(missing_fids)
+
+        if request is not None:
+            for feature in vlayer.getFeatures(request):
+                context.setFeature(feature)
+                values[feature.id()] = exp.evaluate(context)
+            if fids is None:
+                self._complete.add(key)
+
+        if fids is None:
+            return dict(values)
+        return {fid: values[fid] for fid in fids if fid in values}
+
+    def invalidate_feature(self, layer_id: str, fid: int):
+        """removes the cached values of a single feature, f.e. after attributeValueChanged
+        :param layer_id:
+        :param fid:
+        """
+        # Rev. 2023-08-24
+        for key, values in self._values.items():
+            if key[0] == layer_id:
+                values.pop(fid, None)
+                if key in self._complete:
+                    self._stale.setdefault(key, set()).add(fid)
+
+    def invalidate(self, layer_id: str = None):
+        """removes all cached values and expressions for layer_id, all if layer_id is None
+        :param layer_id:
+        """
+        # Rev. 2023-08-24
+        if layer_id is None:
+            self._expressions = {}
+            self._values = {}
+            self._complete = set()
+            self._stale = {}
+        else:
+            for cache in [self._expressions, self._values, self._stale]:
+                for key in [key for key in cache if key[0] == layer_id]:
+                    del cache[key]
+            self._complete = set(key for key in self._complete if key[0] != layer_id)
+
+
+class ReferenceListCache:
+    """cache for the rows of the Reference-Layer-list (QComboBoxN qcbn_snapped_ref_fid in the dialogs)
+    key: (layer_id, displayExpression) value: dict {fid: [evaluated displayExpression, length of geometry]}
+    filled by ReferenceListTask, geometries are only queried on the first listing and for edited features
+    """
+
+    def __init__(self):
+        # key: (layer_id, expression) value: dict {fid: [display_value, length]}
+        self._rows = {}
+        # (layer_id, expression) for which all features are cached
+        self._complete = set()
+        # key: (layer_id, expression) value: set of fids invalidated since the cache was completed
+        self._stale = {}
+        # key: layer_id value: incremented with each invalidation, rows queried by a task started before are not cached
+        self._generations = {}
+
+    def generation(self, layer_id: str) -> int:
+        """current generation of layer_id, see update
+        :param layer_id:
+        """
+        # Rev. 2023-08-26
+        return self._generations.get(layer_id, 0)
+
+    def get_rows(self, vlayer: qgis.core.QgsVectorLayer) -> dict | None:
+        """returns a copy of the cached rows, if all features are cached, stale rows are re-queried
+        :param vlayer:
+        :returns None if the rows are not completely cached
+        """
+        # Rev. 2023-08-26
+        key = (vlayer.id(), vlayer.displayExpression())
+        if key not in self._complete:
+            return None
+        rows = self._rows[key]
+        stale_fids = list(self._stale.pop(key, set()))
+        if stale_fids:
+            display_values = display_expression_cache.get_values(vlayer, stale_fids)
+            request = qgis.core.QgsFeatureRequest()
+            request.setNoAttributes()
+            request.setFilterFids(stale_fids)
+            for feature in vlayer.getFeatures(request):
+                length = feature.geometry().length() if feature.hasGeometry() else None
+                rows[feature.id()] = [display_values.get(feature.id()), length]
+        return dict(rows)
+
+    def update(self, layer_id: str, expression: str, generation: int, rows: dict):
+        """stores the complete rows queried by a ReferenceListTask
+        :param layer_id:
+        :param expression: displayExpression at start of the task
+        :param generation: generation at start of the task, rows are discarded if the layer was invalidated meanwhile
+        :param rows: dict {fid: [display_value, length]}
+        """
+        # Rev. 2023-08-26
+        if generation == self.generation(layer_id):
+            key = (layer_id, expression)
+            self._rows[key] = rows
+            self._complete.add(key)
+            self._stale.pop(key, None)
+
+    def invalidate_feature(self, layer_id: str, fid: int):
+        """removes the cached row of a single feature, re-queried with the next get_rows
+        :param layer_id:
+        :param fid:
+        """
+        # Rev. 2023-08-26
+        self._generations[layer_id] = self.generation(layer_id) + 1
+        for key, rows in self._rows.items():
+            if key[0] == layer_id:
+                rows.pop(fid, None)
+                if key in self._complete:
+                    self._stale.setdefault(key, set()).add(fid)
+
+    def invalidate(self, layer_id: str = None):
+        """removes all cached rows for layer_id, all rows if layer_id is None
+        :param layer_id:
+        """
+        # Rev. 2023-08-26
+        if layer_id is None:
+            for generation_layer_id in self._generations:
+                self._generations[generation_layer_id] += 1
+            self._rows = {}
+            self._complete = set()
+            self._stale = {}
+        else:
+            self._generations[layer_id] = self.generation(layer_id) + 1
+            for cache in [self._rows, self._stale]:
+                for key in [key for key in cache if key[0] == layer_id]:
+                    del cache[key]
+            self._complete = set(key for key in self._complete if key[0] != layer_id)
+
+
+class ReferenceListTask(qgis.core.QgsTask):
+    """background-task for the Reference-Layer-list, streams the rows in batches via signal rows_fetched
+    cached rows are emitted without query, else the features are queried from a QgsVectorLayerFeatureSource in the worker-thread,
+    the complete result is stored in the ReferenceListCache
+    """
+    # dict {fid: [evaluated displayExpression, length of geometry]}, emitted per batch, received in the main-thread
+    rows_fetched = QtCore.pyqtSignal(dict)
+
+    def __init__(self, vlayer: qgis.core.QgsVectorLayer, batch_size: int = 1000):
+        """constructor, must be called in the main-thread
+        :param vlayer: Reference-Layer
+        :param batch_size: number of rows per rows_fetched-signal
+        """
+        # Rev. 2023-08-26
+        super().__init__(f"LinearReferencing: list {vlayer.name()}", qgis.core.QgsTask.CanCancel)
+        self.layer_id = vlayer.id()
+        self.expression = vlayer.displayExpression()
+        self.generation = reference_list_cache.generation(self.layer_id)
+        self.batch_size = batch_size
+        self.cached_rows = reference_list_cache.get_rows(vlayer)
+        self.fetched_rows = {}
+        if self.cached_rows is None:
+            self.num_features = max(vlayer.featureCount(), 1)
+            self.source = qgis.core.QgsVectorLayerFeatureSource(vlayer)
+            self.context = qgis.core.QgsExpressionContext(qgis.core.QgsExpressionContextUtils.globalProjectLayerScopes(vlayer))
+            self.exp = qgis.core.QgsExpression(self.expression)
+            self.exp.prepare(self.context)
+            self.request = qgis.core.QgsFeatureRequest()
+            referenced_columns = self.exp.referencedColumns()
+            if qgis.core.QgsFeatureRequest.ALL_ATTRIBUTES not in referenced_columns:
+                self.request.setSubsetOfAttributes(referenced_columns, vlayer.fields())
+
+    def run(self) -> bool:
+        """worker-thread, no access to layers or widgets"""
+        # Rev. 2023-08-26
+        if self.cached_rows is not None:
+            rows = list(self.cached_rows.items())
+            for batch_start in range(0, len(rows), self.batch_size):
+                if self.isCanceled():
+                    return False
+                self.rows_fetched.emit(dict(rows[batch_start:batch_start + self.batch_size]))
+            return True
+
+        batch = {}
+        for feature in self.source.getFeatures(self.request):
+            if self.isCanceled():
+                return False
+            self.context.setFeature(feature)
+            length = feature.geometry().length() if feature.hasGeometry() else None
+            batch[feature.id()] = [self.exp.evaluate(self.context), length]
+            if len(batch) >= self.batch_size:
+                self.fetched_rows.update(batch)
+                self.rows_fetched.emit(batch)
+                self.setProgress(100 * len(self.fetched_rows) / self.num_features)
+                batch = {}
+        if batch:
+            self.fetched_rows.update(batch)
+            self.rows_fetched.emit(batch)
+        return True
+
+    def finished(self, result: bool):
+        """main-thread, caches the complete result
+        :param result: return-value of run, False if canceled
+        """
+        # Rev. 2023-08-26
+        if result and self.cached_rows is None:
+            reference_list_cache.update(self.layer_id, self.expression, self.generation, self.fetched_rows)
+
+
+# module-wide instances, shared by PolEvt and LolEvt
+pk_fid_index = PkFidIndex()
+pk_allocator = PkAllocator()
+ref_geometry_cache = RefGeometryCache()
+display_expression_cache = DisplayExpressionCache()
+reference_list_cache = ReferenceListCache()
+
+
+def get_feature_by_pk(vlayer: qgis.core.QgsVectorLayer, field: qgis.core.QgsField, value: str | int, request: qgis.core.QgsFeatureRequest = None) -> qgis.core.QgsFeature | None:
+    """indexed replacement for MyToolFunctions.get_feature_by_value
+    sample:
+    found_feature = get_feature_by_pk(iface.activeLayer(),iface.activeLayer().fields()[0],1)
+    :param request: optional, f.e. from MyToolFunctions.get_attribute_request, must include field
+    """
+    # Rev. 2023-08-25
+    return pk_fid_index.get_feature(vlayer, field, value, request)
+
+
+def get_features_by_pks(vlayer: qgis.core.QgsVectorLayer, field: qgis.core.QgsField, values: list, request: qgis.core.QgsFeatureRequest = None) -> dict:
+    """indexed bulk-replacement for MyToolFunctions.get_features_by_values
+    sample:
+    found_features = get_features_by_pks(iface.activeLayer(),iface.activeLayer().fields()[0],[1,2,3])
+    :param request: optional, f.e. from MyToolFunctions.get_attribute_request, must include field
+    :returns dict key: value value: feature, values without feature are missing
+    """
+    # Rev. 2023-08-25
+    return pk_fid_index.get_features(vlayer, field, values, request)
+
+
+def invalidate_layer(layer_id: str = None, *args):
+    """slot for layer-signals (afterCommitChanges, featureAdded, featureDeleted...)
+    removes all cached data for layer_id
+    :param layer_id:
+    :param args: signal-arguments, f.e. fid from featureAdded, unused
+    """
+    # Rev. 2023-08-16
+    pk_fid_index.invalidate(layer_id)
+    ref_geometry_cache.invalidate(layer_id)
+    display_expression_cache.invalidate(layer_id)
+    reference_list_cache.invalidate(layer_id)
+
+
+def get_next_pk(vlayer: qgis.core.QgsVectorLayer, field: qgis.core.QgsField) -> int:
+    """constant-time replacement for max(QgsVectorLayerUtils.getValues(vlayer, field.name())[0]) + 1
+    sample:
+    new_pk = get_next_pk(iface.activeLayer(),iface.activeLayer().fields()[0])
+    :param field: integer PK-field
+    """
+    # Rev. 2023-09-02
+    return pk_allocator.get_next_pk(vlayer, field)
+
+
+def get_sequence_clause(vlayer: qgis.core.QgsVectorLayer, field: qgis.core.QgsField) -> str:
+    """sequence-default-clause as PK-value for bulk-inserts, allocated by the provider on insert without a round-trip per row
+    sample:
+    pk_value = get_sequence_clause(vlayer, pk_field) or get_next_pk(vlayer, pk_field)
+    :param field: integer PK-field
+    :returns empty string if the field has no sequence
+    """
+    # Rev. 2023-09-11
+    return pk_allocator.get_sequence_clause(vlayer, field)
+
+
+def update_pk_index(vlayer: qgis.core.QgsVectorLayer, fid: int, field_idx: int, value):
+    """slot for layer-signal attributeValueChanged, PK-values changed in the edit-buffer are found by get_feature_by_pk/get_features_by_pks
+    :param vlayer:
+    :param fid:
+    :param field_idx:
+    :param value:
+    """
+    # Rev. 2023-09-11
+    pk_fid_index.update_value(vlayer, fid, field_idx, value)
+
+
+def add_pk_index_feature(vlayer: qgis.core.QgsVectorLayer, fid: int, *args):
+    """slot for layer-signal featureAdded, the added feature is found by get_feature_by_pk/get_features_by_pks without rebuild of the index
+    :param vlayer:
+    :param fid:
+    :param args: signal-arguments, unused
+    """
+    # Rev. 2023-09-12
+    pk_fid_index.add_feature(vlayer, fid)
+
+
+def remove_pk_index_feature(layer_id: str, fid: int, *args):
+    """slot for layer-signal featureDeleted, removes the PK-values of the deleted feature from the index
+    :param layer_id:
+    :param fid:
+    :param args: signal-arguments, unused
+    """
+    # Rev. 2023-09-12
+    pk_fid_index.remove_feature(layer_id, fid)
+
+
+def register_pk_feature(vlayer: qgis.core.QgsVectorLayer, fid: int, *args):
+    """slot for layer-signal featureAdded
+    :param vlayer:
+    :param fid:
+    :param args: signal-arguments, unused
+    """
+    # Rev. 2023-09-02
+    pk_allocator.register_feature(vlayer, fid)
+
+
+def register_pk_value(vlayer: qgis.core.QgsVectorLayer, fid: int, field_idx: int, value):
+    """slot for layer-signal attributeValueChanged
+    :param vlayer:
+    :param fid: unused
+    :param field_idx:
+    :param value:
+    """
+    # Rev. 2023-09-02
+    pk_allocator.register_attribute_value(vlayer, field_idx, value)
+
+
+def register_committed_pks(layer_id: str, features: list):
+    """slot for layer-signal committedFeaturesAdded
+    :param layer_id:
+    :param features:
+    """
+    # Rev. 2023-09-02
+    pk_allocator.register_features(layer_id, features)
+
+
+def invalidate_pks(layer_id: str = None, *args):
+    """slot for layer-signals beforeCommitChanges, afterCommitChanges, afterRollBack and subsetStringChanged, after provider-level inserts
+    next get_next_pk re-queries the maximum
+    :param layer_id:
+    :param args: signal-arguments, f.e. stopEditing from beforeCommitChanges, unused
+    """
+    # Rev. 2023-09-12
+    pk_allocator.invalidate(layer_id)
+
+
+def get_ref_geometry(vlayer: qgis.core.QgsVectorLayer, fid: int) -> RefGeometry | None:
+    """cached Reference-geometry
+    sample:
+    ref_geom = get_ref_geometry(iface.activeLayer(),1)
+    ref_geom.geometry.interpolate(ref_geom.length / 2)
+    :returns None if feature not found, not valid, without or with empty geometry
+    """
+    # Rev. 2023-08-16
+    return ref_geometry_cache.get(vlayer, fid)
+
+
+def invalidate_feature(layer_id: str, fid: int, *args):
+    """slot for layer-signals geometryChanged and featureDeleted
+    removes the cached geometry for this feature
+    :param layer_id:
+    :param fid:
+    :param args: signal-arguments, f.e. the new geometry from geometryChanged, unused
+    """
+    # Rev. 2023-08-16
+    ref_geometry_cache.invalidate_feature(layer_id, fid)
+    reference_list_cache.invalidate_feature(layer_id, fid)
+
+
+def get_display_expression(vlayer: qgis.core.QgsVectorLayer) -> qgis.core.QgsExpression:
+    """prepared displayExpression, f.e. for isField() and referencedColumns()
+    sample:
+    exp = get_display_expression(iface.activeLayer())
+    """
+    # Rev. 2023-08-24
+    return display_expression_cache.get_expression(vlayer)
+
+
+def get_display_value(vlayer: qgis.core.QgsVectorLayer, feature: qgis.core.QgsFeature):
+    """cached displayExpression-value of an already queried feature
+    sample:
+    get_display_value(iface.activeLayer(), iface.activeLayer().getFeature(1))
+    """
+    # Rev. 2023-08-24
+    return display_expression_cache.get_value(vlayer, feature)
+
+
+def get_display_values(vlayer: qgis.core.QgsVectorLayer, fids: list = None) -> dict:
+    """cached displayExpression-values, uncached features are queried with one geometry-less request
+    sample:
+    display_values = get_display_values(iface.activeLayer())
+    :param fids: list of fids, None ➜ all features
+    :returns dict key: fid value: evaluated displayExpression
+    """
+    # Rev. 2023-08-24
+    return display_expression_cache.get_values(vlayer, fids)
+
+
+def invalidate_display_value(layer_id: str, fid: int, *args):
+    """slot for layer-signals attributeValueChanged, featureAdded and featureDeleted
+    removes the cached displayExpression-values for this feature, re-queried if the cache was complete
+    :param layer_id:
+    :param fid:
+    :param args: signal-arguments, field-index and new value from attributeValueChanged, unused
+    """
+    # Rev. 2023-09-12
+    display_expression_cache.invalidate_feature(layer_id, fid)
+    reference_list_cache.invalidate_feature(layer_id, fid)
+
+
+def invalidate_display_values(layer_id: str, *args):
+    """slot for layer-signals displayExpressionChanged and afterRollBack
+    removes all cached displayExpression-values for layer_id
+    :param layer_id:
+    :param args: signal-arguments, unused
+    """
+    # Rev. 2023-08-24
+    display_expression_cache.invalidate(layer_id)
+    reference_list_cache.invalidate(layer_id)
@@ -0,0 +1,397 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+********************************************************************
+
+* Part of the QGis-Plugin LinearReferencing:
+* per-route measure-interval-index for LoL-features
+
+.. note::
+    * import to console from Path (LinearReferencing-plugin-folder in current QGis-Profile-Folder)
+    * or use: import LinearReferencing.tools.MyMeasureIndex
+    * overlap-, stab- and nearest-queries on the measure-ranges of one Reference-id in O(log n + k)
+      instead of iterating the Data-Layer with filter-expressions
+    * only Data-Layer-attributes, no geometries: independent from Reference- and Show-Layer
+    * changed features are marked by the layer-signals connected in LolEvt and re-read lazily on the next query
+
+sample:
+    measure_index = LinearReferencing.tools.MyMeasureIndex.MeasureIntervalIndex(data_layer, 'fid', 'line_ref_id', 'measure_from', 'measure_to')
+    measure_index.overlap(4711, 100, 250)
+    measure_index.stab(4711, 1234.5)
+    measure_index.nearest(4711, 1234.5)
+
+********************************************************************
+
+* Date                 : 2023-09-04
+* Copyright            : (C) 2023 by Ludwig Kniprath
+* Email                : ludwig at kni minus online dot de
+
+********************************************************************
+
+this program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+********************************************************************
+"""
+from __future__ import annotations
+import bisect
+import qgis
+from qgis import core
+
+
+class IntervalTree:
+    """static centered interval-tree over the measure-ranges of one Reference-id
+    every node keeps the intervals containing its center, sorted by start ascending and by end descending,
+    left/right subtrees the intervals completely below/above the center
+    """
+
+    def __init__(self, intervals: list):
+        """constructor
+        :param intervals: list of tuples (start, end, fid) with start <= end
+        """
+        # Rev. 2023-09-04
+        # node: list [center, by_start, by_end, left_node, right_node]
+        self.root = self._build(intervals)
+        # for nearest: intervals sorted by start and by end
+        self.by_start = sorted(intervals, key=lambda interval: interval[0])
+        self.starts = [interval[0] for interval in self.by_start]
+        self.by_end = sorted(intervals, key=lambda interval: interval[1])
+        self.ends = [interval[1] for interval in self.by_end]
+
+    def _build(self, intervals: list) -> list | None:
+        """builds the tree non-recursive, the depth is O(log n) anyway, but long routes with many short events must not hit the recursion-limit
+        :param intervals:
+        """
+        # Rev. 2023-09-04
+        if not intervals:
+            return None
+        root = [None, None, None, None, None]
+        stack = [(root, intervals)]
+        while stack:
+            node, node_intervals = stack.pop()
+            endpoints = sorted([interval[0] for interval in node_intervals] + [interval[1] for interval in node_intervals])
+            center = endpoints[len(endpoints) // 2]
+            left = []
+            right = []
+            centered = []
+            for interval in node_intervals:
+                if interval[1] < center:
+                    left.append(interval)
+                elif interval[0] > center:
+                    right.append(interval)
+                else:
+                    centered.append(interval)
+            node[0] = center
+            node[1] = sorted(centered, key=lambda interval: interval[0])
+            node[2] = sorted(centered, key=lambda interval: interval[1], reverse=True)
+            if left:
+                node[3] = [None, None, None, None, None]
+                stack.append((node[3], left))
+            if right:
+                node[4] = [None, None, None, None, None]
+                stack.append((node[4], right))
+        return root
+
+    def overlap(self, start: float, end: float) -> list:
+        """intervals overlapping or touching [start, end]
+        :param start:
+        :param end:
+        :returns list of tuples (start, end, fid)
+        """
+        # Rev. 2023-09-04
+        result = []
+        stack = [self.root] if self.root else []
+        while stack:
+            center, by_start, by_end, left_node, right_node = stack.pop()
+            if end < center:
+                # all centered intervals end >= center > end, overlapping if start <= end
+                for interval in by_start:
+                    if interval[0] > end:
+                        break
+                    result.append(interval)
+                if left_node:
+                    stack.append(left_node)
+            elif start > center:
+                # all centered intervals start <= center < start, overlapping if end >= start
+                for interval in by_end:
+                    if interval[1] < start:
+                        break
+                    result.append(interval)
+                if right_node:
+                    stack.append(right_node)
+            else:
+                result.extend(by_start)
+                if left_node:
+                    stack.append(left_node)
+                if right_node:
+                    stack.append(right_node)
+        return result
+
+    def nearest(self, measure: float) -> tuple | None:
+        """interval with the smallest distance to measure, 0 for intervals containing measure
+        :param measure:
+        :returns tuple (start, end, fid, distance) or None if empty
+        """
+        # Rev. 2023-09-04
+        stabbed = self.overlap(measure, measure)
+        if stabbed:
+            return stabbed[0] + (0,)
+        candidates = []
+        # first interval starting behind and last interval ending before measure
+        i = bisect.bisect_right(self.starts, measure)
+        if i < len(self.by_start):
+            candidates.append(self.by_start[i] + (self.by_start[i][0] - measure,))
+        i = bisect.bisect_left(self.ends, measure)
+        if i > 0:
+            candidates.append(self.by_end[i - 1] + (measure - self.by_end[i - 1][1],))
+        if candidates:
+            return min(candidates, key=lambda candidate: candidate[3])
+
+
+class MeasureIntervalIndex:
+    """one IntervalTree per Reference-id, built from the From-/To-measure-fields of the Data-Layer
+    the trees are built lazily per Reference-id on first query
+    """
+
+    def __init__(self, data_layer: qgis.core.QgsVectorLayer, data_id_field_name: str, data_reference_field_name: str, measure_from_field_name: str, measure_to_field_name: str):
+        """constructor
+        :param data_layer:
+        :param data_id_field_name:
+        :param data_reference_field_name:
+        :param measure_from_field_name:
+        :param measure_to_field_name:
+        """
+        # Rev. 2023-09-04
+        self.data_layer = data_layer
+        self.data_layer_id = data_layer.id()
+        self.data_id_field_name = data_id_field_name
+        self.data_reference_field_name = data_reference_field_name
+        self.measure_from_field_name = measure_from_field_name
+        self.measure_to_field_name = measure_to_field_name
+        # key: Data-fid value: tuple (Reference-id, start, end, PK)
+        self.entries = {}
+        # key: Reference-id value: set of Data-fids
+        self.fids_by_ref_id = {}
+        # key: Reference-id value: IntervalTree, removed if outdated
+        self.trees = {}
+        self.dirty_fids = set()
+        self.rebuild_needed = True
+
+    @property
+    def key(self) -> tuple:
+        """identifies the configuration, a changed configuration needs a new index"""
+        return (
+            self.data_layer.id(),
+            self.data_id_field_name,
+            self.data_reference_field_name,
+            self.measure_from_field_name,
+            self.measure_to_field_name
+        )
+
+    def _read_entries(self, fids: list = None) -> dict:
+        """queries the Data-features
+        :param fids: None ➜ all Data-features
+        :returns dict key: Data-fid value: tuple (Reference-id, start, end, PK), features without Reference-id or with NULL-measures are skipped
+        """
+        # Rev. 2023-09-04
+        request = qgis.core.QgsFeatureRequest()
+        request.setFlags(qgis.core.QgsFeatureRequest.NoGeometry)
+        request.setSubsetOfAttributes([self.data_id_field_name, self.data_reference_field_name, self.measure_from_field_name, self.measure_to_field_name], self.data_layer.fields())
+        if fids is not None:
+            request.setFilterFids(fids)
+        entries = {}
+        for data_feature in self.data_layer.getFeatures(request):
+            ref_id = data_feature[self.data_reference_field_name]
+            measure_from = data_feature[self.measure_from_field_name]
+            measure_to = data_feature[self.measure_to_field_name]
+            if ref_id is None or ref_id == qgis.core.NULL or measure_from is None or measure_from == qgis.core.NULL or measure_to is None or measure_to == qgis.core.NULL:
+                continue
+            try:
+                measure_from = float(measure_from)
+                measure_to = float(measure_to)
+            except (TypeError, ValueError):
+                continue
+            # LoL-features may be digitized against the line-direction
+            entries[data_feature.id()] = (ref_id, min(measure_from, measure_to), max(measure_from, measure_to), data_feature[self.data_id_field_name])
+        return entries
+
+    def _add_entries(self, entries: dict):
+        """adds entries, the trees of the affected Reference-ids are re-built on the next query
+        :param entries: from _read_entries
+        """
+        # Rev. 2023-09-04
+        for fid, entry in entries.items():
+            self.entries[fid] = entry
+            self.fids_by_ref_id.setdefault(entry[0], set()).add(fid)
+            self.trees.pop(entry[0], None)
+
+    def _remove_entry(self, fid: int):
+        """removes a Data-feature
+        :param fid:
+        """
+        # Rev. 2023-09-04
+        entry = self.entries.pop(fid, None)
+        if entry is not None:
+            self.fids_by_ref_id.get(entry[0], set()).discard(fid)
+            self.trees.pop(entry[0], None)
+
+    def build(self):
+        """(re-)reads all Data-features"""
+        # Rev. 2023-09-04
+        self.entries = {}
+        self.fids_by_ref_id = {}
+        self.trees = {}
+        self._add_entries(self._read_entries())
+        self.dirty_fids = set()
+        self.rebuild_needed = False
+
+    def ensure_current(self):
+        """full build or re-read of the marked Data-features"""
+        # Rev. 2023-09-04
+        if self.rebuild_needed:
+            self.build()
+        elif self.dirty_fids:
+            fids = list(self.dirty_fids)
+            for fid in fids:
+                self._remove_entry(fid)
+            # removed fids are not returned
+            self._add_entries(self._read_entries(fids))
+            self.dirty_fids = set()
+
+    def get_tree(self, ref_id) -> IntervalTree | None:
+        """current IntervalTree for ref_id
+        :param ref_id: value of the Reference-field
+        :returns None if no Data-features on this Reference-id
+        """
+        # Rev. 2023-09-04
+        self.ensure_current()
+        tree = self.trees.get(ref_id)
+        if tree is None:
+            fids = self.fids_by_ref_id.get(ref_id)
+            if fids:
+                tree = IntervalTree([(self.entries[fid][1], self.entries[fid][2], fid) for fid in fids])
+                self.trees[ref_id] = tree
+        return tree
+
+    def _result(self, intervals: list) -> list:
+        """converts tree-intervals into result-tuples sorted by start
+        :param intervals: list of tuples (start, end, fid)
+        :returns list of tuples (fid, PK, start, end)
+        """
+        # Rev. 2023-09-04
+        return [(fid, self.entries[fid][3], start, end) for start, end, fid in sorted(intervals)]
+
+    def overlap(self, ref_id, start: float, end: float) -> list:
+        """LoL-features on ref_id overlapping or touching the measure-range [start, end]
+        :param ref_id: value of the Reference-field
+        :param start:
+        :param end:
+        :returns list of tuples (fid, PK, start, end) sorted by start
+        """
+        # Rev. 2023-09-04
+        tree = self.get_tree(ref_id)
+        if tree is None:
+            return []
+        return self._result(tree.overlap(min(start, end), max(start, end)))
+
+    def contained(self, ref_id, start: float, end: float) -> list:
+        """LoL-features on ref_id completely within the measure-range [start, end]
+        :param ref_id:
+        :param start:
+        :param end:
+        :returns list of tuples (fid, PK, start, end) sorted by start
+        """
+        # Rev. 2023-09-04
+        start, end = min(start, end), max(start, end)
+        return [result for result in self.overlap(ref_id, start, end) if result[2] >= start and result[3] <= end]
+
+    def stab(self, ref_id, measure: float) -> list:
+        """LoL-features on ref_id at station measure
+        :param ref_id:
+        :param measure:
+        :returns list of tuples (fid, PK, start, end) sorted by start
+        """
+        # Rev. 2023-09-04
+        return self.overlap(ref_id, measure, measure)
+
+    def nearest(self, ref_id, measure: float) -> tuple | None:
+        """LoL-feature on ref_id nearest to station measure
+        :param ref_id:
+        :param measure:
+        :returns tuple (fid, PK, start, end, distance) or None if no Data-features on this Reference-id
+        """
+        # Rev. 2023-09-04
+        tree = self.get_tree(ref_id)
+        if tree is not None:
+            nearest = tree.nearest(measure)
+            if nearest:
+                start, end, fid, distance = nearest
+                return fid, self.entries[fid][3], start, end, distance
+
+    def mark_dirty(self, fid: int):
+        """Data-feature added, changed or deleted
+        :param fid:
+        """
+        # Rev. 2023-09-04
+        self.dirty_fids.add(fid)
+
+    def mark_committed(self, features: list):
+        """committed Data-features get new fids, the temporary (negative) fids of the edit-buffer are obsolete
+        :param features: committed features with their new fids
+        """
+        # Rev. 2023-09-04
+        self.dirty_fids.update(feature.id() for feature in features)
+        self.dirty_fids.update(fid for fid in self.entries if fid < 0)
+
+
+# module-wide registry, key: Data-Layer-id, value: MeasureIntervalIndex
+_measure_indices = {}
+
+
+def get_measure_index(data_layer: qgis.core.QgsVectorLayer, data_id_field_name: str, data_reference_field_name: str, measure_from_field_name: str, measure_to_field_name: str) -> MeasureIntervalIndex:
+    """returns the registered index for data_layer, creates a new one if not registered or the configuration has changed
+    parameters see MeasureIntervalIndex
+    """
+    # Rev. 2023-09-04
+    measure_index = MeasureIntervalIndex(data_layer, data_id_field_name, data_reference_field_name, measure_from_field_name, measure_to_field_name)
+    registered = _measure_indices.get(data_layer.id())
+    if registered is not None and registered.key == measure_index.key:
+        return registered
+    _measure_indices[data_layer.id()] = measure_index
+    return measure_index
+
+
+def mark_dirty(layer_id: str, fid: int, *args):
+    """slot for Data-Layer-signals featureAdded, featureDeleted and attributeValueChanged
+    :param layer_id:
+    :param fid:
+    :param args: signal-arguments, unused
+    """
+    # Rev. 2023-09-04
+    measure_index = _measure_indices.get(layer_id)
+    if measure_index is not None:
+        measure_index.mark_dirty(fid)
+
+
+def mark_committed(layer_id: str, features: list):
+    """slot for Data-Layer-signal committedFeaturesAdded
+    :param layer_id:
+    :param features:
+    """
+    # Rev. 2023-09-04
+    measure_index = _measure_indices.get(layer_id)
+    if measure_index is not None:
+        measure_index.mark_committed(features)
+
+
+def invalidate_measures(layer_id: str = None, *args):
+    """slot for afterRollBack and subsetStringChanged of the Data-Layer, after provider-level inserts
+    :param layer_id: None ➜ all indices
+    :param args: signal-arguments, unused
+    """
+    # Rev. 2023-09-04
+    for measure_index in _measure_indices.values():
+        if layer_id is None or layer_id == measure_index.data_layer_id:
+            measure_index.rebuild_needed = True
@@ -0,0 +1,278 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+********************************************************************
+
+* Part of the QGis-Plugin LinearReferencing:
+* dynamic segmentation: overlay of two LoL-Data-Layers on the same Reference-Layer
+
+.. note::
+    * import to console from Path (LinearReferencing-plugin-folder in current QGis-Profile-Folder)
+    * or use: import LinearReferencing.tools.MyOverlay
+    * sweep-line over the sorted From-/To-measures per Reference-id, linear in the number of endpoints and result-segments after sorting:
+      per endpoint only the A-/B-combinations of the started and ended fids are opened/closed,
+      all open combinations only if the type of combination changes (f.e. union: A only ➜ A and B), which closes all of them anyway
+    * operations:
+        intersection ➜ segments covered by A and B, one segment per overlapping pair
+        union ➜ all segments covered by A or B, splitted at every endpoint, attributes of the covering A- and/or B-features
+        difference ➜ segments covered by A but not by B
+    * LoL-features with From == To have no length and are skipped
+
+sample:
+    LinearReferencing.tools.MyOverlay.overlay_intervals([(0, 100, 1)], [(50, 150, 7)], 'intersection')
+    ➜ [(50, 100, 1, 7)]
+
+********************************************************************
+
+* Date                 : 2023-09-05
+* Copyright            : (C) 2023 by Ludwig Kniprath
+* Email                : ludwig at kni minus online dot de
+
+********************************************************************
+
+this program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+********************************************************************
+"""
+from __future__ import annotations
+import qgis
+from qgis import core
+from PyQt5 import QtCore
+
+operations = ['intersection', 'union', 'difference']
+
+
+def _get_keys(active_a: dict, active_b: dict, operation: str) -> list:
+    """combinations of A- and B-fids covering the current elementary segment
+    :param active_a: A-fids covering the segment, dict used as ordered set
+    :param active_b: B-fids covering the segment
+    :param operation: see operations
+    :returns list of tuples (a_fid|None, b_fid|None)
+    """
+    # Rev. 2023-09-05
+    if active_a and active_b:
+        if operation in ['intersection', 'union']:
+            return [(a_fid, b_fid) for a_fid in active_a for b_fid in active_b]
+    elif active_a:
+        if operation in ['union', 'difference']:
+            return [(a_fid, None) for a_fid in active_a]
+    elif active_b:
+        if operation == 'union':
+            return [(None, b_fid) for b_fid in active_b]
+    return []
+
+
+def overlay_intervals(a_intervals: list, b_intervals: list, operation: str) -> list:
+    """sweep-line-overlay of the measure-ranges of two LoL-tables on one Reference-line
+    consecutive elementary segments with the same A-/B-combination are merged
+    :param a_intervals: list of tuples (start, end, fid) with start <= end
+    :param b_intervals: list of tuples (start, end, fid) with start <= end
+    :param operation: see operations
+    :returns list of tuples (start, end, a_fid|None, b_fid|None) sorted by start
+    """
+    # Rev. 2023-09-12
+    # tuples (measure, is_start, is_b, fid)
+    endpoints = []
+    for is_b, intervals in enumerate([a_intervals, b_intervals]):
+        for start, end, fid in intervals:
+            if end > start:
+                endpoints.append((start, True, is_b, fid))
+                endpoints.append((end, False, is_b, fid))
+    endpoints.sort(key=lambda endpoint: endpoint[0])
+
+    active = ({}, {})
+    # key: tuple (a_fid, b_fid) value: start of the open segment
+    open_segments = {}
+    segments = []
+    i = 0
+    while i < len(endpoints):
+        measure = endpoints[i][0]
+        prev_mode = (bool(active[0]), bool(active[1]))
+        # fids started/ended at this measure per side
+        added = ({}, {})
+        removed = ({}, {})
+        # all endpoints at this measure, the segments are half-open [start, end)
+        while i < len(endpoints) and endpoints[i][0] == measure:
+            measure, is_start, is_b, fid = endpoints[i]
+            if is_start:
+                active[is_b][fid] = None
+                added[is_b][fid] = None
+            else:
+                active[is_b].pop(fid, None)
+                removed[is_b][fid] = None
+            i += 1
+
+        if (bool(active[0]), bool(active[1])) != prev_mode:
+            # other type of combination ➜ all open segments end
+            closed_keys = list(open_segments)
+            opened_keys = _get_keys(active[0], active[1], operation)
+        else:
+            # only the combinations with the ended/started fids, previous active fids = current - added + removed
+            closed_keys = set()
+            if removed[0]:
+                prev_b = {fid: None for fid in active[1] if fid not in added[1]}
+                prev_b.update(removed[1])
+                closed_keys.update(_get_keys(removed[0], prev_b, operation))
+            if removed[1]:
+                prev_a = {fid: None for fid in active[0] if fid not in added[0]}
+                prev_a.update(removed[0])
+                closed_keys.update(_get_keys(prev_a, removed[1], operation))
+            opened_keys = set()
+            if added[0]:
+                opened_keys.update(_get_keys(added[0], active[1], operation))
+            if added[1]:
+                opened_keys.update(_get_keys(active[0], added[1], operation))
+
+        for key in closed_keys:
+            start = open_segments.pop(key, None)
+            if start is not None:
+                segments.append((start, measure) + key)
+        for key in opened_keys:
+            if key not in open_segments:
+                open_segments[key] = measure
+
+    segments.sort(key=lambda segment: (segment[0], segment[1]))
+    return segments
+
+
+class OverlayTask(qgis.core.QgsTask):
+    """background-task: overlays two LoL-Data-Layers and writes the result as new LoL-Data-Layer into a GeoPackage-table
+    result-fields: fid, line_ref_id, measure_from, measure_to, offset (always 0) and all fields of A and B with prefix a_/b_
+    """
+
+    def __init__(self, a_layer: qgis.core.QgsVectorLayer, a_field_names: list, b_layer: qgis.core.QgsVectorLayer, b_field_names: list, ref_pk_field: qgis.core.QgsField, operation: str, gpkg_path: str, table_name: str, overwrite: bool = False):
+        """constructor, must be called in the main-thread
+        :param a_layer: Data-Layer A
+        :param a_field_names: Reference-, From- and To-field of a_layer
+        :param b_layer: Data-Layer B
+        :param b_field_names: Reference-, From- and To-field of b_layer
+        :param ref_pk_field: PK-field of the Reference-Layer, type for the result-Reference-field
+        :param operation: see operations
+        :param gpkg_path:
+        :param table_name:
+        :param overwrite: True ➜ existing GeoPackage, table is created or replaced
+        """
+        # Rev. 2023-09-05
+        super().__init__(f"LinearReferencing: overlay {a_layer.name()} {operation} {b_layer.name()}", qgis.core.QgsTask.CanCancel)
+        self.operation = operation
+        self.gpkg_path = gpkg_path
+        self.table_name = table_name
+        self.overwrite = overwrite
+        self.num_segments = 0
+        self.error_msg = ''
+
+        self.sources = []
+        for layer, field_names in [(a_layer, a_field_names), (b_layer, b_field_names)]:
+            request = qgis.core.QgsFeatureRequest()
+            request.setFlags(qgis.core.QgsFeatureRequest.NoGeometry)
+            self.sources.append((qgis.core.QgsVectorLayerFeatureSource(layer), request, field_names, max(layer.featureCount(), 1), layer.fields().count()))
+
+        self.fields = qgis.core.QgsFields()
+        self.fields.append(qgis.core.QgsField("fid", QtCore.QVariant.Int))
+        self.fields.append(qgis.core.QgsField("line_ref_id", ref_pk_field.type()))
+        self.fields.append(qgis.core.QgsField("measure_from", QtCore.QVariant.Double))
+        self.fields.append(qgis.core.QgsField("measure_to", QtCore.QVariant.Double))
+        self.fields.append(qgis.core.QgsField("offset", QtCore.QVariant.Double))
+        for prefix, layer in [('a_', a_layer), ('b_', b_layer)]:
+            for field in layer.fields():
+                result_field = qgis.core.QgsField(field)
+                result_field.setName(prefix + field.name())
+                self.fields.append(result_field)
+
+    def _read_source(self, source_idx: int) -> tuple:
+        """worker-thread: reads the features of one Data-Layer
+        :param source_idx: 0 ➜ A, 1 ➜ B
+        :returns tuple (intervals, attributes), dict key: Reference-id value: list of (start, end, fid), dict key: fid value: attribute-list
+        None if canceled
+        """
+        # Rev. 2023-09-05
+        source, request, field_names, num_features, num_fields = self.sources[source_idx]
+        reference_field_name, measure_from_field_name, measure_to_field_name = field_names
+        intervals = {}
+        attributes = {}
+        for feature_no, feature in enumerate(source.getFeatures(request)):
+            if self.isCanceled():
+                return None
+            ref_id = feature[reference_field_name]
+            try:
+                measure_from = float(feature[measure_from_field_name])
+                measure_to = float(feature[measure_to_field_name])
+            except (TypeError, ValueError):
+                # NULL-measures
+                continue
+            if ref_id is not None and repr(ref_id) != 'NULL':
+                intervals.setdefault(ref_id, []).append((min(measure_from, measure_to), max(measure_from, measure_to), feature.id()))
+                attributes[feature.id()] = feature.attributes()
+            if feature_no % 1000 == 0:
+                self.setProgress(25 * source_idx + 25 * feature_no / num_features)
+        return intervals, attributes
+
+    def run(self) -> bool:
+        """worker-thread, no access to layers or widgets
+        progress: 0...50 read, 50...100 overlay and write
+        """
+        # Rev. 2023-09-05
+        read_results = []
+        for source_idx in range(2):
+            read_result = self._read_source(source_idx)
+            if read_result is None:
+                return False
+            read_results.append(read_result)
+        (a_intervals, a_attributes), (b_intervals, b_attributes) = read_results
+        a_nulls = [None] * self.sources[0][4]
+        b_nulls = [None] * self.sources[1][4]
+
+        if self.operation == 'intersection':
+            ref_ids = [ref_id for ref_id in a_intervals if ref_id in b_intervals]
+        elif self.operation == 'union':
+            ref_ids = list(dict.fromkeys(list(a_intervals.keys()) + list(b_intervals.keys())))
+        else:
+            ref_ids = list(a_intervals.keys())
+
+        options = qgis.core.QgsVectorFileWriter.SaveVectorOptions()
+        options.driverName = "gpkg"
+        options.layerName = self.table_name
+        if self.overwrite:
+            options.actionOnExistingFile = qgis.core.QgsVectorFileWriter.CreateOrOverwriteLayer
+        writer = qgis.core.QgsVectorFileWriter.create(
+            self.gpkg_path,
+            self.fields,
+            qgis.core.QgsWkbTypes.NoGeometry,
+            qgis.core.QgsCoordinateReferenceSystem(""),  # dummy
+            qgis.core.QgsCoordinateTransformContext(),
+            options
+        )
+        if writer.hasError() != qgis.core.QgsVectorFileWriter.NoError:
+            self.error_msg = writer.errorMessage()
+            del writer
+            return False
+
+        fid = 1
+        for ref_no, ref_id in enumerate(ref_ids):
+            if self.isCanceled():
+                del writer
+                return False
+            features = []
+            for start, end, a_fid, b_fid in overlay_intervals(a_intervals.get(ref_id, []), b_intervals.get(ref_id, []), self.operation):
+                feature = qgis.core.QgsFeature(self.fields)
+                feature.setAttributes(
+                    [fid, ref_id, start, end, 0.0] +
+                    (a_attributes[a_fid] if a_fid is not None else a_nulls) +
+                    (b_attributes[b_fid] if b_fid is not None else b_nulls)
+                )
+                features.append(feature)
+                fid += 1
+            if features and not writer.addFeatures(features):
+                self.error_msg = writer.errorMessage()
+                del writer
+                return False
+            self.num_segments += len(features)
+            if ref_no % 100 == 0:
+                self.setProgress(50 + 50 * ref_no / max(len(ref_ids), 1))
+
+        # the GeoPackage-table is finished and readable after the writer is deleted
+        del writer
+        return True
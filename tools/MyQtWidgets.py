@@ -1,5 +1,6 @@
 import os
 import re
+import functools
 from typing import Any, Callable
 from PyQt5 import QtCore, QtGui, QtWidgets
 
@@ -95,30 +96,242 @@ class QTableWidgetItemMultipleSort(QtWidgets.QTableWidgetItem):
         :param other: the compared QTableWidgetItem
         :returns bool: True, if "self is less than other"
         """
-        for role in self.sort_roles:
-            self_val = self.data(role)
-            other_val = other.data(role)
-
-            try:
-                if self_val is None and other_val is not None:
-                    return True
-                elif self_val is not None and other_val is None:
-                    return False
-                elif self_val is None and other_val is None:
-                    pass
-                else:
-                    if self_val < other_val:
-                        return True
-                    elif self_val > other_val:
-                        return False
-
-            except Exception as e:
-                # if self.data(role) is not None and other.data(role) is not None:
-                # "'<' not supported between instances of 'NoneType' and 'NoneType'"
-                return True
-
-        # emergency exit: if data for all rows in self and other is null
-        return True
+        return multiple_sort_cmp([self.data(role) for role in self.sort_roles], [other.data(role) for role in self.sort_roles]) <= 0
+
+
+def multiple_sort_cmp(self_values: list, other_values: list) -> int:
+    """comparison used by QTableWidgetItemMultipleSort and LazyTableModel
+
+    * iterates through the values,
+    * returns the first valuable comparison,
+    * continues as long as the self/other values are equal
+    * None-Value-Handling: "None" is allways assumed less then any value != "None"
+
+    :param self_values: list of sort-values
+    :param other_values: list of sort-values in the same order
+    :returns int: -1 if "self is less than other", 1 if greater, 0 if all values are equal
+    """
+    # Rev. 2023-08-23
+    for self_val, other_val in zip(self_values, other_values):
+        try:
+            if self_val is None and other_val is not None:
+                return -1
+            elif self_val is not None and other_val is None:
+                return 1
+            elif self_val is None and other_val is None:
+                pass
+            else:
+                if self_val < other_val:
+                    return -1
+                elif self_val > other_val:
+                    return 1
+
+        except Exception as e:
+            # "'<' not supported between instances of 'NoneType' and 'NoneType'"
+            return -1
+
+    return 0
+
+
+class LazyTableModel(QtCore.QAbstractTableModel):
+    """Problem in QTableWidget:
+
+    one QTableWidgetItem per cell, all created and filled in advance, freezes the GUI with some thousand rows and expensive cell-contents (f.e. evaluated display-expressions)
+
+    Solution: model for QTableView
+
+    * only the row-keys are known at construction
+    * the rows are exposed to the view in batches (canFetchMore/fetchMore), f.e. while scrolling
+    * the cell-data is calculated on first access via fetch_rows for a batch of rows and cached
+    * sort with the same semantics as QTableWidgetItemMultipleSort, sort-values via sort_values
+
+    Usage-Sample:
+
+    .. code-block:: text
+
+    def fetch_rows(keys):
+        return {key: [{QtCore.Qt.DisplayRole: f"# {key}"}, {QtCore.Qt.DisplayRole: expensive_label(key)}] for key in keys}
+
+    def sort_values(key, column):
+        return [key] if column == 0 else [expensive_label(key), key]
+
+    self.model = LazyTableModel(['ID', 'Label'], keys, fetch_rows, sort_values)
+    self.qtv_table.setModel(self.model)
+    """
+
+    rows_fetched = QtCore.pyqtSignal(int, int)
+    """own signal, emitted after rows were exposed to the view, f.e. to add cell-widgets: first and last row"""
+
+    # Rev. 2023-08-23
+
+    def __init__(self, header_labels: list, row_keys: list, fetch_rows: Callable, sort_values: Callable, batch_size: int = 100, parent: QtCore.QObject = None):
+        """constructor
+        :param header_labels: horizontal header, defines the number of columns
+        :param row_keys: one unique key per row, f.e. PKs
+        :param fetch_rows: function(keys: list) -> dict key: list with one dict {role: value} per column
+        :param sort_values: function(key, column: int) -> list of values for multiple sort
+        :param batch_size: number of rows exposed/calculated per step
+        :param parent: Qt-Hierarchy
+        """
+        super().__init__(parent)
+        self.header_labels = header_labels
+        self.row_keys = list(row_keys)
+        self.fetch_rows = fetch_rows
+        self.sort_values = sort_values
+        self.batch_size = batch_size
+        # rows exposed to the view
+        self._fetched_count = 0
+        # key: row-key value: list of dicts {role: value} per column
+        self._row_data = {}
+
+    def row_key(self, row: int):
+        """returns the key of this row in current sort-order
+        :param row:
+        """
+        return self.row_keys[row]
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        """reimplemented, only the exposed rows"""
+        if parent.isValid():
+            return 0
+        return self._fetched_count
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        """reimplemented"""
+        if parent.isValid():
+            return 0
+        return len(self.header_labels)
+
+    def headerData(self, section: int, orientation: int, role: int = QtCore.Qt.DisplayRole) -> Any:
+        """reimplemented, horizontal header from header_labels"""
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal and 0 <= section < len(self.header_labels):
+            return self.header_labels[section]
+        return super().headerData(section, orientation, role)
+
+    def canFetchMore(self, parent: QtCore.QModelIndex) -> bool:
+        """reimplemented, called by the view f.e. on scroll to the last exposed row"""
+        return not parent.isValid() and self._fetched_count < len(self.row_keys)
+
+    def fetchMore(self, parent: QtCore.QModelIndex):
+        """reimplemented, exposes the next batch of rows"""
+        if not parent.isValid():
+            first = self._fetched_count
+            last = min(first + self.batch_size, len(self.row_keys)) - 1
+            if last >= first:
+                self.beginInsertRows(QtCore.QModelIndex(), first, last)
+                self._fetched_count = last + 1
+                self.endInsertRows()
+                self.rows_fetched.emit(first, last)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole) -> Any:
+        """reimplemented, calculates the data for a batch of rows on first access"""
+        if index.isValid():
+            key = self.row_keys[index.row()]
+            if key not in self._row_data:
+                self._load_rows(index.row())
+            row_data = self._row_data[key]
+            if index.column() < len(row_data):
+                return row_data[index.column()].get(role)
+
+    def _load_rows(self, row: int):
+        """calculates the data for the uncached rows in row...row + batch_size
+        :param row:
+        """
+        keys = [key for key in self.row_keys[row:row + self.batch_size] if key not in self._row_data]
+        self._row_data.update(self.fetch_rows(keys))
+        # rows without data: cached as empty
+        for key in keys:
+            self._row_data.setdefault(key, [])
+
+    def sort(self, column: int, order: int = QtCore.Qt.AscendingOrder):
+        """reimplemented, called by the view f.e. on click on the header
+        sorts all rows, the cell-data is not needed, only the sort-values
+        model-reset: the view removes all cell-widgets, rows_fetched is emitted for the already exposed rows
+        """
+        if 0 <= column < len(self.header_labels):
+            self.beginResetModel()
+            sort_values = {key: self.sort_values(key, column) for key in self.row_keys}
+            self.row_keys.sort(key=functools.cmp_to_key(lambda key_a, key_b: multiple_sort_cmp(sort_values[key_a], sort_values[key_b])), reverse=order == QtCore.Qt.DescendingOrder)
+            self.endResetModel()
+            if self._fetched_count:
+                self.rows_fetched.emit(0, self._fetched_count - 1)
+
+
+class LatestEventCoalescer(QtCore.QObject):
+    """coalesces high-frequency events, f.e. mouse-moves on canvas from trackpads or high-DPI mice with 200+ Hz
+    the first event is processed immediately, further events within the interval only replace the pending one (latest wins),
+    which is processed once per interval by a single-shot QTimer
+    usage:
+    self.move_coalescer = LatestEventCoalescer(self.process_canvas_move, parent=self)
+    def canvasMoveEvent(self, event): self.move_coalescer.push(QtCore.QPoint(event.pos()))
+    caveat: the pushed arguments must be copies, events like QgsMapMouseEvent are deleted after the event-handler returns
+    """
+
+    def __init__(self, process_fn: Callable, interval_ms: int = 16, parent: QtCore.QObject = None):
+        """constructor
+        :param process_fn: called with the pushed arguments
+        :param interval_ms: min. interval between two calls of process_fn, default 16 ms ➜ approx. one call per frame with 60 Hz
+        :param parent:
+        """
+        # Rev. 2023-08-27
+        super().__init__(parent)
+        self.process_fn = process_fn
+
+        # statistics: number of processed events and number of pending events, which were replaced by a later one
+        self.processed_count = 0
+        self.dropped_count = 0
+
+        self._pending_args = None
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._s_timeout)
+
+    def push(self, *args):
+        """register an event, processed immediately or with the next timeout
+        :param args: arguments for process_fn
+        """
+        # Rev. 2023-08-27
+        if self._timer.isActive():
+            if self._pending_args is not None:
+                self.dropped_count += 1
+            self._pending_args = args
+        else:
+            self._process(args)
+            self._timer.start()
+
+    def flush(self):
+        """processes the pending event immediately, f.e. before mouse-release, so that the last position is not lost"""
+        # Rev. 2023-08-27
+        if self._pending_args is not None:
+            args = self._pending_args
+            self._pending_args = None
+            self._process(args)
+
+    def discard(self):
+        """stops the timer and drops the pending event"""
+        # Rev. 2023-08-27
+        self._timer.stop()
+        if self._pending_args is not None:
+            self.dropped_count += 1
+            self._pending_args = None
+
+    def _process(self, args: tuple):
+        """call process_fn
+        :param args:
+        """
+        # Rev. 2023-08-27
+        self.processed_count += 1
+        self.process_fn(*args)
+
+    def _s_timeout(self):
+        """processes the pending event, if any, and restarts the interval"""
+        # Rev. 2023-08-27
+        if self._pending_args is not None:
+            args = self._pending_args
+            self._pending_args = None
+            self._process(args)
+            self._timer.start()
 
 
 class LambdaDelegate(QtWidgets.QStyledItemDelegate):
@@ -370,6 +583,9 @@ class QComboBoxN(QtWidgets.QComboBox):
     # default width for resizeMode Interactive and Fixed, if not defined for a column via col_widths
     _default_col_width = 100
 
+    # emitted, if the filter was resetted by select_by_value, f.e. to clear the QLineEdit with the filter-text
+    filter_reset = QtCore.pyqtSignal()
+
     def __init__(self,
                  parent: QtCore.QObject = None,
                  column_resize_mode: int = QtWidgets.QHeaderView.ResizeToContents,
@@ -393,7 +609,8 @@ class QComboBoxN(QtWidgets.QComboBox):
                  word_wrap: bool = True,
                  elide_mode: int = QtCore.Qt.ElideRight,
                  icon_size: QtCore.QSize = QtCore.QSize(12, 12),
-                 clear_button_icon: QtGui.QIcon = None
+                 clear_button_icon: QtGui.QIcon = None,
+                 filter_enabled: bool = False
                  ):
         """ Constructor, long parameter-list with default-values for style and behaviour, consistent to current purposes (select layer and fields in QGis)
         :param parent: optional parent objekt in Qt-hierarchy
@@ -442,6 +659,7 @@ class QComboBoxN(QtWidgets.QComboBox):
         :param clear_button_icon: if show_clear_button: icon of the Clear-Button (other icons )
             if unset: QtWidgets.QApplication.instance().style().standardIcon(70)
             ➜ nice under linux, ugly with windows
+        :param filter_enabled: the model is wrapped in a QSortFilterProxyModel, filtered with set_filter, f.e. for type-ahead from a QLineEdit
         """
         super().__init__(parent)
         self.append_index_col = append_index_col
@@ -476,6 +694,11 @@ class QComboBoxN(QtWidgets.QComboBox):
 
         self.clear_button_icon = clear_button_icon
 
+        self.filter_enabled = filter_enabled
+
+        # QSortFilterProxyModel between view and the model assigned with set_model, if filter_enabled
+        self.filter_model = None
+
         # at runtime (apply_settings): filled from self.show_template via RegExp
         self._show_col_idzs = {}
 
@@ -547,14 +770,14 @@ class QComboBoxN(QtWidgets.QComboBox):
         if self.show_horizontal_header:
             self.view().horizontalHeader().show()
             if self.col_names:
-                self.model().setHorizontalHeaderLabels(self.col_names)
+                self.source_model().setHorizontalHeaderLabels(self.col_names)
         else:
             self.view().horizontalHeader().hide()
 
         if self.show_vertical_header:
             self.view().verticalHeader().show()
             if self.row_names:
-                self.model().setVerticalHeaderLabels(self.row_names)
+                self.source_model().setVerticalHeaderLabels(self.row_names)
         else:
             self.view().verticalHeader().hide()
 
@@ -649,11 +872,33 @@ class QComboBoxN(QtWidgets.QComboBox):
                     for cc in range(in_model.columnCount()):
                         in_model.item(rc, cc).setEnabled(master_enable)
 
-            self.setModel(in_model)
+            if self.filter_enabled:
+                self.filter_model = QtCore.QSortFilterProxyModel(self)
+                self.filter_model.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
+                # match in all columns
+                self.filter_model.setFilterKeyColumn(-1)
+                self.filter_model.setSourceModel(in_model)
+                self.setModel(self.filter_model)
+            else:
+                self.setModel(in_model)
 
             self.apply_settings()
             self.setCurrentIndex(-1)
 
+    def source_model(self) -> QtGui.QStandardItemModel:
+        """the model assigned with set_model, self.model() is the QSortFilterProxyModel, if filter_enabled"""
+        if self.filter_model:
+            return self.filter_model.sourceModel()
+        return self.model()
+
+    def set_filter(self, filter_text: str):
+        """filters the rows, case-insensitive match in all columns, without triggering any signal/slot
+        :param filter_text: '' ➜ show all rows
+        """
+        if self.filter_model:
+            with QtCore.QSignalBlocker(self):
+                self.filter_model.setFilterFixedString(filter_text)
+
     def set_current_index(self, current_index: int):
         """select an item via setCurrentIndex but without triggering any signal/slot
         caveat: disabled features can also be selected with this method
@@ -675,6 +920,11 @@ class QComboBoxN(QtWidgets.QComboBox):
         :param select_value: the compare-value
         """
         matching_items = self.get_matching_items(col_idx, role_idx, select_value)
+        if not matching_items and self.filter_model and self.filter_model.filterRegExp().pattern():
+            # row probably filtered out
+            self.set_filter('')
+            self.filter_reset.emit()
+            matching_items = self.get_matching_items(col_idx, role_idx, select_value)
         if matching_items:
             first_matching_item = matching_items.pop(0)
             self.set_current_index(first_matching_item.row())
@@ -0,0 +1,307 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+********************************************************************
+
+* Part of the QGis-Plugin LinearReferencing:
+* materialized Show-Layers
+
+.. note::
+    * import to console from Path (LinearReferencing-plugin-folder in current QGis-Profile-Folder)
+    * or use: import LinearReferencing.tools.MyShowLayers
+    * alternative to the virtual Show-Layer, which re-evaluates ST_Line_Interpolate_Point/ST_Line_Substring/ST_OffsetCurve
+      for every feature on every render
+    * the PoL/LoL-geometries are calculated in one pass per Reference-line and written directly via dataProvider to a memory-layer,
+      the layer can be made permanent (f.e. GeoPackage), the custom-property is kept and the layer stays materialized
+
+********************************************************************
+
+* Date                 : 2023-08-21
+* Copyright            : (C) 2023 by Ludwig Kniprath
+* Email                : ludwig at kni minus online dot de
+
+********************************************************************
+
+this program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+********************************************************************
+"""
+from __future__ import annotations
+import typing
+import qgis
+from qgis import core
+from LinearReferencing.tools import MyLayerCaches
+from LinearReferencing.tools import MyToolFunctions
+
+# custom layer-property, marks the layer as materialized Show-Layer, value: 'PolEvt' or 'LolEvt'
+materialized_property = 'LinearReferencing/materialized'
+
+
+def is_materialized(show_layer: qgis.core.QgsVectorLayer) -> bool:
+    """True, if show_layer was created as materialized Show-Layer
+    :param show_layer:
+    """
+    # Rev. 2023-08-21
+    return show_layer is not None and bool(show_layer.customProperty(materialized_property))
+
+
+def create_memory_layer(layer_name: str, geometry_type: str, crs: qgis.core.QgsCoordinateReferenceSystem, fields: list, tool_name: str) -> qgis.core.QgsVectorLayer:
+    """creates an empty memory-layer, marked as materialized Show-Layer
+    :param layer_name:
+    :param geometry_type: 'point' or 'linestring'
+    :param crs: same as Reference-Layer
+    :param fields: list of QgsField, copied from Data-Layer
+    :param tool_name: 'PolEvt' or 'LolEvt', stored as custom-property
+    """
+    # Rev. 2023-08-21
+    show_lyr = qgis.core.QgsVectorLayer(f"{geometry_type}?crs={crs.authid()}", layer_name, "memory")
+    if show_lyr and show_lyr.isValid():
+        show_lyr.dataProvider().addAttributes([qgis.core.QgsField(field) for field in fields])
+        show_lyr.updateFields()
+        show_lyr.setCrs(crs)
+        show_lyr.setCustomProperty(materialized_property, tool_name)
+        return show_lyr
+
+
+class ShowLayerMaterializer:
+    """calculates the PoL/LoL-geometries of the Data-features and writes them to a materialized Show-Layer
+    all Data-features with the same Reference-id are calculated with the same RefGeometry,
+    so the vertex-arrays are built only once per Reference-line
+    writes via dataProvider, the Show-Layer needs no edit-session
+    """
+
+    def __init__(self, show_layer: qgis.core.QgsVectorLayer, ref_layer: qgis.core.QgsVectorLayer, ref_pk_field: qgis.core.QgsField, data_layer: qgis.core.QgsVectorLayer, data_id_field: qgis.core.QgsField, data_reference_field: qgis.core.QgsField, data_fields: list, calc_geometry: typing.Callable):
+        """constructor
+        :param show_layer: materialized Show-Layer with the same field-names as data_fields
+        :param ref_layer:
+        :param ref_pk_field:
+        :param data_layer:
+        :param data_id_field:
+        :param data_reference_field:
+        :param data_fields: list of QgsField, the Data-Layer-fields copied to the Show-Layer, including data_id_field and data_reference_field
+        :param calc_geometry: function(ref_geom: MyLayerCaches.RefGeometry, data_feature: QgsFeature) -> QgsGeometry|None
+        """
+        # Rev. 2023-08-21
+        self.show_layer = show_layer
+        self.ref_layer = ref_layer
+        self.ref_pk_field = ref_pk_field
+        self.data_layer = data_layer
+        self.data_id_field = data_id_field
+        self.data_reference_field = data_reference_field
+        self.data_fields = data_fields
+        self.calc_geometry = calc_geometry
+        self.is_materialized = False
+        # key: str(data_id) value: fid in Show-Layer
+        self._show_fids = None
+        # key: fid in Data-Layer value: str(data_id), for the committedFeaturesRemoved-signal, which only delivers fids
+        self._data_ids = {}
+
+    @property
+    def key(self) -> tuple:
+        """identifies the configuration, a changed configuration needs a new materializer"""
+        return (
+            self.show_layer.id(),
+            self.ref_layer.id(),
+            self.ref_pk_field.name(),
+            self.data_layer.id(),
+            tuple(field.name() for field in self.data_fields)
+        )
+
+    def _calc_show_features(self, data_fids: list = None) -> list:
+        """queries the Data-features, groups them by Reference-id and calculates the Show-features
+        :param data_fids: fids in Data-Layer, None ➜ all Data-features
+        :returns list of QgsFeature for the Show-Layer, Data-features without valid Reference-feature are skipped (same as the INNER JOIN in the virtual layer)
+        """
+        # Rev. 2023-08-21
+        request = qgis.core.QgsFeatureRequest()
+        request.setFlags(qgis.core.QgsFeatureRequest.NoGeometry)
+        request.setSubsetOfAttributes([field.name() for field in self.data_fields], self.data_layer.fields())
+        if data_fids is not None:
+            request.setFilterFids(data_fids)
+
+        data_features_by_ref_id = {}
+        for data_feature in self.data_layer.getFeatures(request):
+            self._data_ids[data_feature.id()] = str(data_feature[self.data_id_field.name()])
+            data_features_by_ref_id.setdefault(data_feature[self.data_reference_field.name()], []).append(data_feature)
+
+        ref_features = MyLayerCaches.get_features_by_pks(self.ref_layer, self.ref_pk_field, list(data_features_by_ref_id.keys()))
+
+        show_fields = self.show_layer.fields()
+        show_features = []
+        for ref_id, data_features in data_features_by_ref_id.items():
+            ref_feature = ref_features.get(ref_id)
+            if ref_feature and ref_feature.hasGeometry() and not ref_feature.geometry().isEmpty():
+                ref_geom = MyLayerCaches.RefGeometry(ref_feature)
+                for data_feature in data_features:
+                    show_feature = qgis.core.QgsFeature(show_fields)
+                    for field in self.data_fields:
+                        show_feature[field.name()] = data_feature[field.name()]
+                    show_geom = self.calc_geometry(ref_geom, data_feature)
+                    if show_geom:
+                        show_feature.setGeometry(show_geom)
+                    show_features.append(show_feature)
+
+        return show_features
+
+    def _get_show_fids(self) -> dict:
+        """index data_id ➜ fid in Show-Layer, built once with a geometry-less request"""
+        # Rev. 2023-08-21
+        if self._show_fids is None:
+            self._show_fids = {}
+            request = qgis.core.QgsFeatureRequest()
+            request.setFlags(qgis.core.QgsFeatureRequest.NoGeometry)
+            request.setSubsetOfAttributes([self.data_id_field.name()], self.show_layer.fields())
+            for show_feature in self.show_layer.getFeatures(request):
+                self._show_fids[str(show_feature[self.data_id_field.name()])] = show_feature.id()
+        return self._show_fids
+
+    def _add_show_features(self, show_features: list):
+        """adds the features to the Show-Layer and registers their fids
+        :param show_features:
+        """
+        # Rev. 2023-08-21
+        show_fids = self._get_show_fids()
+        result, added_features = self.show_layer.dataProvider().addFeatures(show_features)
+        if result:
+            for show_feature in added_features:
+                show_fids[str(show_feature[self.data_id_field.name()])] = show_feature.id()
+
+    def _write_show_features(self, show_features: list) -> tuple:
+        """writes the calculated Show-features, existing rows are changed in place (fid and selection are kept), the others are added
+        :param show_features:
+        :returns tuple (rows_added, extent_changed), extent_changed if at least one geometry is outside the current layer-extent
+        """
+        # Rev. 2023-08-22
+        show_fids = self._get_show_fids()
+        field_indices = [self.show_layer.fields().indexOf(field.name()) for field in self.data_fields]
+        layer_extent = self.show_layer.extent()
+        extent_changed = False
+        new_features = []
+        attribute_map = {}
+        geometry_map = {}
+        for show_feature in show_features:
+            if show_feature.hasGeometry() and not layer_extent.contains(show_feature.geometry().boundingBox()):
+                extent_changed = True
+            show_fid = show_fids.get(str(show_feature[self.data_id_field.name()]))
+            if show_fid is None:
+                new_features.append(show_feature)
+            else:
+                attribute_map[show_fid] = {field_idx: show_feature[field_idx] for field_idx in field_indices}
+                geometry_map[show_fid] = show_feature.geometry()
+
+        if attribute_map:
+            self.show_layer.dataProvider().changeFeatures(attribute_map, geometry_map)
+
+        if new_features:
+            self._add_show_features(new_features)
+
+        return bool(new_features), extent_changed
+
+    def _delete_show_features(self, data_ids: list) -> bool:
+        """removes the Show-features for these Data-ids
+        :param data_ids: str(data_id)
+        :returns True, if rows were deleted
+        """
+        # Rev. 2023-08-21
+        show_fids = self._get_show_fids()
+        delete_fids = [show_fids.pop(data_id) for data_id in data_ids if data_id in show_fids]
+        if delete_fids:
+            self.show_layer.dataProvider().deleteFeatures(delete_fids)
+        return bool(delete_fids)
+
+    def _refresh(self, rows_changed: bool = True, extent_changed: bool = True):
+        """after writing via dataProvider: no layer-signals, therefore explicit refresh
+        :param rows_changed: rows added or deleted ➜ the PK-index of the Show-Layer is outdated
+        :param extent_changed: the extent is only updated if necessary, removed rows don't shrink the extent
+        """
+        # Rev. 2023-08-22
+        if rows_changed:
+            MyLayerCaches.invalidate_layer(self.show_layer.id())
+        if extent_changed:
+            self.show_layer.updateExtents()
+        self.show_layer.triggerRepaint()
+
+    def materialize(self):
+        """(re-)calculates all Show-features"""
+        # Rev. 2023-08-21
+        self._data_ids = {}
+        self._show_fids = {}
+        show_features = self._calc_show_features()
+        self.show_layer.dataProvider().truncate()
+        self._add_show_features(show_features)
+        self.is_materialized = True
+        self._refresh()
+
+    def ensure_materialized(self):
+        """memory-layers are stored without features in the project ➜ materialize once per session"""
+        # Rev. 2023-08-21
+        if not self.is_materialized and self.show_layer.dataProvider().name() == 'memory':
+            self.materialize()
+
+    def update_features(self, data_fids: list):
+        """re-calculates the Show-features for these Data-features, f.e. after committedFeaturesAdded/committedAttributeValuesChanges
+        :param data_fids: fids in Data-Layer
+        """
+        # Rev. 2023-08-22
+        if data_fids:
+            # previous ids, the id itself could have been changed
+            previous_ids = set(self._data_ids[data_fid] for data_fid in data_fids if data_fid in self._data_ids)
+            show_features = self._calc_show_features(data_fids)
+            current_ids = set(str(show_feature[self.data_id_field.name()]) for show_feature in show_features)
+            # changed ids or no longer calculable, f.e. Reference-id without Reference-feature
+            rows_deleted = self._delete_show_features(list(previous_ids - current_ids))
+            rows_added, extent_changed = self._write_show_features(show_features)
+            self._refresh(rows_deleted or rows_added, extent_changed)
+
+    def update_references(self, ref_fids: list):
+        """re-calculates the Show-features referencing these Reference-features, f.e. after committedGeometriesChanges on Reference-Layer
+        :param ref_fids: fids in Reference-Layer
+        """
+        # Rev. 2023-09-12
+        if ref_fids:
+            request = qgis.core.QgsFeatureRequest()
+            request.setFlags(qgis.core.QgsFeatureRequest.NoGeometry)
+            request.setSubsetOfAttributes([self.ref_pk_field.name()], self.ref_layer.fields())
+            request.setFilterFids(ref_fids)
+            ref_ids = [ref_feature[self.ref_pk_field.name()] for ref_feature in self.ref_layer.getFeatures(request)]
+            if ref_ids:
+                self.update_features(MyToolFunctions.get_fids_by_values(self.data_layer, self.data_reference_field, ref_ids))
+
+    def remove_features(self, data_fids: list):
+        """removes the Show-features for these removed Data-features, f.e. after committedFeaturesRemoved
+        :param data_fids: fids in Data-Layer
+        """
+        # Rev. 2023-08-22
+        if data_fids:
+            data_ids = [self._data_ids.pop(data_fid) for data_fid in data_fids if data_fid in self._data_ids]
+            if len(data_ids) < len(data_fids):
+                # unknown fids, f.e. Show-Layer not materialized in this session ➜ compare with the remaining Data-ids
+                request = qgis.core.QgsFeatureRequest()
+                request.setFlags(qgis.core.QgsFeatureRequest.NoGeometry)
+                request.setSubsetOfAttributes([self.data_id_field.name()], self.data_layer.fields())
+                existing_ids = set(str(data_feature[self.data_id_field.name()]) for data_feature in self.data_layer.getFeatures(request))
+                data_ids += [data_id for data_id in self._get_show_fids() if data_id not in existing_ids]
+            if self._delete_show_features(data_ids):
+                self._refresh(True, False)
+
+
+# module-wide registry, key: Show-Layer-id, value: ShowLayerMaterializer
+_materializers = {}
+
+
+def get_materializer(show_layer: qgis.core.QgsVectorLayer, ref_layer: qgis.core.QgsVectorLayer, ref_pk_field: qgis.core.QgsField, data_layer: qgis.core.QgsVectorLayer, data_id_field: qgis.core.QgsField, data_reference_field: qgis.core.QgsField, data_fields: list, calc_geometry: typing.Callable) -> ShowLayerMaterializer:
+    """returns the registered materializer for show_layer, creates a new one if not registered or the configuration has changed
+    parameters see ShowLayerMaterializer
+    """
+    # Rev. 2023-08-21
+    materializer = ShowLayerMaterializer(show_layer, ref_layer, ref_pk_field, data_layer, data_id_field, data_reference_field, data_fields, calc_geometry)
+    registered = _materializers.get(show_layer.id())
+    if registered is not None and registered.key == materializer.key:
+        # current callback, f.e. after re-initialization of the Map-Tool
+        registered.calc_geometry = calc_geometry
+        return registered
+    _materializers[show_layer.id()] = materializer
+    return materializer
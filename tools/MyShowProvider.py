@@ -0,0 +1,431 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+********************************************************************
+
+* Part of the QGis-Plugin LinearReferencing:
+* vector-data-provider 'linref' for Show-Layers
+
+.. note::
+    * import to console from Path (LinearReferencing-plugin-folder in current QGis-Profile-Folder)
+    * or use: import LinearReferencing.tools.MyShowProvider
+    * third alternative beside virtual and materialized Show-Layer:
+      joins Data- and Reference-Layer in Python, the PoL/LoL-geometries are calculated per Reference-line by MyEventIndex.EventIndex
+    * filter-rects are resolved via the bounding-box-index of the calculated geometries,
+      rendering scales with the features in the viewport, not with the size of the Data-Layer
+    * extent and feature-count from the index, no scan after the first build
+    * source-agnostic like the virtual layer: Data- and Reference-Layer by layer-id, any provider
+    * the fields are stored in the uri, so the Show-Layer is valid on project-load even before Data- and Reference-Layer are loaded,
+      the features are calculated on the first request
+    * registered in LinearReference.__init__, layers with this provider are only readable with the plugin installed
+
+sample:
+    uri = LinearReferencing.tools.MyShowProvider.build_uri('LolEvt', ref_layer.crs(), ref_layer.id(), 'fid', data_layer.id(), data_fields, 'fid', 'line_ref_id', ['measure_from', 'measure_to', 'offset'])
+    show_layer = qgis.core.QgsVectorLayer(uri, 'LineOnLine_Show_Layer', 'linref')
+
+********************************************************************
+
+* Date                 : 2023-09-06
+* Copyright            : (C) 2023 by Ludwig Kniprath
+* Email                : ludwig at kni minus online dot de
+
+********************************************************************
+
+this program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+********************************************************************
+"""
+from __future__ import annotations
+import functools
+import urllib.parse
+import qgis
+from qgis import core
+from PyQt5 import QtCore
+from LinearReferencing.tools import MyEventIndex
+from LinearReferencing.tools import MyToolFunctions
+
+provider_key = 'linref'
+
+
+def calc_point_geometry(measure_field_name: str, ref_geom, data_feature: qgis.core.QgsFeature) -> qgis.core.QgsGeometry | None:
+    """PoL-geometry, same as PolEvt.calc_show_geometry
+    :param measure_field_name:
+    :param ref_geom: MyLayerCaches.RefGeometry
+    :param data_feature:
+    """
+    # Rev. 2023-09-06
+    measure = data_feature[measure_field_name]
+    if measure is not None and measure != qgis.core.NULL:
+        return MyToolFunctions.get_point_geom(ref_geom, measure)
+
+
+def calc_segment_geometry(measure_from_field_name: str, measure_to_field_name: str, offset_field_name: str, ref_geom, data_feature: qgis.core.QgsFeature) -> qgis.core.QgsGeometry | None:
+    """LoL-geometry, same as LolEvt.calc_show_geometry
+    :param measure_from_field_name:
+    :param measure_to_field_name:
+    :param offset_field_name:
+    :param ref_geom: MyLayerCaches.RefGeometry
+    :param data_feature:
+    """
+    # Rev. 2023-09-06
+    measure_from = data_feature[measure_from_field_name]
+    measure_to = data_feature[measure_to_field_name]
+    offset = data_feature[offset_field_name]
+    if not (measure_from is None or measure_from == qgis.core.NULL or measure_to is None or measure_to == qgis.core.NULL):
+        if offset is None or offset == qgis.core.NULL:
+            offset = 0
+        return MyToolFunctions.get_segment_geom(ref_geom, measure_from, measure_to, offset)
+
+
+def build_uri(tool_name: str, crs: qgis.core.QgsCoordinateReferenceSystem, ref_layer_id: str, ref_pk_field_name: str, data_layer_id: str, data_fields: list, data_id_field_name: str, data_reference_field_name: str, measure_field_names: list) -> str:
+    """uri for a 'linref'-Show-Layer
+    :param tool_name: 'PolEvt' or 'LolEvt'
+    :param crs: Reference-Layer-CRS
+    :param ref_layer_id:
+    :param ref_pk_field_name:
+    :param data_layer_id:
+    :param data_fields: list of QgsField, the Data-Layer-fields of the Show-Layer, including the ID-, Reference- and measure-fields
+    :param data_id_field_name:
+    :param data_reference_field_name:
+    :param measure_field_names: PolEvt: [measure], LolEvt: [measure_from, measure_to, offset]
+    """
+    # Rev. 2023-09-06
+    params = [
+        ('tool', tool_name),
+        ('crs', crs.authid() if crs.authid() else crs.toWkt()),
+        ('ref_layer', ref_layer_id),
+        ('ref_pk', ref_pk_field_name),
+        ('data_layer', data_layer_id),
+        ('data_id', data_id_field_name),
+        ('data_ref', data_reference_field_name)
+    ]
+    params += [('measure', field_name) for field_name in measure_field_names]
+    params += [('field', f"{field.name()}:{int(field.type())}") for field in data_fields]
+    return urllib.parse.urlencode(params)
+
+
+class ShowFeatureIterator(qgis.core.QgsAbstractFeatureIterator):
+    """iterates the snapshot of a ShowFeatureSource, runs in the render-thread without access to layers"""
+
+    def __init__(self, source: ShowFeatureSource, request: qgis.core.QgsFeatureRequest):
+        """constructor
+        :param source:
+        :param request:
+        """
+        # Rev. 2023-09-06
+        super().__init__(request)
+        self._source = source
+        self._request = request if request is not None else qgis.core.QgsFeatureRequest()
+        self._transform = qgis.core.QgsCoordinateTransform()
+        if self._request.destinationCrs().isValid() and self._request.destinationCrs() != source.crs:
+            self._transform = qgis.core.QgsCoordinateTransform(source.crs, self._request.destinationCrs(), self._request.transformContext())
+
+        self._fids = []
+        self._position = 0
+        self._exact_geom = None
+        try:
+            filter_rect = self.filterRectToSourceCrs(self._transform)
+        except qgis.core.QgsCsException:
+            # filter-rect not transformable ➜ no features
+            return
+
+        # requested fids, f.e. getFeature(fid) for identify or selection, without iteration of all entries
+        if self._request.filterType() == qgis.core.QgsFeatureRequest.FilterFid:
+            filter_fids = [self._request.filterFid()]
+        elif self._request.filterType() == qgis.core.QgsFeatureRequest.FilterFids:
+            filter_fids = list(self._request.filterFids())
+        else:
+            filter_fids = None
+
+        if not filter_rect.isNull() and source.spatial_index is not None:
+            # candidates from the bounding-box-index, the exact test only on request
+            self._fids = source.spatial_index.intersects(filter_rect)
+            if filter_fids is not None:
+                rect_fids = set(self._fids)
+                self._fids = [fid for fid in filter_fids if fid in rect_fids]
+            if self._request.flags() & qgis.core.QgsFeatureRequest.ExactIntersect:
+                self._exact_geom = qgis.core.QgsGeometry.fromRect(filter_rect)
+        elif filter_fids is not None:
+            self._fids = filter_fids
+        else:
+            self._fids = list(source.entries.keys())
+
+        if self._request.filterType() == qgis.core.QgsFeatureRequest.FilterExpression:
+            self._request.expressionContext().setFields(source.fields)
+            self._request.filterExpression().prepare(self._request.expressionContext())
+
+    def fetchFeature(self, feature: qgis.core.QgsFeature) -> bool:
+        """next feature
+        :param feature: filled in place
+        """
+        # Rev. 2023-09-06
+        while self._position < len(self._fids):
+            fid = self._fids[self._position]
+            self._position += 1
+            entry = self._source.entries.get(fid)
+            if entry is None:
+                continue
+            if self._exact_geom is not None and not entry[2].intersects(self._exact_geom):
+                continue
+
+            feature.setFields(self._source.fields, True)
+            feature.setId(fid)
+            feature.setAttributes(list(entry[3]))
+            if self._request.flags() & qgis.core.QgsFeatureRequest.NoGeometry:
+                feature.clearGeometry()
+            else:
+                feature.setGeometry(qgis.core.QgsGeometry(entry[2]))
+                self.geometryToDestinationCrs(feature, self._transform)
+            feature.setValid(True)
+
+            if self._request.filterType() == qgis.core.QgsFeatureRequest.FilterExpression:
+                self._request.expressionContext().setFeature(feature)
+                if not self._request.filterExpression().evaluate(self._request.expressionContext()):
+                    continue
+            return True
+
+        feature.setValid(False)
+        return False
+
+    def rewind(self) -> bool:
+        """restart iteration"""
+        # Rev. 2023-09-06
+        self._position = 0
+        return True
+
+    def close(self) -> bool:
+        """end iteration"""
+        # Rev. 2023-09-06
+        self._position = len(self._fids)
+        return True
+
+
+class ShowFeatureSource(qgis.core.QgsAbstractFeatureSource):
+    """snapshot of the provider-index, created in the main-thread, iterated in the render-thread
+    the entries-dict is copied flat, the QgsSpatialIndex is implicitly shared and only detached on later changes of the provider-index
+    """
+
+    def __init__(self, provider: ShowLayerProvider):
+        """constructor
+        :param provider:
+        """
+        # Rev. 2023-09-06
+        super().__init__()
+        self.fields = provider.fields()
+        self.crs = provider.crs()
+        self.entries = {}
+        self.spatial_index = None
+        event_index = provider.get_event_index()
+        if event_index is not None:
+            self.entries = dict(event_index.entries)
+            self.spatial_index = qgis.core.QgsSpatialIndex(event_index.index)
+
+    def getFeatures(self, request: qgis.core.QgsFeatureRequest) -> qgis.core.QgsFeatureIterator:
+        """standard-function of QgsAbstractFeatureSource
+        :param request:
+        """
+        # Rev. 2023-09-06
+        return qgis.core.QgsFeatureIterator(ShowFeatureIterator(self, request))
+
+
+class ShowLayerProvider(qgis.core.QgsVectorDataProvider):
+    """read-only vector-data-provider 'linref', Data-Layer joined to Reference-Layer with geometries from MyEventIndex.EventIndex
+    the index is private to the provider and kept current by the Data- and Reference-Layer-signals, independent from the Map-Tools
+    """
+
+    @classmethod
+    def providerKey(cls) -> str:
+        """key for QgsProviderRegistry and QgsVectorLayer"""
+        return provider_key
+
+    @classmethod
+    def description(cls) -> str:
+        """description for QgsProviderRegistry"""
+        return 'LinearReferencing Show-Layer'
+
+    @classmethod
+    def createProvider(cls, uri: str, provider_options: qgis.core.QgsDataProvider.ProviderOptions, flags=qgis.core.QgsDataProvider.ReadFlags()) -> ShowLayerProvider:
+        """factory for QgsProviderMetadata"""
+        return ShowLayerProvider(uri, provider_options, flags)
+
+    def __init__(self, uri: str = '', provider_options: qgis.core.QgsDataProvider.ProviderOptions = qgis.core.QgsDataProvider.ProviderOptions(), flags=qgis.core.QgsDataProvider.ReadFlags()):
+        """constructor, parses the uri, the layers are resolved on the first request
+        :param uri: see build_uri
+        :param provider_options:
+        :param flags:
+        """
+        # Rev. 2023-09-06
+        super().__init__(uri, provider_options, flags)
+        self._uri = uri
+        params = urllib.parse.parse_qs(uri)
+        self._tool_name = params.get('tool', [None])[0]
+        self._crs = qgis.core.QgsCoordinateReferenceSystem(params.get('crs', [''])[0])
+        self._ref_layer_id = params.get('ref_layer', [None])[0]
+        self._ref_pk_field_name = params.get('ref_pk', [None])[0]
+        self._data_layer_id = params.get('data_layer', [None])[0]
+        self._data_id_field_name = params.get('data_id', [None])[0]
+        self._data_reference_field_name = params.get('data_ref', [None])[0]
+        self._measure_field_names = params.get('measure', [])
+
+        self._fields = qgis.core.QgsFields()
+        for field_def in params.get('field', []):
+            field_name, field_type = field_def.rsplit(':', 1)
+            self._fields.append(qgis.core.QgsField(field_name, QtCore.QVariant.Type(int(field_type))))
+
+        self._is_valid = (
+            (self._tool_name == 'PolEvt' and len(self._measure_field_names) == 1 or self._tool_name == 'LolEvt' and len(self._measure_field_names) == 3) and
+            None not in [self._ref_layer_id, self._ref_pk_field_name, self._data_layer_id, self._data_id_field_name, self._data_reference_field_name] and
+            all(self._fields.indexOf(field_name) >= 0 for field_name in [self._data_id_field_name, self._data_reference_field_name] + self._measure_field_names)
+        )
+        self._event_index = None
+
+    def get_event_index(self) -> MyEventIndex.EventIndex | None:
+        """resolves Data- and Reference-Layer on first usage and returns the current index, main-thread only
+        :returns None if the layers are not (yet) loaded or the fields are missing
+        """
+        # Rev. 2023-09-06
+        if self._event_index is None and self._is_valid:
+            ref_layer = qgis.core.QgsProject.instance().mapLayer(self._ref_layer_id)
+            data_layer = qgis.core.QgsProject.instance().mapLayer(self._data_layer_id)
+            if ref_layer is None or data_layer is None:
+                return None
+            field_names = [self._fields.at(field_idx).name() for field_idx in range(self._fields.count())]
+            if ref_layer.fields().indexOf(self._ref_pk_field_name) < 0 or any(data_layer.fields().indexOf(field_name) < 0 for field_name in field_names):
+                return None
+
+            if self._tool_name == 'PolEvt':
+                calc_geometry = functools.partial(calc_point_geometry, *self._measure_field_names)
+            else:
+                calc_geometry = functools.partial(calc_segment_geometry, *self._measure_field_names)
+
+            self._event_index = MyEventIndex.EventIndex(
+                ref_layer,
+                ref_layer.fields().field(self._ref_pk_field_name),
+                data_layer,
+                data_layer.fields().field(self._data_id_field_name),
+                data_layer.fields().field(self._data_reference_field_name),
+                [data_layer.fields().field(field_name) for field_name in field_names],
+                calc_geometry
+            )
+            # slots are methods of this QObject ➜ disconnected automatically, if the provider is deleted together with its layer
+            for signal in [data_layer.attributeValueChanged, data_layer.featureAdded, data_layer.featureDeleted]:
+                signal.connect(self._s_data_dirty)
+            data_layer.committedFeaturesAdded.connect(self._s_data_committed)
+            for signal in [ref_layer.geometryChanged, ref_layer.attributeValueChanged, ref_layer.featureAdded, ref_layer.featureDeleted]:
+                signal.connect(self._s_reference_dirty)
+            for signal in [data_layer.afterRollBack, data_layer.subsetStringChanged, ref_layer.afterRollBack, ref_layer.subsetStringChanged]:
+                signal.connect(self._s_invalidate)
+            for signal in [data_layer.willBeDeleted, ref_layer.willBeDeleted]:
+                signal.connect(self._s_release)
+
+        if self._event_index is not None:
+            self._event_index.ensure_current()
+        return self._event_index
+
+    def _s_data_dirty(self, fid: int, *args):
+        """slot for Data-Layer-signals featureAdded, featureDeleted and attributeValueChanged"""
+        # Rev. 2023-09-06
+        if self._event_index is not None:
+            self._event_index.mark_data_dirty(fid)
+
+    def _s_data_committed(self, layer_id: str, features: list):
+        """slot for Data-Layer-signal committedFeaturesAdded"""
+        # Rev. 2023-09-06
+        if self._event_index is not None:
+            self._event_index.mark_data_committed(features)
+
+    def _s_reference_dirty(self, fid: int, *args):
+        """slot for Reference-Layer-signals featureAdded, featureDeleted, geometryChanged and attributeValueChanged"""
+        # Rev. 2023-09-06
+        if self._event_index is not None:
+            self._event_index.mark_ref_dirty(fid)
+
+    def _s_invalidate(self, *args):
+        """slot for afterRollBack and subsetStringChanged of Data- and Reference-Layer"""
+        # Rev. 2023-09-06
+        if self._event_index is not None:
+            self._event_index.rebuild_needed = True
+
+    def _s_release(self):
+        """slot for willBeDeleted of Data- and Reference-Layer, the layers are resolved again on the next request"""
+        # Rev. 2023-09-06
+        self._event_index = None
+
+    def featureSource(self) -> ShowFeatureSource:
+        """standard-function of QgsVectorDataProvider, called in the main-thread before rendering"""
+        # Rev. 2023-09-06
+        return ShowFeatureSource(self)
+
+    def getFeatures(self, request: qgis.core.QgsFeatureRequest = qgis.core.QgsFeatureRequest()) -> qgis.core.QgsFeatureIterator:
+        """standard-function of QgsVectorDataProvider
+        :param request:
+        """
+        # Rev. 2023-09-06
+        return qgis.core.QgsFeatureIterator(ShowFeatureIterator(ShowFeatureSource(self), request))
+
+    def featureCount(self) -> int:
+        """number of calculable features, from the index"""
+        # Rev. 2023-09-06
+        event_index = self.get_event_index()
+        return len(event_index.entries) if event_index is not None else 0
+
+    def extent(self) -> qgis.core.QgsRectangle:
+        """combined bounding-box of the calculated geometries, from the index"""
+        # Rev. 2023-09-06
+        event_index = self.get_event_index()
+        return event_index.full_extent() if event_index is not None else qgis.core.QgsRectangle()
+
+    def updateExtents(self):
+        """extent is always current, see extent"""
+        # Rev. 2023-09-06
+        pass
+
+    def fields(self) -> qgis.core.QgsFields:
+        """Data-Layer-fields stored in the uri"""
+        return self._fields
+
+    def wkbType(self) -> int:
+        """point for PolEvt, linestring for LolEvt"""
+        return qgis.core.QgsWkbTypes.Point if self._tool_name == 'PolEvt' else qgis.core.QgsWkbTypes.LineString
+
+    def crs(self) -> qgis.core.QgsCoordinateReferenceSystem:
+        """Reference-Layer-CRS stored in the uri"""
+        return self._crs
+
+    def isValid(self) -> bool:
+        """uri complete, independent from the availability of Data- and Reference-Layer"""
+        return self._is_valid
+
+    def name(self) -> str:
+        """provider-key"""
+        return provider_key
+
+    def dataSourceUri(self, expandAuthConfig: bool = False) -> str:
+        """uri, see build_uri"""
+        return self._uri
+
+    def storageType(self) -> str:
+        """description of the storage"""
+        return 'LinearReferencing Show-Layer, calculated'
+
+    def capabilities(self) -> int:
+        """read-only, features by id"""
+        return qgis.core.QgsVectorDataProvider.SelectAtId
+
+    def dependencies(self) -> set:
+        """Data- and Reference-Layer are loaded before this layer"""
+        if not self._is_valid:
+            return set()
+        return {qgis.core.QgsMapLayerDependency(self._ref_layer_id), qgis.core.QgsMapLayerDependency(self._data_layer_id)}
+
+
+def register_provider():
+    """registers the provider 'linref' once per QGis-session, must be called before project-load"""
+    # Rev. 2023-09-06
+    registry = qgis.core.QgsProviderRegistry.instance()
+    if provider_key not in registry.providerList():
+        metadata = qgis.core.QgsProviderMetadata(provider_key, ShowLayerProvider.description(), ShowLayerProvider.createProvider)
+        registry.registerProvider(metadata)
@@ -0,0 +1,323 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+********************************************************************
+
+* Part of the QGis-Plugin LinearReferencing:
+* own snapping-engine for the Reference-Layer
+
+.. note::
+    * import to console from Path (LinearReferencing-plugin-folder in current QGis-Profile-Folder)
+    * or use: import LinearReferencing.tools.MySnapping
+    * or use f.e.: from LinearReferencing.tools.MySnapping import ReferenceSnapper, SegmentIndex
+    * independent from the project-wide snapping-config and QgsPointLocator,
+      segment-wise QgsSpatialIndex, built in background by SegmentIndexTask, updated incrementally on geometry-edits
+    * coords, tolerances and measures in Reference-Layer-crs/-units, transformation from/to canvas-crs in the Map-Tools
+
+********************************************************************
+
+* Date                 : 2023-08-29
+* Copyright            : (C) 2023 by Ludwig Kniprath
+* Email                : ludwig at kni minus online dot de
+
+********************************************************************
+
+this program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+********************************************************************
+"""
+from __future__ import annotations
+import math, array
+import qgis
+from qgis import core
+
+
+def line_vertices(geometry: qgis.core.QgsGeometry) -> tuple | None:
+    """coords and cumulative distances of the vertices, same as MyLayerCaches.RefGeometry,
+    multi-geometries: only first part, curved geometries are segmentized
+    :param geometry:
+    :returns tuple (xs, ys, cum_dists) or None for empty geometries and lines with less than two vertices
+    """
+    # Rev. 2023-08-29
+    if geometry is None or geometry.isEmpty():
+        return None
+    if qgis.core.QgsWkbTypes.isSingleType(geometry.wkbType()):
+        curve = geometry.constGet()
+    else:
+        curve = geometry.constGet().geometryN(0)
+    if not isinstance(curve, qgis.core.QgsLineString):
+        curve = curve.curveToLine()
+    xs = array.array('d', curve.xVector())
+    ys = array.array('d', curve.yVector())
+    if len(xs) < 2:
+        return None
+    cum_dists = array.array('d', [0.0] * len(xs))
+    for i in range(1, len(xs)):
+        cum_dists[i] = cum_dists[i - 1] + math.hypot(xs[i] - xs[i - 1], ys[i] - ys[i - 1])
+    return xs, ys, cum_dists
+
+
+def segment_rect(xs: array.array, ys: array.array, i: int) -> qgis.core.QgsRectangle:
+    """bounding-box of segment vertex i - 1 ➜ vertex i"""
+    # Rev. 2023-08-29
+    return qgis.core.QgsRectangle(min(xs[i - 1], xs[i]), min(ys[i - 1], ys[i]), max(xs[i - 1], xs[i]), max(ys[i - 1], ys[i]))
+
+
+class SegmentIndex:
+    """segment-wise QgsSpatialIndex over the (first parts of the) Reference-lines
+    removed/changed segments stay as orphans in the QgsSpatialIndex and are skipped in the queries
+    """
+
+    def __init__(self):
+        # Rev. 2023-08-30
+        self.index = qgis.core.QgsSpatialIndex()
+        # key: fid value: tuple (xs, ys, cum_dists)
+        self.lines = {}
+        # key: segment-id in index, value: tuple (fid, i) segment vertex i - 1 ➜ vertex i
+        self.segments = {}
+        # key: fid value: list of segment-ids
+        self.fid_segments = {}
+        self._next_seg_id = 0
+
+    def add_line(self, fid: int, geometry: qgis.core.QgsGeometry) -> bool:
+        """adds the segments of geometry, previous segments of fid are removed
+        :param fid:
+        :param geometry: Reference-geometry in Reference-Layer-crs
+        :returns False for empty geometries
+        """
+        # Rev. 2023-08-30
+        self.remove_line(fid)
+        vertices = line_vertices(geometry)
+        if vertices:
+            xs, ys, cum_dists = vertices
+            self.lines[fid] = vertices
+            seg_ids = []
+            for i in range(1, len(xs)):
+                seg_id = self._next_seg_id
+                self._next_seg_id += 1
+                self.index.addFeature(seg_id, segment_rect(xs, ys, i))
+                self.segments[seg_id] = (fid, i)
+                seg_ids.append(seg_id)
+            self.fid_segments[fid] = seg_ids
+            return True
+        return False
+
+    def remove_line(self, fid: int):
+        """the segments of fid become orphans in the index
+        :param fid:
+        """
+        # Rev. 2023-08-30
+        for seg_id in self.fid_segments.pop(fid, []):
+            self.segments.pop(seg_id, None)
+        self.lines.pop(fid, None)
+
+    def snap(self, point_xy: qgis.core.QgsPointXY, tolerance: float, fid: int = None) -> tuple | None:
+        """nearest segment within tolerance
+        :param point_xy: point in Reference-Layer-crs
+        :param tolerance: search-radius in Reference-Layer-units
+        :param fid: optional, only segments of this feature, replacement for OneFeatureFilter
+        :returns tuple (fid, snapped point as QgsPointXY, measure, distance, side, segment-index) or None
+        """
+        # Rev. 2023-08-30
+        px = point_xy.x()
+        py = point_xy.y()
+        search_rect = qgis.core.QgsRectangle(px - tolerance, py - tolerance, px + tolerance, py + tolerance)
+        best = None
+        for seg_id in self.index.intersects(search_rect):
+            segment = self.segments.get(seg_id)
+            if segment is None or (fid is not None and segment[0] != fid):
+                continue
+            seg_fid, i = segment
+            xs, ys, cum_dists = self.lines[seg_fid]
+            x1 = xs[i - 1]
+            y1 = ys[i - 1]
+            dx = xs[i] - x1
+            dy = ys[i] - y1
+            seg_sqr_len = dx * dx + dy * dy
+            t = ((px - x1) * dx + (py - y1) * dy) / seg_sqr_len if seg_sqr_len > 0 else 0
+            t = max(0.0, min(1.0, t))
+            nx = x1 + t * dx
+            ny = y1 + t * dy
+            sqr_dist = (px - nx) ** 2 + (py - ny) ** 2
+            if best is None or sqr_dist < best[3]:
+                cross = dx * (py - y1) - dy * (px - x1)
+                # same convention as MyLayerCaches.RefGeometry.locate_point: <0 left, >0 right
+                side = -1 if cross > 0 else (1 if cross < 0 else 0)
+                best = (seg_fid, nx, ny, sqr_dist, cum_dists[i - 1] + t * math.sqrt(seg_sqr_len), side, i)
+
+        if best is not None and best[3] <= tolerance * tolerance:
+            seg_fid, nx, ny, sqr_dist, measure, side, i = best
+            return seg_fid, qgis.core.QgsPointXY(nx, ny), measure, math.sqrt(sqr_dist), side, i
+
+    def nearest(self, point_xy: qgis.core.QgsPointXY, max_distance: float = 0) -> tuple | None:
+        """nearest segment without tolerance, f.e. for batch-locate
+        the nearest bounding-box gives an upper bound for the distance, the exact result is searched within this radius
+        :param point_xy: point in Reference-Layer-crs
+        :param max_distance: optional search-radius in Reference-Layer-units, 0 ➜ unlimited
+        :returns tuple (fid, snapped point as QgsPointXY, measure, distance, side, segment-index) or None
+        """
+        # Rev. 2023-09-12
+        upper_bound = None
+        for seg_id in self.index.nearestNeighbor(point_xy, 1, max_distance):
+            segment = self.segments.get(seg_id)
+            if segment is not None:
+                seg_fid, i = segment
+                xs, ys, cum_dists = self.lines[seg_fid]
+                # the distance to the nearer vertex limits the distance to this segment
+                seg_bound = min(math.hypot(point_xy.x() - xs[i - 1], point_xy.y() - ys[i - 1]), math.hypot(point_xy.x() - xs[i], point_xy.y() - ys[i]))
+                upper_bound = seg_bound if upper_bound is None else min(upper_bound, seg_bound)
+        if upper_bound is None:
+            return None
+        # padded: hypot(dx, dy) ** 2 can round below dx * dx + dy * dy, snap would reject the nearest vertex, f.e. points past a line-end
+        upper_bound = upper_bound * (1 + 1e-9) + 1e-12
+        if max_distance:
+            upper_bound = min(upper_bound, max_distance)
+        return self.snap(point_xy, upper_bound)
+
+
+class SegmentIndexTask(qgis.core.QgsTask):
+    """background-task, builds the SegmentIndex for ReferenceSnapper
+    the features are queried from a QgsVectorLayerFeatureSource (snapshot incl. edit-buffer) in the worker-thread,
+    the result is handed over to the snapper in finished (main-thread)
+    """
+
+    def __init__(self, snapper: ReferenceSnapper, vlayer: qgis.core.QgsVectorLayer):
+        """constructor, must be called in the main-thread
+        :param snapper: receives the result
+        :param vlayer: Reference-Layer
+        """
+        # Rev. 2023-08-29
+        super().__init__(f"LinearReferencing: snapping-index {vlayer.name()}", qgis.core.QgsTask.CanCancel)
+        self.snapper = snapper
+        self.layer_id = vlayer.id()
+        self.num_features = max(vlayer.featureCount(), 1)
+        self.source = qgis.core.QgsVectorLayerFeatureSource(vlayer)
+        self.request = qgis.core.QgsFeatureRequest().setNoAttributes()
+        self.segment_index = SegmentIndex()
+
+    def run(self) -> bool:
+        """worker-thread, no access to layers or widgets"""
+        # Rev. 2023-08-30
+        for feature_no, feature in enumerate(self.source.getFeatures(self.request)):
+            if self.isCanceled():
+                return False
+            if feature.hasGeometry():
+                self.segment_index.add_line(feature.id(), feature.geometry())
+            if feature_no % 1000 == 0:
+                self.setProgress(100 * feature_no / self.num_features)
+        return True
+
+    def finished(self, result: bool):
+        """main-thread, hands the index over to the snapper
+        :param result: return-value of run, False if canceled
+        """
+        # Rev. 2023-08-29
+        self.snapper.s_build_finished(self, result)
+
+
+class ReferenceSnapper:
+    """snapping-engine for one Reference-Layer, owned by the Map-Tool
+    replaces mapCanvas().snappingUtils().snapToMap with OneLayerFilter/OneFeatureFilter:
+    nearest segment, snapped point, measure and side in one query,
+    independent from the user's snapping-settings and the locators of other layers
+    the SegmentIndex is updated incrementally on geometry-edits and rebuilt after rollBack or if the Reference-Layer is changed
+    """
+
+    def __init__(self):
+        # Rev. 2023-08-30
+        self.layer_id = None
+        self.task = None
+        self.segment_index = None
+        # edits during the build ➜ rebuild after finished
+        self._rebuild_needed = False
+
+    def is_ready(self, layer_id: str) -> bool:
+        """True if the index for layer_id is built and can be queried
+        :param layer_id:
+        """
+        # Rev. 2023-08-30
+        return self.segment_index is not None and self.layer_id == layer_id
+
+    def build(self, vlayer: qgis.core.QgsVectorLayer):
+        """starts the background-build of the index, previous index is dropped, until finished the Map-Tools use the QGis-snapping
+        :param vlayer: Reference-Layer
+        """
+        # Rev. 2023-08-29
+        self.cancel()
+        self.layer_id = vlayer.id()
+        self._rebuild_needed = False
+        self.task = SegmentIndexTask(self, vlayer)
+        qgis.core.QgsApplication.taskManager().addTask(self.task)
+
+    def cancel(self):
+        """cancels a running build and drops the index"""
+        # Rev. 2023-08-30
+        if self.task is not None:
+            try:
+                self.task.cancel()
+            except RuntimeError:
+                # already finished and deleted by the QgsTaskManager
+                pass
+            self.task = None
+        self.layer_id = None
+        self.segment_index = None
+
+    def s_build_finished(self, task: SegmentIndexTask, result: bool):
+        """slot called by SegmentIndexTask.finished
+        :param task:
+        :param result: False if canceled
+        """
+        # Rev. 2023-08-30
+        if task is not self.task:
+            # outdated task, canceled or replaced by a newer build
+            return
+        self.task = None
+        if result:
+            self.segment_index = task.segment_index
+            if self._rebuild_needed:
+                vlayer = qgis.core.QgsProject.instance().mapLayer(self.layer_id)
+                if vlayer:
+                    self.build(vlayer)
+
+    def remove_feature(self, fid: int, *args):
+        """slot for featureDeleted
+        :param fid:
+        :param args: signal-arguments, unused
+        """
+        # Rev. 2023-08-30
+        if self.task is not None:
+            self._rebuild_needed = True
+        elif self.segment_index is not None:
+            self.segment_index.remove_line(fid)
+
+    def update_feature(self, vlayer: qgis.core.QgsVectorLayer, fid: int, geometry: qgis.core.QgsGeometry = None):
+        """slot for geometryChanged and featureAdded
+        :param vlayer: Reference-Layer
+        :param fid:
+        :param geometry: new geometry from geometryChanged, queried if None (featureAdded)
+        """
+        # Rev. 2023-08-30
+        if self.task is not None:
+            self._rebuild_needed = True
+            return
+        if self.segment_index is None or vlayer.id() != self.layer_id:
+            return
+        if geometry is None:
+            feature = vlayer.getFeature(fid)
+            geometry = feature.geometry() if feature.isValid() and feature.hasGeometry() else None
+        if not self.segment_index.add_line(fid, geometry):
+            self.segment_index.remove_line(fid)
+
+    def snap(self, point_xy: qgis.core.QgsPointXY, tolerance: float, fid: int = None) -> tuple | None:
+        """nearest segment within tolerance, see SegmentIndex.snap
+        :param point_xy: point in Reference-Layer-crs
+        :param tolerance: search-radius in Reference-Layer-units
+        :param fid: optional, only segments of this feature, replacement for OneFeatureFilter
+        :returns tuple (fid, snapped point as QgsPointXY, measure, distance, side, segment-index) or None
+        """
+        # Rev. 2023-08-30
+        if self.segment_index is not None:
+            return self.segment_index.snap(point_xy, tolerance, fid)
@@ -93,18 +93,23 @@ def select_by_value(wdg_with_model,select_value,col_idx = 0,role_idx = 0):
 
 
 def get_segment_geom(line_geometry:qgis.core.QgsGeometry, measure_from:float,measure_to:float, offset:float = 0)->qgis.core.QgsGeometry:
-    """calculate line-segment measure_from...measure_to on line_geometry with optional offset"""
-    is_single = qgis.core.QgsWkbTypes.isSingleType(line_geometry.wkbType())
-
-    if is_single:
-        ls = line_geometry.constGet()
+    """calculate line-segment measure_from...measure_to on line_geometry with optional offset
+    :param line_geometry: QgsGeometry or cached MyLayerCaches.RefGeometry, the latter with substring located by bisect on cumulative vertex-distances
+    """
+    if isinstance(line_geometry, qgis.core.QgsGeometry):
+        is_single = qgis.core.QgsWkbTypes.isSingleType(line_geometry.wkbType())
+
+        if is_single:
+            ls = line_geometry.constGet()
+        else:
+            #experimental... implemented for shape-file-based refLyr
+            ls = line_geometry.constGet().geometryN(0)
+
+        m_from = min(measure_from, measure_to)
+        m_to = max(measure_from, measure_to)
+        segment_geom = qgis.core.QgsGeometry(ls.curveSubstring(m_from, m_to))
     else:
-        #experimental... implemented for shape-file-based refLyr
-        ls = line_geometry.constGet().geometryN(0)
-
-    m_from = min(measure_from, measure_to)
-    m_to = max(measure_from, measure_to)
-    segment_geom = qgis.core.QgsGeometry(ls.curveSubstring(m_from, m_to))
+        segment_geom = line_geometry.substring(measure_from, measure_to)
 
     if segment_geom:
         if offset:
@@ -118,13 +123,60 @@ def get_segment_geom(line_geometry:qgis.core.QgsGeometry, measure_from:float,mea
         return segment_geom
 
 
-def get_feature_by_value(vlayer: qgis.core.QgsVectorLayer, field: qgis.core.QgsField, value: str | int) -> qgis.core.QgsFeature|None:
+def get_point_geom(line_geometry:qgis.core.QgsGeometry, measure:float)->qgis.core.QgsGeometry:
+    """calculate point at measure on line_geometry
+    :param line_geometry: QgsGeometry or cached MyLayerCaches.RefGeometry, the latter with point located by bisect on cumulative vertex-distances
+    """
+    return line_geometry.interpolate(measure)
+
+
+def get_attribute_request(vlayer: qgis.core.QgsVectorLayer, field_names: list, with_geometry: bool = False) -> qgis.core.QgsFeatureRequest:
+    """central factory for attribute-queries: request with only the listed attributes and without geometry,
+    database-providers (PostGIS, GeoPackage...) transfer only the needed columns
+    sample:
+    request = get_attribute_request(iface.activeLayer(),['fid','line_ref_id'])
+    :param vlayer:
+    :param field_names: list of field-names, f.e. from StoredSettings, None-entries (unconfigured fields) and unknown names are skipped
+    :param with_geometry: True ➜ geometry is queried too, f.e. for Reference-features
+    """
+    # Rev. 2023-08-25
+    request = qgis.core.QgsFeatureRequest()
+    if not with_geometry:
+        request.setFlags(qgis.core.QgsFeatureRequest.NoGeometry)
+    field_idcs = []
+    for field_name in field_names:
+        if field_name:
+            field_idx = vlayer.fields().indexOf(field_name)
+            if field_idx >= 0 and field_idx not in field_idcs:
+                field_idcs.append(field_idx)
+    request.setSubsetOfAttributes(field_idcs)
+    return request
+
+
+def get_feature_by_fid(vlayer: qgis.core.QgsVectorLayer, fid: int, request: qgis.core.QgsFeatureRequest = None) -> qgis.core.QgsFeature:
+    """QgsVectorLayer.getFeature with optional request, f.e. from get_attribute_request
+    sample:
+    feature = get_feature_by_fid(iface.activeLayer(),1,get_attribute_request(iface.activeLayer(),['fid']))
+    :returns invalid QgsFeature if not found, same as getFeature
+    """
+    # Rev. 2023-08-25
+    if request is None:
+        return vlayer.getFeature(fid)
+    fid_request = qgis.core.QgsFeatureRequest(request)
+    fid_request.setFilterFid(fid)
+    for feature in vlayer.getFeatures(fid_request):
+        return feature
+    return qgis.core.QgsFeature()
+
+
+def get_feature_by_value(vlayer: qgis.core.QgsVectorLayer, field: qgis.core.QgsField, value: str | int, request: qgis.core.QgsFeatureRequest = None) -> qgis.core.QgsFeature|None:
     """Returns first feature from layer by query on a single value,
     intended for use on PK-field and PK-Value, where only one feature is expected
     sample:
     found_feature = get_feature_by_value(iface.activeLayer(),iface.activeLayer().fields()[0],1)
+    :param request: optional, f.e. from get_attribute_request, the filter-expression is added
     """
-    request = qgis.core.QgsFeatureRequest()
+    request = qgis.core.QgsFeatureRequest(request) if request else qgis.core.QgsFeatureRequest()
     # expression independent of type of field and value
     request.setFilterExpression(f'"{field.name()}" = \'{value}\'')
     queried_features = vlayer.getFeatures(request)
@@ -134,6 +186,66 @@ def get_feature_by_value(vlayer: qgis.core.QgsVectorLayer, field: qgis.core.QgsF
         return feature
 
 
+def get_features_by_values(vlayer: qgis.core.QgsVectorLayer, field: qgis.core.QgsField, values: list, chunk_size: int = 1000, request: qgis.core.QgsFeatureRequest = None) -> dict:
+    """bulk counterpart of get_feature_by_value: queries features from layer by a list of values
+    one request with IN-filter per chunk instead of one request per value,
+    intended for use on PK-field and PK-Values, where only one feature per value is expected
+    sample:
+    found_features = get_features_by_values(iface.activeLayer(),iface.activeLayer().fields()[0],[1,2,3])
+    :param vlayer:
+    :param field:
+    :param values: list of queried values
+    :param chunk_size: max. number of values in one IN-filter, avoids too long SQL-statements on database-layers
+    :param request: optional, f.e. from get_attribute_request, the filter-expression is added
+    :returns dict key: value value: first found feature, values without feature are missing
+    """
+    # Rev. 2023-08-25
+    found_features = {}
+    # expression independent of type of field and value ➜ compare as string
+    values_by_str = {}
+    for value in values:
+        if value is not None and value != qgis.core.NULL:
+            values_by_str.setdefault(str(value), value)
+
+    str_values = list(values_by_str.keys())
+    for chunk_start in range(0, len(str_values), chunk_size):
+        chunk_values = str_values[chunk_start:chunk_start + chunk_size]
+        in_list = ','.join([qgis.core.QgsExpression.quotedValue(str_value) for str_value in chunk_values])
+        chunk_request = qgis.core.QgsFeatureRequest(request) if request else qgis.core.QgsFeatureRequest()
+        chunk_request.setFilterExpression(f'{qgis.core.QgsExpression.quotedColumnRef(field.name())} IN ({in_list})')
+        for feature in vlayer.getFeatures(chunk_request):
+            str_value = str(feature[field.name()])
+            if str_value in values_by_str and values_by_str[str_value] not in found_features:
+                # first feature wins
+                found_features[values_by_str[str_value]] = feature
+
+    return found_features
+
+
+def get_fids_by_values(vlayer: qgis.core.QgsVectorLayer, field: qgis.core.QgsField, values: list, chunk_size: int = 1000) -> list:
+    """fids of all features with one of these values, f.e. all Data-features referencing a list of Reference-ids
+    geometry- and attribute-less request with IN-filter per chunk, see get_features_by_values
+    sample:
+    data_fids = get_fids_by_values(iface.activeLayer(),iface.activeLayer().fields()[1],[1,2,3])
+    :param vlayer:
+    :param field:
+    :param values: list of queried values
+    :param chunk_size: max. number of values in one IN-filter, avoids too long SQL-statements on database-layers
+    """
+    # Rev. 2023-09-12
+    # expression independent of type of field and value ➜ compare as string
+    str_values = list(dict.fromkeys(str(value) for value in values if value is not None and value != qgis.core.NULL))
+    fids = []
+    for chunk_start in range(0, len(str_values), chunk_size):
+        in_list = ','.join([qgis.core.QgsExpression.quotedValue(str_value) for str_value in str_values[chunk_start:chunk_start + chunk_size]])
+        request = qgis.core.QgsFeatureRequest()
+        request.setFlags(qgis.core.QgsFeatureRequest.NoGeometry)
+        request.setNoAttributes()
+        request.setFilterExpression(f'{qgis.core.QgsExpression.quotedColumnRef(field.name())} IN ({in_list})')
+        fids += [feature.id() for feature in vlayer.getFeatures(request)]
+    return fids
+
+
 
 
 
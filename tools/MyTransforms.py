@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+********************************************************************
+
+* Part of the QGis-Plugin LinearReferencing:
+* cached Coordinate-Transforms
+
+.. note::
+    * import to console from Path (LinearReferencing-plugin-folder in current QGis-Profile-Folder)
+    * or use: import LinearReferencing.tools.MyTransforms
+    * or use f.e.: from LinearReferencing.tools.MyTransforms import get_transform
+    * cache is module-wide, shared by PolEvt and LolEvt,
+      invalidation via destinationCrsChanged/transformContextChanged (connected in LinearReference) and crsChanged of the layers (connected in the Map-Tools)
+
+********************************************************************
+
+* Date                 : 2023-08-28
+* Copyright            : (C) 2023 by Ludwig Kniprath
+* Email                : ludwig at kni minus online dot de
+
+********************************************************************
+
+this program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+********************************************************************
+"""
+from __future__ import annotations
+import qgis
+from qgis import core
+
+
+class TransformCache:
+    """cache for QgsCoordinateTransforms, key: (source-crs, target-crs)
+    replaces the inline QgsCoordinateTransform(canvas_crs, ref_crs, QgsProject.instance()) in the mouse-event-handlers,
+    forward and reverse transform are cached separately, the same object is returned until invalidated,
+    so it can be used as cache-key, see MyLayerCaches.RefGeometry.projected
+    """
+
+    def __init__(self):
+        # key: (source_crs_key, target_crs_key) value: QgsCoordinateTransform
+        self._transforms = {}
+
+    @staticmethod
+    def crs_key(crs: qgis.core.QgsCoordinateReferenceSystem) -> str:
+        """hashable key for crs, WKT for custom crs without authid
+        :param crs:
+        """
+        # Rev. 2023-08-28
+        return crs.authid() or crs.toWkt()
+
+    def get(self, source_crs: qgis.core.QgsCoordinateReferenceSystem, target_crs: qgis.core.QgsCoordinateReferenceSystem) -> qgis.core.QgsCoordinateTransform:
+        """returns the cached transform, created with the transform-context of the current project
+        :param source_crs:
+        :param target_crs:
+        """
+        # Rev. 2023-08-28
+        key = (self.crs_key(source_crs), self.crs_key(target_crs))
+        transform = self._transforms.get(key)
+        if transform is None:
+            transform = qgis.core.QgsCoordinateTransform(source_crs, target_crs, qgis.core.QgsProject.instance())
+            self._transforms[key] = transform
+        return transform
+
+    def invalidate(self):
+        """removes all cached transforms"""
+        # Rev. 2023-08-28
+        self._transforms = {}
+
+
+# module-wide instance, shared by PolEvt and LolEvt
+transform_cache = TransformCache()
+
+
+def get_transform(source_crs: qgis.core.QgsCoordinateReferenceSystem, target_crs: qgis.core.QgsCoordinateReferenceSystem) -> qgis.core.QgsCoordinateTransform:
+    """cached replacement for QgsCoordinateTransform(source_crs, target_crs, QgsProject.instance())
+    sample:
+    tr = get_transform(iface.activeLayer().crs(), iface.mapCanvas().mapSettings().destinationCrs())
+    """
+    # Rev. 2023-08-28
+    return transform_cache.get(source_crs, target_crs)
+
+
+def invalidate_transforms(*args):
+    """slot for destinationCrsChanged, transformContextChanged and crsChanged
+    :param args: signal-arguments, unused
+    """
+    # Rev. 2023-08-28
+    transform_cache.invalidate()
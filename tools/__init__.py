@@ -1,3 +1,16 @@
 from LinearReferencing.tools import MyDebugFunctions
 from LinearReferencing.tools import MyToolFunctions
-from LinearReferencing.tools import MyQtWidgets
\ No newline at end of file
+from LinearReferencing.tools import MyQtWidgets
+from LinearReferencing.tools import MyLayerCaches
+from LinearReferencing.tools import MyShowLayers
+from LinearReferencing.tools import MyTransforms
+from LinearReferencing.tools import MySnapping
+from LinearReferencing.tools import MyBatchTools
+from LinearReferencing.tools import MyIntegrity
+from LinearReferencing.tools import MyEventIndex
+from LinearReferencing.tools import MyMeasureIndex
+from LinearReferencing.tools import MyOverlay
+from LinearReferencing.tools import MyShowProvider
+from LinearReferencing.tools import MyDbViews
+from LinearReferencing.tools import MyGeoPackage
+from LinearReferencing.tools import MyEditSession
\ No newline at end of file